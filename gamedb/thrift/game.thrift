@@ -173,7 +173,8 @@ struct MobileItem {
     3: MobileId mobile_id;
     4: string internal_name; // used internally to talk about the item, but
     // not shown to users, as their names/descriptions must come for i18n translations
-    5: map<AttributeType, Attribute> attributes;
+    5: map<AttributeType, Attribute> attributes; // the template's attributes with this item's overrides
+    // on top: mobile_item_attributes only stores the overrides
     6: optional i64 max_stack_size;
     7: ItemType item_type;
     // Optional because not all items can be constructed by players
@@ -197,7 +198,7 @@ struct ItemBlueprintComponent {
 struct ItemBlueprint {
     1: optional i64 id;
     2: map<ItemId, ItemBlueprintComponent> components;
-    3: i64 bake_time_ms;
+    3: i64 bake_time_ms; // Time to make one unit from the direct components
 }
 
 // Recursive tree structure for displaying blueprints
@@ -207,22 +208,34 @@ struct BlueprintTreeNode {
     2: optional ItemBlueprint blueprint; // Blueprint if this item has one
     3: list<BlueprintTreeNode> component_nodes; // Child nodes (recursive)
     4: list<double> component_ratios; // Ratios corresponding to component_nodes
-    5: i64 total_bake_time_ms; // Sum of this blueprint's bake time + all component bake times
+    5: i64 total_bake_time_ms; // Time to make one unit from raw materials: this blueprint's bake time + each component's total x its ratio
     6: bool max_depth_reached = false; // True if recursion stopped due to max depth
     7: bool cycle_detected = false; // True if a circular reference was detected
 }
 
+// Flattened blueprint tree: the raw materials (items without a blueprint)
+// needed for one unit of an item, with the component ratios multiplied down
+// every path of the tree
+struct BillOfMaterials {
+    1: ItemId item_id;
+    2: map<ItemId, double> materials;
+    3: i64 total_bake_time_ms; // Same total as BlueprintTreeNode.total_bake_time_ms
+    4: bool cycle_detected = false;
+}
+
 struct ItemDb {
     1: list<Item> items;
 }
 
 //@mysql_table('inventory_entries')
 //@info mobile_item_id is optional becasue this may be an inventory owned by the game, in that case, we just reference the item_id, but once the item is moved into an inventory owned by a player's mobile, we need to copy over all the item data to the mobile_items and supporting tables to materialize an persistent version of the item in the game world.
+//@info the copy is lazy: an entry keeps referencing the template item_id, wherever it moves, until one of its attributes is set to a value the template does not have (see InventoryService.set_item_attributes).
 struct InventoryEntry {
     1: ItemId item_id;
     2: double quantity;
     3: bool is_max_stacked = false;
     4: optional ItemId mobile_item_id;
+    5: optional i64 id; // the inventory_entries row; unset for an entry not saved yet
 }
 
 //@mysql_table('inventories')
@@ -233,6 +246,9 @@ struct Inventory {
     4: list<InventoryEntry> entries;
     5: double last_calculated_volume = 0.0;
     6: Owner owner;
+    // Volume of every inventory nested in the containers this one holds, at any
+    // depth; maintained by the server and ignored on save
+    7: double contained_volume = 0.0;
 }
 
 enum StatusType {
@@ -305,10 +321,48 @@ struct Mobile {
     5: string what_we_call_you;
 }
 
+// ============================================================================
+// Response Projection
+// ============================================================================
+
+// Lets load and list requests ask for a sparse response. Leaving the
+// projection unset returns full objects.
+struct Projection {
+    // Load and return attribute maps; false skips the attribute query entirely
+    1: optional bool include_attributes = true;
+    // Load and embed the player's mobile
+    2: optional bool include_mobile = true;
+    // Only return these attribute types; unset or empty returns all of them
+    3: optional list<AttributeType> attribute_types;
+    // Leave human readable messages out of successful results
+    4: optional bool compact_results = false;
+}
+
 // ============================================================================
 // Inventory Service Request/Response Structures
 // ============================================================================
 
+enum CraftingJobState {
+    PENDING = 1,
+    COMPLETED = 2,
+    // Inputs missing or output did not fit when the bake time elapsed
+    FAILED = 3,
+    CANCELLED = 4,
+}
+
+// Crafting quantity units of item_id in an inventory: the blueprint's
+// components are consumed from it and the output added to it at ready_at_ms
+struct CraftingJob {
+    1: i64 id;
+    2: i64 inventory_id;
+    3: ItemId item_id;
+    4: double quantity;
+    5: CraftingJobState state;
+    // Milliseconds since the epoch
+    6: i64 ready_at_ms;
+    7: optional string error;
+}
+
 // Request data structures for each operation
 struct LoadInventoryRequestData {
     1: i64 inventory_id;
@@ -333,6 +387,9 @@ struct TransferItemRequestData {
     2: i64 destination_inventory_id;
     3: i64 item_id;
     4: double quantity;
+    // Set to move the entry holding this item instance, whole and with the
+    // inventory it owns when it is a container; quantity is then ignored
+    5: optional ItemId mobile_item_id;
 }
 
 struct ListInventoryRequestData {
@@ -341,6 +398,89 @@ struct ListInventoryRequestData {
     3: optional string search_string;
 }
 
+struct LoadManyInventoriesRequestData {
+    1: list<i64> inventory_ids;
+}
+
+// Owner-scoped queries run as aggregates over every inventory of the owner
+struct OwnerItemTotalsRequestData {
+    1: Owner owner;
+    // Only total these items; unset or empty totals every item held
+    2: optional list<i64> item_ids;
+}
+
+struct OwnerCapacityRequestData {
+    1: Owner owner;
+}
+
+struct OwnerHasItemsRequestData {
+    1: Owner owner;
+    2: list<i64> item_ids;
+}
+
+// An inventory and every inventory nested in the containers it holds
+struct LoadContainerTreeRequestData {
+    1: i64 inventory_id;
+    // Unset follows nesting down to the server's limit
+    2: optional i32 max_depth;
+    // Recompute and store the cached contained volumes of the loaded tree
+    3: optional bool rebuild = false;
+}
+
+struct StartCraftingRequestData {
+    1: i64 inventory_id;
+    2: ItemId item_id;
+    3: double quantity = 1.0;
+}
+
+struct CancelCraftingRequestData {
+    1: i64 job_id;
+}
+
+struct ListCraftingJobsRequestData {
+    1: i64 inventory_id;
+    // Only jobs still baking
+    2: optional bool pending_only = true;
+}
+
+// Break quantity units of item_id into the components of its blueprint,
+// scaled by their ratios, in the same inventory
+struct BreakdownItemRequestData {
+    1: i64 inventory_id;
+    2: ItemId item_id;
+    3: double quantity = 1.0;
+    // Break down through every blueprint level to raw materials
+    4: optional bool to_raw_materials = false;
+}
+
+// Set attributes of one item in an inventory. A stack that still references
+// its template is copied into mobile_items the first time an attribute
+// diverges from the template; values matching the template write nothing
+struct SetItemAttributesRequestData {
+    1: i64 inventory_id;
+    2: ItemId item_id;
+    // The instance to change; unset changes the first stack referencing the template
+    3: optional ItemId mobile_item_id;
+    4: list<Attribute> attributes;
+    // Units of the stack to customize: they are split off into an entry of
+    // their own before the copy, the rest stays a reference. Ignored when
+    // mobile_item_id is set
+    5: optional double quantity = 1.0;
+}
+
+// Break down every stack with blueprint components in each inventory, in one
+// transaction; item instances and items without components are kept
+struct SalvageContainersRequestData {
+    1: list<i64> inventory_ids;
+    2: optional bool to_raw_materials = false;
+}
+
+struct OwnerCraftableRequestData {
+    1: Owner owner;
+    // Only check the blueprints of these items; unset or empty checks every blueprint
+    2: optional list<i64> item_ids;
+}
+
 // Response data structures for each operation
 struct LoadInventoryResponseData {
     1: Inventory inventory;
@@ -368,6 +508,92 @@ struct ListInventoryResponseData {
     2: i64 total_count;
 }
 
+// Inventories keyed by id; ids that could not be loaded are in errors instead
+struct LoadManyInventoriesResponseData {
+    1: map<i64, Inventory> inventories;
+    2: map<i64, GameResult> errors;
+}
+
+// Total quantity held per item id, summed over every inventory of the owner
+struct OwnerItemTotalsResponseData {
+    1: map<i64, double> quantities;
+}
+
+// Free space left in one inventory
+struct InventoryCapacity {
+    1: i64 inventory_id;
+    2: i32 used_entries;
+    3: i32 free_entries;
+    4: double free_volume;
+}
+
+struct OwnerCapacityResponseData {
+    1: list<InventoryCapacity> inventories;
+}
+
+// Whether each requested item id is in any inventory of the owner
+struct OwnerHasItemsResponseData {
+    1: map<i64, bool> present;
+}
+
+struct StartCraftingResponseData {
+    1: CraftingJob job;
+}
+
+struct CancelCraftingResponseData {
+    1: i64 job_id;
+    // False if the job had already completed, failed or been cancelled
+    2: bool cancelled;
+}
+
+// Ordered by ready_at_ms
+struct ListCraftingJobsResponseData {
+    1: list<CraftingJob> jobs;
+}
+
+struct SetItemAttributesResponseData {
+    // Unset when the stack still references its template
+    1: optional ItemId mobile_item_id;
+    // True if this call copied the template into mobile_items
+    2: bool materialized;
+}
+
+struct BreakdownItemResponseData {
+    1: Inventory inventory;
+    // Quantity added to the inventory, by item id
+    2: map<ItemId, double> produced;
+}
+
+struct SalvageContainersResponseData {
+    // In the order requested
+    1: list<Inventory> inventories;
+    // Totals over every inventory, by item id
+    2: map<ItemId, double> consumed;
+    3: map<ItemId, double> produced;
+}
+
+// Times each item's blueprint can be crafted from what the owner holds,
+// counting each blueprint on its own; items that cannot be crafted are absent
+struct OwnerCraftableResponseData {
+    1: map<i64, i64> craftable;
+}
+
+// One inventory of a container tree; the root has no parent
+struct ContainerNode {
+    1: Inventory inventory;
+    2: optional i64 parent_inventory_id;
+    3: i32 depth;
+    // Volume of every inventory nested below this one, at any depth
+    4: double contained_volume;
+    // last_calculated_volume + contained_volume
+    5: double total_volume;
+}
+
+// Nodes are ordered by depth, parents before their children
+struct LoadContainerTreeResponseData {
+    1: list<ContainerNode> nodes;
+}
+
 // Union of all inventory request data types
 union InventoryRequestData {
     1: LoadInventoryRequestData load_inventory;
@@ -376,6 +602,18 @@ union InventoryRequestData {
     4: SplitStackRequestData split_stack;
     5: TransferItemRequestData transfer_item;
     6: ListInventoryRequestData list_inventory;
+    7: LoadManyInventoriesRequestData load_many_inventories;
+    8: OwnerItemTotalsRequestData owner_item_totals;
+    9: OwnerCapacityRequestData owner_capacity;
+    10: OwnerHasItemsRequestData owner_has_items;
+    11: LoadContainerTreeRequestData load_container_tree;
+    12: OwnerCraftableRequestData owner_craftable;
+    13: StartCraftingRequestData start_crafting;
+    14: CancelCraftingRequestData cancel_crafting;
+    15: ListCraftingJobsRequestData list_crafting_jobs;
+    16: BreakdownItemRequestData breakdown_item;
+    17: SalvageContainersRequestData salvage_containers;
+    18: SetItemAttributesRequestData set_item_attributes;
 }
 
 // Union of all inventory response data types
@@ -386,6 +624,18 @@ union InventoryResponseData {
     4: SplitStackResponseData split_stack;
     5: TransferItemResponseData transfer_item;
     6: ListInventoryResponseData list_inventory;
+    7: LoadManyInventoriesResponseData load_many_inventories;
+    8: OwnerItemTotalsResponseData owner_item_totals;
+    9: OwnerCapacityResponseData owner_capacity;
+    10: OwnerHasItemsResponseData owner_has_items;
+    11: LoadContainerTreeResponseData load_container_tree;
+    12: OwnerCraftableResponseData owner_craftable;
+    13: StartCraftingResponseData start_crafting;
+    14: CancelCraftingResponseData cancel_crafting;
+    15: ListCraftingJobsResponseData list_crafting_jobs;
+    16: BreakdownItemResponseData breakdown_item;
+    17: SalvageContainersResponseData salvage_containers;
+    18: SetItemAttributesResponseData set_item_attributes;
 }
 
 // Inventory Request structure (extensible for auth, tracing, etc.)
@@ -413,6 +663,7 @@ struct CreateItemRequestData {
 struct LoadItemRequestData {
     1: i64 item_id;
     2: optional BackingTable backing_table;
+    3: optional Projection projection;
 }
 
 struct SaveItemRequestData {
@@ -427,6 +678,7 @@ struct ListItemRequestData {
     1: i32 page;
     2: i32 results_per_page;
     3: optional string search_string;
+    4: optional Projection projection;
 }
 
 struct AutocompleteItemRequestData {
@@ -439,6 +691,20 @@ struct LoadItemWithBlueprintTreeRequestData {
     2: i32 max_depth = 10;
 }
 
+struct LoadManyItemsRequestData {
+    1: list<i64> item_ids;
+    2: optional Projection projection;
+}
+
+struct LoadBillOfMaterialsRequestData {
+    1: list<i64> item_ids;
+}
+
+struct LoadDependentsRequestData {
+    1: i64 item_id;
+    2: i32 max_depth = 10;
+}
+
 // Response data structures for each operation
 struct CreateItemResponseData {
     1: Item item;
@@ -474,6 +740,26 @@ struct LoadItemWithBlueprintTreeResponseData {
     1: BlueprintTreeNode tree;
 }
 
+// Items keyed by id; ids that could not be loaded are in errors instead
+struct LoadManyItemsResponseData {
+    1: map<i64, Item> items;
+    2: map<i64, GameResult> errors;
+}
+
+// Keyed by item id; ids that could not be loaded are in errors instead
+struct LoadBillOfMaterialsResponseData {
+    1: map<i64, BillOfMaterials> boms;
+    2: map<i64, GameResult> errors;
+}
+
+struct LoadDependentsResponseData {
+    1: i64 item_id;
+    // Item id -> fewest blueprint steps from item_id to it (1 = direct use)
+    2: map<i64, i32> depths;
+    // True if items beyond max_depth were left out
+    3: bool truncated = false;
+}
+
 // Union of all item request data types
 union ItemRequestData {
     1: CreateItemRequestData create_item;
@@ -483,6 +769,9 @@ union ItemRequestData {
     5: ListItemRequestData list_item;
     6: AutocompleteItemRequestData autocomplete_item;
     7: LoadItemWithBlueprintTreeRequestData load_with_blueprint_tree;
+    8: LoadManyItemsRequestData load_many_items;
+    9: LoadBillOfMaterialsRequestData load_bill_of_materials;
+    10: LoadDependentsRequestData load_dependents;
 }
 
 // Union of all item response data types
@@ -494,6 +783,9 @@ union ItemResponseData {
     5: ListItemResponseData list_item;
     6: AutocompleteItemResponseData autocomplete_item;
     7: LoadItemWithBlueprintTreeResponseData load_with_blueprint_tree;
+    8: LoadManyItemsResponseData load_many_items;
+    9: LoadBillOfMaterialsResponseData load_bill_of_materials;
+    10: LoadDependentsResponseData load_dependents;
 }
 
 // Item Request structure (extensible for auth, tracing, etc.)
@@ -520,6 +812,7 @@ struct CreatePlayerRequestData {
 
 struct LoadPlayerRequestData {
     1: i64 player_id;
+    2: optional Projection projection;
 }
 
 struct SavePlayerRequestData {
@@ -534,6 +827,17 @@ struct ListPlayerRequestData {
     1: i32 page;
     2: i32 results_per_page;
     3: optional string search_string;
+    4: optional Projection projection;
+}
+
+struct LoadManyPlayersRequestData {
+    1: list<i64> player_ids;
+    2: optional Projection projection;
+}
+
+struct LoadSessionRequestData {
+    1: i64 player_id;
+    2: optional Projection projection;
 }
 
 // Response data structures for each operation
@@ -558,6 +862,22 @@ struct ListPlayerResponseData {
     2: i64 total_count;
 }
 
+// Players keyed by id; ids that could not be loaded are in errors instead
+struct LoadManyPlayersResponseData {
+    1: map<i64, Player> players;
+    2: map<i64, GameResult> errors;
+}
+
+// A player's working set: the player with its mobile, every inventory owned by
+// the player or the mobile (with entries), the item templates those entries
+// reference, and the mobile item instances of entries that hold one
+struct LoadSessionResponseData {
+    1: Player player;
+    2: list<Inventory> inventories;
+    3: map<i64, Item> items;
+    4: map<i64, MobileItem> mobile_items;
+}
+
 // Union of all player request data types
 union PlayerRequestData {
     1: CreatePlayerRequestData create_player;
@@ -565,6 +885,8 @@ union PlayerRequestData {
     3: SavePlayerRequestData save_player;
     4: DeletePlayerRequestData delete_player;
     5: ListPlayerRequestData list_player;
+    6: LoadManyPlayersRequestData load_many_players;
+    7: LoadSessionRequestData load_session;
 }
 
 // Union of all player response data types
@@ -574,6 +896,8 @@ union PlayerResponseData {
     3: SavePlayerResponseData save_player;
     4: DeletePlayerResponseData delete_player;
     5: ListPlayerResponseData list_player;
+    6: LoadManyPlayersResponseData load_many_players;
+    7: LoadSessionResponseData load_session;
 }
 
 // Player Request structure (extensible for auth, tracing, etc.)
@@ -589,6 +913,133 @@ struct PlayerResponse {
     // Future fields: response_id, performance_metrics, etc.
 }
 
+// ============================================================================
+// World Service Request/Response Structures
+// ============================================================================
+
+// Kinds of entity that carry position attributes
+enum EntityKind {
+    ITEM = 1,
+    MOBILE = 2,
+}
+
+// Entities within radius of center at one position level, e.g.
+// LOCAL_POSITION. frame holds the positions of the enclosing levels (the
+// planet's GLOBAL_POSITION, ...); leaving it unset searches every frame.
+struct QueryRadiusRequestData {
+    1: AttributeType level;
+    2: ItemVector3 center;
+    3: double radius;
+    4: optional map<AttributeType, ItemVector3> frame;
+    // Only return entities of this kind
+    5: optional EntityKind kind;
+    6: optional i32 max_results;
+}
+
+struct EntityPosition {
+    1: EntityKind kind;
+    2: i64 id;
+    3: ItemVector3 position;
+    4: double distance;
+}
+
+// Nearest first
+struct QueryRadiusResponseData {
+    1: list<EntityPosition> entities;
+}
+
+// New position of one entity at one level
+struct PositionUpdate {
+    1: EntityKind kind;
+    2: i64 id;
+    3: AttributeType level;
+    4: ItemVector3 position;
+}
+
+// Applied in memory at once and written to the attributes table in bulk by
+// the next periodic flush. Only positions the entity already has can move:
+// an update for an unknown entity or level is rejected, never created
+struct UpdatePositionsRequestData {
+    1: list<PositionUpdate> updates;
+}
+
+struct UpdatePositionsResponseData {
+    1: i32 updated;
+    // Rejected updates, keyed by their index in the request
+    2: map<i32, GameResult> errors;
+}
+
+// An area to watch: a sphere at one position level, either fixed at center
+// within frame (as for query_radius) or around follow_mobile_id as it moves
+struct SubscribeAreaRequestData {
+    1: AttributeType level;
+    2: double radius;
+    3: optional ItemVector3 center;
+    4: optional map<AttributeType, ItemVector3> frame;
+    5: optional i64 follow_mobile_id;
+    // Only watch entities of this kind
+    6: optional EntityKind kind;
+}
+
+// The entities in the area now; later changes are returned by poll_area
+struct SubscribeAreaResponseData {
+    1: i64 subscription_id;
+    2: list<EntityPosition> entities;
+}
+
+struct PollAreaRequestData {
+    1: i64 subscription_id;
+}
+
+struct EntityRef {
+    1: EntityKind kind;
+    2: i64 id;
+}
+
+// Changes since the previous poll; distances are from the area's current center
+struct PollAreaResponseData {
+    1: list<EntityPosition> entered;
+    2: list<EntityPosition> moved;
+    3: list<EntityRef> left;
+}
+
+struct UnsubscribeAreaRequestData {
+    1: i64 subscription_id;
+}
+
+struct UnsubscribeAreaResponseData {
+    1: i64 subscription_id;
+}
+
+// Union of all world request data types
+union WorldRequestData {
+    1: QueryRadiusRequestData query_radius;
+    2: UpdatePositionsRequestData update_positions;
+    3: SubscribeAreaRequestData subscribe_area;
+    4: PollAreaRequestData poll_area;
+    5: UnsubscribeAreaRequestData unsubscribe_area;
+}
+
+// Union of all world response data types
+union WorldResponseData {
+    1: QueryRadiusResponseData query_radius;
+    2: UpdatePositionsResponseData update_positions;
+    3: SubscribeAreaResponseData subscribe_area;
+    4: PollAreaResponseData poll_area;
+    5: UnsubscribeAreaResponseData unsubscribe_area;
+}
+
+// World Request structure (extensible for auth, tracing, etc.)
+struct WorldRequest {
+    1: WorldRequestData data;
+}
+
+// World Response structure
+struct WorldResponse {
+    1: list<GameResult> results;
+    2: optional WorldResponseData response_data;
+}
+
 // ============================================================================
 // Service Discovery and Metadata (for Fiddler)
 // ============================================================================
@@ -656,6 +1107,42 @@ service InventoryService extends BaseService {
 
     // List inventories with pagination
     InventoryResponse list_records(1: InventoryRequest request),
+
+    // Load many inventories by ID in one call
+    InventoryResponse load_many(1: InventoryRequest request),
+
+    // Total quantity per item across every inventory of an owner
+    InventoryResponse owner_item_totals(1: InventoryRequest request),
+
+    // Used and free entries and volume of every inventory of an owner
+    InventoryResponse owner_capacity(1: InventoryRequest request),
+
+    // Whether items are present in any inventory of an owner
+    InventoryResponse owner_has_items(1: InventoryRequest request),
+
+    // Load an inventory with every inventory nested inside its containers
+    InventoryResponse load_container_tree(1: InventoryRequest request),
+
+    // Which items an owner can craft from the materials it holds, and how many
+    InventoryResponse owner_craftable(1: InventoryRequest request),
+
+    // Queue crafting an item in an inventory; it completes after the blueprint's bake time
+    InventoryResponse start_crafting(1: InventoryRequest request),
+
+    // Cancel a crafting job that has not completed yet
+    InventoryResponse cancel_crafting(1: InventoryRequest request),
+
+    // Crafting jobs of an inventory
+    InventoryResponse list_crafting_jobs(1: InventoryRequest request),
+
+    // Recycle units of an item into its blueprint components
+    InventoryResponse breakdown_item(1: InventoryRequest request),
+
+    // Recycle everything that has a blueprint in many container inventories at once
+    InventoryResponse salvage_containers(1: InventoryRequest request),
+
+    // Change an item's attributes, materializing it into mobile_items on the first divergence
+    InventoryResponse set_item_attributes(1: InventoryRequest request),
 }
 
 // ============================================================================
@@ -683,6 +1170,15 @@ service ItemService extends BaseService {
 
     // Load an item with its complete blueprint tree (recursive)
     ItemResponse load_with_blueprint_tree(1: ItemRequest request),
+
+    // Load many items by ID in one call
+    ItemResponse load_many(1: ItemRequest request),
+
+    // Flattened raw material totals and bake time of blueprinted items
+    ItemResponse load_bill_of_materials(1: ItemRequest request),
+
+    // Items whose blueprints use an item, directly or through other blueprints
+    ItemResponse load_dependents(1: ItemRequest request),
 }
 
 // ============================================================================
@@ -704,4 +1200,26 @@ service PlayerService extends BaseService {
 
     // List players with pagination and search
     PlayerResponse list_records(1: PlayerRequest request),
+
+    // Load many players by ID in one call
+    PlayerResponse load_many(1: PlayerRequest request),
+
+    // Load a player's full working set for a new session
+    PlayerResponse load_session(1: PlayerRequest request),
+}
+
+// ============================================================================
+// World Service Definition
+// ============================================================================
+
+service WorldService extends BaseService {
+    // Entities near a point, served from the in-memory spatial index
+    WorldResponse query_radius(1: WorldRequest request),
+    // Batched position changes, e.g. every mobile moved in one tick
+    WorldResponse update_positions(1: WorldRequest request),
+    // Area-of-interest subscriptions: subscribe once, then poll for the
+    // entities that entered, moved within or left the area
+    WorldResponse subscribe_area(1: WorldRequest request),
+    WorldResponse poll_area(1: WorldRequest request),
+    WorldResponse unsubscribe_area(1: WorldRequest request),
 }
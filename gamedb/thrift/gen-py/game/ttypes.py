@@ -23,6 +23,7 @@ class ItemType(object):
     WEAPON = 3
     RAWMATERIAL = 4
     REFINEDMATERIAL = 5
+    BLUEPRINT = 6
 
     _VALUES_TO_NAMES = {
         1: "VIRTUAL",
@@ -30,6 +31,7 @@ class ItemType(object):
         3: "WEAPON",
         4: "RAWMATERIAL",
         5: "REFINEDMATERIAL",
+        6: "BLUEPRINT",
     }
 
     _NAMES_TO_VALUES = {
@@ -38,6 +40,7 @@ class ItemType(object):
         "WEAPON": 3,
         "RAWMATERIAL": 4,
         "REFINEDMATERIAL": 5,
+        "BLUEPRINT": 6,
     }
 
 
@@ -128,6 +131,7 @@ class AttributeType(object):
     DEXTERITY = 18
     ARCANA = 19
     OPERATIONS = 20
+    BLUEPRINT_ITEM_ID = 21
 
     _VALUES_TO_NAMES = {
         1: "TRANSLATED_NAME",
@@ -150,6 +154,7 @@ class AttributeType(object):
         18: "DEXTERITY",
         19: "ARCANA",
         20: "OPERATIONS",
+        21: "BLUEPRINT_ITEM_ID",
     }
 
     _NAMES_TO_VALUES = {
@@ -173,6 +178,7 @@ class AttributeType(object):
         "DEXTERITY": 18,
         "ARCANA": 19,
         "OPERATIONS": 20,
+        "BLUEPRINT_ITEM_ID": 21,
     }
 
 
@@ -269,6 +275,42 @@ class GameError(object):
     }
 
 
+class CraftingJobState(object):
+    PENDING = 1
+    COMPLETED = 2
+    FAILED = 3
+    CANCELLED = 4
+
+    _VALUES_TO_NAMES = {
+        1: "PENDING",
+        2: "COMPLETED",
+        3: "FAILED",
+        4: "CANCELLED",
+    }
+
+    _NAMES_TO_VALUES = {
+        "PENDING": 1,
+        "COMPLETED": 2,
+        "FAILED": 3,
+        "CANCELLED": 4,
+    }
+
+
+class EntityKind(object):
+    ITEM = 1
+    MOBILE = 2
+
+    _VALUES_TO_NAMES = {
+        1: "ITEM",
+        2: "MOBILE",
+    }
+
+    _NAMES_TO_VALUES = {
+        "ITEM": 1,
+        "MOBILE": 2,
+    }
+
+
 class Player(object):
     """
     Attributes:
@@ -1390,6 +1432,108 @@ class BlueprintTreeNode(object):
         return not (self == other)
 
 
+class BillOfMaterials(object):
+    """
+    Attributes:
+     - item_id
+     - materials
+     - total_bake_time_ms
+     - cycle_detected
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item_id = None, materials = None, total_bake_time_ms = None, cycle_detected = False,):
+        self.item_id = item_id
+        self.materials = materials
+        self.total_bake_time_ms = total_bake_time_ms
+        self.cycle_detected = cycle_detected
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.materials = {}
+                    (_ktype42, _vtype43, _size41) = iprot.readMapBegin()
+                    for _i45 in range(_size41):
+                        _key46 = iprot.readI64()
+                        _val47 = iprot.readDouble()
+                        self.materials[_key46] = _val47
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.total_bake_time_ms = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.BOOL:
+                    self.cycle_detected = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('BillOfMaterials')
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 1)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        if self.materials is not None:
+            oprot.writeFieldBegin('materials', TType.MAP, 2)
+            oprot.writeMapBegin(TType.I64, TType.DOUBLE, len(self.materials))
+            for kiter48, viter49 in self.materials.items():
+                oprot.writeI64(kiter48)
+                oprot.writeDouble(viter49)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.total_bake_time_ms is not None:
+            oprot.writeFieldBegin('total_bake_time_ms', TType.I64, 3)
+            oprot.writeI64(self.total_bake_time_ms)
+            oprot.writeFieldEnd()
+        if self.cycle_detected is not None:
+            oprot.writeFieldBegin('cycle_detected', TType.BOOL, 4)
+            oprot.writeBool(self.cycle_detected)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
 class ItemDb(object):
     """
     Attributes:
@@ -1414,11 +1558,11 @@ class ItemDb(object):
             if fid == 1:
                 if ftype == TType.LIST:
                     self.items = []
-                    (_etype44, _size41) = iprot.readListBegin()
-                    for _i45 in range(_size41):
-                        _elem46 = Item()
-                        _elem46.read(iprot)
-                        self.items.append(_elem46)
+                    (_etype53, _size50) = iprot.readListBegin()
+                    for _i54 in range(_size50):
+                        _elem55 = Item()
+                        _elem55.read(iprot)
+                        self.items.append(_elem55)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -1436,8 +1580,8 @@ class ItemDb(object):
         if self.items is not None:
             oprot.writeFieldBegin('items', TType.LIST, 1)
             oprot.writeListBegin(TType.STRUCT, len(self.items))
-            for iter47 in self.items:
-                iter47.write(oprot)
+            for iter56 in self.items:
+                iter56.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -1465,16 +1609,18 @@ class InventoryEntry(object):
      - quantity
      - is_max_stacked
      - mobile_item_id
+     - id
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item_id = None, quantity = None, is_max_stacked = False, mobile_item_id = None,):
+    def __init__(self, item_id = None, quantity = None, is_max_stacked = False, mobile_item_id = None, id = None,):
         self.item_id = item_id
         self.quantity = quantity
         self.is_max_stacked = is_max_stacked
         self.mobile_item_id = mobile_item_id
+        self.id = id
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1505,6 +1651,11 @@ class InventoryEntry(object):
                     self.mobile_item_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1532,6 +1683,10 @@ class InventoryEntry(object):
             oprot.writeFieldBegin('mobile_item_id', TType.I64, 4)
             oprot.writeI64(self.mobile_item_id)
             oprot.writeFieldEnd()
+        if self.id is not None:
+            oprot.writeFieldBegin('id', TType.I64, 5)
+            oprot.writeI64(self.id)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1559,18 +1714,20 @@ class Inventory(object):
      - entries
      - last_calculated_volume
      - owner
+     - contained_volume
 
     """
     thrift_spec = None
 
 
-    def __init__(self, id = None, max_entries = None, max_volume = None, entries = None, last_calculated_volume = 0.0000000000000000, owner = None,):
+    def __init__(self, id = None, max_entries = None, max_volume = None, entries = None, last_calculated_volume = 0.0000000000000000, owner = None, contained_volume = 0.0000000000000000,):
         self.id = id
         self.max_entries = max_entries
         self.max_volume = max_volume
         self.entries = entries
         self.last_calculated_volume = last_calculated_volume
         self.owner = owner
+        self.contained_volume = contained_volume
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1599,11 +1756,11 @@ class Inventory(object):
             elif fid == 4:
                 if ftype == TType.LIST:
                     self.entries = []
-                    (_etype51, _size48) = iprot.readListBegin()
-                    for _i52 in range(_size48):
-                        _elem53 = InventoryEntry()
-                        _elem53.read(iprot)
-                        self.entries.append(_elem53)
+                    (_etype60, _size57) = iprot.readListBegin()
+                    for _i61 in range(_size57):
+                        _elem62 = InventoryEntry()
+                        _elem62.read(iprot)
+                        self.entries.append(_elem62)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -1618,6 +1775,11 @@ class Inventory(object):
                     self.owner.read(iprot)
                 else:
                     iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.DOUBLE:
+                    self.contained_volume = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1644,8 +1806,8 @@ class Inventory(object):
         if self.entries is not None:
             oprot.writeFieldBegin('entries', TType.LIST, 4)
             oprot.writeListBegin(TType.STRUCT, len(self.entries))
-            for iter54 in self.entries:
-                iter54.write(oprot)
+            for iter63 in self.entries:
+                iter63.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.last_calculated_volume is not None:
@@ -1656,6 +1818,10 @@ class Inventory(object):
             oprot.writeFieldBegin('owner', TType.STRUCT, 6)
             self.owner.write(oprot)
             oprot.writeFieldEnd()
+        if self.contained_volume is not None:
+            oprot.writeFieldBegin('contained_volume', TType.DOUBLE, 7)
+            oprot.writeDouble(self.contained_volume)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1797,12 +1963,12 @@ class Mobile(object):
             elif fid == 3:
                 if ftype == TType.MAP:
                     self.attributes = {}
-                    (_ktype56, _vtype57, _size55) = iprot.readMapBegin()
-                    for _i59 in range(_size55):
-                        _key60 = iprot.readI32()
-                        _val61 = Attribute()
-                        _val61.read(iprot)
-                        self.attributes[_key60] = _val61
+                    (_ktype65, _vtype66, _size64) = iprot.readMapBegin()
+                    for _i68 in range(_size64):
+                        _key69 = iprot.readI32()
+                        _val70 = Attribute()
+                        _val70.read(iprot)
+                        self.attributes[_key69] = _val70
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
@@ -1839,9 +2005,9 @@ class Mobile(object):
         if self.attributes is not None:
             oprot.writeFieldBegin('attributes', TType.MAP, 3)
             oprot.writeMapBegin(TType.I32, TType.STRUCT, len(self.attributes))
-            for kiter62, viter63 in self.attributes.items():
-                oprot.writeI32(kiter62)
-                viter63.write(oprot)
+            for kiter71, viter72 in self.attributes.items():
+                oprot.writeI32(kiter71)
+                viter72.write(oprot)
             oprot.writeMapEnd()
             oprot.writeFieldEnd()
         if self.owner is not None:
@@ -1870,17 +2036,23 @@ class Mobile(object):
         return not (self == other)
 
 
-class LoadInventoryRequestData(object):
+class Projection(object):
     """
     Attributes:
-     - inventory_id
+     - include_attributes
+     - include_mobile
+     - attribute_types
+     - compact_results
 
     """
     thrift_spec = None
 
 
-    def __init__(self, inventory_id = None,):
-        self.inventory_id = inventory_id
+    def __init__(self, include_attributes = True, include_mobile = True, attribute_types = None, compact_results = False,):
+        self.include_attributes = include_attributes
+        self.include_mobile = include_mobile
+        self.attribute_types = attribute_types
+        self.compact_results = compact_results
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1892,8 +2064,28 @@ class LoadInventoryRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.inventory_id = iprot.readI64()
+                if ftype == TType.BOOL:
+                    self.include_attributes = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.BOOL:
+                    self.include_mobile = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.attribute_types = []
+                    (_etype76, _size73) = iprot.readListBegin()
+                    for _i77 in range(_size73):
+                        _elem78 = iprot.readI32()
+                        self.attribute_types.append(_elem78)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.BOOL:
+                    self.compact_results = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1906,10 +2098,25 @@ class LoadInventoryRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('LoadInventoryRequestData')
-        if self.inventory_id is not None:
-            oprot.writeFieldBegin('inventory_id', TType.I64, 1)
-            oprot.writeI64(self.inventory_id)
+        oprot.writeStructBegin('Projection')
+        if self.include_attributes is not None:
+            oprot.writeFieldBegin('include_attributes', TType.BOOL, 1)
+            oprot.writeBool(self.include_attributes)
+            oprot.writeFieldEnd()
+        if self.include_mobile is not None:
+            oprot.writeFieldBegin('include_mobile', TType.BOOL, 2)
+            oprot.writeBool(self.include_mobile)
+            oprot.writeFieldEnd()
+        if self.attribute_types is not None:
+            oprot.writeFieldBegin('attribute_types', TType.LIST, 3)
+            oprot.writeListBegin(TType.I32, len(self.attribute_types))
+            for iter79 in self.attribute_types:
+                oprot.writeI32(iter79)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.compact_results is not None:
+            oprot.writeFieldBegin('compact_results', TType.BOOL, 4)
+            oprot.writeBool(self.compact_results)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1929,17 +2136,29 @@ class LoadInventoryRequestData(object):
         return not (self == other)
 
 
-class CreateInventoryRequestData(object):
+class CraftingJob(object):
     """
     Attributes:
-     - inventory
+     - id
+     - inventory_id
+     - item_id
+     - quantity
+     - state
+     - ready_at_ms
+     - error
 
     """
     thrift_spec = None
 
 
-    def __init__(self, inventory = None,):
-        self.inventory = inventory
+    def __init__(self, id = None, inventory_id = None, item_id = None, quantity = None, state = None, ready_at_ms = None, error = None,):
+        self.id = id
+        self.inventory_id = inventory_id
+        self.item_id = item_id
+        self.quantity = quantity
+        self.state = state
+        self.ready_at_ms = ready_at_ms
+        self.error = error
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1951,9 +2170,38 @@ class CreateInventoryRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.inventory = Inventory()
-                    self.inventory.read(iprot)
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.inventory_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.DOUBLE:
+                    self.quantity = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I32:
+                    self.state = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.I64:
+                    self.ready_at_ms = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRING:
+                    self.error = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1966,10 +2214,34 @@ class CreateInventoryRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('CreateInventoryRequestData')
-        if self.inventory is not None:
-            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
-            self.inventory.write(oprot)
+        oprot.writeStructBegin('CraftingJob')
+        if self.id is not None:
+            oprot.writeFieldBegin('id', TType.I64, 1)
+            oprot.writeI64(self.id)
+            oprot.writeFieldEnd()
+        if self.inventory_id is not None:
+            oprot.writeFieldBegin('inventory_id', TType.I64, 2)
+            oprot.writeI64(self.inventory_id)
+            oprot.writeFieldEnd()
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 3)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        if self.quantity is not None:
+            oprot.writeFieldBegin('quantity', TType.DOUBLE, 4)
+            oprot.writeDouble(self.quantity)
+            oprot.writeFieldEnd()
+        if self.state is not None:
+            oprot.writeFieldBegin('state', TType.I32, 5)
+            oprot.writeI32(self.state)
+            oprot.writeFieldEnd()
+        if self.ready_at_ms is not None:
+            oprot.writeFieldBegin('ready_at_ms', TType.I64, 6)
+            oprot.writeI64(self.ready_at_ms)
+            oprot.writeFieldEnd()
+        if self.error is not None:
+            oprot.writeFieldBegin('error', TType.STRING, 7)
+            oprot.writeString(self.error.encode('utf-8') if sys.version_info[0] == 2 else self.error)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1989,17 +2261,17 @@ class CreateInventoryRequestData(object):
         return not (self == other)
 
 
-class SaveInventoryRequestData(object):
+class LoadInventoryRequestData(object):
     """
     Attributes:
-     - inventory
+     - inventory_id
 
     """
     thrift_spec = None
 
 
-    def __init__(self, inventory = None,):
-        self.inventory = inventory
+    def __init__(self, inventory_id = None,):
+        self.inventory_id = inventory_id
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2011,9 +2283,8 @@ class SaveInventoryRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.inventory = Inventory()
-                    self.inventory.read(iprot)
+                if ftype == TType.I64:
+                    self.inventory_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2026,10 +2297,10 @@ class SaveInventoryRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('SaveInventoryRequestData')
-        if self.inventory is not None:
-            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
-            self.inventory.write(oprot)
+        oprot.writeStructBegin('LoadInventoryRequestData')
+        if self.inventory_id is not None:
+            oprot.writeFieldBegin('inventory_id', TType.I64, 1)
+            oprot.writeI64(self.inventory_id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2049,21 +2320,17 @@ class SaveInventoryRequestData(object):
         return not (self == other)
 
 
-class SplitStackRequestData(object):
+class CreateInventoryRequestData(object):
     """
     Attributes:
-     - inventory_id
-     - item_id
-     - quantity_to_split
+     - inventory
 
     """
     thrift_spec = None
 
 
-    def __init__(self, inventory_id = None, item_id = None, quantity_to_split = None,):
-        self.inventory_id = inventory_id
-        self.item_id = item_id
-        self.quantity_to_split = quantity_to_split
+    def __init__(self, inventory = None,):
+        self.inventory = inventory
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2075,18 +2342,142 @@ class SplitStackRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.inventory_id = iprot.readI64()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.I64:
-                    self.item_id = iprot.readI64()
+                if ftype == TType.STRUCT:
+                    self.inventory = Inventory()
+                    self.inventory.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.DOUBLE:
-                    self.quantity_to_split = iprot.readDouble()
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('CreateInventoryRequestData')
+        if self.inventory is not None:
+            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
+            self.inventory.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SaveInventoryRequestData(object):
+    """
+    Attributes:
+     - inventory
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, inventory = None,):
+        self.inventory = inventory
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.inventory = Inventory()
+                    self.inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('SaveInventoryRequestData')
+        if self.inventory is not None:
+            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
+            self.inventory.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SplitStackRequestData(object):
+    """
+    Attributes:
+     - inventory_id
+     - item_id
+     - quantity_to_split
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, inventory_id = None, item_id = None, quantity_to_split = None,):
+        self.inventory_id = inventory_id
+        self.item_id = item_id
+        self.quantity_to_split = quantity_to_split
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.inventory_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.DOUBLE:
+                    self.quantity_to_split = iprot.readDouble()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2137,16 +2528,18 @@ class TransferItemRequestData(object):
      - destination_inventory_id
      - item_id
      - quantity
+     - mobile_item_id
 
     """
     thrift_spec = None
 
 
-    def __init__(self, source_inventory_id = None, destination_inventory_id = None, item_id = None, quantity = None,):
+    def __init__(self, source_inventory_id = None, destination_inventory_id = None, item_id = None, quantity = None, mobile_item_id = None,):
         self.source_inventory_id = source_inventory_id
         self.destination_inventory_id = destination_inventory_id
         self.item_id = item_id
         self.quantity = quantity
+        self.mobile_item_id = mobile_item_id
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2177,6 +2570,11 @@ class TransferItemRequestData(object):
                     self.quantity = iprot.readDouble()
                 else:
                     iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I64:
+                    self.mobile_item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -2204,6 +2602,10 @@ class TransferItemRequestData(object):
             oprot.writeFieldBegin('quantity', TType.DOUBLE, 4)
             oprot.writeDouble(self.quantity)
             oprot.writeFieldEnd()
+        if self.mobile_item_id is not None:
+            oprot.writeFieldBegin('mobile_item_id', TType.I64, 5)
+            oprot.writeI64(self.mobile_item_id)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -2303,17 +2705,17 @@ class ListInventoryRequestData(object):
         return not (self == other)
 
 
-class LoadInventoryResponseData(object):
+class LoadManyInventoriesRequestData(object):
     """
     Attributes:
-     - inventory
+     - inventory_ids
 
     """
     thrift_spec = None
 
 
-    def __init__(self, inventory = None,):
-        self.inventory = inventory
+    def __init__(self, inventory_ids = None,):
+        self.inventory_ids = inventory_ids
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2325,9 +2727,13 @@ class LoadInventoryResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.inventory = Inventory()
-                    self.inventory.read(iprot)
+                if ftype == TType.LIST:
+                    self.inventory_ids = []
+                    (_etype83, _size80) = iprot.readListBegin()
+                    for _i84 in range(_size80):
+                        _elem85 = iprot.readI64()
+                        self.inventory_ids.append(_elem85)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2340,10 +2746,13 @@ class LoadInventoryResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('LoadInventoryResponseData')
-        if self.inventory is not None:
-            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
-            self.inventory.write(oprot)
+        oprot.writeStructBegin('LoadManyInventoriesRequestData')
+        if self.inventory_ids is not None:
+            oprot.writeFieldBegin('inventory_ids', TType.LIST, 1)
+            oprot.writeListBegin(TType.I64, len(self.inventory_ids))
+            for iter86 in self.inventory_ids:
+                oprot.writeI64(iter86)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2363,17 +2772,19 @@ class LoadInventoryResponseData(object):
         return not (self == other)
 
 
-class CreateInventoryResponseData(object):
+class OwnerItemTotalsRequestData(object):
     """
     Attributes:
-     - inventory
+     - owner
+     - item_ids
 
     """
     thrift_spec = None
 
 
-    def __init__(self, inventory = None,):
-        self.inventory = inventory
+    def __init__(self, owner = None, item_ids = None,):
+        self.owner = owner
+        self.item_ids = item_ids
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2386,8 +2797,18 @@ class CreateInventoryResponseData(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.inventory = Inventory()
-                    self.inventory.read(iprot)
+                    self.owner = Owner()
+                    self.owner.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.item_ids = []
+                    (_etype90, _size87) = iprot.readListBegin()
+                    for _i91 in range(_size87):
+                        _elem92 = iprot.readI64()
+                        self.item_ids.append(_elem92)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2400,10 +2821,17 @@ class CreateInventoryResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('CreateInventoryResponseData')
-        if self.inventory is not None:
-            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
-            self.inventory.write(oprot)
+        oprot.writeStructBegin('OwnerItemTotalsRequestData')
+        if self.owner is not None:
+            oprot.writeFieldBegin('owner', TType.STRUCT, 1)
+            self.owner.write(oprot)
+            oprot.writeFieldEnd()
+        if self.item_ids is not None:
+            oprot.writeFieldBegin('item_ids', TType.LIST, 2)
+            oprot.writeListBegin(TType.I64, len(self.item_ids))
+            for iter93 in self.item_ids:
+                oprot.writeI64(iter93)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2423,17 +2851,17 @@ class CreateInventoryResponseData(object):
         return not (self == other)
 
 
-class SaveInventoryResponseData(object):
+class OwnerCapacityRequestData(object):
     """
     Attributes:
-     - inventory
+     - owner
 
     """
     thrift_spec = None
 
 
-    def __init__(self, inventory = None,):
-        self.inventory = inventory
+    def __init__(self, owner = None,):
+        self.owner = owner
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2446,8 +2874,8 @@ class SaveInventoryResponseData(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.inventory = Inventory()
-                    self.inventory.read(iprot)
+                    self.owner = Owner()
+                    self.owner.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -2460,10 +2888,10 @@ class SaveInventoryResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('SaveInventoryResponseData')
-        if self.inventory is not None:
-            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
-            self.inventory.write(oprot)
+        oprot.writeStructBegin('OwnerCapacityRequestData')
+        if self.owner is not None:
+            oprot.writeFieldBegin('owner', TType.STRUCT, 1)
+            self.owner.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2483,17 +2911,19 @@ class SaveInventoryResponseData(object):
         return not (self == other)
 
 
-class SplitStackResponseData(object):
+class OwnerHasItemsRequestData(object):
     """
     Attributes:
-     - inventory
+     - owner
+     - item_ids
 
     """
     thrift_spec = None
 
 
-    def __init__(self, inventory = None,):
-        self.inventory = inventory
+    def __init__(self, owner = None, item_ids = None,):
+        self.owner = owner
+        self.item_ids = item_ids
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2506,8 +2936,18 @@ class SplitStackResponseData(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.inventory = Inventory()
-                    self.inventory.read(iprot)
+                    self.owner = Owner()
+                    self.owner.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.item_ids = []
+                    (_etype97, _size94) = iprot.readListBegin()
+                    for _i98 in range(_size94):
+                        _elem99 = iprot.readI64()
+                        self.item_ids.append(_elem99)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2520,10 +2960,17 @@ class SplitStackResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('SplitStackResponseData')
-        if self.inventory is not None:
-            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
-            self.inventory.write(oprot)
+        oprot.writeStructBegin('OwnerHasItemsRequestData')
+        if self.owner is not None:
+            oprot.writeFieldBegin('owner', TType.STRUCT, 1)
+            self.owner.write(oprot)
+            oprot.writeFieldEnd()
+        if self.item_ids is not None:
+            oprot.writeFieldBegin('item_ids', TType.LIST, 2)
+            oprot.writeListBegin(TType.I64, len(self.item_ids))
+            for iter100 in self.item_ids:
+                oprot.writeI64(iter100)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2543,19 +2990,21 @@ class SplitStackResponseData(object):
         return not (self == other)
 
 
-class TransferItemResponseData(object):
+class LoadContainerTreeRequestData(object):
     """
     Attributes:
-     - source_inventory
-     - destination_inventory
+     - inventory_id
+     - max_depth
+     - rebuild
 
     """
     thrift_spec = None
 
 
-    def __init__(self, source_inventory = None, destination_inventory = None,):
-        self.source_inventory = source_inventory
-        self.destination_inventory = destination_inventory
+    def __init__(self, inventory_id = None, max_depth = None, rebuild = False,):
+        self.inventory_id = inventory_id
+        self.max_depth = max_depth
+        self.rebuild = rebuild
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2567,15 +3016,18 @@ class TransferItemResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.source_inventory = Inventory()
-                    self.source_inventory.read(iprot)
+                if ftype == TType.I64:
+                    self.inventory_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.destination_inventory = Inventory()
-                    self.destination_inventory.read(iprot)
+                if ftype == TType.I32:
+                    self.max_depth = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.BOOL:
+                    self.rebuild = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2588,14 +3040,18 @@ class TransferItemResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('TransferItemResponseData')
-        if self.source_inventory is not None:
-            oprot.writeFieldBegin('source_inventory', TType.STRUCT, 1)
-            self.source_inventory.write(oprot)
+        oprot.writeStructBegin('LoadContainerTreeRequestData')
+        if self.inventory_id is not None:
+            oprot.writeFieldBegin('inventory_id', TType.I64, 1)
+            oprot.writeI64(self.inventory_id)
             oprot.writeFieldEnd()
-        if self.destination_inventory is not None:
-            oprot.writeFieldBegin('destination_inventory', TType.STRUCT, 2)
-            self.destination_inventory.write(oprot)
+        if self.max_depth is not None:
+            oprot.writeFieldBegin('max_depth', TType.I32, 2)
+            oprot.writeI32(self.max_depth)
+            oprot.writeFieldEnd()
+        if self.rebuild is not None:
+            oprot.writeFieldBegin('rebuild', TType.BOOL, 3)
+            oprot.writeBool(self.rebuild)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2615,19 +3071,21 @@ class TransferItemResponseData(object):
         return not (self == other)
 
 
-class ListInventoryResponseData(object):
+class StartCraftingRequestData(object):
     """
     Attributes:
-     - inventories
-     - total_count
+     - inventory_id
+     - item_id
+     - quantity
 
     """
     thrift_spec = None
 
 
-    def __init__(self, inventories = None, total_count = None,):
-        self.inventories = inventories
-        self.total_count = total_count
+    def __init__(self, inventory_id = None, item_id = None, quantity = 1.0000000000000000,):
+        self.inventory_id = inventory_id
+        self.item_id = item_id
+        self.quantity = quantity
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2639,19 +3097,18 @@ class ListInventoryResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.LIST:
-                    self.inventories = []
-                    (_etype67, _size64) = iprot.readListBegin()
-                    for _i68 in range(_size64):
-                        _elem69 = Inventory()
-                        _elem69.read(iprot)
-                        self.inventories.append(_elem69)
-                    iprot.readListEnd()
+                if ftype == TType.I64:
+                    self.inventory_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.I64:
-                    self.total_count = iprot.readI64()
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.DOUBLE:
+                    self.quantity = iprot.readDouble()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2664,17 +3121,18 @@ class ListInventoryResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ListInventoryResponseData')
-        if self.inventories is not None:
-            oprot.writeFieldBegin('inventories', TType.LIST, 1)
-            oprot.writeListBegin(TType.STRUCT, len(self.inventories))
-            for iter70 in self.inventories:
-                iter70.write(oprot)
-            oprot.writeListEnd()
+        oprot.writeStructBegin('StartCraftingRequestData')
+        if self.inventory_id is not None:
+            oprot.writeFieldBegin('inventory_id', TType.I64, 1)
+            oprot.writeI64(self.inventory_id)
             oprot.writeFieldEnd()
-        if self.total_count is not None:
-            oprot.writeFieldBegin('total_count', TType.I64, 2)
-            oprot.writeI64(self.total_count)
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 2)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        if self.quantity is not None:
+            oprot.writeFieldBegin('quantity', TType.DOUBLE, 3)
+            oprot.writeDouble(self.quantity)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2694,27 +3152,17 @@ class ListInventoryResponseData(object):
         return not (self == other)
 
 
-class InventoryRequestData(object):
+class CancelCraftingRequestData(object):
     """
     Attributes:
-     - load_inventory
-     - create_inventory
-     - save_inventory
-     - split_stack
-     - transfer_item
-     - list_inventory
+     - job_id
 
     """
     thrift_spec = None
 
 
-    def __init__(self, load_inventory = None, create_inventory = None, save_inventory = None, split_stack = None, transfer_item = None, list_inventory = None,):
-        self.load_inventory = load_inventory
-        self.create_inventory = create_inventory
-        self.save_inventory = save_inventory
-        self.split_stack = split_stack
-        self.transfer_item = transfer_item
-        self.list_inventory = list_inventory
+    def __init__(self, job_id = None,):
+        self.job_id = job_id
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2726,39 +3174,8 @@ class InventoryRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.load_inventory = LoadInventoryRequestData()
-                    self.load_inventory.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.create_inventory = CreateInventoryRequestData()
-                    self.create_inventory.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.save_inventory = SaveInventoryRequestData()
-                    self.save_inventory.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRUCT:
-                    self.split_stack = SplitStackRequestData()
-                    self.split_stack.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRUCT:
-                    self.transfer_item = TransferItemRequestData()
-                    self.transfer_item.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRUCT:
-                    self.list_inventory = ListInventoryRequestData()
-                    self.list_inventory.read(iprot)
+                if ftype == TType.I64:
+                    self.job_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2771,30 +3188,10 @@ class InventoryRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('InventoryRequestData')
-        if self.load_inventory is not None:
-            oprot.writeFieldBegin('load_inventory', TType.STRUCT, 1)
-            self.load_inventory.write(oprot)
-            oprot.writeFieldEnd()
-        if self.create_inventory is not None:
-            oprot.writeFieldBegin('create_inventory', TType.STRUCT, 2)
-            self.create_inventory.write(oprot)
-            oprot.writeFieldEnd()
-        if self.save_inventory is not None:
-            oprot.writeFieldBegin('save_inventory', TType.STRUCT, 3)
-            self.save_inventory.write(oprot)
-            oprot.writeFieldEnd()
-        if self.split_stack is not None:
-            oprot.writeFieldBegin('split_stack', TType.STRUCT, 4)
-            self.split_stack.write(oprot)
-            oprot.writeFieldEnd()
-        if self.transfer_item is not None:
-            oprot.writeFieldBegin('transfer_item', TType.STRUCT, 5)
-            self.transfer_item.write(oprot)
-            oprot.writeFieldEnd()
-        if self.list_inventory is not None:
-            oprot.writeFieldBegin('list_inventory', TType.STRUCT, 6)
-            self.list_inventory.write(oprot)
+        oprot.writeStructBegin('CancelCraftingRequestData')
+        if self.job_id is not None:
+            oprot.writeFieldBegin('job_id', TType.I64, 1)
+            oprot.writeI64(self.job_id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2814,27 +3211,19 @@ class InventoryRequestData(object):
         return not (self == other)
 
 
-class InventoryResponseData(object):
+class ListCraftingJobsRequestData(object):
     """
     Attributes:
-     - load_inventory
-     - create_inventory
-     - save_inventory
-     - split_stack
-     - transfer_item
-     - list_inventory
+     - inventory_id
+     - pending_only
 
     """
     thrift_spec = None
 
 
-    def __init__(self, load_inventory = None, create_inventory = None, save_inventory = None, split_stack = None, transfer_item = None, list_inventory = None,):
-        self.load_inventory = load_inventory
-        self.create_inventory = create_inventory
-        self.save_inventory = save_inventory
-        self.split_stack = split_stack
-        self.transfer_item = transfer_item
-        self.list_inventory = list_inventory
+    def __init__(self, inventory_id = None, pending_only = True,):
+        self.inventory_id = inventory_id
+        self.pending_only = pending_only
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2846,39 +3235,13 @@ class InventoryResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.load_inventory = LoadInventoryResponseData()
-                    self.load_inventory.read(iprot)
+                if ftype == TType.I64:
+                    self.inventory_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.create_inventory = CreateInventoryResponseData()
-                    self.create_inventory.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.save_inventory = SaveInventoryResponseData()
-                    self.save_inventory.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRUCT:
-                    self.split_stack = SplitStackResponseData()
-                    self.split_stack.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRUCT:
-                    self.transfer_item = TransferItemResponseData()
-                    self.transfer_item.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRUCT:
-                    self.list_inventory = ListInventoryResponseData()
-                    self.list_inventory.read(iprot)
+                if ftype == TType.BOOL:
+                    self.pending_only = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2891,30 +3254,14 @@ class InventoryResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('InventoryResponseData')
-        if self.load_inventory is not None:
-            oprot.writeFieldBegin('load_inventory', TType.STRUCT, 1)
-            self.load_inventory.write(oprot)
-            oprot.writeFieldEnd()
-        if self.create_inventory is not None:
-            oprot.writeFieldBegin('create_inventory', TType.STRUCT, 2)
-            self.create_inventory.write(oprot)
-            oprot.writeFieldEnd()
-        if self.save_inventory is not None:
-            oprot.writeFieldBegin('save_inventory', TType.STRUCT, 3)
-            self.save_inventory.write(oprot)
-            oprot.writeFieldEnd()
-        if self.split_stack is not None:
-            oprot.writeFieldBegin('split_stack', TType.STRUCT, 4)
-            self.split_stack.write(oprot)
-            oprot.writeFieldEnd()
-        if self.transfer_item is not None:
-            oprot.writeFieldBegin('transfer_item', TType.STRUCT, 5)
-            self.transfer_item.write(oprot)
+        oprot.writeStructBegin('ListCraftingJobsRequestData')
+        if self.inventory_id is not None:
+            oprot.writeFieldBegin('inventory_id', TType.I64, 1)
+            oprot.writeI64(self.inventory_id)
             oprot.writeFieldEnd()
-        if self.list_inventory is not None:
-            oprot.writeFieldBegin('list_inventory', TType.STRUCT, 6)
-            self.list_inventory.write(oprot)
+        if self.pending_only is not None:
+            oprot.writeFieldBegin('pending_only', TType.BOOL, 2)
+            oprot.writeBool(self.pending_only)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2934,17 +3281,23 @@ class InventoryResponseData(object):
         return not (self == other)
 
 
-class InventoryRequest(object):
+class BreakdownItemRequestData(object):
     """
     Attributes:
-     - data
+     - inventory_id
+     - item_id
+     - quantity
+     - to_raw_materials
 
     """
     thrift_spec = None
 
 
-    def __init__(self, data = None,):
-        self.data = data
+    def __init__(self, inventory_id = None, item_id = None, quantity = 1.0000000000000000, to_raw_materials = False,):
+        self.inventory_id = inventory_id
+        self.item_id = item_id
+        self.quantity = quantity
+        self.to_raw_materials = to_raw_materials
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -2956,9 +3309,23 @@ class InventoryRequest(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.data = InventoryRequestData()
-                    self.data.read(iprot)
+                if ftype == TType.I64:
+                    self.inventory_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.DOUBLE:
+                    self.quantity = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.BOOL:
+                    self.to_raw_materials = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -2971,10 +3338,22 @@ class InventoryRequest(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('InventoryRequest')
-        if self.data is not None:
-            oprot.writeFieldBegin('data', TType.STRUCT, 1)
-            self.data.write(oprot)
+        oprot.writeStructBegin('BreakdownItemRequestData')
+        if self.inventory_id is not None:
+            oprot.writeFieldBegin('inventory_id', TType.I64, 1)
+            oprot.writeI64(self.inventory_id)
+            oprot.writeFieldEnd()
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 2)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        if self.quantity is not None:
+            oprot.writeFieldBegin('quantity', TType.DOUBLE, 3)
+            oprot.writeDouble(self.quantity)
+            oprot.writeFieldEnd()
+        if self.to_raw_materials is not None:
+            oprot.writeFieldBegin('to_raw_materials', TType.BOOL, 4)
+            oprot.writeBool(self.to_raw_materials)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -2994,19 +3373,25 @@ class InventoryRequest(object):
         return not (self == other)
 
 
-class InventoryResponse(object):
+class SetItemAttributesRequestData(object):
     """
     Attributes:
-     - results
-     - response_data
+     - inventory_id
+     - item_id
+     - mobile_item_id
+     - attributes
+     - quantity
 
     """
     thrift_spec = None
 
 
-    def __init__(self, results = None, response_data = None,):
-        self.results = results
-        self.response_data = response_data
+    def __init__(self, inventory_id = None, item_id = None, mobile_item_id = None, attributes = None, quantity = 1.0000000000000000,):
+        self.inventory_id = inventory_id
+        self.item_id = item_id
+        self.mobile_item_id = mobile_item_id
+        self.attributes = attributes
+        self.quantity = quantity
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3018,20 +3403,34 @@ class InventoryResponse(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.LIST:
-                    self.results = []
-                    (_etype74, _size71) = iprot.readListBegin()
-                    for _i75 in range(_size71):
-                        _elem76 = GameResult()
-                        _elem76.read(iprot)
-                        self.results.append(_elem76)
-                    iprot.readListEnd()
+                if ftype == TType.I64:
+                    self.inventory_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.response_data = InventoryResponseData()
-                    self.response_data.read(iprot)
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.mobile_item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.LIST:
+                    self.attributes = []
+                    (_etype104, _size101) = iprot.readListBegin()
+                    for _i105 in range(_size101):
+                        _elem106 = Attribute()
+                        _elem106.read(iprot)
+                        self.attributes.append(_elem106)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.DOUBLE:
+                    self.quantity = iprot.readDouble()
                 else:
                     iprot.skip(ftype)
             else:
@@ -3044,17 +3443,29 @@ class InventoryResponse(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('InventoryResponse')
-        if self.results is not None:
-            oprot.writeFieldBegin('results', TType.LIST, 1)
-            oprot.writeListBegin(TType.STRUCT, len(self.results))
-            for iter77 in self.results:
-                iter77.write(oprot)
+        oprot.writeStructBegin('SetItemAttributesRequestData')
+        if self.inventory_id is not None:
+            oprot.writeFieldBegin('inventory_id', TType.I64, 1)
+            oprot.writeI64(self.inventory_id)
+            oprot.writeFieldEnd()
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 2)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        if self.mobile_item_id is not None:
+            oprot.writeFieldBegin('mobile_item_id', TType.I64, 3)
+            oprot.writeI64(self.mobile_item_id)
+            oprot.writeFieldEnd()
+        if self.attributes is not None:
+            oprot.writeFieldBegin('attributes', TType.LIST, 4)
+            oprot.writeListBegin(TType.STRUCT, len(self.attributes))
+            for iter107 in self.attributes:
+                iter107.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
-        if self.response_data is not None:
-            oprot.writeFieldBegin('response_data', TType.STRUCT, 2)
-            self.response_data.write(oprot)
+        if self.quantity is not None:
+            oprot.writeFieldBegin('quantity', TType.DOUBLE, 5)
+            oprot.writeDouble(self.quantity)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3074,17 +3485,19 @@ class InventoryResponse(object):
         return not (self == other)
 
 
-class CreateItemRequestData(object):
+class SalvageContainersRequestData(object):
     """
     Attributes:
-     - item
+     - inventory_ids
+     - to_raw_materials
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item = None,):
-        self.item = item
+    def __init__(self, inventory_ids = None, to_raw_materials = False,):
+        self.inventory_ids = inventory_ids
+        self.to_raw_materials = to_raw_materials
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3096,9 +3509,18 @@ class CreateItemRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.item = Item()
-                    self.item.read(iprot)
+                if ftype == TType.LIST:
+                    self.inventory_ids = []
+                    (_etype111, _size108) = iprot.readListBegin()
+                    for _i112 in range(_size108):
+                        _elem113 = iprot.readI64()
+                        self.inventory_ids.append(_elem113)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.BOOL:
+                    self.to_raw_materials = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -3111,10 +3533,17 @@ class CreateItemRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('CreateItemRequestData')
-        if self.item is not None:
-            oprot.writeFieldBegin('item', TType.STRUCT, 1)
-            self.item.write(oprot)
+        oprot.writeStructBegin('SalvageContainersRequestData')
+        if self.inventory_ids is not None:
+            oprot.writeFieldBegin('inventory_ids', TType.LIST, 1)
+            oprot.writeListBegin(TType.I64, len(self.inventory_ids))
+            for iter114 in self.inventory_ids:
+                oprot.writeI64(iter114)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.to_raw_materials is not None:
+            oprot.writeFieldBegin('to_raw_materials', TType.BOOL, 2)
+            oprot.writeBool(self.to_raw_materials)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3134,19 +3563,19 @@ class CreateItemRequestData(object):
         return not (self == other)
 
 
-class LoadItemRequestData(object):
+class OwnerCraftableRequestData(object):
     """
     Attributes:
-     - item_id
-     - backing_table
+     - owner
+     - item_ids
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item_id = None, backing_table = None,):
-        self.item_id = item_id
-        self.backing_table = backing_table
+    def __init__(self, owner = None, item_ids = None,):
+        self.owner = owner
+        self.item_ids = item_ids
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3158,13 +3587,19 @@ class LoadItemRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.item_id = iprot.readI64()
+                if ftype == TType.STRUCT:
+                    self.owner = Owner()
+                    self.owner.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.I32:
-                    self.backing_table = iprot.readI32()
+                if ftype == TType.LIST:
+                    self.item_ids = []
+                    (_etype118, _size115) = iprot.readListBegin()
+                    for _i119 in range(_size115):
+                        _elem120 = iprot.readI64()
+                        self.item_ids.append(_elem120)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -3177,14 +3612,17 @@ class LoadItemRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('LoadItemRequestData')
-        if self.item_id is not None:
-            oprot.writeFieldBegin('item_id', TType.I64, 1)
-            oprot.writeI64(self.item_id)
+        oprot.writeStructBegin('OwnerCraftableRequestData')
+        if self.owner is not None:
+            oprot.writeFieldBegin('owner', TType.STRUCT, 1)
+            self.owner.write(oprot)
             oprot.writeFieldEnd()
-        if self.backing_table is not None:
-            oprot.writeFieldBegin('backing_table', TType.I32, 2)
-            oprot.writeI32(self.backing_table)
+        if self.item_ids is not None:
+            oprot.writeFieldBegin('item_ids', TType.LIST, 2)
+            oprot.writeListBegin(TType.I64, len(self.item_ids))
+            for iter121 in self.item_ids:
+                oprot.writeI64(iter121)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3204,17 +3642,17 @@ class LoadItemRequestData(object):
         return not (self == other)
 
 
-class SaveItemRequestData(object):
+class LoadInventoryResponseData(object):
     """
     Attributes:
-     - item
+     - inventory
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item = None,):
-        self.item = item
+    def __init__(self, inventory = None,):
+        self.inventory = inventory
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3227,8 +3665,8 @@ class SaveItemRequestData(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.item = Item()
-                    self.item.read(iprot)
+                    self.inventory = Inventory()
+                    self.inventory.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -3241,10 +3679,10 @@ class SaveItemRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('SaveItemRequestData')
-        if self.item is not None:
-            oprot.writeFieldBegin('item', TType.STRUCT, 1)
-            self.item.write(oprot)
+        oprot.writeStructBegin('LoadInventoryResponseData')
+        if self.inventory is not None:
+            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
+            self.inventory.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3264,17 +3702,17 @@ class SaveItemRequestData(object):
         return not (self == other)
 
 
-class DestroyItemRequestData(object):
+class CreateInventoryResponseData(object):
     """
     Attributes:
-     - item_id
+     - inventory
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item_id = None,):
-        self.item_id = item_id
+    def __init__(self, inventory = None,):
+        self.inventory = inventory
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3286,8 +3724,9 @@ class DestroyItemRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.item_id = iprot.readI64()
+                if ftype == TType.STRUCT:
+                    self.inventory = Inventory()
+                    self.inventory.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -3300,10 +3739,10 @@ class DestroyItemRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('DestroyItemRequestData')
-        if self.item_id is not None:
-            oprot.writeFieldBegin('item_id', TType.I64, 1)
-            oprot.writeI64(self.item_id)
+        oprot.writeStructBegin('CreateInventoryResponseData')
+        if self.inventory is not None:
+            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
+            self.inventory.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3323,21 +3762,17 @@ class DestroyItemRequestData(object):
         return not (self == other)
 
 
-class ListItemRequestData(object):
+class SaveInventoryResponseData(object):
     """
     Attributes:
-     - page
-     - results_per_page
-     - search_string
+     - inventory
 
     """
     thrift_spec = None
 
 
-    def __init__(self, page = None, results_per_page = None, search_string = None,):
-        self.page = page
-        self.results_per_page = results_per_page
-        self.search_string = search_string
+    def __init__(self, inventory = None,):
+        self.inventory = inventory
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3349,18 +3784,9 @@ class ListItemRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I32:
-                    self.page = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.I32:
-                    self.results_per_page = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.search_string = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.STRUCT:
+                    self.inventory = Inventory()
+                    self.inventory.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -3373,18 +3799,10 @@ class ListItemRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ListItemRequestData')
-        if self.page is not None:
-            oprot.writeFieldBegin('page', TType.I32, 1)
-            oprot.writeI32(self.page)
-            oprot.writeFieldEnd()
-        if self.results_per_page is not None:
-            oprot.writeFieldBegin('results_per_page', TType.I32, 2)
-            oprot.writeI32(self.results_per_page)
-            oprot.writeFieldEnd()
-        if self.search_string is not None:
-            oprot.writeFieldBegin('search_string', TType.STRING, 3)
-            oprot.writeString(self.search_string.encode('utf-8') if sys.version_info[0] == 2 else self.search_string)
+        oprot.writeStructBegin('SaveInventoryResponseData')
+        if self.inventory is not None:
+            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
+            self.inventory.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3404,19 +3822,17 @@ class ListItemRequestData(object):
         return not (self == other)
 
 
-class AutocompleteItemRequestData(object):
+class SplitStackResponseData(object):
     """
     Attributes:
-     - search_string
-     - max_results
+     - inventory
 
     """
     thrift_spec = None
 
 
-    def __init__(self, search_string = None, max_results = 10,):
-        self.search_string = search_string
-        self.max_results = max_results
+    def __init__(self, inventory = None,):
+        self.inventory = inventory
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3428,13 +3844,9 @@ class AutocompleteItemRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.search_string = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.I32:
-                    self.max_results = iprot.readI32()
+                if ftype == TType.STRUCT:
+                    self.inventory = Inventory()
+                    self.inventory.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -3447,14 +3859,10 @@ class AutocompleteItemRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('AutocompleteItemRequestData')
-        if self.search_string is not None:
-            oprot.writeFieldBegin('search_string', TType.STRING, 1)
-            oprot.writeString(self.search_string.encode('utf-8') if sys.version_info[0] == 2 else self.search_string)
-            oprot.writeFieldEnd()
-        if self.max_results is not None:
-            oprot.writeFieldBegin('max_results', TType.I32, 2)
-            oprot.writeI32(self.max_results)
+        oprot.writeStructBegin('SplitStackResponseData')
+        if self.inventory is not None:
+            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
+            self.inventory.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3474,19 +3882,19 @@ class AutocompleteItemRequestData(object):
         return not (self == other)
 
 
-class LoadItemWithBlueprintTreeRequestData(object):
+class TransferItemResponseData(object):
     """
     Attributes:
-     - item_id
-     - max_depth
+     - source_inventory
+     - destination_inventory
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item_id = None, max_depth = 10,):
-        self.item_id = item_id
-        self.max_depth = max_depth
+    def __init__(self, source_inventory = None, destination_inventory = None,):
+        self.source_inventory = source_inventory
+        self.destination_inventory = destination_inventory
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3498,13 +3906,15 @@ class LoadItemWithBlueprintTreeRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.item_id = iprot.readI64()
+                if ftype == TType.STRUCT:
+                    self.source_inventory = Inventory()
+                    self.source_inventory.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.I32:
-                    self.max_depth = iprot.readI32()
+                if ftype == TType.STRUCT:
+                    self.destination_inventory = Inventory()
+                    self.destination_inventory.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -3517,14 +3927,14 @@ class LoadItemWithBlueprintTreeRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('LoadItemWithBlueprintTreeRequestData')
-        if self.item_id is not None:
-            oprot.writeFieldBegin('item_id', TType.I64, 1)
-            oprot.writeI64(self.item_id)
+        oprot.writeStructBegin('TransferItemResponseData')
+        if self.source_inventory is not None:
+            oprot.writeFieldBegin('source_inventory', TType.STRUCT, 1)
+            self.source_inventory.write(oprot)
             oprot.writeFieldEnd()
-        if self.max_depth is not None:
-            oprot.writeFieldBegin('max_depth', TType.I32, 2)
-            oprot.writeI32(self.max_depth)
+        if self.destination_inventory is not None:
+            oprot.writeFieldBegin('destination_inventory', TType.STRUCT, 2)
+            self.destination_inventory.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3544,17 +3954,19 @@ class LoadItemWithBlueprintTreeRequestData(object):
         return not (self == other)
 
 
-class CreateItemResponseData(object):
+class ListInventoryResponseData(object):
     """
     Attributes:
-     - item
+     - inventories
+     - total_count
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item = None,):
-        self.item = item
+    def __init__(self, inventories = None, total_count = None,):
+        self.inventories = inventories
+        self.total_count = total_count
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3566,25 +3978,42 @@ class CreateItemResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.item = Item()
-                    self.item.read(iprot)
+                if ftype == TType.LIST:
+                    self.inventories = []
+                    (_etype125, _size122) = iprot.readListBegin()
+                    for _i126 in range(_size122):
+                        _elem127 = Inventory()
+                        _elem127.read(iprot)
+                        self.inventories.append(_elem127)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.total_count = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
 
     def write(self, oprot):
         self.validate()
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('CreateItemResponseData')
-        if self.item is not None:
-            oprot.writeFieldBegin('item', TType.STRUCT, 1)
-            self.item.write(oprot)
+        oprot.writeStructBegin('ListInventoryResponseData')
+        if self.inventories is not None:
+            oprot.writeFieldBegin('inventories', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.inventories))
+            for iter128 in self.inventories:
+                iter128.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.total_count is not None:
+            oprot.writeFieldBegin('total_count', TType.I64, 2)
+            oprot.writeI64(self.total_count)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3604,17 +4033,19 @@ class CreateItemResponseData(object):
         return not (self == other)
 
 
-class LoadItemResponseData(object):
+class LoadManyInventoriesResponseData(object):
     """
     Attributes:
-     - item
+     - inventories
+     - errors
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item = None,):
-        self.item = item
+    def __init__(self, inventories = None, errors = None,):
+        self.inventories = inventories
+        self.errors = errors
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3626,9 +4057,27 @@ class LoadItemResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.item = Item()
-                    self.item.read(iprot)
+                if ftype == TType.MAP:
+                    self.inventories = {}
+                    (_ktype130, _vtype131, _size129) = iprot.readMapBegin()
+                    for _i133 in range(_size129):
+                        _key134 = iprot.readI64()
+                        _val135 = Inventory()
+                        _val135.read(iprot)
+                        self.inventories[_key134] = _val135
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.errors = {}
+                    (_ktype137, _vtype138, _size136) = iprot.readMapBegin()
+                    for _i140 in range(_size136):
+                        _key141 = iprot.readI64()
+                        _val142 = GameResult()
+                        _val142.read(iprot)
+                        self.errors[_key141] = _val142
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -3641,10 +4090,22 @@ class LoadItemResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('LoadItemResponseData')
-        if self.item is not None:
-            oprot.writeFieldBegin('item', TType.STRUCT, 1)
-            self.item.write(oprot)
+        oprot.writeStructBegin('LoadManyInventoriesResponseData')
+        if self.inventories is not None:
+            oprot.writeFieldBegin('inventories', TType.MAP, 1)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.inventories))
+            for kiter143, viter144 in self.inventories.items():
+                oprot.writeI64(kiter143)
+                viter144.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.errors is not None:
+            oprot.writeFieldBegin('errors', TType.MAP, 2)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.errors))
+            for kiter145, viter146 in self.errors.items():
+                oprot.writeI64(kiter145)
+                viter146.write(oprot)
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3664,17 +4125,17 @@ class LoadItemResponseData(object):
         return not (self == other)
 
 
-class SaveItemResponseData(object):
+class OwnerItemTotalsResponseData(object):
     """
     Attributes:
-     - item
+     - quantities
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item = None,):
-        self.item = item
+    def __init__(self, quantities = None,):
+        self.quantities = quantities
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3686,9 +4147,14 @@ class SaveItemResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.item = Item()
-                    self.item.read(iprot)
+                if ftype == TType.MAP:
+                    self.quantities = {}
+                    (_ktype148, _vtype149, _size147) = iprot.readMapBegin()
+                    for _i151 in range(_size147):
+                        _key152 = iprot.readI64()
+                        _val153 = iprot.readDouble()
+                        self.quantities[_key152] = _val153
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -3701,10 +4167,14 @@ class SaveItemResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('SaveItemResponseData')
-        if self.item is not None:
-            oprot.writeFieldBegin('item', TType.STRUCT, 1)
-            self.item.write(oprot)
+        oprot.writeStructBegin('OwnerItemTotalsResponseData')
+        if self.quantities is not None:
+            oprot.writeFieldBegin('quantities', TType.MAP, 1)
+            oprot.writeMapBegin(TType.I64, TType.DOUBLE, len(self.quantities))
+            for kiter154, viter155 in self.quantities.items():
+                oprot.writeI64(kiter154)
+                oprot.writeDouble(viter155)
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3724,17 +4194,23 @@ class SaveItemResponseData(object):
         return not (self == other)
 
 
-class DestroyItemResponseData(object):
+class InventoryCapacity(object):
     """
     Attributes:
-     - item_id
+     - inventory_id
+     - used_entries
+     - free_entries
+     - free_volume
 
     """
     thrift_spec = None
 
 
-    def __init__(self, item_id = None,):
-        self.item_id = item_id
+    def __init__(self, inventory_id = None, used_entries = None, free_entries = None, free_volume = None,):
+        self.inventory_id = inventory_id
+        self.used_entries = used_entries
+        self.free_entries = free_entries
+        self.free_volume = free_volume
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3747,7 +4223,22 @@ class DestroyItemResponseData(object):
                 break
             if fid == 1:
                 if ftype == TType.I64:
-                    self.item_id = iprot.readI64()
+                    self.inventory_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.used_entries = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.free_entries = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.DOUBLE:
+                    self.free_volume = iprot.readDouble()
                 else:
                     iprot.skip(ftype)
             else:
@@ -3760,10 +4251,22 @@ class DestroyItemResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('DestroyItemResponseData')
-        if self.item_id is not None:
-            oprot.writeFieldBegin('item_id', TType.I64, 1)
-            oprot.writeI64(self.item_id)
+        oprot.writeStructBegin('InventoryCapacity')
+        if self.inventory_id is not None:
+            oprot.writeFieldBegin('inventory_id', TType.I64, 1)
+            oprot.writeI64(self.inventory_id)
+            oprot.writeFieldEnd()
+        if self.used_entries is not None:
+            oprot.writeFieldBegin('used_entries', TType.I32, 2)
+            oprot.writeI32(self.used_entries)
+            oprot.writeFieldEnd()
+        if self.free_entries is not None:
+            oprot.writeFieldBegin('free_entries', TType.I32, 3)
+            oprot.writeI32(self.free_entries)
+            oprot.writeFieldEnd()
+        if self.free_volume is not None:
+            oprot.writeFieldBegin('free_volume', TType.DOUBLE, 4)
+            oprot.writeDouble(self.free_volume)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3783,19 +4286,17 @@ class DestroyItemResponseData(object):
         return not (self == other)
 
 
-class ListItemResponseData(object):
+class OwnerCapacityResponseData(object):
     """
     Attributes:
-     - items
-     - total_count
+     - inventories
 
     """
     thrift_spec = None
 
 
-    def __init__(self, items = None, total_count = None,):
-        self.items = items
-        self.total_count = total_count
+    def __init__(self, inventories = None,):
+        self.inventories = inventories
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3808,20 +4309,15 @@ class ListItemResponseData(object):
                 break
             if fid == 1:
                 if ftype == TType.LIST:
-                    self.items = []
-                    (_etype81, _size78) = iprot.readListBegin()
-                    for _i82 in range(_size78):
-                        _elem83 = Item()
-                        _elem83.read(iprot)
-                        self.items.append(_elem83)
+                    self.inventories = []
+                    (_etype159, _size156) = iprot.readListBegin()
+                    for _i160 in range(_size156):
+                        _elem161 = InventoryCapacity()
+                        _elem161.read(iprot)
+                        self.inventories.append(_elem161)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.I64:
-                    self.total_count = iprot.readI64()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -3832,18 +4328,14 @@ class ListItemResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ListItemResponseData')
-        if self.items is not None:
-            oprot.writeFieldBegin('items', TType.LIST, 1)
-            oprot.writeListBegin(TType.STRUCT, len(self.items))
-            for iter84 in self.items:
-                iter84.write(oprot)
+        oprot.writeStructBegin('OwnerCapacityResponseData')
+        if self.inventories is not None:
+            oprot.writeFieldBegin('inventories', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.inventories))
+            for iter162 in self.inventories:
+                iter162.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
-        if self.total_count is not None:
-            oprot.writeFieldBegin('total_count', TType.I64, 2)
-            oprot.writeI64(self.total_count)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -3862,19 +4354,17 @@ class ListItemResponseData(object):
         return not (self == other)
 
 
-class ItemAutocompleteResult(object):
+class OwnerHasItemsResponseData(object):
     """
     Attributes:
-     - id
-     - internal_name
+     - present
 
     """
     thrift_spec = None
 
 
-    def __init__(self, id = None, internal_name = None,):
-        self.id = id
-        self.internal_name = internal_name
+    def __init__(self, present = None,):
+        self.present = present
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3886,13 +4376,14 @@ class ItemAutocompleteResult(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.id = iprot.readI64()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.internal_name = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.MAP:
+                    self.present = {}
+                    (_ktype164, _vtype165, _size163) = iprot.readMapBegin()
+                    for _i167 in range(_size163):
+                        _key168 = iprot.readI64()
+                        _val169 = iprot.readBool()
+                        self.present[_key168] = _val169
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -3905,14 +4396,14 @@ class ItemAutocompleteResult(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ItemAutocompleteResult')
-        if self.id is not None:
-            oprot.writeFieldBegin('id', TType.I64, 1)
-            oprot.writeI64(self.id)
-            oprot.writeFieldEnd()
-        if self.internal_name is not None:
-            oprot.writeFieldBegin('internal_name', TType.STRING, 2)
-            oprot.writeString(self.internal_name.encode('utf-8') if sys.version_info[0] == 2 else self.internal_name)
+        oprot.writeStructBegin('OwnerHasItemsResponseData')
+        if self.present is not None:
+            oprot.writeFieldBegin('present', TType.MAP, 1)
+            oprot.writeMapBegin(TType.I64, TType.BOOL, len(self.present))
+            for kiter170, viter171 in self.present.items():
+                oprot.writeI64(kiter170)
+                oprot.writeBool(viter171)
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -3932,17 +4423,17 @@ class ItemAutocompleteResult(object):
         return not (self == other)
 
 
-class AutocompleteItemResponseData(object):
+class StartCraftingResponseData(object):
     """
     Attributes:
-     - results
+     - job
 
     """
     thrift_spec = None
 
 
-    def __init__(self, results = None,):
-        self.results = results
+    def __init__(self, job = None,):
+        self.job = job
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3954,14 +4445,9 @@ class AutocompleteItemResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.LIST:
-                    self.results = []
-                    (_etype88, _size85) = iprot.readListBegin()
-                    for _i89 in range(_size85):
-                        _elem90 = ItemAutocompleteResult()
-                        _elem90.read(iprot)
-                        self.results.append(_elem90)
-                    iprot.readListEnd()
+                if ftype == TType.STRUCT:
+                    self.job = CraftingJob()
+                    self.job.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -3974,13 +4460,10 @@ class AutocompleteItemResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('AutocompleteItemResponseData')
-        if self.results is not None:
-            oprot.writeFieldBegin('results', TType.LIST, 1)
-            oprot.writeListBegin(TType.STRUCT, len(self.results))
-            for iter91 in self.results:
-                iter91.write(oprot)
-            oprot.writeListEnd()
+        oprot.writeStructBegin('StartCraftingResponseData')
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRUCT, 1)
+            self.job.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4000,17 +4483,19 @@ class AutocompleteItemResponseData(object):
         return not (self == other)
 
 
-class LoadItemWithBlueprintTreeResponseData(object):
+class CancelCraftingResponseData(object):
     """
     Attributes:
-     - tree
+     - job_id
+     - cancelled
 
     """
     thrift_spec = None
 
 
-    def __init__(self, tree = None,):
-        self.tree = tree
+    def __init__(self, job_id = None, cancelled = None,):
+        self.job_id = job_id
+        self.cancelled = cancelled
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4022,9 +4507,13 @@ class LoadItemWithBlueprintTreeResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.tree = BlueprintTreeNode()
-                    self.tree.read(iprot)
+                if ftype == TType.I64:
+                    self.job_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.BOOL:
+                    self.cancelled = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4037,10 +4526,14 @@ class LoadItemWithBlueprintTreeResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('LoadItemWithBlueprintTreeResponseData')
-        if self.tree is not None:
-            oprot.writeFieldBegin('tree', TType.STRUCT, 1)
-            self.tree.write(oprot)
+        oprot.writeStructBegin('CancelCraftingResponseData')
+        if self.job_id is not None:
+            oprot.writeFieldBegin('job_id', TType.I64, 1)
+            oprot.writeI64(self.job_id)
+            oprot.writeFieldEnd()
+        if self.cancelled is not None:
+            oprot.writeFieldBegin('cancelled', TType.BOOL, 2)
+            oprot.writeBool(self.cancelled)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4060,29 +4553,17 @@ class LoadItemWithBlueprintTreeResponseData(object):
         return not (self == other)
 
 
-class ItemRequestData(object):
+class ListCraftingJobsResponseData(object):
     """
     Attributes:
-     - create_item
-     - load_item
-     - save_item
-     - destroy_item
-     - list_item
-     - autocomplete_item
-     - load_with_blueprint_tree
+     - jobs
 
     """
     thrift_spec = None
 
 
-    def __init__(self, create_item = None, load_item = None, save_item = None, destroy_item = None, list_item = None, autocomplete_item = None, load_with_blueprint_tree = None,):
-        self.create_item = create_item
-        self.load_item = load_item
-        self.save_item = save_item
-        self.destroy_item = destroy_item
-        self.list_item = list_item
-        self.autocomplete_item = autocomplete_item
-        self.load_with_blueprint_tree = load_with_blueprint_tree
+    def __init__(self, jobs = None,):
+        self.jobs = jobs
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4094,45 +4575,14 @@ class ItemRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.create_item = CreateItemRequestData()
-                    self.create_item.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.load_item = LoadItemRequestData()
-                    self.load_item.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.save_item = SaveItemRequestData()
-                    self.save_item.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRUCT:
-                    self.destroy_item = DestroyItemRequestData()
-                    self.destroy_item.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRUCT:
-                    self.list_item = ListItemRequestData()
-                    self.list_item.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRUCT:
-                    self.autocomplete_item = AutocompleteItemRequestData()
-                    self.autocomplete_item.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.STRUCT:
-                    self.load_with_blueprint_tree = LoadItemWithBlueprintTreeRequestData()
-                    self.load_with_blueprint_tree.read(iprot)
+                if ftype == TType.LIST:
+                    self.jobs = []
+                    (_etype175, _size172) = iprot.readListBegin()
+                    for _i176 in range(_size172):
+                        _elem177 = CraftingJob()
+                        _elem177.read(iprot)
+                        self.jobs.append(_elem177)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4145,34 +4595,2852 @@ class ItemRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ItemRequestData')
-        if self.create_item is not None:
-            oprot.writeFieldBegin('create_item', TType.STRUCT, 1)
-            self.create_item.write(oprot)
-            oprot.writeFieldEnd()
-        if self.load_item is not None:
-            oprot.writeFieldBegin('load_item', TType.STRUCT, 2)
-            self.load_item.write(oprot)
-            oprot.writeFieldEnd()
-        if self.save_item is not None:
-            oprot.writeFieldBegin('save_item', TType.STRUCT, 3)
-            self.save_item.write(oprot)
-            oprot.writeFieldEnd()
-        if self.destroy_item is not None:
-            oprot.writeFieldBegin('destroy_item', TType.STRUCT, 4)
-            self.destroy_item.write(oprot)
-            oprot.writeFieldEnd()
-        if self.list_item is not None:
-            oprot.writeFieldBegin('list_item', TType.STRUCT, 5)
-            self.list_item.write(oprot)
-            oprot.writeFieldEnd()
-        if self.autocomplete_item is not None:
-            oprot.writeFieldBegin('autocomplete_item', TType.STRUCT, 6)
-            self.autocomplete_item.write(oprot)
-            oprot.writeFieldEnd()
-        if self.load_with_blueprint_tree is not None:
-            oprot.writeFieldBegin('load_with_blueprint_tree', TType.STRUCT, 7)
-            self.load_with_blueprint_tree.write(oprot)
+        oprot.writeStructBegin('ListCraftingJobsResponseData')
+        if self.jobs is not None:
+            oprot.writeFieldBegin('jobs', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.jobs))
+            for iter178 in self.jobs:
+                iter178.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SetItemAttributesResponseData(object):
+    """
+    Attributes:
+     - mobile_item_id
+     - materialized
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, mobile_item_id = None, materialized = None,):
+        self.mobile_item_id = mobile_item_id
+        self.materialized = materialized
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.mobile_item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.BOOL:
+                    self.materialized = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('SetItemAttributesResponseData')
+        if self.mobile_item_id is not None:
+            oprot.writeFieldBegin('mobile_item_id', TType.I64, 1)
+            oprot.writeI64(self.mobile_item_id)
+            oprot.writeFieldEnd()
+        if self.materialized is not None:
+            oprot.writeFieldBegin('materialized', TType.BOOL, 2)
+            oprot.writeBool(self.materialized)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class BreakdownItemResponseData(object):
+    """
+    Attributes:
+     - inventory
+     - produced
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, inventory = None, produced = None,):
+        self.inventory = inventory
+        self.produced = produced
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.inventory = Inventory()
+                    self.inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.produced = {}
+                    (_ktype180, _vtype181, _size179) = iprot.readMapBegin()
+                    for _i183 in range(_size179):
+                        _key184 = iprot.readI64()
+                        _val185 = iprot.readDouble()
+                        self.produced[_key184] = _val185
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('BreakdownItemResponseData')
+        if self.inventory is not None:
+            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
+            self.inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.produced is not None:
+            oprot.writeFieldBegin('produced', TType.MAP, 2)
+            oprot.writeMapBegin(TType.I64, TType.DOUBLE, len(self.produced))
+            for kiter186, viter187 in self.produced.items():
+                oprot.writeI64(kiter186)
+                oprot.writeDouble(viter187)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SalvageContainersResponseData(object):
+    """
+    Attributes:
+     - inventories
+     - consumed
+     - produced
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, inventories = None, consumed = None, produced = None,):
+        self.inventories = inventories
+        self.consumed = consumed
+        self.produced = produced
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.inventories = []
+                    (_etype191, _size188) = iprot.readListBegin()
+                    for _i192 in range(_size188):
+                        _elem193 = Inventory()
+                        _elem193.read(iprot)
+                        self.inventories.append(_elem193)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.consumed = {}
+                    (_ktype195, _vtype196, _size194) = iprot.readMapBegin()
+                    for _i198 in range(_size194):
+                        _key199 = iprot.readI64()
+                        _val200 = iprot.readDouble()
+                        self.consumed[_key199] = _val200
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.MAP:
+                    self.produced = {}
+                    (_ktype202, _vtype203, _size201) = iprot.readMapBegin()
+                    for _i205 in range(_size201):
+                        _key206 = iprot.readI64()
+                        _val207 = iprot.readDouble()
+                        self.produced[_key206] = _val207
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('SalvageContainersResponseData')
+        if self.inventories is not None:
+            oprot.writeFieldBegin('inventories', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.inventories))
+            for iter208 in self.inventories:
+                iter208.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.consumed is not None:
+            oprot.writeFieldBegin('consumed', TType.MAP, 2)
+            oprot.writeMapBegin(TType.I64, TType.DOUBLE, len(self.consumed))
+            for kiter209, viter210 in self.consumed.items():
+                oprot.writeI64(kiter209)
+                oprot.writeDouble(viter210)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.produced is not None:
+            oprot.writeFieldBegin('produced', TType.MAP, 3)
+            oprot.writeMapBegin(TType.I64, TType.DOUBLE, len(self.produced))
+            for kiter211, viter212 in self.produced.items():
+                oprot.writeI64(kiter211)
+                oprot.writeDouble(viter212)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class OwnerCraftableResponseData(object):
+    """
+    Attributes:
+     - craftable
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, craftable = None,):
+        self.craftable = craftable
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.MAP:
+                    self.craftable = {}
+                    (_ktype214, _vtype215, _size213) = iprot.readMapBegin()
+                    for _i217 in range(_size213):
+                        _key218 = iprot.readI64()
+                        _val219 = iprot.readI64()
+                        self.craftable[_key218] = _val219
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('OwnerCraftableResponseData')
+        if self.craftable is not None:
+            oprot.writeFieldBegin('craftable', TType.MAP, 1)
+            oprot.writeMapBegin(TType.I64, TType.I64, len(self.craftable))
+            for kiter220, viter221 in self.craftable.items():
+                oprot.writeI64(kiter220)
+                oprot.writeI64(viter221)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ContainerNode(object):
+    """
+    Attributes:
+     - inventory
+     - parent_inventory_id
+     - depth
+     - contained_volume
+     - total_volume
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, inventory = None, parent_inventory_id = None, depth = None, contained_volume = None, total_volume = None,):
+        self.inventory = inventory
+        self.parent_inventory_id = parent_inventory_id
+        self.depth = depth
+        self.contained_volume = contained_volume
+        self.total_volume = total_volume
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.inventory = Inventory()
+                    self.inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.parent_inventory_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.depth = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.DOUBLE:
+                    self.contained_volume = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.DOUBLE:
+                    self.total_volume = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ContainerNode')
+        if self.inventory is not None:
+            oprot.writeFieldBegin('inventory', TType.STRUCT, 1)
+            self.inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.parent_inventory_id is not None:
+            oprot.writeFieldBegin('parent_inventory_id', TType.I64, 2)
+            oprot.writeI64(self.parent_inventory_id)
+            oprot.writeFieldEnd()
+        if self.depth is not None:
+            oprot.writeFieldBegin('depth', TType.I32, 3)
+            oprot.writeI32(self.depth)
+            oprot.writeFieldEnd()
+        if self.contained_volume is not None:
+            oprot.writeFieldBegin('contained_volume', TType.DOUBLE, 4)
+            oprot.writeDouble(self.contained_volume)
+            oprot.writeFieldEnd()
+        if self.total_volume is not None:
+            oprot.writeFieldBegin('total_volume', TType.DOUBLE, 5)
+            oprot.writeDouble(self.total_volume)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadContainerTreeResponseData(object):
+    """
+    Attributes:
+     - nodes
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, nodes = None,):
+        self.nodes = nodes
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.nodes = []
+                    (_etype225, _size222) = iprot.readListBegin()
+                    for _i226 in range(_size222):
+                        _elem227 = ContainerNode()
+                        _elem227.read(iprot)
+                        self.nodes.append(_elem227)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadContainerTreeResponseData')
+        if self.nodes is not None:
+            oprot.writeFieldBegin('nodes', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.nodes))
+            for iter228 in self.nodes:
+                iter228.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class InventoryRequestData(object):
+    """
+    Attributes:
+     - load_inventory
+     - create_inventory
+     - save_inventory
+     - split_stack
+     - transfer_item
+     - list_inventory
+     - load_many_inventories
+     - owner_item_totals
+     - owner_capacity
+     - owner_has_items
+     - load_container_tree
+     - owner_craftable
+     - start_crafting
+     - cancel_crafting
+     - list_crafting_jobs
+     - breakdown_item
+     - salvage_containers
+     - set_item_attributes
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, load_inventory = None, create_inventory = None, save_inventory = None, split_stack = None, transfer_item = None, list_inventory = None, load_many_inventories = None, owner_item_totals = None, owner_capacity = None, owner_has_items = None, load_container_tree = None, owner_craftable = None, start_crafting = None, cancel_crafting = None, list_crafting_jobs = None, breakdown_item = None, salvage_containers = None, set_item_attributes = None,):
+        self.load_inventory = load_inventory
+        self.create_inventory = create_inventory
+        self.save_inventory = save_inventory
+        self.split_stack = split_stack
+        self.transfer_item = transfer_item
+        self.list_inventory = list_inventory
+        self.load_many_inventories = load_many_inventories
+        self.owner_item_totals = owner_item_totals
+        self.owner_capacity = owner_capacity
+        self.owner_has_items = owner_has_items
+        self.load_container_tree = load_container_tree
+        self.owner_craftable = owner_craftable
+        self.start_crafting = start_crafting
+        self.cancel_crafting = cancel_crafting
+        self.list_crafting_jobs = list_crafting_jobs
+        self.breakdown_item = breakdown_item
+        self.salvage_containers = salvage_containers
+        self.set_item_attributes = set_item_attributes
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.load_inventory = LoadInventoryRequestData()
+                    self.load_inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.create_inventory = CreateInventoryRequestData()
+                    self.create_inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.save_inventory = SaveInventoryRequestData()
+                    self.save_inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.split_stack = SplitStackRequestData()
+                    self.split_stack.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.transfer_item = TransferItemRequestData()
+                    self.transfer_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.list_inventory = ListInventoryRequestData()
+                    self.list_inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.load_many_inventories = LoadManyInventoriesRequestData()
+                    self.load_many_inventories.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.STRUCT:
+                    self.owner_item_totals = OwnerItemTotalsRequestData()
+                    self.owner_item_totals.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.STRUCT:
+                    self.owner_capacity = OwnerCapacityRequestData()
+                    self.owner_capacity.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.STRUCT:
+                    self.owner_has_items = OwnerHasItemsRequestData()
+                    self.owner_has_items.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.STRUCT:
+                    self.load_container_tree = LoadContainerTreeRequestData()
+                    self.load_container_tree.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 12:
+                if ftype == TType.STRUCT:
+                    self.owner_craftable = OwnerCraftableRequestData()
+                    self.owner_craftable.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 13:
+                if ftype == TType.STRUCT:
+                    self.start_crafting = StartCraftingRequestData()
+                    self.start_crafting.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 14:
+                if ftype == TType.STRUCT:
+                    self.cancel_crafting = CancelCraftingRequestData()
+                    self.cancel_crafting.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 15:
+                if ftype == TType.STRUCT:
+                    self.list_crafting_jobs = ListCraftingJobsRequestData()
+                    self.list_crafting_jobs.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 16:
+                if ftype == TType.STRUCT:
+                    self.breakdown_item = BreakdownItemRequestData()
+                    self.breakdown_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 17:
+                if ftype == TType.STRUCT:
+                    self.salvage_containers = SalvageContainersRequestData()
+                    self.salvage_containers.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 18:
+                if ftype == TType.STRUCT:
+                    self.set_item_attributes = SetItemAttributesRequestData()
+                    self.set_item_attributes.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('InventoryRequestData')
+        if self.load_inventory is not None:
+            oprot.writeFieldBegin('load_inventory', TType.STRUCT, 1)
+            self.load_inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.create_inventory is not None:
+            oprot.writeFieldBegin('create_inventory', TType.STRUCT, 2)
+            self.create_inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.save_inventory is not None:
+            oprot.writeFieldBegin('save_inventory', TType.STRUCT, 3)
+            self.save_inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.split_stack is not None:
+            oprot.writeFieldBegin('split_stack', TType.STRUCT, 4)
+            self.split_stack.write(oprot)
+            oprot.writeFieldEnd()
+        if self.transfer_item is not None:
+            oprot.writeFieldBegin('transfer_item', TType.STRUCT, 5)
+            self.transfer_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.list_inventory is not None:
+            oprot.writeFieldBegin('list_inventory', TType.STRUCT, 6)
+            self.list_inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_many_inventories is not None:
+            oprot.writeFieldBegin('load_many_inventories', TType.STRUCT, 7)
+            self.load_many_inventories.write(oprot)
+            oprot.writeFieldEnd()
+        if self.owner_item_totals is not None:
+            oprot.writeFieldBegin('owner_item_totals', TType.STRUCT, 8)
+            self.owner_item_totals.write(oprot)
+            oprot.writeFieldEnd()
+        if self.owner_capacity is not None:
+            oprot.writeFieldBegin('owner_capacity', TType.STRUCT, 9)
+            self.owner_capacity.write(oprot)
+            oprot.writeFieldEnd()
+        if self.owner_has_items is not None:
+            oprot.writeFieldBegin('owner_has_items', TType.STRUCT, 10)
+            self.owner_has_items.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_container_tree is not None:
+            oprot.writeFieldBegin('load_container_tree', TType.STRUCT, 11)
+            self.load_container_tree.write(oprot)
+            oprot.writeFieldEnd()
+        if self.owner_craftable is not None:
+            oprot.writeFieldBegin('owner_craftable', TType.STRUCT, 12)
+            self.owner_craftable.write(oprot)
+            oprot.writeFieldEnd()
+        if self.start_crafting is not None:
+            oprot.writeFieldBegin('start_crafting', TType.STRUCT, 13)
+            self.start_crafting.write(oprot)
+            oprot.writeFieldEnd()
+        if self.cancel_crafting is not None:
+            oprot.writeFieldBegin('cancel_crafting', TType.STRUCT, 14)
+            self.cancel_crafting.write(oprot)
+            oprot.writeFieldEnd()
+        if self.list_crafting_jobs is not None:
+            oprot.writeFieldBegin('list_crafting_jobs', TType.STRUCT, 15)
+            self.list_crafting_jobs.write(oprot)
+            oprot.writeFieldEnd()
+        if self.breakdown_item is not None:
+            oprot.writeFieldBegin('breakdown_item', TType.STRUCT, 16)
+            self.breakdown_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.salvage_containers is not None:
+            oprot.writeFieldBegin('salvage_containers', TType.STRUCT, 17)
+            self.salvage_containers.write(oprot)
+            oprot.writeFieldEnd()
+        if self.set_item_attributes is not None:
+            oprot.writeFieldBegin('set_item_attributes', TType.STRUCT, 18)
+            self.set_item_attributes.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class InventoryResponseData(object):
+    """
+    Attributes:
+     - load_inventory
+     - create_inventory
+     - save_inventory
+     - split_stack
+     - transfer_item
+     - list_inventory
+     - load_many_inventories
+     - owner_item_totals
+     - owner_capacity
+     - owner_has_items
+     - load_container_tree
+     - owner_craftable
+     - start_crafting
+     - cancel_crafting
+     - list_crafting_jobs
+     - breakdown_item
+     - salvage_containers
+     - set_item_attributes
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, load_inventory = None, create_inventory = None, save_inventory = None, split_stack = None, transfer_item = None, list_inventory = None, load_many_inventories = None, owner_item_totals = None, owner_capacity = None, owner_has_items = None, load_container_tree = None, owner_craftable = None, start_crafting = None, cancel_crafting = None, list_crafting_jobs = None, breakdown_item = None, salvage_containers = None, set_item_attributes = None,):
+        self.load_inventory = load_inventory
+        self.create_inventory = create_inventory
+        self.save_inventory = save_inventory
+        self.split_stack = split_stack
+        self.transfer_item = transfer_item
+        self.list_inventory = list_inventory
+        self.load_many_inventories = load_many_inventories
+        self.owner_item_totals = owner_item_totals
+        self.owner_capacity = owner_capacity
+        self.owner_has_items = owner_has_items
+        self.load_container_tree = load_container_tree
+        self.owner_craftable = owner_craftable
+        self.start_crafting = start_crafting
+        self.cancel_crafting = cancel_crafting
+        self.list_crafting_jobs = list_crafting_jobs
+        self.breakdown_item = breakdown_item
+        self.salvage_containers = salvage_containers
+        self.set_item_attributes = set_item_attributes
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.load_inventory = LoadInventoryResponseData()
+                    self.load_inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.create_inventory = CreateInventoryResponseData()
+                    self.create_inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.save_inventory = SaveInventoryResponseData()
+                    self.save_inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.split_stack = SplitStackResponseData()
+                    self.split_stack.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.transfer_item = TransferItemResponseData()
+                    self.transfer_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.list_inventory = ListInventoryResponseData()
+                    self.list_inventory.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.load_many_inventories = LoadManyInventoriesResponseData()
+                    self.load_many_inventories.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.STRUCT:
+                    self.owner_item_totals = OwnerItemTotalsResponseData()
+                    self.owner_item_totals.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.STRUCT:
+                    self.owner_capacity = OwnerCapacityResponseData()
+                    self.owner_capacity.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.STRUCT:
+                    self.owner_has_items = OwnerHasItemsResponseData()
+                    self.owner_has_items.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.STRUCT:
+                    self.load_container_tree = LoadContainerTreeResponseData()
+                    self.load_container_tree.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 12:
+                if ftype == TType.STRUCT:
+                    self.owner_craftable = OwnerCraftableResponseData()
+                    self.owner_craftable.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 13:
+                if ftype == TType.STRUCT:
+                    self.start_crafting = StartCraftingResponseData()
+                    self.start_crafting.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 14:
+                if ftype == TType.STRUCT:
+                    self.cancel_crafting = CancelCraftingResponseData()
+                    self.cancel_crafting.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 15:
+                if ftype == TType.STRUCT:
+                    self.list_crafting_jobs = ListCraftingJobsResponseData()
+                    self.list_crafting_jobs.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 16:
+                if ftype == TType.STRUCT:
+                    self.breakdown_item = BreakdownItemResponseData()
+                    self.breakdown_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 17:
+                if ftype == TType.STRUCT:
+                    self.salvage_containers = SalvageContainersResponseData()
+                    self.salvage_containers.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 18:
+                if ftype == TType.STRUCT:
+                    self.set_item_attributes = SetItemAttributesResponseData()
+                    self.set_item_attributes.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('InventoryResponseData')
+        if self.load_inventory is not None:
+            oprot.writeFieldBegin('load_inventory', TType.STRUCT, 1)
+            self.load_inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.create_inventory is not None:
+            oprot.writeFieldBegin('create_inventory', TType.STRUCT, 2)
+            self.create_inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.save_inventory is not None:
+            oprot.writeFieldBegin('save_inventory', TType.STRUCT, 3)
+            self.save_inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.split_stack is not None:
+            oprot.writeFieldBegin('split_stack', TType.STRUCT, 4)
+            self.split_stack.write(oprot)
+            oprot.writeFieldEnd()
+        if self.transfer_item is not None:
+            oprot.writeFieldBegin('transfer_item', TType.STRUCT, 5)
+            self.transfer_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.list_inventory is not None:
+            oprot.writeFieldBegin('list_inventory', TType.STRUCT, 6)
+            self.list_inventory.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_many_inventories is not None:
+            oprot.writeFieldBegin('load_many_inventories', TType.STRUCT, 7)
+            self.load_many_inventories.write(oprot)
+            oprot.writeFieldEnd()
+        if self.owner_item_totals is not None:
+            oprot.writeFieldBegin('owner_item_totals', TType.STRUCT, 8)
+            self.owner_item_totals.write(oprot)
+            oprot.writeFieldEnd()
+        if self.owner_capacity is not None:
+            oprot.writeFieldBegin('owner_capacity', TType.STRUCT, 9)
+            self.owner_capacity.write(oprot)
+            oprot.writeFieldEnd()
+        if self.owner_has_items is not None:
+            oprot.writeFieldBegin('owner_has_items', TType.STRUCT, 10)
+            self.owner_has_items.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_container_tree is not None:
+            oprot.writeFieldBegin('load_container_tree', TType.STRUCT, 11)
+            self.load_container_tree.write(oprot)
+            oprot.writeFieldEnd()
+        if self.owner_craftable is not None:
+            oprot.writeFieldBegin('owner_craftable', TType.STRUCT, 12)
+            self.owner_craftable.write(oprot)
+            oprot.writeFieldEnd()
+        if self.start_crafting is not None:
+            oprot.writeFieldBegin('start_crafting', TType.STRUCT, 13)
+            self.start_crafting.write(oprot)
+            oprot.writeFieldEnd()
+        if self.cancel_crafting is not None:
+            oprot.writeFieldBegin('cancel_crafting', TType.STRUCT, 14)
+            self.cancel_crafting.write(oprot)
+            oprot.writeFieldEnd()
+        if self.list_crafting_jobs is not None:
+            oprot.writeFieldBegin('list_crafting_jobs', TType.STRUCT, 15)
+            self.list_crafting_jobs.write(oprot)
+            oprot.writeFieldEnd()
+        if self.breakdown_item is not None:
+            oprot.writeFieldBegin('breakdown_item', TType.STRUCT, 16)
+            self.breakdown_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.salvage_containers is not None:
+            oprot.writeFieldBegin('salvage_containers', TType.STRUCT, 17)
+            self.salvage_containers.write(oprot)
+            oprot.writeFieldEnd()
+        if self.set_item_attributes is not None:
+            oprot.writeFieldBegin('set_item_attributes', TType.STRUCT, 18)
+            self.set_item_attributes.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class InventoryRequest(object):
+    """
+    Attributes:
+     - data
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, data = None,):
+        self.data = data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.data = InventoryRequestData()
+                    self.data.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('InventoryRequest')
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRUCT, 1)
+            self.data.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class InventoryResponse(object):
+    """
+    Attributes:
+     - results
+     - response_data
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, results = None, response_data = None,):
+        self.results = results
+        self.response_data = response_data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.results = []
+                    (_etype232, _size229) = iprot.readListBegin()
+                    for _i233 in range(_size229):
+                        _elem234 = GameResult()
+                        _elem234.read(iprot)
+                        self.results.append(_elem234)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.response_data = InventoryResponseData()
+                    self.response_data.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('InventoryResponse')
+        if self.results is not None:
+            oprot.writeFieldBegin('results', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.results))
+            for iter235 in self.results:
+                iter235.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.response_data is not None:
+            oprot.writeFieldBegin('response_data', TType.STRUCT, 2)
+            self.response_data.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class CreateItemRequestData(object):
+    """
+    Attributes:
+     - item
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item = None,):
+        self.item = item
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.item = Item()
+                    self.item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('CreateItemRequestData')
+        if self.item is not None:
+            oprot.writeFieldBegin('item', TType.STRUCT, 1)
+            self.item.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadItemRequestData(object):
+    """
+    Attributes:
+     - item_id
+     - backing_table
+     - projection
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item_id = None, backing_table = None, projection = None,):
+        self.item_id = item_id
+        self.backing_table = backing_table
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.backing_table = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.projection = Projection()
+                    self.projection.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadItemRequestData')
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 1)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        if self.backing_table is not None:
+            oprot.writeFieldBegin('backing_table', TType.I32, 2)
+            oprot.writeI32(self.backing_table)
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRUCT, 3)
+            self.projection.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SaveItemRequestData(object):
+    """
+    Attributes:
+     - item
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item = None,):
+        self.item = item
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.item = Item()
+                    self.item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('SaveItemRequestData')
+        if self.item is not None:
+            oprot.writeFieldBegin('item', TType.STRUCT, 1)
+            self.item.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class DestroyItemRequestData(object):
+    """
+    Attributes:
+     - item_id
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item_id = None,):
+        self.item_id = item_id
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('DestroyItemRequestData')
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 1)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ListItemRequestData(object):
+    """
+    Attributes:
+     - page
+     - results_per_page
+     - search_string
+     - projection
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, page = None, results_per_page = None, search_string = None, projection = None,):
+        self.page = page
+        self.results_per_page = results_per_page
+        self.search_string = search_string
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.page = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.results_per_page = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.search_string = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.projection = Projection()
+                    self.projection.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ListItemRequestData')
+        if self.page is not None:
+            oprot.writeFieldBegin('page', TType.I32, 1)
+            oprot.writeI32(self.page)
+            oprot.writeFieldEnd()
+        if self.results_per_page is not None:
+            oprot.writeFieldBegin('results_per_page', TType.I32, 2)
+            oprot.writeI32(self.results_per_page)
+            oprot.writeFieldEnd()
+        if self.search_string is not None:
+            oprot.writeFieldBegin('search_string', TType.STRING, 3)
+            oprot.writeString(self.search_string.encode('utf-8') if sys.version_info[0] == 2 else self.search_string)
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRUCT, 4)
+            self.projection.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class AutocompleteItemRequestData(object):
+    """
+    Attributes:
+     - search_string
+     - max_results
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, search_string = None, max_results = 10,):
+        self.search_string = search_string
+        self.max_results = max_results
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.search_string = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.max_results = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('AutocompleteItemRequestData')
+        if self.search_string is not None:
+            oprot.writeFieldBegin('search_string', TType.STRING, 1)
+            oprot.writeString(self.search_string.encode('utf-8') if sys.version_info[0] == 2 else self.search_string)
+            oprot.writeFieldEnd()
+        if self.max_results is not None:
+            oprot.writeFieldBegin('max_results', TType.I32, 2)
+            oprot.writeI32(self.max_results)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadItemWithBlueprintTreeRequestData(object):
+    """
+    Attributes:
+     - item_id
+     - max_depth
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item_id = None, max_depth = 10,):
+        self.item_id = item_id
+        self.max_depth = max_depth
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.max_depth = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadItemWithBlueprintTreeRequestData')
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 1)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        if self.max_depth is not None:
+            oprot.writeFieldBegin('max_depth', TType.I32, 2)
+            oprot.writeI32(self.max_depth)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadManyItemsRequestData(object):
+    """
+    Attributes:
+     - item_ids
+     - projection
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item_ids = None, projection = None,):
+        self.item_ids = item_ids
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.item_ids = []
+                    (_etype239, _size236) = iprot.readListBegin()
+                    for _i240 in range(_size236):
+                        _elem241 = iprot.readI64()
+                        self.item_ids.append(_elem241)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.projection = Projection()
+                    self.projection.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadManyItemsRequestData')
+        if self.item_ids is not None:
+            oprot.writeFieldBegin('item_ids', TType.LIST, 1)
+            oprot.writeListBegin(TType.I64, len(self.item_ids))
+            for iter242 in self.item_ids:
+                oprot.writeI64(iter242)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRUCT, 2)
+            self.projection.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadBillOfMaterialsRequestData(object):
+    """
+    Attributes:
+     - item_ids
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item_ids = None,):
+        self.item_ids = item_ids
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.item_ids = []
+                    (_etype246, _size243) = iprot.readListBegin()
+                    for _i247 in range(_size243):
+                        _elem248 = iprot.readI64()
+                        self.item_ids.append(_elem248)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadBillOfMaterialsRequestData')
+        if self.item_ids is not None:
+            oprot.writeFieldBegin('item_ids', TType.LIST, 1)
+            oprot.writeListBegin(TType.I64, len(self.item_ids))
+            for iter249 in self.item_ids:
+                oprot.writeI64(iter249)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadDependentsRequestData(object):
+    """
+    Attributes:
+     - item_id
+     - max_depth
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item_id = None, max_depth = 10,):
+        self.item_id = item_id
+        self.max_depth = max_depth
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.max_depth = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadDependentsRequestData')
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 1)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        if self.max_depth is not None:
+            oprot.writeFieldBegin('max_depth', TType.I32, 2)
+            oprot.writeI32(self.max_depth)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class CreateItemResponseData(object):
+    """
+    Attributes:
+     - item
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item = None,):
+        self.item = item
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.item = Item()
+                    self.item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('CreateItemResponseData')
+        if self.item is not None:
+            oprot.writeFieldBegin('item', TType.STRUCT, 1)
+            self.item.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadItemResponseData(object):
+    """
+    Attributes:
+     - item
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item = None,):
+        self.item = item
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.item = Item()
+                    self.item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadItemResponseData')
+        if self.item is not None:
+            oprot.writeFieldBegin('item', TType.STRUCT, 1)
+            self.item.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SaveItemResponseData(object):
+    """
+    Attributes:
+     - item
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item = None,):
+        self.item = item
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.item = Item()
+                    self.item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('SaveItemResponseData')
+        if self.item is not None:
+            oprot.writeFieldBegin('item', TType.STRUCT, 1)
+            self.item.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class DestroyItemResponseData(object):
+    """
+    Attributes:
+     - item_id
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item_id = None,):
+        self.item_id = item_id
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('DestroyItemResponseData')
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 1)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ListItemResponseData(object):
+    """
+    Attributes:
+     - items
+     - total_count
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, items = None, total_count = None,):
+        self.items = items
+        self.total_count = total_count
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.items = []
+                    (_etype253, _size250) = iprot.readListBegin()
+                    for _i254 in range(_size250):
+                        _elem255 = Item()
+                        _elem255.read(iprot)
+                        self.items.append(_elem255)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.total_count = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ListItemResponseData')
+        if self.items is not None:
+            oprot.writeFieldBegin('items', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.items))
+            for iter256 in self.items:
+                iter256.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.total_count is not None:
+            oprot.writeFieldBegin('total_count', TType.I64, 2)
+            oprot.writeI64(self.total_count)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ItemAutocompleteResult(object):
+    """
+    Attributes:
+     - id
+     - internal_name
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, id = None, internal_name = None,):
+        self.id = id
+        self.internal_name = internal_name
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.internal_name = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ItemAutocompleteResult')
+        if self.id is not None:
+            oprot.writeFieldBegin('id', TType.I64, 1)
+            oprot.writeI64(self.id)
+            oprot.writeFieldEnd()
+        if self.internal_name is not None:
+            oprot.writeFieldBegin('internal_name', TType.STRING, 2)
+            oprot.writeString(self.internal_name.encode('utf-8') if sys.version_info[0] == 2 else self.internal_name)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class AutocompleteItemResponseData(object):
+    """
+    Attributes:
+     - results
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, results = None,):
+        self.results = results
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.results = []
+                    (_etype260, _size257) = iprot.readListBegin()
+                    for _i261 in range(_size257):
+                        _elem262 = ItemAutocompleteResult()
+                        _elem262.read(iprot)
+                        self.results.append(_elem262)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('AutocompleteItemResponseData')
+        if self.results is not None:
+            oprot.writeFieldBegin('results', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.results))
+            for iter263 in self.results:
+                iter263.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadItemWithBlueprintTreeResponseData(object):
+    """
+    Attributes:
+     - tree
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, tree = None,):
+        self.tree = tree
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.tree = BlueprintTreeNode()
+                    self.tree.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadItemWithBlueprintTreeResponseData')
+        if self.tree is not None:
+            oprot.writeFieldBegin('tree', TType.STRUCT, 1)
+            self.tree.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadManyItemsResponseData(object):
+    """
+    Attributes:
+     - items
+     - errors
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, items = None, errors = None,):
+        self.items = items
+        self.errors = errors
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.MAP:
+                    self.items = {}
+                    (_ktype265, _vtype266, _size264) = iprot.readMapBegin()
+                    for _i268 in range(_size264):
+                        _key269 = iprot.readI64()
+                        _val270 = Item()
+                        _val270.read(iprot)
+                        self.items[_key269] = _val270
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.errors = {}
+                    (_ktype272, _vtype273, _size271) = iprot.readMapBegin()
+                    for _i275 in range(_size271):
+                        _key276 = iprot.readI64()
+                        _val277 = GameResult()
+                        _val277.read(iprot)
+                        self.errors[_key276] = _val277
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadManyItemsResponseData')
+        if self.items is not None:
+            oprot.writeFieldBegin('items', TType.MAP, 1)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.items))
+            for kiter278, viter279 in self.items.items():
+                oprot.writeI64(kiter278)
+                viter279.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.errors is not None:
+            oprot.writeFieldBegin('errors', TType.MAP, 2)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.errors))
+            for kiter280, viter281 in self.errors.items():
+                oprot.writeI64(kiter280)
+                viter281.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadBillOfMaterialsResponseData(object):
+    """
+    Attributes:
+     - boms
+     - errors
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, boms = None, errors = None,):
+        self.boms = boms
+        self.errors = errors
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.MAP:
+                    self.boms = {}
+                    (_ktype283, _vtype284, _size282) = iprot.readMapBegin()
+                    for _i286 in range(_size282):
+                        _key287 = iprot.readI64()
+                        _val288 = BillOfMaterials()
+                        _val288.read(iprot)
+                        self.boms[_key287] = _val288
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.errors = {}
+                    (_ktype290, _vtype291, _size289) = iprot.readMapBegin()
+                    for _i293 in range(_size289):
+                        _key294 = iprot.readI64()
+                        _val295 = GameResult()
+                        _val295.read(iprot)
+                        self.errors[_key294] = _val295
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadBillOfMaterialsResponseData')
+        if self.boms is not None:
+            oprot.writeFieldBegin('boms', TType.MAP, 1)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.boms))
+            for kiter296, viter297 in self.boms.items():
+                oprot.writeI64(kiter296)
+                viter297.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.errors is not None:
+            oprot.writeFieldBegin('errors', TType.MAP, 2)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.errors))
+            for kiter298, viter299 in self.errors.items():
+                oprot.writeI64(kiter298)
+                viter299.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadDependentsResponseData(object):
+    """
+    Attributes:
+     - item_id
+     - depths
+     - truncated
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, item_id = None, depths = None, truncated = False,):
+        self.item_id = item_id
+        self.depths = depths
+        self.truncated = truncated
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.item_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.depths = {}
+                    (_ktype301, _vtype302, _size300) = iprot.readMapBegin()
+                    for _i304 in range(_size300):
+                        _key305 = iprot.readI64()
+                        _val306 = iprot.readI32()
+                        self.depths[_key305] = _val306
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.BOOL:
+                    self.truncated = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadDependentsResponseData')
+        if self.item_id is not None:
+            oprot.writeFieldBegin('item_id', TType.I64, 1)
+            oprot.writeI64(self.item_id)
+            oprot.writeFieldEnd()
+        if self.depths is not None:
+            oprot.writeFieldBegin('depths', TType.MAP, 2)
+            oprot.writeMapBegin(TType.I64, TType.I32, len(self.depths))
+            for kiter307, viter308 in self.depths.items():
+                oprot.writeI64(kiter307)
+                oprot.writeI32(viter308)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.truncated is not None:
+            oprot.writeFieldBegin('truncated', TType.BOOL, 3)
+            oprot.writeBool(self.truncated)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ItemRequestData(object):
+    """
+    Attributes:
+     - create_item
+     - load_item
+     - save_item
+     - destroy_item
+     - list_item
+     - autocomplete_item
+     - load_with_blueprint_tree
+     - load_many_items
+     - load_bill_of_materials
+     - load_dependents
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, create_item = None, load_item = None, save_item = None, destroy_item = None, list_item = None, autocomplete_item = None, load_with_blueprint_tree = None, load_many_items = None, load_bill_of_materials = None, load_dependents = None,):
+        self.create_item = create_item
+        self.load_item = load_item
+        self.save_item = save_item
+        self.destroy_item = destroy_item
+        self.list_item = list_item
+        self.autocomplete_item = autocomplete_item
+        self.load_with_blueprint_tree = load_with_blueprint_tree
+        self.load_many_items = load_many_items
+        self.load_bill_of_materials = load_bill_of_materials
+        self.load_dependents = load_dependents
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.create_item = CreateItemRequestData()
+                    self.create_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.load_item = LoadItemRequestData()
+                    self.load_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.save_item = SaveItemRequestData()
+                    self.save_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.destroy_item = DestroyItemRequestData()
+                    self.destroy_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.list_item = ListItemRequestData()
+                    self.list_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.autocomplete_item = AutocompleteItemRequestData()
+                    self.autocomplete_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.load_with_blueprint_tree = LoadItemWithBlueprintTreeRequestData()
+                    self.load_with_blueprint_tree.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.STRUCT:
+                    self.load_many_items = LoadManyItemsRequestData()
+                    self.load_many_items.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.STRUCT:
+                    self.load_bill_of_materials = LoadBillOfMaterialsRequestData()
+                    self.load_bill_of_materials.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.STRUCT:
+                    self.load_dependents = LoadDependentsRequestData()
+                    self.load_dependents.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ItemRequestData')
+        if self.create_item is not None:
+            oprot.writeFieldBegin('create_item', TType.STRUCT, 1)
+            self.create_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_item is not None:
+            oprot.writeFieldBegin('load_item', TType.STRUCT, 2)
+            self.load_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.save_item is not None:
+            oprot.writeFieldBegin('save_item', TType.STRUCT, 3)
+            self.save_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.destroy_item is not None:
+            oprot.writeFieldBegin('destroy_item', TType.STRUCT, 4)
+            self.destroy_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.list_item is not None:
+            oprot.writeFieldBegin('list_item', TType.STRUCT, 5)
+            self.list_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.autocomplete_item is not None:
+            oprot.writeFieldBegin('autocomplete_item', TType.STRUCT, 6)
+            self.autocomplete_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_with_blueprint_tree is not None:
+            oprot.writeFieldBegin('load_with_blueprint_tree', TType.STRUCT, 7)
+            self.load_with_blueprint_tree.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_many_items is not None:
+            oprot.writeFieldBegin('load_many_items', TType.STRUCT, 8)
+            self.load_many_items.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_bill_of_materials is not None:
+            oprot.writeFieldBegin('load_bill_of_materials', TType.STRUCT, 9)
+            self.load_bill_of_materials.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_dependents is not None:
+            oprot.writeFieldBegin('load_dependents', TType.STRUCT, 10)
+            self.load_dependents.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4195,26 +7463,1493 @@ class ItemRequestData(object):
 class ItemResponseData(object):
     """
     Attributes:
-     - create_item
-     - load_item
-     - save_item
-     - destroy_item
-     - list_item
-     - autocomplete_item
-     - load_with_blueprint_tree
+     - create_item
+     - load_item
+     - save_item
+     - destroy_item
+     - list_item
+     - autocomplete_item
+     - load_with_blueprint_tree
+     - load_many_items
+     - load_bill_of_materials
+     - load_dependents
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, create_item = None, load_item = None, save_item = None, destroy_item = None, list_item = None, autocomplete_item = None, load_with_blueprint_tree = None, load_many_items = None, load_bill_of_materials = None, load_dependents = None,):
+        self.create_item = create_item
+        self.load_item = load_item
+        self.save_item = save_item
+        self.destroy_item = destroy_item
+        self.list_item = list_item
+        self.autocomplete_item = autocomplete_item
+        self.load_with_blueprint_tree = load_with_blueprint_tree
+        self.load_many_items = load_many_items
+        self.load_bill_of_materials = load_bill_of_materials
+        self.load_dependents = load_dependents
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.create_item = CreateItemResponseData()
+                    self.create_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.load_item = LoadItemResponseData()
+                    self.load_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.save_item = SaveItemResponseData()
+                    self.save_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.destroy_item = DestroyItemResponseData()
+                    self.destroy_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.list_item = ListItemResponseData()
+                    self.list_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.autocomplete_item = AutocompleteItemResponseData()
+                    self.autocomplete_item.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.load_with_blueprint_tree = LoadItemWithBlueprintTreeResponseData()
+                    self.load_with_blueprint_tree.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.STRUCT:
+                    self.load_many_items = LoadManyItemsResponseData()
+                    self.load_many_items.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.STRUCT:
+                    self.load_bill_of_materials = LoadBillOfMaterialsResponseData()
+                    self.load_bill_of_materials.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.STRUCT:
+                    self.load_dependents = LoadDependentsResponseData()
+                    self.load_dependents.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ItemResponseData')
+        if self.create_item is not None:
+            oprot.writeFieldBegin('create_item', TType.STRUCT, 1)
+            self.create_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_item is not None:
+            oprot.writeFieldBegin('load_item', TType.STRUCT, 2)
+            self.load_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.save_item is not None:
+            oprot.writeFieldBegin('save_item', TType.STRUCT, 3)
+            self.save_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.destroy_item is not None:
+            oprot.writeFieldBegin('destroy_item', TType.STRUCT, 4)
+            self.destroy_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.list_item is not None:
+            oprot.writeFieldBegin('list_item', TType.STRUCT, 5)
+            self.list_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.autocomplete_item is not None:
+            oprot.writeFieldBegin('autocomplete_item', TType.STRUCT, 6)
+            self.autocomplete_item.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_with_blueprint_tree is not None:
+            oprot.writeFieldBegin('load_with_blueprint_tree', TType.STRUCT, 7)
+            self.load_with_blueprint_tree.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_many_items is not None:
+            oprot.writeFieldBegin('load_many_items', TType.STRUCT, 8)
+            self.load_many_items.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_bill_of_materials is not None:
+            oprot.writeFieldBegin('load_bill_of_materials', TType.STRUCT, 9)
+            self.load_bill_of_materials.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_dependents is not None:
+            oprot.writeFieldBegin('load_dependents', TType.STRUCT, 10)
+            self.load_dependents.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ItemRequest(object):
+    """
+    Attributes:
+     - data
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, data = None,):
+        self.data = data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.data = ItemRequestData()
+                    self.data.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ItemRequest')
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRUCT, 1)
+            self.data.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ItemResponse(object):
+    """
+    Attributes:
+     - results
+     - response_data
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, results = None, response_data = None,):
+        self.results = results
+        self.response_data = response_data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.results = []
+                    (_etype312, _size309) = iprot.readListBegin()
+                    for _i313 in range(_size309):
+                        _elem314 = GameResult()
+                        _elem314.read(iprot)
+                        self.results.append(_elem314)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.response_data = ItemResponseData()
+                    self.response_data.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ItemResponse')
+        if self.results is not None:
+            oprot.writeFieldBegin('results', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.results))
+            for iter315 in self.results:
+                iter315.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.response_data is not None:
+            oprot.writeFieldBegin('response_data', TType.STRUCT, 2)
+            self.response_data.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class CreatePlayerRequestData(object):
+    """
+    Attributes:
+     - player
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player = None,):
+        self.player = player
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.player = Player()
+                    self.player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('CreatePlayerRequestData')
+        if self.player is not None:
+            oprot.writeFieldBegin('player', TType.STRUCT, 1)
+            self.player.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadPlayerRequestData(object):
+    """
+    Attributes:
+     - player_id
+     - projection
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player_id = None, projection = None,):
+        self.player_id = player_id
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.player_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.projection = Projection()
+                    self.projection.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadPlayerRequestData')
+        if self.player_id is not None:
+            oprot.writeFieldBegin('player_id', TType.I64, 1)
+            oprot.writeI64(self.player_id)
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRUCT, 2)
+            self.projection.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SavePlayerRequestData(object):
+    """
+    Attributes:
+     - player
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player = None,):
+        self.player = player
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.player = Player()
+                    self.player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('SavePlayerRequestData')
+        if self.player is not None:
+            oprot.writeFieldBegin('player', TType.STRUCT, 1)
+            self.player.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class DeletePlayerRequestData(object):
+    """
+    Attributes:
+     - player_id
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player_id = None,):
+        self.player_id = player_id
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.player_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('DeletePlayerRequestData')
+        if self.player_id is not None:
+            oprot.writeFieldBegin('player_id', TType.I64, 1)
+            oprot.writeI64(self.player_id)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ListPlayerRequestData(object):
+    """
+    Attributes:
+     - page
+     - results_per_page
+     - search_string
+     - projection
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, page = None, results_per_page = None, search_string = None, projection = None,):
+        self.page = page
+        self.results_per_page = results_per_page
+        self.search_string = search_string
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.page = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.results_per_page = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.search_string = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.projection = Projection()
+                    self.projection.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ListPlayerRequestData')
+        if self.page is not None:
+            oprot.writeFieldBegin('page', TType.I32, 1)
+            oprot.writeI32(self.page)
+            oprot.writeFieldEnd()
+        if self.results_per_page is not None:
+            oprot.writeFieldBegin('results_per_page', TType.I32, 2)
+            oprot.writeI32(self.results_per_page)
+            oprot.writeFieldEnd()
+        if self.search_string is not None:
+            oprot.writeFieldBegin('search_string', TType.STRING, 3)
+            oprot.writeString(self.search_string.encode('utf-8') if sys.version_info[0] == 2 else self.search_string)
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRUCT, 4)
+            self.projection.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadManyPlayersRequestData(object):
+    """
+    Attributes:
+     - player_ids
+     - projection
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player_ids = None, projection = None,):
+        self.player_ids = player_ids
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.player_ids = []
+                    (_etype319, _size316) = iprot.readListBegin()
+                    for _i320 in range(_size316):
+                        _elem321 = iprot.readI64()
+                        self.player_ids.append(_elem321)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.projection = Projection()
+                    self.projection.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadManyPlayersRequestData')
+        if self.player_ids is not None:
+            oprot.writeFieldBegin('player_ids', TType.LIST, 1)
+            oprot.writeListBegin(TType.I64, len(self.player_ids))
+            for iter322 in self.player_ids:
+                oprot.writeI64(iter322)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRUCT, 2)
+            self.projection.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadSessionRequestData(object):
+    """
+    Attributes:
+     - player_id
+     - projection
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player_id = None, projection = None,):
+        self.player_id = player_id
+        self.projection = projection
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.player_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.projection = Projection()
+                    self.projection.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadSessionRequestData')
+        if self.player_id is not None:
+            oprot.writeFieldBegin('player_id', TType.I64, 1)
+            oprot.writeI64(self.player_id)
+            oprot.writeFieldEnd()
+        if self.projection is not None:
+            oprot.writeFieldBegin('projection', TType.STRUCT, 2)
+            self.projection.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class CreatePlayerResponseData(object):
+    """
+    Attributes:
+     - player
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player = None,):
+        self.player = player
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.player = Player()
+                    self.player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('CreatePlayerResponseData')
+        if self.player is not None:
+            oprot.writeFieldBegin('player', TType.STRUCT, 1)
+            self.player.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadPlayerResponseData(object):
+    """
+    Attributes:
+     - player
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player = None,):
+        self.player = player
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.player = Player()
+                    self.player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadPlayerResponseData')
+        if self.player is not None:
+            oprot.writeFieldBegin('player', TType.STRUCT, 1)
+            self.player.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SavePlayerResponseData(object):
+    """
+    Attributes:
+     - player
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player = None,):
+        self.player = player
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.player = Player()
+                    self.player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('SavePlayerResponseData')
+        if self.player is not None:
+            oprot.writeFieldBegin('player', TType.STRUCT, 1)
+            self.player.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class DeletePlayerResponseData(object):
+    """
+    Attributes:
+     - player_id
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, player_id = None,):
+        self.player_id = player_id
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.player_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('DeletePlayerResponseData')
+        if self.player_id is not None:
+            oprot.writeFieldBegin('player_id', TType.I64, 1)
+            oprot.writeI64(self.player_id)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ListPlayerResponseData(object):
+    """
+    Attributes:
+     - players
+     - total_count
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, players = None, total_count = None,):
+        self.players = players
+        self.total_count = total_count
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.players = []
+                    (_etype326, _size323) = iprot.readListBegin()
+                    for _i327 in range(_size323):
+                        _elem328 = Player()
+                        _elem328.read(iprot)
+                        self.players.append(_elem328)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.total_count = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ListPlayerResponseData')
+        if self.players is not None:
+            oprot.writeFieldBegin('players', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.players))
+            for iter329 in self.players:
+                iter329.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.total_count is not None:
+            oprot.writeFieldBegin('total_count', TType.I64, 2)
+            oprot.writeI64(self.total_count)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadManyPlayersResponseData(object):
+    """
+    Attributes:
+     - players
+     - errors
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, players = None, errors = None,):
+        self.players = players
+        self.errors = errors
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.MAP:
+                    self.players = {}
+                    (_ktype331, _vtype332, _size330) = iprot.readMapBegin()
+                    for _i334 in range(_size330):
+                        _key335 = iprot.readI64()
+                        _val336 = Player()
+                        _val336.read(iprot)
+                        self.players[_key335] = _val336
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.errors = {}
+                    (_ktype338, _vtype339, _size337) = iprot.readMapBegin()
+                    for _i341 in range(_size337):
+                        _key342 = iprot.readI64()
+                        _val343 = GameResult()
+                        _val343.read(iprot)
+                        self.errors[_key342] = _val343
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadManyPlayersResponseData')
+        if self.players is not None:
+            oprot.writeFieldBegin('players', TType.MAP, 1)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.players))
+            for kiter344, viter345 in self.players.items():
+                oprot.writeI64(kiter344)
+                viter345.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.errors is not None:
+            oprot.writeFieldBegin('errors', TType.MAP, 2)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.errors))
+            for kiter346, viter347 in self.errors.items():
+                oprot.writeI64(kiter346)
+                viter347.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadSessionResponseData(object):
+    """
+    Attributes:
+     - player
+     - inventories
+     - items
+     - mobile_items
 
     """
     thrift_spec = None
 
 
-    def __init__(self, create_item = None, load_item = None, save_item = None, destroy_item = None, list_item = None, autocomplete_item = None, load_with_blueprint_tree = None,):
-        self.create_item = create_item
-        self.load_item = load_item
-        self.save_item = save_item
-        self.destroy_item = destroy_item
-        self.list_item = list_item
-        self.autocomplete_item = autocomplete_item
-        self.load_with_blueprint_tree = load_with_blueprint_tree
+    def __init__(self, player = None, inventories = None, items = None, mobile_items = None,):
+        self.player = player
+        self.inventories = inventories
+        self.items = items
+        self.mobile_items = mobile_items
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.player = Player()
+                    self.player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.inventories = []
+                    (_etype351, _size348) = iprot.readListBegin()
+                    for _i352 in range(_size348):
+                        _elem353 = Inventory()
+                        _elem353.read(iprot)
+                        self.inventories.append(_elem353)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.MAP:
+                    self.items = {}
+                    (_ktype355, _vtype356, _size354) = iprot.readMapBegin()
+                    for _i358 in range(_size354):
+                        _key359 = iprot.readI64()
+                        _val360 = Item()
+                        _val360.read(iprot)
+                        self.items[_key359] = _val360
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.MAP:
+                    self.mobile_items = {}
+                    (_ktype362, _vtype363, _size361) = iprot.readMapBegin()
+                    for _i365 in range(_size361):
+                        _key366 = iprot.readI64()
+                        _val367 = MobileItem()
+                        _val367.read(iprot)
+                        self.mobile_items[_key366] = _val367
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('LoadSessionResponseData')
+        if self.player is not None:
+            oprot.writeFieldBegin('player', TType.STRUCT, 1)
+            self.player.write(oprot)
+            oprot.writeFieldEnd()
+        if self.inventories is not None:
+            oprot.writeFieldBegin('inventories', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRUCT, len(self.inventories))
+            for iter368 in self.inventories:
+                iter368.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.items is not None:
+            oprot.writeFieldBegin('items', TType.MAP, 3)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.items))
+            for kiter369, viter370 in self.items.items():
+                oprot.writeI64(kiter369)
+                viter370.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.mobile_items is not None:
+            oprot.writeFieldBegin('mobile_items', TType.MAP, 4)
+            oprot.writeMapBegin(TType.I64, TType.STRUCT, len(self.mobile_items))
+            for kiter371, viter372 in self.mobile_items.items():
+                oprot.writeI64(kiter371)
+                viter372.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class PlayerRequestData(object):
+    """
+    Attributes:
+     - create_player
+     - load_player
+     - save_player
+     - delete_player
+     - list_player
+     - load_many_players
+     - load_session
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, create_player = None, load_player = None, save_player = None, delete_player = None, list_player = None, load_many_players = None, load_session = None,):
+        self.create_player = create_player
+        self.load_player = load_player
+        self.save_player = save_player
+        self.delete_player = delete_player
+        self.list_player = list_player
+        self.load_many_players = load_many_players
+        self.load_session = load_session
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.create_player = CreatePlayerRequestData()
+                    self.create_player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.load_player = LoadPlayerRequestData()
+                    self.load_player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.save_player = SavePlayerRequestData()
+                    self.save_player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.delete_player = DeletePlayerRequestData()
+                    self.delete_player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.list_player = ListPlayerRequestData()
+                    self.list_player.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.load_many_players = LoadManyPlayersRequestData()
+                    self.load_many_players.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.load_session = LoadSessionRequestData()
+                    self.load_session.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('PlayerRequestData')
+        if self.create_player is not None:
+            oprot.writeFieldBegin('create_player', TType.STRUCT, 1)
+            self.create_player.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_player is not None:
+            oprot.writeFieldBegin('load_player', TType.STRUCT, 2)
+            self.load_player.write(oprot)
+            oprot.writeFieldEnd()
+        if self.save_player is not None:
+            oprot.writeFieldBegin('save_player', TType.STRUCT, 3)
+            self.save_player.write(oprot)
+            oprot.writeFieldEnd()
+        if self.delete_player is not None:
+            oprot.writeFieldBegin('delete_player', TType.STRUCT, 4)
+            self.delete_player.write(oprot)
+            oprot.writeFieldEnd()
+        if self.list_player is not None:
+            oprot.writeFieldBegin('list_player', TType.STRUCT, 5)
+            self.list_player.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_many_players is not None:
+            oprot.writeFieldBegin('load_many_players', TType.STRUCT, 6)
+            self.load_many_players.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_session is not None:
+            oprot.writeFieldBegin('load_session', TType.STRUCT, 7)
+            self.load_session.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class PlayerResponseData(object):
+    """
+    Attributes:
+     - create_player
+     - load_player
+     - save_player
+     - delete_player
+     - list_player
+     - load_many_players
+     - load_session
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, create_player = None, load_player = None, save_player = None, delete_player = None, list_player = None, load_many_players = None, load_session = None,):
+        self.create_player = create_player
+        self.load_player = load_player
+        self.save_player = save_player
+        self.delete_player = delete_player
+        self.list_player = list_player
+        self.load_many_players = load_many_players
+        self.load_session = load_session
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4227,44 +8962,44 @@ class ItemResponseData(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.create_item = CreateItemResponseData()
-                    self.create_item.read(iprot)
+                    self.create_player = CreatePlayerResponseData()
+                    self.create_player.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.load_item = LoadItemResponseData()
-                    self.load_item.read(iprot)
+                    self.load_player = LoadPlayerResponseData()
+                    self.load_player.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 3:
                 if ftype == TType.STRUCT:
-                    self.save_item = SaveItemResponseData()
-                    self.save_item.read(iprot)
+                    self.save_player = SavePlayerResponseData()
+                    self.save_player.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 4:
                 if ftype == TType.STRUCT:
-                    self.destroy_item = DestroyItemResponseData()
-                    self.destroy_item.read(iprot)
+                    self.delete_player = DeletePlayerResponseData()
+                    self.delete_player.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 5:
                 if ftype == TType.STRUCT:
-                    self.list_item = ListItemResponseData()
-                    self.list_item.read(iprot)
+                    self.list_player = ListPlayerResponseData()
+                    self.list_player.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 6:
                 if ftype == TType.STRUCT:
-                    self.autocomplete_item = AutocompleteItemResponseData()
-                    self.autocomplete_item.read(iprot)
+                    self.load_many_players = LoadManyPlayersResponseData()
+                    self.load_many_players.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 7:
                 if ftype == TType.STRUCT:
-                    self.load_with_blueprint_tree = LoadItemWithBlueprintTreeResponseData()
-                    self.load_with_blueprint_tree.read(iprot)
+                    self.load_session = LoadSessionResponseData()
+                    self.load_session.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -4277,34 +9012,300 @@ class ItemResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ItemResponseData')
-        if self.create_item is not None:
-            oprot.writeFieldBegin('create_item', TType.STRUCT, 1)
-            self.create_item.write(oprot)
+        oprot.writeStructBegin('PlayerResponseData')
+        if self.create_player is not None:
+            oprot.writeFieldBegin('create_player', TType.STRUCT, 1)
+            self.create_player.write(oprot)
             oprot.writeFieldEnd()
-        if self.load_item is not None:
-            oprot.writeFieldBegin('load_item', TType.STRUCT, 2)
-            self.load_item.write(oprot)
+        if self.load_player is not None:
+            oprot.writeFieldBegin('load_player', TType.STRUCT, 2)
+            self.load_player.write(oprot)
             oprot.writeFieldEnd()
-        if self.save_item is not None:
-            oprot.writeFieldBegin('save_item', TType.STRUCT, 3)
-            self.save_item.write(oprot)
+        if self.save_player is not None:
+            oprot.writeFieldBegin('save_player', TType.STRUCT, 3)
+            self.save_player.write(oprot)
             oprot.writeFieldEnd()
-        if self.destroy_item is not None:
-            oprot.writeFieldBegin('destroy_item', TType.STRUCT, 4)
-            self.destroy_item.write(oprot)
+        if self.delete_player is not None:
+            oprot.writeFieldBegin('delete_player', TType.STRUCT, 4)
+            self.delete_player.write(oprot)
             oprot.writeFieldEnd()
-        if self.list_item is not None:
-            oprot.writeFieldBegin('list_item', TType.STRUCT, 5)
-            self.list_item.write(oprot)
+        if self.list_player is not None:
+            oprot.writeFieldBegin('list_player', TType.STRUCT, 5)
+            self.list_player.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_many_players is not None:
+            oprot.writeFieldBegin('load_many_players', TType.STRUCT, 6)
+            self.load_many_players.write(oprot)
+            oprot.writeFieldEnd()
+        if self.load_session is not None:
+            oprot.writeFieldBegin('load_session', TType.STRUCT, 7)
+            self.load_session.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class PlayerRequest(object):
+    """
+    Attributes:
+     - data
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, data = None,):
+        self.data = data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.data = PlayerRequestData()
+                    self.data.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('PlayerRequest')
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRUCT, 1)
+            self.data.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class PlayerResponse(object):
+    """
+    Attributes:
+     - results
+     - response_data
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, results = None, response_data = None,):
+        self.results = results
+        self.response_data = response_data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.results = []
+                    (_etype376, _size373) = iprot.readListBegin()
+                    for _i377 in range(_size373):
+                        _elem378 = GameResult()
+                        _elem378.read(iprot)
+                        self.results.append(_elem378)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.response_data = PlayerResponseData()
+                    self.response_data.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('PlayerResponse')
+        if self.results is not None:
+            oprot.writeFieldBegin('results', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.results))
+            for iter379 in self.results:
+                iter379.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.response_data is not None:
+            oprot.writeFieldBegin('response_data', TType.STRUCT, 2)
+            self.response_data.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class QueryRadiusRequestData(object):
+    """
+    Attributes:
+     - level
+     - center
+     - radius
+     - frame
+     - kind
+     - max_results
+
+    """
+    thrift_spec = None
+
+
+    def __init__(self, level = None, center = None, radius = None, frame = None, kind = None, max_results = None,):
+        self.level = level
+        self.center = center
+        self.radius = radius
+        self.frame = frame
+        self.kind = kind
+        self.max_results = max_results
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.level = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.center = ItemVector3()
+                    self.center.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.DOUBLE:
+                    self.radius = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.MAP:
+                    self.frame = {}
+                    (_ktype381, _vtype382, _size380) = iprot.readMapBegin()
+                    for _i384 in range(_size380):
+                        _key385 = iprot.readI32()
+                        _val386 = ItemVector3()
+                        _val386.read(iprot)
+                        self.frame[_key385] = _val386
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I32:
+                    self.kind = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.I32:
+                    self.max_results = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        self.validate()
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('QueryRadiusRequestData')
+        if self.level is not None:
+            oprot.writeFieldBegin('level', TType.I32, 1)
+            oprot.writeI32(self.level)
+            oprot.writeFieldEnd()
+        if self.center is not None:
+            oprot.writeFieldBegin('center', TType.STRUCT, 2)
+            self.center.write(oprot)
+            oprot.writeFieldEnd()
+        if self.radius is not None:
+            oprot.writeFieldBegin('radius', TType.DOUBLE, 3)
+            oprot.writeDouble(self.radius)
+            oprot.writeFieldEnd()
+        if self.frame is not None:
+            oprot.writeFieldBegin('frame', TType.MAP, 4)
+            oprot.writeMapBegin(TType.I32, TType.STRUCT, len(self.frame))
+            for kiter387, viter388 in self.frame.items():
+                oprot.writeI32(kiter387)
+                viter388.write(oprot)
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
-        if self.autocomplete_item is not None:
-            oprot.writeFieldBegin('autocomplete_item', TType.STRUCT, 6)
-            self.autocomplete_item.write(oprot)
+        if self.kind is not None:
+            oprot.writeFieldBegin('kind', TType.I32, 5)
+            oprot.writeI32(self.kind)
             oprot.writeFieldEnd()
-        if self.load_with_blueprint_tree is not None:
-            oprot.writeFieldBegin('load_with_blueprint_tree', TType.STRUCT, 7)
-            self.load_with_blueprint_tree.write(oprot)
+        if self.max_results is not None:
+            oprot.writeFieldBegin('max_results', TType.I32, 6)
+            oprot.writeI32(self.max_results)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4324,17 +9325,23 @@ class ItemResponseData(object):
         return not (self == other)
 
 
-class ItemRequest(object):
+class EntityPosition(object):
     """
     Attributes:
-     - data
+     - kind
+     - id
+     - position
+     - distance
 
     """
     thrift_spec = None
 
 
-    def __init__(self, data = None,):
-        self.data = data
+    def __init__(self, kind = None, id = None, position = None, distance = None,):
+        self.kind = kind
+        self.id = id
+        self.position = position
+        self.distance = distance
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4346,9 +9353,24 @@ class ItemRequest(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.I32:
+                    self.kind = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
                 if ftype == TType.STRUCT:
-                    self.data = ItemRequestData()
-                    self.data.read(iprot)
+                    self.position = ItemVector3()
+                    self.position.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.DOUBLE:
+                    self.distance = iprot.readDouble()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4361,10 +9383,22 @@ class ItemRequest(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ItemRequest')
-        if self.data is not None:
-            oprot.writeFieldBegin('data', TType.STRUCT, 1)
-            self.data.write(oprot)
+        oprot.writeStructBegin('EntityPosition')
+        if self.kind is not None:
+            oprot.writeFieldBegin('kind', TType.I32, 1)
+            oprot.writeI32(self.kind)
+            oprot.writeFieldEnd()
+        if self.id is not None:
+            oprot.writeFieldBegin('id', TType.I64, 2)
+            oprot.writeI64(self.id)
+            oprot.writeFieldEnd()
+        if self.position is not None:
+            oprot.writeFieldBegin('position', TType.STRUCT, 3)
+            self.position.write(oprot)
+            oprot.writeFieldEnd()
+        if self.distance is not None:
+            oprot.writeFieldBegin('distance', TType.DOUBLE, 4)
+            oprot.writeDouble(self.distance)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4384,19 +9418,17 @@ class ItemRequest(object):
         return not (self == other)
 
 
-class ItemResponse(object):
+class QueryRadiusResponseData(object):
     """
     Attributes:
-     - results
-     - response_data
+     - entities
 
     """
     thrift_spec = None
 
 
-    def __init__(self, results = None, response_data = None,):
-        self.results = results
-        self.response_data = response_data
+    def __init__(self, entities = None,):
+        self.entities = entities
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4409,21 +9441,15 @@ class ItemResponse(object):
                 break
             if fid == 1:
                 if ftype == TType.LIST:
-                    self.results = []
-                    (_etype95, _size92) = iprot.readListBegin()
-                    for _i96 in range(_size92):
-                        _elem97 = GameResult()
-                        _elem97.read(iprot)
-                        self.results.append(_elem97)
+                    self.entities = []
+                    (_etype392, _size389) = iprot.readListBegin()
+                    for _i393 in range(_size389):
+                        _elem394 = EntityPosition()
+                        _elem394.read(iprot)
+                        self.entities.append(_elem394)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.response_data = ItemResponseData()
-                    self.response_data.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -4434,18 +9460,14 @@ class ItemResponse(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ItemResponse')
-        if self.results is not None:
-            oprot.writeFieldBegin('results', TType.LIST, 1)
-            oprot.writeListBegin(TType.STRUCT, len(self.results))
-            for iter98 in self.results:
-                iter98.write(oprot)
+        oprot.writeStructBegin('QueryRadiusResponseData')
+        if self.entities is not None:
+            oprot.writeFieldBegin('entities', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.entities))
+            for iter395 in self.entities:
+                iter395.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
-        if self.response_data is not None:
-            oprot.writeFieldBegin('response_data', TType.STRUCT, 2)
-            self.response_data.write(oprot)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -4464,17 +9486,23 @@ class ItemResponse(object):
         return not (self == other)
 
 
-class CreatePlayerRequestData(object):
+class PositionUpdate(object):
     """
     Attributes:
-     - player
+     - kind
+     - id
+     - level
+     - position
 
     """
     thrift_spec = None
 
 
-    def __init__(self, player = None,):
-        self.player = player
+    def __init__(self, kind = None, id = None, level = None, position = None,):
+        self.kind = kind
+        self.id = id
+        self.level = level
+        self.position = position
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4486,9 +9514,24 @@ class CreatePlayerRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.I32:
+                    self.kind = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.level = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
                 if ftype == TType.STRUCT:
-                    self.player = Player()
-                    self.player.read(iprot)
+                    self.position = ItemVector3()
+                    self.position.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -4501,10 +9544,22 @@ class CreatePlayerRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('CreatePlayerRequestData')
-        if self.player is not None:
-            oprot.writeFieldBegin('player', TType.STRUCT, 1)
-            self.player.write(oprot)
+        oprot.writeStructBegin('PositionUpdate')
+        if self.kind is not None:
+            oprot.writeFieldBegin('kind', TType.I32, 1)
+            oprot.writeI32(self.kind)
+            oprot.writeFieldEnd()
+        if self.id is not None:
+            oprot.writeFieldBegin('id', TType.I64, 2)
+            oprot.writeI64(self.id)
+            oprot.writeFieldEnd()
+        if self.level is not None:
+            oprot.writeFieldBegin('level', TType.I32, 3)
+            oprot.writeI32(self.level)
+            oprot.writeFieldEnd()
+        if self.position is not None:
+            oprot.writeFieldBegin('position', TType.STRUCT, 4)
+            self.position.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4524,17 +9579,17 @@ class CreatePlayerRequestData(object):
         return not (self == other)
 
 
-class LoadPlayerRequestData(object):
+class UpdatePositionsRequestData(object):
     """
     Attributes:
-     - player_id
+     - updates
 
     """
     thrift_spec = None
 
 
-    def __init__(self, player_id = None,):
-        self.player_id = player_id
+    def __init__(self, updates = None,):
+        self.updates = updates
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4546,8 +9601,14 @@ class LoadPlayerRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.player_id = iprot.readI64()
+                if ftype == TType.LIST:
+                    self.updates = []
+                    (_etype399, _size396) = iprot.readListBegin()
+                    for _i400 in range(_size396):
+                        _elem401 = PositionUpdate()
+                        _elem401.read(iprot)
+                        self.updates.append(_elem401)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4560,10 +9621,13 @@ class LoadPlayerRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('LoadPlayerRequestData')
-        if self.player_id is not None:
-            oprot.writeFieldBegin('player_id', TType.I64, 1)
-            oprot.writeI64(self.player_id)
+        oprot.writeStructBegin('UpdatePositionsRequestData')
+        if self.updates is not None:
+            oprot.writeFieldBegin('updates', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.updates))
+            for iter402 in self.updates:
+                iter402.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4583,17 +9647,19 @@ class LoadPlayerRequestData(object):
         return not (self == other)
 
 
-class SavePlayerRequestData(object):
+class UpdatePositionsResponseData(object):
     """
     Attributes:
-     - player
+     - updated
+     - errors
 
     """
     thrift_spec = None
 
 
-    def __init__(self, player = None,):
-        self.player = player
+    def __init__(self, updated = None, errors = None,):
+        self.updated = updated
+        self.errors = errors
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4605,9 +9671,20 @@ class SavePlayerRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.player = Player()
-                    self.player.read(iprot)
+                if ftype == TType.I32:
+                    self.updated = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.errors = {}
+                    (_ktype404, _vtype405, _size403) = iprot.readMapBegin()
+                    for _i407 in range(_size403):
+                        _key408 = iprot.readI32()
+                        _val409 = GameResult()
+                        _val409.read(iprot)
+                        self.errors[_key408] = _val409
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4620,10 +9697,18 @@ class SavePlayerRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('SavePlayerRequestData')
-        if self.player is not None:
-            oprot.writeFieldBegin('player', TType.STRUCT, 1)
-            self.player.write(oprot)
+        oprot.writeStructBegin('UpdatePositionsResponseData')
+        if self.updated is not None:
+            oprot.writeFieldBegin('updated', TType.I32, 1)
+            oprot.writeI32(self.updated)
+            oprot.writeFieldEnd()
+        if self.errors is not None:
+            oprot.writeFieldBegin('errors', TType.MAP, 2)
+            oprot.writeMapBegin(TType.I32, TType.STRUCT, len(self.errors))
+            for kiter410, viter411 in self.errors.items():
+                oprot.writeI32(kiter410)
+                viter411.write(oprot)
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4643,17 +9728,27 @@ class SavePlayerRequestData(object):
         return not (self == other)
 
 
-class DeletePlayerRequestData(object):
+class SubscribeAreaRequestData(object):
     """
     Attributes:
-     - player_id
+     - level
+     - radius
+     - center
+     - frame
+     - follow_mobile_id
+     - kind
 
     """
     thrift_spec = None
 
 
-    def __init__(self, player_id = None,):
-        self.player_id = player_id
+    def __init__(self, level = None, radius = None, center = None, frame = None, follow_mobile_id = None, kind = None,):
+        self.level = level
+        self.radius = radius
+        self.center = center
+        self.frame = frame
+        self.follow_mobile_id = follow_mobile_id
+        self.kind = kind
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4665,8 +9760,41 @@ class DeletePlayerRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.I32:
+                    self.level = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.DOUBLE:
+                    self.radius = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.center = ItemVector3()
+                    self.center.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.MAP:
+                    self.frame = {}
+                    (_ktype413, _vtype414, _size412) = iprot.readMapBegin()
+                    for _i416 in range(_size412):
+                        _key417 = iprot.readI32()
+                        _val418 = ItemVector3()
+                        _val418.read(iprot)
+                        self.frame[_key417] = _val418
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
                 if ftype == TType.I64:
-                    self.player_id = iprot.readI64()
+                    self.follow_mobile_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.I32:
+                    self.kind = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4679,10 +9807,34 @@ class DeletePlayerRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('DeletePlayerRequestData')
-        if self.player_id is not None:
-            oprot.writeFieldBegin('player_id', TType.I64, 1)
-            oprot.writeI64(self.player_id)
+        oprot.writeStructBegin('SubscribeAreaRequestData')
+        if self.level is not None:
+            oprot.writeFieldBegin('level', TType.I32, 1)
+            oprot.writeI32(self.level)
+            oprot.writeFieldEnd()
+        if self.radius is not None:
+            oprot.writeFieldBegin('radius', TType.DOUBLE, 2)
+            oprot.writeDouble(self.radius)
+            oprot.writeFieldEnd()
+        if self.center is not None:
+            oprot.writeFieldBegin('center', TType.STRUCT, 3)
+            self.center.write(oprot)
+            oprot.writeFieldEnd()
+        if self.frame is not None:
+            oprot.writeFieldBegin('frame', TType.MAP, 4)
+            oprot.writeMapBegin(TType.I32, TType.STRUCT, len(self.frame))
+            for kiter419, viter420 in self.frame.items():
+                oprot.writeI32(kiter419)
+                viter420.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.follow_mobile_id is not None:
+            oprot.writeFieldBegin('follow_mobile_id', TType.I64, 5)
+            oprot.writeI64(self.follow_mobile_id)
+            oprot.writeFieldEnd()
+        if self.kind is not None:
+            oprot.writeFieldBegin('kind', TType.I32, 6)
+            oprot.writeI32(self.kind)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4702,21 +9854,19 @@ class DeletePlayerRequestData(object):
         return not (self == other)
 
 
-class ListPlayerRequestData(object):
+class SubscribeAreaResponseData(object):
     """
     Attributes:
-     - page
-     - results_per_page
-     - search_string
+     - subscription_id
+     - entities
 
     """
     thrift_spec = None
 
 
-    def __init__(self, page = None, results_per_page = None, search_string = None,):
-        self.page = page
-        self.results_per_page = results_per_page
-        self.search_string = search_string
+    def __init__(self, subscription_id = None, entities = None,):
+        self.subscription_id = subscription_id
+        self.entities = entities
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4728,18 +9878,19 @@ class ListPlayerRequestData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I32:
-                    self.page = iprot.readI32()
+                if ftype == TType.I64:
+                    self.subscription_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.I32:
-                    self.results_per_page = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.search_string = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.LIST:
+                    self.entities = []
+                    (_etype424, _size421) = iprot.readListBegin()
+                    for _i425 in range(_size421):
+                        _elem426 = EntityPosition()
+                        _elem426.read(iprot)
+                        self.entities.append(_elem426)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4752,18 +9903,17 @@ class ListPlayerRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ListPlayerRequestData')
-        if self.page is not None:
-            oprot.writeFieldBegin('page', TType.I32, 1)
-            oprot.writeI32(self.page)
-            oprot.writeFieldEnd()
-        if self.results_per_page is not None:
-            oprot.writeFieldBegin('results_per_page', TType.I32, 2)
-            oprot.writeI32(self.results_per_page)
+        oprot.writeStructBegin('SubscribeAreaResponseData')
+        if self.subscription_id is not None:
+            oprot.writeFieldBegin('subscription_id', TType.I64, 1)
+            oprot.writeI64(self.subscription_id)
             oprot.writeFieldEnd()
-        if self.search_string is not None:
-            oprot.writeFieldBegin('search_string', TType.STRING, 3)
-            oprot.writeString(self.search_string.encode('utf-8') if sys.version_info[0] == 2 else self.search_string)
+        if self.entities is not None:
+            oprot.writeFieldBegin('entities', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRUCT, len(self.entities))
+            for iter427 in self.entities:
+                iter427.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4783,17 +9933,17 @@ class ListPlayerRequestData(object):
         return not (self == other)
 
 
-class CreatePlayerResponseData(object):
+class PollAreaRequestData(object):
     """
     Attributes:
-     - player
+     - subscription_id
 
     """
     thrift_spec = None
 
 
-    def __init__(self, player = None,):
-        self.player = player
+    def __init__(self, subscription_id = None,):
+        self.subscription_id = subscription_id
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4805,9 +9955,8 @@ class CreatePlayerResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.player = Player()
-                    self.player.read(iprot)
+                if ftype == TType.I64:
+                    self.subscription_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4820,10 +9969,10 @@ class CreatePlayerResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('CreatePlayerResponseData')
-        if self.player is not None:
-            oprot.writeFieldBegin('player', TType.STRUCT, 1)
-            self.player.write(oprot)
+        oprot.writeStructBegin('PollAreaRequestData')
+        if self.subscription_id is not None:
+            oprot.writeFieldBegin('subscription_id', TType.I64, 1)
+            oprot.writeI64(self.subscription_id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4843,17 +9992,19 @@ class CreatePlayerResponseData(object):
         return not (self == other)
 
 
-class LoadPlayerResponseData(object):
+class EntityRef(object):
     """
     Attributes:
-     - player
+     - kind
+     - id
 
     """
     thrift_spec = None
 
 
-    def __init__(self, player = None,):
-        self.player = player
+    def __init__(self, kind = None, id = None,):
+        self.kind = kind
+        self.id = id
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4865,9 +10016,13 @@ class LoadPlayerResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.player = Player()
-                    self.player.read(iprot)
+                if ftype == TType.I32:
+                    self.kind = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4880,10 +10035,14 @@ class LoadPlayerResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('LoadPlayerResponseData')
-        if self.player is not None:
-            oprot.writeFieldBegin('player', TType.STRUCT, 1)
-            self.player.write(oprot)
+        oprot.writeStructBegin('EntityRef')
+        if self.kind is not None:
+            oprot.writeFieldBegin('kind', TType.I32, 1)
+            oprot.writeI32(self.kind)
+            oprot.writeFieldEnd()
+        if self.id is not None:
+            oprot.writeFieldBegin('id', TType.I64, 2)
+            oprot.writeI64(self.id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4903,17 +10062,21 @@ class LoadPlayerResponseData(object):
         return not (self == other)
 
 
-class SavePlayerResponseData(object):
+class PollAreaResponseData(object):
     """
     Attributes:
-     - player
+     - entered
+     - moved
+     - left
 
     """
     thrift_spec = None
 
 
-    def __init__(self, player = None,):
-        self.player = player
+    def __init__(self, entered = None, moved = None, left = None,):
+        self.entered = entered
+        self.moved = moved
+        self.left = left
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4925,9 +10088,36 @@ class SavePlayerResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.player = Player()
-                    self.player.read(iprot)
+                if ftype == TType.LIST:
+                    self.entered = []
+                    (_etype431, _size428) = iprot.readListBegin()
+                    for _i432 in range(_size428):
+                        _elem433 = EntityPosition()
+                        _elem433.read(iprot)
+                        self.entered.append(_elem433)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.moved = []
+                    (_etype437, _size434) = iprot.readListBegin()
+                    for _i438 in range(_size434):
+                        _elem439 = EntityPosition()
+                        _elem439.read(iprot)
+                        self.moved.append(_elem439)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.left = []
+                    (_etype443, _size440) = iprot.readListBegin()
+                    for _i444 in range(_size440):
+                        _elem445 = EntityRef()
+                        _elem445.read(iprot)
+                        self.left.append(_elem445)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4938,12 +10128,29 @@ class SavePlayerResponseData(object):
     def write(self, oprot):
         self.validate()
         if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
-            return
-        oprot.writeStructBegin('SavePlayerResponseData')
-        if self.player is not None:
-            oprot.writeFieldBegin('player', TType.STRUCT, 1)
-            self.player.write(oprot)
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('PollAreaResponseData')
+        if self.entered is not None:
+            oprot.writeFieldBegin('entered', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.entered))
+            for iter446 in self.entered:
+                iter446.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.moved is not None:
+            oprot.writeFieldBegin('moved', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRUCT, len(self.moved))
+            for iter447 in self.moved:
+                iter447.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.left is not None:
+            oprot.writeFieldBegin('left', TType.LIST, 3)
+            oprot.writeListBegin(TType.STRUCT, len(self.left))
+            for iter448 in self.left:
+                iter448.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -4963,17 +10170,17 @@ class SavePlayerResponseData(object):
         return not (self == other)
 
 
-class DeletePlayerResponseData(object):
+class UnsubscribeAreaRequestData(object):
     """
     Attributes:
-     - player_id
+     - subscription_id
 
     """
     thrift_spec = None
 
 
-    def __init__(self, player_id = None,):
-        self.player_id = player_id
+    def __init__(self, subscription_id = None,):
+        self.subscription_id = subscription_id
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -4986,7 +10193,7 @@ class DeletePlayerResponseData(object):
                 break
             if fid == 1:
                 if ftype == TType.I64:
-                    self.player_id = iprot.readI64()
+                    self.subscription_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -4999,10 +10206,10 @@ class DeletePlayerResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('DeletePlayerResponseData')
-        if self.player_id is not None:
-            oprot.writeFieldBegin('player_id', TType.I64, 1)
-            oprot.writeI64(self.player_id)
+        oprot.writeStructBegin('UnsubscribeAreaRequestData')
+        if self.subscription_id is not None:
+            oprot.writeFieldBegin('subscription_id', TType.I64, 1)
+            oprot.writeI64(self.subscription_id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -5022,19 +10229,17 @@ class DeletePlayerResponseData(object):
         return not (self == other)
 
 
-class ListPlayerResponseData(object):
+class UnsubscribeAreaResponseData(object):
     """
     Attributes:
-     - players
-     - total_count
+     - subscription_id
 
     """
     thrift_spec = None
 
 
-    def __init__(self, players = None, total_count = None,):
-        self.players = players
-        self.total_count = total_count
+    def __init__(self, subscription_id = None,):
+        self.subscription_id = subscription_id
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -5046,19 +10251,8 @@ class ListPlayerResponseData(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.LIST:
-                    self.players = []
-                    (_etype102, _size99) = iprot.readListBegin()
-                    for _i103 in range(_size99):
-                        _elem104 = Player()
-                        _elem104.read(iprot)
-                        self.players.append(_elem104)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
                 if ftype == TType.I64:
-                    self.total_count = iprot.readI64()
+                    self.subscription_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -5071,17 +10265,10 @@ class ListPlayerResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ListPlayerResponseData')
-        if self.players is not None:
-            oprot.writeFieldBegin('players', TType.LIST, 1)
-            oprot.writeListBegin(TType.STRUCT, len(self.players))
-            for iter105 in self.players:
-                iter105.write(oprot)
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.total_count is not None:
-            oprot.writeFieldBegin('total_count', TType.I64, 2)
-            oprot.writeI64(self.total_count)
+        oprot.writeStructBegin('UnsubscribeAreaResponseData')
+        if self.subscription_id is not None:
+            oprot.writeFieldBegin('subscription_id', TType.I64, 1)
+            oprot.writeI64(self.subscription_id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -5101,25 +10288,25 @@ class ListPlayerResponseData(object):
         return not (self == other)
 
 
-class PlayerRequestData(object):
+class WorldRequestData(object):
     """
     Attributes:
-     - create_player
-     - load_player
-     - save_player
-     - delete_player
-     - list_player
+     - query_radius
+     - update_positions
+     - subscribe_area
+     - poll_area
+     - unsubscribe_area
 
     """
     thrift_spec = None
 
 
-    def __init__(self, create_player = None, load_player = None, save_player = None, delete_player = None, list_player = None,):
-        self.create_player = create_player
-        self.load_player = load_player
-        self.save_player = save_player
-        self.delete_player = delete_player
-        self.list_player = list_player
+    def __init__(self, query_radius = None, update_positions = None, subscribe_area = None, poll_area = None, unsubscribe_area = None,):
+        self.query_radius = query_radius
+        self.update_positions = update_positions
+        self.subscribe_area = subscribe_area
+        self.poll_area = poll_area
+        self.unsubscribe_area = unsubscribe_area
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -5132,32 +10319,32 @@ class PlayerRequestData(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.create_player = CreatePlayerRequestData()
-                    self.create_player.read(iprot)
+                    self.query_radius = QueryRadiusRequestData()
+                    self.query_radius.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.load_player = LoadPlayerRequestData()
-                    self.load_player.read(iprot)
+                    self.update_positions = UpdatePositionsRequestData()
+                    self.update_positions.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 3:
                 if ftype == TType.STRUCT:
-                    self.save_player = SavePlayerRequestData()
-                    self.save_player.read(iprot)
+                    self.subscribe_area = SubscribeAreaRequestData()
+                    self.subscribe_area.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 4:
                 if ftype == TType.STRUCT:
-                    self.delete_player = DeletePlayerRequestData()
-                    self.delete_player.read(iprot)
+                    self.poll_area = PollAreaRequestData()
+                    self.poll_area.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 5:
                 if ftype == TType.STRUCT:
-                    self.list_player = ListPlayerRequestData()
-                    self.list_player.read(iprot)
+                    self.unsubscribe_area = UnsubscribeAreaRequestData()
+                    self.unsubscribe_area.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -5170,26 +10357,26 @@ class PlayerRequestData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('PlayerRequestData')
-        if self.create_player is not None:
-            oprot.writeFieldBegin('create_player', TType.STRUCT, 1)
-            self.create_player.write(oprot)
+        oprot.writeStructBegin('WorldRequestData')
+        if self.query_radius is not None:
+            oprot.writeFieldBegin('query_radius', TType.STRUCT, 1)
+            self.query_radius.write(oprot)
             oprot.writeFieldEnd()
-        if self.load_player is not None:
-            oprot.writeFieldBegin('load_player', TType.STRUCT, 2)
-            self.load_player.write(oprot)
+        if self.update_positions is not None:
+            oprot.writeFieldBegin('update_positions', TType.STRUCT, 2)
+            self.update_positions.write(oprot)
             oprot.writeFieldEnd()
-        if self.save_player is not None:
-            oprot.writeFieldBegin('save_player', TType.STRUCT, 3)
-            self.save_player.write(oprot)
+        if self.subscribe_area is not None:
+            oprot.writeFieldBegin('subscribe_area', TType.STRUCT, 3)
+            self.subscribe_area.write(oprot)
             oprot.writeFieldEnd()
-        if self.delete_player is not None:
-            oprot.writeFieldBegin('delete_player', TType.STRUCT, 4)
-            self.delete_player.write(oprot)
+        if self.poll_area is not None:
+            oprot.writeFieldBegin('poll_area', TType.STRUCT, 4)
+            self.poll_area.write(oprot)
             oprot.writeFieldEnd()
-        if self.list_player is not None:
-            oprot.writeFieldBegin('list_player', TType.STRUCT, 5)
-            self.list_player.write(oprot)
+        if self.unsubscribe_area is not None:
+            oprot.writeFieldBegin('unsubscribe_area', TType.STRUCT, 5)
+            self.unsubscribe_area.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -5209,25 +10396,25 @@ class PlayerRequestData(object):
         return not (self == other)
 
 
-class PlayerResponseData(object):
+class WorldResponseData(object):
     """
     Attributes:
-     - create_player
-     - load_player
-     - save_player
-     - delete_player
-     - list_player
+     - query_radius
+     - update_positions
+     - subscribe_area
+     - poll_area
+     - unsubscribe_area
 
     """
     thrift_spec = None
 
 
-    def __init__(self, create_player = None, load_player = None, save_player = None, delete_player = None, list_player = None,):
-        self.create_player = create_player
-        self.load_player = load_player
-        self.save_player = save_player
-        self.delete_player = delete_player
-        self.list_player = list_player
+    def __init__(self, query_radius = None, update_positions = None, subscribe_area = None, poll_area = None, unsubscribe_area = None,):
+        self.query_radius = query_radius
+        self.update_positions = update_positions
+        self.subscribe_area = subscribe_area
+        self.poll_area = poll_area
+        self.unsubscribe_area = unsubscribe_area
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -5240,32 +10427,32 @@ class PlayerResponseData(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.create_player = CreatePlayerResponseData()
-                    self.create_player.read(iprot)
+                    self.query_radius = QueryRadiusResponseData()
+                    self.query_radius.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.load_player = LoadPlayerResponseData()
-                    self.load_player.read(iprot)
+                    self.update_positions = UpdatePositionsResponseData()
+                    self.update_positions.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 3:
                 if ftype == TType.STRUCT:
-                    self.save_player = SavePlayerResponseData()
-                    self.save_player.read(iprot)
+                    self.subscribe_area = SubscribeAreaResponseData()
+                    self.subscribe_area.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 4:
                 if ftype == TType.STRUCT:
-                    self.delete_player = DeletePlayerResponseData()
-                    self.delete_player.read(iprot)
+                    self.poll_area = PollAreaResponseData()
+                    self.poll_area.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 5:
                 if ftype == TType.STRUCT:
-                    self.list_player = ListPlayerResponseData()
-                    self.list_player.read(iprot)
+                    self.unsubscribe_area = UnsubscribeAreaResponseData()
+                    self.unsubscribe_area.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -5278,26 +10465,26 @@ class PlayerResponseData(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('PlayerResponseData')
-        if self.create_player is not None:
-            oprot.writeFieldBegin('create_player', TType.STRUCT, 1)
-            self.create_player.write(oprot)
+        oprot.writeStructBegin('WorldResponseData')
+        if self.query_radius is not None:
+            oprot.writeFieldBegin('query_radius', TType.STRUCT, 1)
+            self.query_radius.write(oprot)
             oprot.writeFieldEnd()
-        if self.load_player is not None:
-            oprot.writeFieldBegin('load_player', TType.STRUCT, 2)
-            self.load_player.write(oprot)
+        if self.update_positions is not None:
+            oprot.writeFieldBegin('update_positions', TType.STRUCT, 2)
+            self.update_positions.write(oprot)
             oprot.writeFieldEnd()
-        if self.save_player is not None:
-            oprot.writeFieldBegin('save_player', TType.STRUCT, 3)
-            self.save_player.write(oprot)
+        if self.subscribe_area is not None:
+            oprot.writeFieldBegin('subscribe_area', TType.STRUCT, 3)
+            self.subscribe_area.write(oprot)
             oprot.writeFieldEnd()
-        if self.delete_player is not None:
-            oprot.writeFieldBegin('delete_player', TType.STRUCT, 4)
-            self.delete_player.write(oprot)
+        if self.poll_area is not None:
+            oprot.writeFieldBegin('poll_area', TType.STRUCT, 4)
+            self.poll_area.write(oprot)
             oprot.writeFieldEnd()
-        if self.list_player is not None:
-            oprot.writeFieldBegin('list_player', TType.STRUCT, 5)
-            self.list_player.write(oprot)
+        if self.unsubscribe_area is not None:
+            oprot.writeFieldBegin('unsubscribe_area', TType.STRUCT, 5)
+            self.unsubscribe_area.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -5317,7 +10504,7 @@ class PlayerResponseData(object):
         return not (self == other)
 
 
-class PlayerRequest(object):
+class WorldRequest(object):
     """
     Attributes:
      - data
@@ -5340,7 +10527,7 @@ class PlayerRequest(object):
                 break
             if fid == 1:
                 if ftype == TType.STRUCT:
-                    self.data = PlayerRequestData()
+                    self.data = WorldRequestData()
                     self.data.read(iprot)
                 else:
                     iprot.skip(ftype)
@@ -5354,7 +10541,7 @@ class PlayerRequest(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('PlayerRequest')
+        oprot.writeStructBegin('WorldRequest')
         if self.data is not None:
             oprot.writeFieldBegin('data', TType.STRUCT, 1)
             self.data.write(oprot)
@@ -5377,7 +10564,7 @@ class PlayerRequest(object):
         return not (self == other)
 
 
-class PlayerResponse(object):
+class WorldResponse(object):
     """
     Attributes:
      - results
@@ -5403,17 +10590,17 @@ class PlayerResponse(object):
             if fid == 1:
                 if ftype == TType.LIST:
                     self.results = []
-                    (_etype109, _size106) = iprot.readListBegin()
-                    for _i110 in range(_size106):
-                        _elem111 = GameResult()
-                        _elem111.read(iprot)
-                        self.results.append(_elem111)
+                    (_etype452, _size449) = iprot.readListBegin()
+                    for _i453 in range(_size449):
+                        _elem454 = GameResult()
+                        _elem454.read(iprot)
+                        self.results.append(_elem454)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.response_data = PlayerResponseData()
+                    self.response_data = WorldResponseData()
                     self.response_data.read(iprot)
                 else:
                     iprot.skip(ftype)
@@ -5427,12 +10614,12 @@ class PlayerResponse(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('PlayerResponse')
+        oprot.writeStructBegin('WorldResponse')
         if self.results is not None:
             oprot.writeFieldBegin('results', TType.LIST, 1)
             oprot.writeListBegin(TType.STRUCT, len(self.results))
-            for iter112 in self.results:
-                iter112.write(oprot)
+            for iter455 in self.results:
+                iter455.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.response_data is not None:
@@ -5490,11 +10677,11 @@ class EnumDefinition(object):
             elif fid == 2:
                 if ftype == TType.MAP:
                     self.values = {}
-                    (_ktype114, _vtype115, _size113) = iprot.readMapBegin()
-                    for _i117 in range(_size113):
-                        _key118 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
-                        _val119 = iprot.readI32()
-                        self.values[_key118] = _val119
+                    (_ktype457, _vtype458, _size456) = iprot.readMapBegin()
+                    for _i460 in range(_size456):
+                        _key461 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        _val462 = iprot.readI32()
+                        self.values[_key461] = _val462
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
@@ -5521,9 +10708,9 @@ class EnumDefinition(object):
         if self.values is not None:
             oprot.writeFieldBegin('values', TType.MAP, 2)
             oprot.writeMapBegin(TType.STRING, TType.I32, len(self.values))
-            for kiter120, viter121 in self.values.items():
-                oprot.writeString(kiter120.encode('utf-8') if sys.version_info[0] == 2 else kiter120)
-                oprot.writeI32(viter121)
+            for kiter463, viter464 in self.values.items():
+                oprot.writeString(kiter463.encode('utf-8') if sys.version_info[0] == 2 else kiter463)
+                oprot.writeI32(viter464)
             oprot.writeMapEnd()
             oprot.writeFieldEnd()
         if self.description is not None:
@@ -5672,22 +10859,22 @@ class MethodDescription(object):
             elif fid == 5:
                 if ftype == TType.LIST:
                     self.request_enum_fields = []
-                    (_etype125, _size122) = iprot.readListBegin()
-                    for _i126 in range(_size122):
-                        _elem127 = FieldEnumMapping()
-                        _elem127.read(iprot)
-                        self.request_enum_fields.append(_elem127)
+                    (_etype468, _size465) = iprot.readListBegin()
+                    for _i469 in range(_size465):
+                        _elem470 = FieldEnumMapping()
+                        _elem470.read(iprot)
+                        self.request_enum_fields.append(_elem470)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 6:
                 if ftype == TType.LIST:
                     self.response_enum_fields = []
-                    (_etype131, _size128) = iprot.readListBegin()
-                    for _i132 in range(_size128):
-                        _elem133 = FieldEnumMapping()
-                        _elem133.read(iprot)
-                        self.response_enum_fields.append(_elem133)
+                    (_etype474, _size471) = iprot.readListBegin()
+                    for _i475 in range(_size471):
+                        _elem476 = FieldEnumMapping()
+                        _elem476.read(iprot)
+                        self.response_enum_fields.append(_elem476)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -5721,15 +10908,15 @@ class MethodDescription(object):
         if self.request_enum_fields is not None:
             oprot.writeFieldBegin('request_enum_fields', TType.LIST, 5)
             oprot.writeListBegin(TType.STRUCT, len(self.request_enum_fields))
-            for iter134 in self.request_enum_fields:
-                iter134.write(oprot)
+            for iter477 in self.request_enum_fields:
+                iter477.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.response_enum_fields is not None:
             oprot.writeFieldBegin('response_enum_fields', TType.LIST, 6)
             oprot.writeListBegin(TType.STRUCT, len(self.response_enum_fields))
-            for iter135 in self.response_enum_fields:
-                iter135.write(oprot)
+            for iter478 in self.response_enum_fields:
+                iter478.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -5797,22 +10984,22 @@ class ServiceMetadata(object):
             elif fid == 4:
                 if ftype == TType.LIST:
                     self.methods = []
-                    (_etype139, _size136) = iprot.readListBegin()
-                    for _i140 in range(_size136):
-                        _elem141 = MethodDescription()
-                        _elem141.read(iprot)
-                        self.methods.append(_elem141)
+                    (_etype482, _size479) = iprot.readListBegin()
+                    for _i483 in range(_size479):
+                        _elem484 = MethodDescription()
+                        _elem484.read(iprot)
+                        self.methods.append(_elem484)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 5:
                 if ftype == TType.LIST:
                     self.enums = []
-                    (_etype145, _size142) = iprot.readListBegin()
-                    for _i146 in range(_size142):
-                        _elem147 = EnumDefinition()
-                        _elem147.read(iprot)
-                        self.enums.append(_elem147)
+                    (_etype488, _size485) = iprot.readListBegin()
+                    for _i489 in range(_size485):
+                        _elem490 = EnumDefinition()
+                        _elem490.read(iprot)
+                        self.enums.append(_elem490)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -5842,15 +11029,15 @@ class ServiceMetadata(object):
         if self.methods is not None:
             oprot.writeFieldBegin('methods', TType.LIST, 4)
             oprot.writeListBegin(TType.STRUCT, len(self.methods))
-            for iter148 in self.methods:
-                iter148.write(oprot)
+            for iter491 in self.methods:
+                iter491.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.enums is not None:
             oprot.writeFieldBegin('enums', TType.LIST, 5)
             oprot.writeListBegin(TType.STRUCT, len(self.enums))
-            for iter149 in self.enums:
-                iter149.write(oprot)
+            for iter492 in self.enums:
+                iter492.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -5962,6 +11149,14 @@ BlueprintTreeNode.thrift_spec = (
     (6, TType.BOOL, 'max_depth_reached', None, False, ),  # 6
     (7, TType.BOOL, 'cycle_detected', None, False, ),  # 7
 )
+all_structs.append(BillOfMaterials)
+BillOfMaterials.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'item_id', None, None, ),  # 1
+    (2, TType.MAP, 'materials', (TType.I64, None, TType.DOUBLE, None, False), None, ),  # 2
+    (3, TType.I64, 'total_bake_time_ms', None, None, ),  # 3
+    (4, TType.BOOL, 'cycle_detected', None, False, ),  # 4
+)
 all_structs.append(ItemDb)
 ItemDb.thrift_spec = (
     None,  # 0
@@ -5974,6 +11169,7 @@ InventoryEntry.thrift_spec = (
     (2, TType.DOUBLE, 'quantity', None, None, ),  # 2
     (3, TType.BOOL, 'is_max_stacked', None, False, ),  # 3
     (4, TType.I64, 'mobile_item_id', None, None, ),  # 4
+    (5, TType.I64, 'id', None, None, ),  # 5
 )
 all_structs.append(Inventory)
 Inventory.thrift_spec = (
@@ -5984,6 +11180,7 @@ Inventory.thrift_spec = (
     (4, TType.LIST, 'entries', (TType.STRUCT, [InventoryEntry, None], False), None, ),  # 4
     (5, TType.DOUBLE, 'last_calculated_volume', None, 0.0000000000000000, ),  # 5
     (6, TType.STRUCT, 'owner', [Owner, None], None, ),  # 6
+    (7, TType.DOUBLE, 'contained_volume', None, 0.0000000000000000, ),  # 7
 )
 all_structs.append(GameResult)
 GameResult.thrift_spec = (
@@ -6001,6 +11198,25 @@ Mobile.thrift_spec = (
     (4, TType.STRUCT, 'owner', [Owner, None], None, ),  # 4
     (5, TType.STRING, 'what_we_call_you', 'UTF8', None, ),  # 5
 )
+all_structs.append(Projection)
+Projection.thrift_spec = (
+    None,  # 0
+    (1, TType.BOOL, 'include_attributes', None, True, ),  # 1
+    (2, TType.BOOL, 'include_mobile', None, True, ),  # 2
+    (3, TType.LIST, 'attribute_types', (TType.I32, None, False), None, ),  # 3
+    (4, TType.BOOL, 'compact_results', None, False, ),  # 4
+)
+all_structs.append(CraftingJob)
+CraftingJob.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'id', None, None, ),  # 1
+    (2, TType.I64, 'inventory_id', None, None, ),  # 2
+    (3, TType.I64, 'item_id', None, None, ),  # 3
+    (4, TType.DOUBLE, 'quantity', None, None, ),  # 4
+    (5, TType.I32, 'state', None, None, ),  # 5
+    (6, TType.I64, 'ready_at_ms', None, None, ),  # 6
+    (7, TType.STRING, 'error', 'UTF8', None, ),  # 7
+)
 all_structs.append(LoadInventoryRequestData)
 LoadInventoryRequestData.thrift_spec = (
     None,  # 0
@@ -6030,6 +11246,7 @@ TransferItemRequestData.thrift_spec = (
     (2, TType.I64, 'destination_inventory_id', None, None, ),  # 2
     (3, TType.I64, 'item_id', None, None, ),  # 3
     (4, TType.DOUBLE, 'quantity', None, None, ),  # 4
+    (5, TType.I64, 'mobile_item_id', None, None, ),  # 5
 )
 all_structs.append(ListInventoryRequestData)
 ListInventoryRequestData.thrift_spec = (
@@ -6038,6 +11255,82 @@ ListInventoryRequestData.thrift_spec = (
     (2, TType.I32, 'results_per_page', None, None, ),  # 2
     (3, TType.STRING, 'search_string', 'UTF8', None, ),  # 3
 )
+all_structs.append(LoadManyInventoriesRequestData)
+LoadManyInventoriesRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'inventory_ids', (TType.I64, None, False), None, ),  # 1
+)
+all_structs.append(OwnerItemTotalsRequestData)
+OwnerItemTotalsRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'owner', [Owner, None], None, ),  # 1
+    (2, TType.LIST, 'item_ids', (TType.I64, None, False), None, ),  # 2
+)
+all_structs.append(OwnerCapacityRequestData)
+OwnerCapacityRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'owner', [Owner, None], None, ),  # 1
+)
+all_structs.append(OwnerHasItemsRequestData)
+OwnerHasItemsRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'owner', [Owner, None], None, ),  # 1
+    (2, TType.LIST, 'item_ids', (TType.I64, None, False), None, ),  # 2
+)
+all_structs.append(LoadContainerTreeRequestData)
+LoadContainerTreeRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'inventory_id', None, None, ),  # 1
+    (2, TType.I32, 'max_depth', None, None, ),  # 2
+    (3, TType.BOOL, 'rebuild', None, False, ),  # 3
+)
+all_structs.append(StartCraftingRequestData)
+StartCraftingRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'inventory_id', None, None, ),  # 1
+    (2, TType.I64, 'item_id', None, None, ),  # 2
+    (3, TType.DOUBLE, 'quantity', None, 1.0000000000000000, ),  # 3
+)
+all_structs.append(CancelCraftingRequestData)
+CancelCraftingRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'job_id', None, None, ),  # 1
+)
+all_structs.append(ListCraftingJobsRequestData)
+ListCraftingJobsRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'inventory_id', None, None, ),  # 1
+    (2, TType.BOOL, 'pending_only', None, True, ),  # 2
+)
+all_structs.append(BreakdownItemRequestData)
+BreakdownItemRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'inventory_id', None, None, ),  # 1
+    (2, TType.I64, 'item_id', None, None, ),  # 2
+    (3, TType.DOUBLE, 'quantity', None, 1.0000000000000000, ),  # 3
+    (4, TType.BOOL, 'to_raw_materials', None, False, ),  # 4
+)
+all_structs.append(SetItemAttributesRequestData)
+SetItemAttributesRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'inventory_id', None, None, ),  # 1
+    (2, TType.I64, 'item_id', None, None, ),  # 2
+    (3, TType.I64, 'mobile_item_id', None, None, ),  # 3
+    (4, TType.LIST, 'attributes', (TType.STRUCT, [Attribute, None], False), None, ),  # 4
+    (5, TType.DOUBLE, 'quantity', None, 1.0000000000000000, ),  # 5
+)
+all_structs.append(SalvageContainersRequestData)
+SalvageContainersRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'inventory_ids', (TType.I64, None, False), None, ),  # 1
+    (2, TType.BOOL, 'to_raw_materials', None, False, ),  # 2
+)
+all_structs.append(OwnerCraftableRequestData)
+OwnerCraftableRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'owner', [Owner, None], None, ),  # 1
+    (2, TType.LIST, 'item_ids', (TType.I64, None, False), None, ),  # 2
+)
 all_structs.append(LoadInventoryResponseData)
 LoadInventoryResponseData.thrift_spec = (
     None,  # 0
@@ -6070,6 +11363,89 @@ ListInventoryResponseData.thrift_spec = (
     (1, TType.LIST, 'inventories', (TType.STRUCT, [Inventory, None], False), None, ),  # 1
     (2, TType.I64, 'total_count', None, None, ),  # 2
 )
+all_structs.append(LoadManyInventoriesResponseData)
+LoadManyInventoriesResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.MAP, 'inventories', (TType.I64, None, TType.STRUCT, [Inventory, None], False), None, ),  # 1
+    (2, TType.MAP, 'errors', (TType.I64, None, TType.STRUCT, [GameResult, None], False), None, ),  # 2
+)
+all_structs.append(OwnerItemTotalsResponseData)
+OwnerItemTotalsResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.MAP, 'quantities', (TType.I64, None, TType.DOUBLE, None, False), None, ),  # 1
+)
+all_structs.append(InventoryCapacity)
+InventoryCapacity.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'inventory_id', None, None, ),  # 1
+    (2, TType.I32, 'used_entries', None, None, ),  # 2
+    (3, TType.I32, 'free_entries', None, None, ),  # 3
+    (4, TType.DOUBLE, 'free_volume', None, None, ),  # 4
+)
+all_structs.append(OwnerCapacityResponseData)
+OwnerCapacityResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'inventories', (TType.STRUCT, [InventoryCapacity, None], False), None, ),  # 1
+)
+all_structs.append(OwnerHasItemsResponseData)
+OwnerHasItemsResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.MAP, 'present', (TType.I64, None, TType.BOOL, None, False), None, ),  # 1
+)
+all_structs.append(StartCraftingResponseData)
+StartCraftingResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'job', [CraftingJob, None], None, ),  # 1
+)
+all_structs.append(CancelCraftingResponseData)
+CancelCraftingResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'job_id', None, None, ),  # 1
+    (2, TType.BOOL, 'cancelled', None, None, ),  # 2
+)
+all_structs.append(ListCraftingJobsResponseData)
+ListCraftingJobsResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'jobs', (TType.STRUCT, [CraftingJob, None], False), None, ),  # 1
+)
+all_structs.append(SetItemAttributesResponseData)
+SetItemAttributesResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'mobile_item_id', None, None, ),  # 1
+    (2, TType.BOOL, 'materialized', None, None, ),  # 2
+)
+all_structs.append(BreakdownItemResponseData)
+BreakdownItemResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'inventory', [Inventory, None], None, ),  # 1
+    (2, TType.MAP, 'produced', (TType.I64, None, TType.DOUBLE, None, False), None, ),  # 2
+)
+all_structs.append(SalvageContainersResponseData)
+SalvageContainersResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'inventories', (TType.STRUCT, [Inventory, None], False), None, ),  # 1
+    (2, TType.MAP, 'consumed', (TType.I64, None, TType.DOUBLE, None, False), None, ),  # 2
+    (3, TType.MAP, 'produced', (TType.I64, None, TType.DOUBLE, None, False), None, ),  # 3
+)
+all_structs.append(OwnerCraftableResponseData)
+OwnerCraftableResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.MAP, 'craftable', (TType.I64, None, TType.I64, None, False), None, ),  # 1
+)
+all_structs.append(ContainerNode)
+ContainerNode.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'inventory', [Inventory, None], None, ),  # 1
+    (2, TType.I64, 'parent_inventory_id', None, None, ),  # 2
+    (3, TType.I32, 'depth', None, None, ),  # 3
+    (4, TType.DOUBLE, 'contained_volume', None, None, ),  # 4
+    (5, TType.DOUBLE, 'total_volume', None, None, ),  # 5
+)
+all_structs.append(LoadContainerTreeResponseData)
+LoadContainerTreeResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'nodes', (TType.STRUCT, [ContainerNode, None], False), None, ),  # 1
+)
 all_structs.append(InventoryRequestData)
 InventoryRequestData.thrift_spec = (
     None,  # 0
@@ -6079,6 +11455,18 @@ InventoryRequestData.thrift_spec = (
     (4, TType.STRUCT, 'split_stack', [SplitStackRequestData, None], None, ),  # 4
     (5, TType.STRUCT, 'transfer_item', [TransferItemRequestData, None], None, ),  # 5
     (6, TType.STRUCT, 'list_inventory', [ListInventoryRequestData, None], None, ),  # 6
+    (7, TType.STRUCT, 'load_many_inventories', [LoadManyInventoriesRequestData, None], None, ),  # 7
+    (8, TType.STRUCT, 'owner_item_totals', [OwnerItemTotalsRequestData, None], None, ),  # 8
+    (9, TType.STRUCT, 'owner_capacity', [OwnerCapacityRequestData, None], None, ),  # 9
+    (10, TType.STRUCT, 'owner_has_items', [OwnerHasItemsRequestData, None], None, ),  # 10
+    (11, TType.STRUCT, 'load_container_tree', [LoadContainerTreeRequestData, None], None, ),  # 11
+    (12, TType.STRUCT, 'owner_craftable', [OwnerCraftableRequestData, None], None, ),  # 12
+    (13, TType.STRUCT, 'start_crafting', [StartCraftingRequestData, None], None, ),  # 13
+    (14, TType.STRUCT, 'cancel_crafting', [CancelCraftingRequestData, None], None, ),  # 14
+    (15, TType.STRUCT, 'list_crafting_jobs', [ListCraftingJobsRequestData, None], None, ),  # 15
+    (16, TType.STRUCT, 'breakdown_item', [BreakdownItemRequestData, None], None, ),  # 16
+    (17, TType.STRUCT, 'salvage_containers', [SalvageContainersRequestData, None], None, ),  # 17
+    (18, TType.STRUCT, 'set_item_attributes', [SetItemAttributesRequestData, None], None, ),  # 18
 )
 all_structs.append(InventoryResponseData)
 InventoryResponseData.thrift_spec = (
@@ -6089,6 +11477,18 @@ InventoryResponseData.thrift_spec = (
     (4, TType.STRUCT, 'split_stack', [SplitStackResponseData, None], None, ),  # 4
     (5, TType.STRUCT, 'transfer_item', [TransferItemResponseData, None], None, ),  # 5
     (6, TType.STRUCT, 'list_inventory', [ListInventoryResponseData, None], None, ),  # 6
+    (7, TType.STRUCT, 'load_many_inventories', [LoadManyInventoriesResponseData, None], None, ),  # 7
+    (8, TType.STRUCT, 'owner_item_totals', [OwnerItemTotalsResponseData, None], None, ),  # 8
+    (9, TType.STRUCT, 'owner_capacity', [OwnerCapacityResponseData, None], None, ),  # 9
+    (10, TType.STRUCT, 'owner_has_items', [OwnerHasItemsResponseData, None], None, ),  # 10
+    (11, TType.STRUCT, 'load_container_tree', [LoadContainerTreeResponseData, None], None, ),  # 11
+    (12, TType.STRUCT, 'owner_craftable', [OwnerCraftableResponseData, None], None, ),  # 12
+    (13, TType.STRUCT, 'start_crafting', [StartCraftingResponseData, None], None, ),  # 13
+    (14, TType.STRUCT, 'cancel_crafting', [CancelCraftingResponseData, None], None, ),  # 14
+    (15, TType.STRUCT, 'list_crafting_jobs', [ListCraftingJobsResponseData, None], None, ),  # 15
+    (16, TType.STRUCT, 'breakdown_item', [BreakdownItemResponseData, None], None, ),  # 16
+    (17, TType.STRUCT, 'salvage_containers', [SalvageContainersResponseData, None], None, ),  # 17
+    (18, TType.STRUCT, 'set_item_attributes', [SetItemAttributesResponseData, None], None, ),  # 18
 )
 all_structs.append(InventoryRequest)
 InventoryRequest.thrift_spec = (
@@ -6111,6 +11511,7 @@ LoadItemRequestData.thrift_spec = (
     None,  # 0
     (1, TType.I64, 'item_id', None, None, ),  # 1
     (2, TType.I32, 'backing_table', None, None, ),  # 2
+    (3, TType.STRUCT, 'projection', [Projection, None], None, ),  # 3
 )
 all_structs.append(SaveItemRequestData)
 SaveItemRequestData.thrift_spec = (
@@ -6128,6 +11529,7 @@ ListItemRequestData.thrift_spec = (
     (1, TType.I32, 'page', None, None, ),  # 1
     (2, TType.I32, 'results_per_page', None, None, ),  # 2
     (3, TType.STRING, 'search_string', 'UTF8', None, ),  # 3
+    (4, TType.STRUCT, 'projection', [Projection, None], None, ),  # 4
 )
 all_structs.append(AutocompleteItemRequestData)
 AutocompleteItemRequestData.thrift_spec = (
@@ -6141,6 +11543,23 @@ LoadItemWithBlueprintTreeRequestData.thrift_spec = (
     (1, TType.I64, 'item_id', None, None, ),  # 1
     (2, TType.I32, 'max_depth', None, 10, ),  # 2
 )
+all_structs.append(LoadManyItemsRequestData)
+LoadManyItemsRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'item_ids', (TType.I64, None, False), None, ),  # 1
+    (2, TType.STRUCT, 'projection', [Projection, None], None, ),  # 2
+)
+all_structs.append(LoadBillOfMaterialsRequestData)
+LoadBillOfMaterialsRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'item_ids', (TType.I64, None, False), None, ),  # 1
+)
+all_structs.append(LoadDependentsRequestData)
+LoadDependentsRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'item_id', None, None, ),  # 1
+    (2, TType.I32, 'max_depth', None, 10, ),  # 2
+)
 all_structs.append(CreateItemResponseData)
 CreateItemResponseData.thrift_spec = (
     None,  # 0
@@ -6183,6 +11602,25 @@ LoadItemWithBlueprintTreeResponseData.thrift_spec = (
     None,  # 0
     (1, TType.STRUCT, 'tree', [BlueprintTreeNode, None], None, ),  # 1
 )
+all_structs.append(LoadManyItemsResponseData)
+LoadManyItemsResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.MAP, 'items', (TType.I64, None, TType.STRUCT, [Item, None], False), None, ),  # 1
+    (2, TType.MAP, 'errors', (TType.I64, None, TType.STRUCT, [GameResult, None], False), None, ),  # 2
+)
+all_structs.append(LoadBillOfMaterialsResponseData)
+LoadBillOfMaterialsResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.MAP, 'boms', (TType.I64, None, TType.STRUCT, [BillOfMaterials, None], False), None, ),  # 1
+    (2, TType.MAP, 'errors', (TType.I64, None, TType.STRUCT, [GameResult, None], False), None, ),  # 2
+)
+all_structs.append(LoadDependentsResponseData)
+LoadDependentsResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'item_id', None, None, ),  # 1
+    (2, TType.MAP, 'depths', (TType.I64, None, TType.I32, None, False), None, ),  # 2
+    (3, TType.BOOL, 'truncated', None, False, ),  # 3
+)
 all_structs.append(ItemRequestData)
 ItemRequestData.thrift_spec = (
     None,  # 0
@@ -6193,6 +11631,9 @@ ItemRequestData.thrift_spec = (
     (5, TType.STRUCT, 'list_item', [ListItemRequestData, None], None, ),  # 5
     (6, TType.STRUCT, 'autocomplete_item', [AutocompleteItemRequestData, None], None, ),  # 6
     (7, TType.STRUCT, 'load_with_blueprint_tree', [LoadItemWithBlueprintTreeRequestData, None], None, ),  # 7
+    (8, TType.STRUCT, 'load_many_items', [LoadManyItemsRequestData, None], None, ),  # 8
+    (9, TType.STRUCT, 'load_bill_of_materials', [LoadBillOfMaterialsRequestData, None], None, ),  # 9
+    (10, TType.STRUCT, 'load_dependents', [LoadDependentsRequestData, None], None, ),  # 10
 )
 all_structs.append(ItemResponseData)
 ItemResponseData.thrift_spec = (
@@ -6204,6 +11645,9 @@ ItemResponseData.thrift_spec = (
     (5, TType.STRUCT, 'list_item', [ListItemResponseData, None], None, ),  # 5
     (6, TType.STRUCT, 'autocomplete_item', [AutocompleteItemResponseData, None], None, ),  # 6
     (7, TType.STRUCT, 'load_with_blueprint_tree', [LoadItemWithBlueprintTreeResponseData, None], None, ),  # 7
+    (8, TType.STRUCT, 'load_many_items', [LoadManyItemsResponseData, None], None, ),  # 8
+    (9, TType.STRUCT, 'load_bill_of_materials', [LoadBillOfMaterialsResponseData, None], None, ),  # 9
+    (10, TType.STRUCT, 'load_dependents', [LoadDependentsResponseData, None], None, ),  # 10
 )
 all_structs.append(ItemRequest)
 ItemRequest.thrift_spec = (
@@ -6225,6 +11669,7 @@ all_structs.append(LoadPlayerRequestData)
 LoadPlayerRequestData.thrift_spec = (
     None,  # 0
     (1, TType.I64, 'player_id', None, None, ),  # 1
+    (2, TType.STRUCT, 'projection', [Projection, None], None, ),  # 2
 )
 all_structs.append(SavePlayerRequestData)
 SavePlayerRequestData.thrift_spec = (
@@ -6242,6 +11687,19 @@ ListPlayerRequestData.thrift_spec = (
     (1, TType.I32, 'page', None, None, ),  # 1
     (2, TType.I32, 'results_per_page', None, None, ),  # 2
     (3, TType.STRING, 'search_string', 'UTF8', None, ),  # 3
+    (4, TType.STRUCT, 'projection', [Projection, None], None, ),  # 4
+)
+all_structs.append(LoadManyPlayersRequestData)
+LoadManyPlayersRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'player_ids', (TType.I64, None, False), None, ),  # 1
+    (2, TType.STRUCT, 'projection', [Projection, None], None, ),  # 2
+)
+all_structs.append(LoadSessionRequestData)
+LoadSessionRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'player_id', None, None, ),  # 1
+    (2, TType.STRUCT, 'projection', [Projection, None], None, ),  # 2
 )
 all_structs.append(CreatePlayerResponseData)
 CreatePlayerResponseData.thrift_spec = (
@@ -6269,6 +11727,20 @@ ListPlayerResponseData.thrift_spec = (
     (1, TType.LIST, 'players', (TType.STRUCT, [Player, None], False), None, ),  # 1
     (2, TType.I64, 'total_count', None, None, ),  # 2
 )
+all_structs.append(LoadManyPlayersResponseData)
+LoadManyPlayersResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.MAP, 'players', (TType.I64, None, TType.STRUCT, [Player, None], False), None, ),  # 1
+    (2, TType.MAP, 'errors', (TType.I64, None, TType.STRUCT, [GameResult, None], False), None, ),  # 2
+)
+all_structs.append(LoadSessionResponseData)
+LoadSessionResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'player', [Player, None], None, ),  # 1
+    (2, TType.LIST, 'inventories', (TType.STRUCT, [Inventory, None], False), None, ),  # 2
+    (3, TType.MAP, 'items', (TType.I64, None, TType.STRUCT, [Item, None], False), None, ),  # 3
+    (4, TType.MAP, 'mobile_items', (TType.I64, None, TType.STRUCT, [MobileItem, None], False), None, ),  # 4
+)
 all_structs.append(PlayerRequestData)
 PlayerRequestData.thrift_spec = (
     None,  # 0
@@ -6277,6 +11749,8 @@ PlayerRequestData.thrift_spec = (
     (3, TType.STRUCT, 'save_player', [SavePlayerRequestData, None], None, ),  # 3
     (4, TType.STRUCT, 'delete_player', [DeletePlayerRequestData, None], None, ),  # 4
     (5, TType.STRUCT, 'list_player', [ListPlayerRequestData, None], None, ),  # 5
+    (6, TType.STRUCT, 'load_many_players', [LoadManyPlayersRequestData, None], None, ),  # 6
+    (7, TType.STRUCT, 'load_session', [LoadSessionRequestData, None], None, ),  # 7
 )
 all_structs.append(PlayerResponseData)
 PlayerResponseData.thrift_spec = (
@@ -6286,6 +11760,8 @@ PlayerResponseData.thrift_spec = (
     (3, TType.STRUCT, 'save_player', [SavePlayerResponseData, None], None, ),  # 3
     (4, TType.STRUCT, 'delete_player', [DeletePlayerResponseData, None], None, ),  # 4
     (5, TType.STRUCT, 'list_player', [ListPlayerResponseData, None], None, ),  # 5
+    (6, TType.STRUCT, 'load_many_players', [LoadManyPlayersResponseData, None], None, ),  # 6
+    (7, TType.STRUCT, 'load_session', [LoadSessionResponseData, None], None, ),  # 7
 )
 all_structs.append(PlayerRequest)
 PlayerRequest.thrift_spec = (
@@ -6298,6 +11774,121 @@ PlayerResponse.thrift_spec = (
     (1, TType.LIST, 'results', (TType.STRUCT, [GameResult, None], False), None, ),  # 1
     (2, TType.STRUCT, 'response_data', [PlayerResponseData, None], None, ),  # 2
 )
+all_structs.append(QueryRadiusRequestData)
+QueryRadiusRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'level', None, None, ),  # 1
+    (2, TType.STRUCT, 'center', [ItemVector3, None], None, ),  # 2
+    (3, TType.DOUBLE, 'radius', None, None, ),  # 3
+    (4, TType.MAP, 'frame', (TType.I32, None, TType.STRUCT, [ItemVector3, None], False), None, ),  # 4
+    (5, TType.I32, 'kind', None, None, ),  # 5
+    (6, TType.I32, 'max_results', None, None, ),  # 6
+)
+all_structs.append(EntityPosition)
+EntityPosition.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'kind', None, None, ),  # 1
+    (2, TType.I64, 'id', None, None, ),  # 2
+    (3, TType.STRUCT, 'position', [ItemVector3, None], None, ),  # 3
+    (4, TType.DOUBLE, 'distance', None, None, ),  # 4
+)
+all_structs.append(QueryRadiusResponseData)
+QueryRadiusResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'entities', (TType.STRUCT, [EntityPosition, None], False), None, ),  # 1
+)
+all_structs.append(PositionUpdate)
+PositionUpdate.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'kind', None, None, ),  # 1
+    (2, TType.I64, 'id', None, None, ),  # 2
+    (3, TType.I32, 'level', None, None, ),  # 3
+    (4, TType.STRUCT, 'position', [ItemVector3, None], None, ),  # 4
+)
+all_structs.append(UpdatePositionsRequestData)
+UpdatePositionsRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'updates', (TType.STRUCT, [PositionUpdate, None], False), None, ),  # 1
+)
+all_structs.append(UpdatePositionsResponseData)
+UpdatePositionsResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'updated', None, None, ),  # 1
+    (2, TType.MAP, 'errors', (TType.I32, None, TType.STRUCT, [GameResult, None], False), None, ),  # 2
+)
+all_structs.append(SubscribeAreaRequestData)
+SubscribeAreaRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'level', None, None, ),  # 1
+    (2, TType.DOUBLE, 'radius', None, None, ),  # 2
+    (3, TType.STRUCT, 'center', [ItemVector3, None], None, ),  # 3
+    (4, TType.MAP, 'frame', (TType.I32, None, TType.STRUCT, [ItemVector3, None], False), None, ),  # 4
+    (5, TType.I64, 'follow_mobile_id', None, None, ),  # 5
+    (6, TType.I32, 'kind', None, None, ),  # 6
+)
+all_structs.append(SubscribeAreaResponseData)
+SubscribeAreaResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'subscription_id', None, None, ),  # 1
+    (2, TType.LIST, 'entities', (TType.STRUCT, [EntityPosition, None], False), None, ),  # 2
+)
+all_structs.append(PollAreaRequestData)
+PollAreaRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'subscription_id', None, None, ),  # 1
+)
+all_structs.append(EntityRef)
+EntityRef.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'kind', None, None, ),  # 1
+    (2, TType.I64, 'id', None, None, ),  # 2
+)
+all_structs.append(PollAreaResponseData)
+PollAreaResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'entered', (TType.STRUCT, [EntityPosition, None], False), None, ),  # 1
+    (2, TType.LIST, 'moved', (TType.STRUCT, [EntityPosition, None], False), None, ),  # 2
+    (3, TType.LIST, 'left', (TType.STRUCT, [EntityRef, None], False), None, ),  # 3
+)
+all_structs.append(UnsubscribeAreaRequestData)
+UnsubscribeAreaRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'subscription_id', None, None, ),  # 1
+)
+all_structs.append(UnsubscribeAreaResponseData)
+UnsubscribeAreaResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'subscription_id', None, None, ),  # 1
+)
+all_structs.append(WorldRequestData)
+WorldRequestData.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'query_radius', [QueryRadiusRequestData, None], None, ),  # 1
+    (2, TType.STRUCT, 'update_positions', [UpdatePositionsRequestData, None], None, ),  # 2
+    (3, TType.STRUCT, 'subscribe_area', [SubscribeAreaRequestData, None], None, ),  # 3
+    (4, TType.STRUCT, 'poll_area', [PollAreaRequestData, None], None, ),  # 4
+    (5, TType.STRUCT, 'unsubscribe_area', [UnsubscribeAreaRequestData, None], None, ),  # 5
+)
+all_structs.append(WorldResponseData)
+WorldResponseData.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'query_radius', [QueryRadiusResponseData, None], None, ),  # 1
+    (2, TType.STRUCT, 'update_positions', [UpdatePositionsResponseData, None], None, ),  # 2
+    (3, TType.STRUCT, 'subscribe_area', [SubscribeAreaResponseData, None], None, ),  # 3
+    (4, TType.STRUCT, 'poll_area', [PollAreaResponseData, None], None, ),  # 4
+    (5, TType.STRUCT, 'unsubscribe_area', [UnsubscribeAreaResponseData, None], None, ),  # 5
+)
+all_structs.append(WorldRequest)
+WorldRequest.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'data', [WorldRequestData, None], None, ),  # 1
+)
+all_structs.append(WorldResponse)
+WorldResponse.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'results', (TType.STRUCT, [GameResult, None], False), None, ),  # 1
+    (2, TType.STRUCT, 'response_data', [WorldResponseData, None], None, ),  # 2
+)
 all_structs.append(EnumDefinition)
 EnumDefinition.thrift_spec = (
     None,  # 0
@@ -3,11 +3,14 @@
 Bootstrap script to create the gamedb database and all necessary tables.
 """
 
+import argparse
 import sys
 
 sys.path.append("../gen-py")
 
 from db import DB
+from db_models.models import ATTRIBUTE_VALUE_COLUMNS
+from services.crafting import CREATE_CRAFTING_JOBS_TABLE_STATEMENT
 
 
 def check_column_exists(cursor, database, table, column):
@@ -48,6 +51,73 @@ def add_column_if_not_exists(
         return True
 
 
+def check_index_exists(cursor, database, table, index):
+    """Check if an index exists on a table."""
+    cursor.execute(
+        """
+        SELECT COUNT(*) as index_exists
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = %s
+        AND TABLE_NAME = %s
+        AND INDEX_NAME = %s;
+        """,
+        (
+            database,
+            table,
+            index,
+        ),
+    )
+    result = cursor.fetchone()
+    return result[0] > 0
+
+
+def add_index_if_not_exists(
+    cursor,
+    database,
+    table,
+    index,
+    columns,
+):
+    """Add an index to a table if it doesn't already exist."""
+    if check_index_exists(cursor, database, table, index):
+        print(f"   - Index {index} already exists on {table}")
+        return False
+    else:
+        alter_sql = f"ALTER TABLE {database}.{table} ADD INDEX {index} ({columns});"
+        cursor.execute(alter_sql)
+        print(f"   ✓ Added index {index} to {table}")
+        return True
+
+
+def collapse_mobile_item_attribute_copies(cursor, database):
+    """
+    Delete mobile_item_attributes rows equal to their template item's
+    attribute of the same type. Instances used to be materialized with a
+    full copy of the template's attributes; only overrides are stored now,
+    and the template's attributes show through.
+
+    This is a one-off for databases materialized before that change. Run
+    later, it would also delete overrides a player set to the template's
+    current value, so it is not a migration: bootstrap.py runs it only when
+    given --collapse-mobile-item-attributes.
+    """
+    same_value = " AND ".join(f"o.{column} <=> a.{column}" for column in ATTRIBUTE_VALUE_COLUMNS)
+    cursor.execute(
+        f"""
+        DELETE o FROM {database}.mobile_item_attributes o
+        JOIN {database}.mobile_items t ON t.id = o.mobile_item_id
+        JOIN {database}.attribute_owners p ON p.item_id = t.item_id
+        JOIN {database}.attributes a ON a.id = p.attribute_id
+        WHERE {same_value};
+        """
+    )
+    if cursor.rowcount > 0:
+        print(f"   ✓ Collapsed {cursor.rowcount} copied template attributes of mobile items")
+    else:
+        print("   - No copied template attributes in mobile_item_attributes")
+    return cursor.rowcount
+
+
 def apply_migrations(db, database_name):
     """Apply schema migrations to existing tables."""
     print(f"\n4. Applying schema migrations to '{database_name}'...")
@@ -64,6 +134,51 @@ def apply_migrations(db, database_name):
             "BIGINT NULL",
         )
 
+        # Migration: Index inventories by owner for owner-scoped queries
+        add_index_if_not_exists(
+            cursor,
+            database_name,
+            "inventories",
+            "owner_type_owner_id",
+            "owner_type, owner_id",
+        )
+
+        # Migration: Cached volume of nested container inventories
+        add_column_if_not_exists(
+            cursor,
+            database_name,
+            "inventories",
+            "contained_volume",
+            "DOUBLE NOT NULL DEFAULT 0",
+        )
+
+        # Migration: Index entries by container instance to walk container trees
+        add_index_if_not_exists(
+            cursor,
+            database_name,
+            "inventory_entries",
+            "mobile_item_id",
+            "mobile_item_id",
+        )
+
+        # Migration: Index blueprint components by component to walk dependents
+        add_index_if_not_exists(
+            cursor,
+            database_name,
+            "item_blueprint_components",
+            "component_item_id",
+            "component_item_id",
+        )
+
+        # Migration: Index items by blueprint to join components back to items
+        add_index_if_not_exists(
+            cursor,
+            database_name,
+            "items",
+            "blueprint_id",
+            "blueprint_id",
+        )
+
         db.connection.commit()
         cursor.close()
         print("   ✓ All migrations applied successfully")
@@ -74,8 +189,32 @@ def apply_migrations(db, database_name):
         return False
 
 
+def collapse_mobile_item_attributes(db, database_name):
+    """Collapse copied template attributes of mobile items, once, on request."""
+    print(f"\n5. Collapsing copied template attributes of mobile items in '{database_name}'...")
+
+    try:
+        cursor = db.connection.cursor()
+        collapse_mobile_item_attribute_copies(cursor, database_name)
+        db.connection.commit()
+        cursor.close()
+        return True
+    except Exception as e:
+        print(f"   ✗ Error collapsing mobile item attributes: {e}")
+        db.connection.rollback()
+        return False
+
+
 def main():
     """Create the gamedb database and all tables."""
+    parser = argparse.ArgumentParser(description="Create the gamedb database and all tables.")
+    parser.add_argument(
+        "--collapse-mobile-item-attributes",
+        action="store_true",
+        help="once, after upgrading: delete mobile item attributes equal to their template's",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Database Bootstrap Script")
     print("=" * 60)
@@ -171,12 +310,20 @@ def main():
         for stmt in db.get_mobile_item_attributes_table_sql(database_name):
             cursor.execute(stmt)
 
+        # Create crafting_jobs table
+        print("   - Creating crafting_jobs table...")
+        cursor.execute(f"USE {database_name};")
+        cursor.execute(CREATE_CRAFTING_JOBS_TABLE_STATEMENT)
+
         db.connection.commit()
         print("\n   ✓ All tables created successfully")
 
         # Apply schema migrations
         apply_migrations(db, database_name)
 
+        if args.collapse_mobile_item_attributes:
+            collapse_mobile_item_attributes(db, database_name)
+
         cursor.close()
         db.disconnect()
 
@@ -1,4 +1,6 @@
-from typing import Any, Dict
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
 from game.ttypes import StatusType, BackingTable
 from game.constants import TABLE2STR
 
@@ -31,3 +33,32 @@ STR2TABLE: Dict[str, BackingTable] = {
     for backing_table, table_name in TABLE2STR.items()
 }
 
+
+# Upper bound on the number of ids accepted by a single load_many request
+LOAD_MANY_MAX_IDS = 500
+
+def wants_attributes(projection: Any) -> bool:
+    """True unless the request's Projection leaves attributes out."""
+    return projection is None or projection.include_attributes is not False
+
+def wanted_attribute_types(projection: Any) -> Optional[List[int]]:
+    """The AttributeTypes the request's Projection narrows attributes to, or None for all."""
+    if projection is None or not projection.attribute_types:
+        return None
+    return list(projection.attribute_types)
+
+def wants_mobile(projection: Any) -> bool:
+    """True unless the request's Projection leaves the embedded mobile out."""
+    return projection is None or projection.include_mobile is not False
+
+def result_message(projection: Any, message: str) -> Optional[str]:
+    """The message for a successful result, or None when results are compact."""
+    if projection is not None and projection.compact_results:
+        return None
+    return message
+
+# Memory-mapped item catalog file shared by every service process
+SHARED_CATALOG_PATH = os.getenv(
+    "ITEM_CATALOG_PATH",
+    os.path.join(tempfile.gettempdir(), "gamedb_item_catalog.bin"),
+)
@@ -10,6 +10,7 @@ from thrift.protocol.TBinaryProtocol import TBinaryProtocolFactory
 from thrift.protocol.TJSONProtocol import TSimpleJSONProtocolFactory
 from thrift.TSerialization import serialize
 from item_db import CONFIG
+from services.shared_catalog import write_catalog
 def pretty_print(json_data: str) -> None:
     obj = json.loads(json_data)
     json_formatted_str = json.dumps(obj, indent=4)
@@ -21,4 +22,6 @@ if __name__ == "__main__":
     with open("./materialized.json", "w+") as f:
         f.write(pretty_formatted)
     with open('./materialized.bin', 'wb+') as f:
-        f.write(serialized)
\ No newline at end of file
+        f.write(serialized)
+    # Same items with an offset index, mappable by SharedCatalogReader
+    write_catalog('./materialized.catalog', CONFIG.items, 1)
\ No newline at end of file
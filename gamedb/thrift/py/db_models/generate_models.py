@@ -38,6 +38,10 @@ from generator.config import (
     is_pivot_table,
     is_one_to_one_relationship,
     has_embedded_relationship,
+    get_embedded_lists,
+    get_thrift_skip_columns,
+    get_read_only_columns,
+    get_thrift_fk_fields,
     get_valid_owner_types,
     validate_config,
 )
@@ -294,10 +298,21 @@ def generate_pivot_to_attribute_map_code() -> str:
     code = '''
             # Load attributes via pivot table and convert to map<AttributeType, Attribute>
             attributes_map = {}
-            if self.get_id() is not None:
-                # Get attributes through the pivot relationship
-                attribute_models = self.get_attributes(reload=True)
+            include_attributes = projection is None or projection.include_attributes is not False
+            attribute_types = None
+            if projection is not None and projection.attribute_types:
+                attribute_types = set(projection.attribute_types)
+            if include_attributes and self.get_id() is not None:
+                # Reuse a batch loaded by preload_attributes() when there is
+                # one, else load only the types the projection asks for
+                if getattr(self, '_attributes_preloaded', False):
+                    attribute_models = self.get_attributes()
+                else:
+                    attribute_models = self.get_attributes(reload=True, attribute_types=attribute_types)
                 for attr_model in attribute_models:
+                    # A preloaded batch may hold types the projection did not ask for
+                    if attribute_types is not None and attr_model.get_attribute_type() not in attribute_types:
+                        continue
                     # Convert each attribute model to Thrift
                     attr_results, attr_thrift = attr_model.into_thrift()
                     if attr_thrift is not None:
@@ -307,6 +322,230 @@ def generate_pivot_to_attribute_map_code() -> str:
     return code
 
 
+def generate_query_accounting_code() -> str:
+    """
+    Generate the per-thread query accounting shared by all models.
+
+    Every model connection is a CountingMySQLConnection, which reports each
+    statement it sends to QueryStats. Service handlers serve one request per
+    thread, so the difference between two readings of QueryStats.query_count()
+    is the number of queries a request cost.
+
+    Returns:
+        Generated Python code as a string
+    """
+    code = '''
+# Number of recent statements kept per thread for diagnostics
+QUERY_LOG_SIZE = 100
+
+# Transaction control is bookkeeping, not a query against model data
+_UNCOUNTED_STATEMENTS = ('START TRANSACTION', 'COMMIT', 'ROLLBACK')
+
+
+class QueryStats:
+    """
+    Per-thread counters for the statements sent through model connections.
+
+    Session setup performed while connecting and transaction control statements
+    are not counted. Counters only grow; take a reading before and after a block
+    of work to measure it, or call reset() to start over.
+    """
+
+    _local = threading.local()
+
+    @staticmethod
+    def _state() -> Dict[str, Any]:
+        state = getattr(QueryStats._local, 'state', None)
+        if state is None:
+            state = {
+                'queries': 0,
+                'connections': 0,
+                'statements': deque(maxlen=QUERY_LOG_SIZE),
+            }
+            QueryStats._local.state = state
+        return state
+
+    @staticmethod
+    def reset() -> None:
+        """Reset the counters for the current thread."""
+        QueryStats._local.state = None
+
+    @staticmethod
+    def query_count() -> int:
+        """Return the number of statements the current thread has issued."""
+        return QueryStats._state()['queries']
+
+    @staticmethod
+    def connection_count() -> int:
+        """Return the number of connections the current thread has opened."""
+        return QueryStats._state()['connections']
+
+    @staticmethod
+    def statements() -> List[str]:
+        """Return the most recent statements issued by the current thread, oldest first."""
+        return list(QueryStats._state()['statements'])
+
+    @staticmethod
+    def record_connection() -> None:
+        QueryStats._state()['connections'] += 1
+
+    @staticmethod
+    def record_query(statement: str) -> None:
+        state = QueryStats._state()
+        state['queries'] += 1
+        state['statements'].append(statement)
+
+
+class CountingMySQLConnection(MySQLConnection):
+    """MySQLConnection that reports every statement it sends to QueryStats."""
+
+    def __init__(self, **kwargs):
+        self._count_queries = False
+        super().__init__(**kwargs)
+        QueryStats.record_connection()
+        self._count_queries = True
+
+    def cmd_query(self, query, *args, **kwargs):
+        if self._count_queries:
+            if isinstance(query, (bytes, bytearray)):
+                statement = query.decode('utf-8', errors='replace')
+            else:
+                statement = str(query)
+            statement = ' '.join(statement.split())
+            if not statement.upper().startswith(_UNCOUNTED_STATEMENTS):
+                QueryStats.record_query(statement)
+        return super().cmd_query(query, *args, **kwargs)
+'''
+    return code
+
+
+# Columns holding an attribute's value in attributes and the direct attribute tables
+ATTRIBUTE_VALUE_COLUMNS = (
+    'internal_name',
+    'visible',
+    'attribute_type',
+    'bool_value',
+    'double_value',
+    'vector3_x',
+    'vector3_y',
+    'vector3_z',
+    'asset_id',
+)
+
+
+def generate_attribute_interning_code() -> str:
+    """
+    Generate the flyweight pool shared by all attribute-owning models.
+
+    Millions of item instances carry their template's attributes, most of
+    them unchanged. AttributeInterner hands out one shared, read-only
+    Attribute per attribute row and one shared AttributeSet per distinct
+    set, so a template's attributes cost one object however many instances
+    reference them. InternedAttribute itself is emitted after the model
+    classes (see generate_interned_attribute_code).
+
+    Returns:
+        Generated Python code as a string
+    """
+    code = '''
+# Columns holding an attribute's value, shared by attributes and the direct
+# attribute tables; equal values make equal (interned) attributes
+ATTRIBUTE_VALUE_COLUMNS = (
+__ATTRIBUTE_VALUE_COLUMNS__
+)
+
+
+def attribute_types_filter(attribute_types: Optional[List[int]], column: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    SQL condition and params restricting column to some Thrift AttributeType
+    values, or ('', ()) for all of them.
+    """
+    if attribute_types is None:
+        return '', ()
+    names = tuple(sorted(ThriftAttributeType._VALUES_TO_NAMES[t] for t in attribute_types))
+    if not names:
+        return ' AND FALSE', ()
+    return f" AND {column} IN ({', '.join(['%s'] * len(names))})", names
+
+
+class AttributeSet:
+    """An immutable sequence of InternedAttributes, ordered by attribute_type."""
+
+    __slots__ = ('_attributes', '__weakref__')
+
+    def __init__(self, attributes: Tuple['Attribute', ...]):
+        self._attributes = attributes
+
+    def __iter__(self) -> Iterator['Attribute']:
+        return iter(self._attributes)
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def __getitem__(self, index: int) -> 'Attribute':
+        return self._attributes[index]
+
+    def __repr__(self) -> str:
+        return f"AttributeSet({[attribute.get_attribute_type() for attribute in self._attributes]})"
+
+
+class AttributeInterner:
+    """
+    Weak flyweight pool of InternedAttributes and AttributeSets.
+
+    An entry lives as long as some owner still references it. An interned
+    attribute is one stored row, identified by its id and values, and shared
+    by every owner reading that row, e.g. a template attribute read by all of
+    its item instances. Interned attributes are read-only: write the change
+    to the owner's attribute table and reload instead.
+    """
+
+    _lock = threading.Lock()
+    _attributes: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+    _sets: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def key(row: Dict[str, Any]) -> Tuple[Any, ...]:
+        """The identity of an attribute row: its id and ATTRIBUTE_VALUE_COLUMNS values."""
+        return (row.get('id'),) + tuple(row.get(column) for column in ATTRIBUTE_VALUE_COLUMNS)
+
+    @staticmethod
+    def attribute(row: Dict[str, Any]) -> 'InternedAttribute':
+        """The shared, read-only Attribute holding row's id and values."""
+        key = AttributeInterner.key(row)
+        with AttributeInterner._lock:
+            attribute = AttributeInterner._attributes.get(key)
+            if attribute is None:
+                attribute = InternedAttribute(dict(zip(('id',) + ATTRIBUTE_VALUE_COLUMNS, key)))
+                AttributeInterner._attributes[key] = attribute
+            return attribute
+
+    @staticmethod
+    def attribute_set(rows: List[Dict[str, Any]]) -> AttributeSet:
+        """The shared AttributeSet of rows; a later row overrides an earlier one of the same attribute_type."""
+        by_type: Dict[Any, Dict[str, Any]] = {}
+        for row in rows:
+            by_type[row.get('attribute_type')] = row
+        ordered = [by_type[attribute_type] for attribute_type in sorted(by_type, key=str)]
+        key = tuple(AttributeInterner.key(row) for row in ordered)
+        with AttributeInterner._lock:
+            attribute_set = AttributeInterner._sets.get(key)
+            if attribute_set is not None:
+                return attribute_set
+        attribute_set = AttributeSet(tuple(AttributeInterner.attribute(row) for row in ordered))
+        with AttributeInterner._lock:
+            return AttributeInterner._sets.setdefault(key, attribute_set)
+
+    @staticmethod
+    def size() -> Tuple[int, int]:
+        """(distinct attributes, distinct sets) currently interned."""
+        with AttributeInterner._lock:
+            return len(AttributeInterner._attributes), len(AttributeInterner._sets)
+'''
+    columns = "\n".join(f"    '{column}'," for column in ATTRIBUTE_VALUE_COLUMNS)
+    return code.replace('__ATTRIBUTE_VALUE_COLUMNS__', columns)
+
+
 # Utility functions using imported modules
 
 
@@ -675,33 +914,123 @@ def get_attribute_relationship_type(
     return None
 
 
+def generate_interned_attribute_code() -> str:
+    """
+    Generate InternedAttribute, the read-only Attribute AttributeInterner
+    hands out. It subclasses the generated Attribute model, so it is emitted
+    after the model classes.
+
+    Returns:
+        Generated Python code as a string
+    """
+    code = '''
+class InternedAttribute(Attribute):
+    """
+    A read-only Attribute shared through AttributeInterner. Its data cannot
+    be changed, and setters, from_thrift(), save(), destroy() and reload()
+    raise TypeError: change the owner's attribute rows and reload the owner.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__()
+        self._data = MappingProxyType(data)
+        self._dirty = False
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            f"Attribute id={self.get_id()} is interned and read-only; change its owner's attribute rows instead"
+        )
+
+
+for _name in [name for name in vars(Attribute) if name.startswith(('set_', '_set_'))]:
+    setattr(InternedAttribute, _name, InternedAttribute._read_only)
+for _name in ('from_thrift', 'save', 'destroy', 'reload'):
+    setattr(InternedAttribute, _name, InternedAttribute._read_only)
+del _name
+'''
+    return code
+
+
 def generate_direct_attribute_methods(
     table_name: str,
     attribute_table: str,
+    template_column: Optional[str] = None,
 ) -> str:
     """
     Generate get_attributes() method for tables with direct attribute tables.
 
-    For mobile_items -> mobile_item_attributes pattern.
-    Converts direct attribute records to standard Attribute objects for Thrift compatibility.
+    For mobile_items -> mobile_item_attributes pattern. With template_column
+    (mobile_items.item_id), the direct table only holds overrides: the
+    attributes are the template item's, from the attribute_owners pivot, with
+    the direct rows on top, read with one query. Either way the result is an
+    interned AttributeSet (see AttributeInterner).
     """
     singular_name = TableNaming.singularize(table_name)
     class_name = TableNaming.to_pascal_case(singular_name)
-    attr_class = TableNaming.to_pascal_case(TableNaming.singularize(attribute_table))
     fk_column = f"{singular_name}_id"
+    value_columns = ", ".join(ATTRIBUTE_VALUE_COLUMNS)
+
+    if template_column is None:
+        query = f"""
+                SELECT id, {value_columns}
+                FROM {attribute_table}
+                WHERE {fk_column} = %s{{types_filter}}
+            """
+        params = "(my_id,) + types_params"
+        preload_query = f"""
+                SELECT {fk_column} AS owner_id, id, {value_columns}
+                FROM {attribute_table}
+                WHERE {fk_column} IN ({{placeholders}}){{types_filter}}
+            """
+        preload_params = "tuple(ids) + types_params"
+        source = f"the rows of {attribute_table}"
+    else:
+        template_columns = ", ".join(f"a.{column}" for column in ATTRIBUTE_VALUE_COLUMNS)
+        query = f"""
+                SELECT 0 AS layer, a.id, {template_columns}
+                FROM {table_name} t
+                INNER JOIN attribute_owners p ON p.item_id = t.{template_column}
+                INNER JOIN attributes a ON a.id = p.attribute_id
+                WHERE t.id = %s{{template_types_filter}}
+                UNION ALL
+                SELECT 1 AS layer, id, {value_columns}
+                FROM {attribute_table}
+                WHERE {fk_column} = %s{{types_filter}}
+                ORDER BY layer
+            """
+        params = "(my_id,) + types_params + (my_id,) + types_params"
+        preload_query = f"""
+                SELECT t.id AS owner_id, 0 AS layer, a.id, {template_columns}
+                FROM {table_name} t
+                INNER JOIN attribute_owners p ON p.item_id = t.{template_column}
+                INNER JOIN attributes a ON a.id = p.attribute_id
+                WHERE t.id IN ({{placeholders}}){{template_types_filter}}
+                UNION ALL
+                SELECT {fk_column} AS owner_id, 1 AS layer, id, {value_columns}
+                FROM {attribute_table}
+                WHERE {fk_column} IN ({{placeholders}}){{types_filter}}
+                ORDER BY layer
+            """
+        preload_params = "tuple(ids) + types_params + tuple(ids) + types_params"
+        source = f"""its template item's attributes with the overrides
+        stored in {attribute_table} on top"""
 
     code = f'''
-    def get_attributes(self, reload: bool = False) -> List['Attribute']:
+    def get_attributes(self, reload: bool = False, attribute_types: Optional[List[int]] = None) -> AttributeSet:
         """
-        Get all attributes for this {class_name} from {attribute_table} table.
-        Converts to standard Attribute objects for Thrift compatibility.
+        Get all attributes for this {class_name} in one query:
+        {source}.
+
+        The result is an interned, read-only AttributeSet shared with every
+        owner holding the same attributes; write changes to {attribute_table}.
 
         Args:
             reload: If True, ignore cache and reload from database
+            attribute_types: If given, only load attributes of these Thrift AttributeType values
         """
         # Check cache first
         cache_key = '_attributes_cache'
-        if not reload and hasattr(self, cache_key):
+        if attribute_types is None and not reload and hasattr(self, cache_key):
             cached = getattr(self, cache_key)
             if cached is not None:
                 return cached
@@ -709,29 +1038,59 @@ def generate_direct_attribute_methods(
         # Fetch from database
         my_id = self.get_id()
         if my_id is None:
-            return []
+            return AttributeInterner.attribute_set([])
+        types_filter, types_params = attribute_types_filter(attribute_types, 'attribute_type')
+        template_types_filter, _ = attribute_types_filter(attribute_types, 'a.attribute_type')
 
-        # Get direct attribute records
-        direct_attrs = {attr_class}.find_by_{fk_column}(my_id)
-
-        # Convert to standard Attribute objects
-        attributes = []
-        for direct_attr in direct_attrs:
-            attr = Attribute()
-            attr._data['internal_name'] = direct_attr.get_internal_name()
-            attr._data['visible'] = direct_attr.get_visible()
-            attr._data['attribute_type'] = direct_attr.get_attribute_type()
-            attr._data['bool_value'] = direct_attr.get_bool_value()
-            attr._data['double_value'] = direct_attr.get_double_value()
-            attr._data['vector3_x'] = direct_attr.get_vector3_x()
-            attr._data['vector3_y'] = direct_attr.get_vector3_y()
-            attr._data['vector3_z'] = direct_attr.get_vector3_z()
-            attr._data['asset_id'] = direct_attr.get_asset_id()
-            attributes.append(attr)
+        connection = {class_name}._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            query = f"""{query}"""
+            cursor.execute(query, {params})
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
 
-        # Cache results
-        setattr(self, cache_key, attributes)
+        # Only a complete set is cached
+        attributes = AttributeInterner.attribute_set(rows)
+        if attribute_types is None:
+            setattr(self, cache_key, attributes)
         return attributes
+
+    @staticmethod
+    def preload_attributes(instances: List['{class_name}'], attribute_types: Optional[List[int]] = None) -> None:
+        """
+        Load attributes for many {class_name} records with a single query
+        and cache them on each instance, so that get_attributes() and
+        into_thrift() do not query once per record.
+        With attribute_types, only attributes of those Thrift AttributeType
+        values are loaded.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+        types_filter, types_params = attribute_types_filter(attribute_types, 'attribute_type')
+        template_types_filter, _ = attribute_types_filter(attribute_types, 'a.attribute_type')
+
+        grouped = {{owner_id: [] for owner_id in ids}}
+        connection = {class_name}._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f"""{preload_query}"""
+            cursor.execute(query, {preload_params})
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+
+        for row in rows:
+            grouped[row.pop('owner_id')].append(row)
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_attributes_cache', AttributeInterner.attribute_set(grouped[instance.get_id()]))
+                setattr(instance, '_attributes_preloaded', True)
 '''
     return code
 
@@ -759,21 +1118,46 @@ def generate_pivot_owner_methods(
     owner_fk = f"{TableNaming.singularize(owner_table_name)}_id"
     related_fk = f"{related_singular}_id"
 
+    # Attributes can be narrowed to some AttributeTypes in SQL (Projection.attribute_types)
+    types_arg = ""
+    types_doc = ""
+    get_types_filter = ""
+    preload_types_filter = ""
+    types_condition = ""
+    types_params = ""
+    get_query_prefix = ""
+    get_cache_check = "not reload"
+    get_cache_store = "setattr(self, cache_key, results)"
+    if related_table_name == 'attributes':
+        types_arg = ", attribute_types: Optional[List[int]] = None"
+        types_doc = '''
+        With attribute_types, only attributes of those Thrift AttributeType
+        values are loaded.'''
+        get_types_filter = "\n        types_filter, types_params = attribute_types_filter(attribute_types, 'r.attribute_type')"
+        preload_types_filter = "\n        types_filter, types_params = attribute_types_filter(attribute_types, 'r.attribute_type')"
+        types_condition = "{types_filter}"
+        get_query_prefix = "f"
+        types_params = " + types_params"
+        get_cache_check = "attribute_types is None and not reload"
+        get_cache_store = '''# Only a complete set is cached
+        if attribute_types is None:
+            setattr(self, cache_key, results)'''
+
     methods = f"""
-    def get_{related_plural}(self, reload: bool = False) -> List['{related_class}']:
+    def get_{related_plural}(self, reload: bool = False{types_arg}) -> List['{related_class}']:
         \"\"\"
         Get all {related_plural} for this {owner_class} through the {pivot_table_name} pivot table.
-        Returns a list of {related_class} objects.
+        Returns a list of {related_class} objects.{types_doc}
         \"\"\"
         cache_key = '_{related_plural}_cache'
 
-        if not reload and hasattr(self, cache_key):
+        if {get_cache_check} and hasattr(self, cache_key):
             cached = getattr(self, cache_key)
             if cached is not None:
                 return cached
 
         if self.get_id() is None:
-            return []
+            return []{get_types_filter}
 
         # Query through pivot table
         self._connect()
@@ -781,13 +1165,13 @@ def generate_pivot_owner_methods(
         results = []
 
         try:
-            query = \"\"\"
+            query = {get_query_prefix}\"\"\"
                 SELECT r.*
                 FROM {related_table_name} r
                 INNER JOIN {pivot_table_name} p ON r.id = p.{related_fk}
-                WHERE p.{owner_fk} = %s
+                WHERE p.{owner_fk} = %s{types_condition}
             \"\"\"
-            cursor.execute(query, (self.get_id(),))
+            cursor.execute(query, (self.get_id(),){types_params})
             rows = cursor.fetchall()
 
             for row in rows:
@@ -799,9 +1183,50 @@ def generate_pivot_owner_methods(
             cursor.close()
 
         # Cache results
-        setattr(self, cache_key, results)
+        {get_cache_store}
         return results
 
+    @staticmethod
+    def preload_{related_plural}(instances: List['{owner_class}']{types_arg}) -> None:
+        \"\"\"
+        Load {related_plural} for many {owner_class} records with a single query through
+        the {pivot_table_name} pivot table and cache them on each instance, so that
+        get_{related_plural}() and into_thrift() do not query once per record.{types_doc}
+        \"\"\"
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return{preload_types_filter}
+
+        grouped = {{owner_id: [] for owner_id in ids}}
+        connection = {owner_class}._create_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f\"\"\"
+                SELECT p.{owner_fk} AS pivot_owner_id, r.*
+                FROM {related_table_name} r
+                INNER JOIN {pivot_table_name} p ON r.id = p.{related_fk}
+                WHERE p.{owner_fk} IN ({{placeholders}}){types_condition}
+            \"\"\"
+            cursor.execute(query, tuple(ids){types_params})
+            rows = cursor.fetchall()
+
+            for row in rows:
+                owner_id = row.pop('pivot_owner_id')
+                instance = {related_class}()
+                instance._data = row
+                instance._dirty = False
+                grouped[owner_id].append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_{related_plural}_cache', grouped[instance.get_id()])
+                setattr(instance, '_{related_plural}_preloaded', True)
+
     def get_{pivot_singular}s(self, reload: bool = False, lazy: bool = False):
         \"\"\"
         Get all {pivot_class} pivot records for this {owner_class}.
@@ -1057,10 +1482,276 @@ def generate_belongs_to_methods(
     return "\n\n".join(methods) if methods else ""
 
 
+def generate_one_to_one_eager_methods(
+    table_name: str,
+    rel_name: str,
+    foreign_table: str,
+    foreign_column: str,
+    foreign_columns: List[Dict[str, Any]],
+    foreign_has_attributes: bool,
+) -> str:
+    """
+    Generate batch loaders for a 1-to-1 relationship (e.g., Player.mobile).
+
+    preload_<rel>() fetches the related records of many already loaded
+    instances with one query. find_many_with_<rel>() fetches instances and
+    their related records with one joined query. Both cache the related record
+    where get_<rel>() looks for it and, when the related model has attributes,
+    batch load those with one more query.
+    """
+    class_name = TableNaming.to_pascal_case(TableNaming.singularize(table_name))
+    foreign_class = TableNaming.to_pascal_case(TableNaming.singularize(foreign_table))
+
+    # Related columns are aliased with a prefix so they cannot collide with the owner's
+    prefix = f"{rel_name}__"
+    joined_columns = ",\n                       ".join(
+        f"r.`{col['name']}` AS `{prefix}{col['name']}`" for col in foreign_columns
+    )
+
+    attributes_arg = (
+        ", include_attributes: bool = True, attribute_types: Optional[List[int]] = None"
+        if foreign_has_attributes else ""
+    )
+    attributes_doc = ""
+    preload_related_attributes = ""
+    if foreign_has_attributes:
+        attributes_doc = f"""
+        With include_attributes, the attributes of the {foreign_class} records are
+        batch loaded too with one more query, only those of attribute_types when
+        given."""
+        preload_related_attributes = f"""
+
+        if include_attributes and related:
+            {foreign_class}.preload_attributes(list(related.values()), attribute_types)"""
+
+    return f"""    @staticmethod
+    def preload_{rel_name}(instances: List['{class_name}']{attributes_arg}) -> None:
+        \"\"\"
+        Load the {foreign_class} of many {class_name} records with a single query and
+        cache it on each instance, so that get_{rel_name}() and into_thrift() do not
+        query once per record.{attributes_doc}
+        \"\"\"
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+
+        connection = {foreign_class}._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(
+                f"SELECT * FROM `{foreign_table}` WHERE `{foreign_column}` IN ({{placeholders}})",
+                tuple(ids),
+            )
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+
+        related = {{}}
+        for row in rows:
+            related_instance = {foreign_class}()
+            related_instance._data = row
+            related_instance._dirty = False
+            # Keep the first match, like get_{rel_name}()
+            related.setdefault(row['{foreign_column}'], related_instance){preload_related_attributes}
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_{rel_name}_cache', related.get(instance.get_id()))
+
+    @staticmethod
+    def find_many_with_{rel_name}(ids: List[int]{attributes_arg}) -> List['{class_name}']:
+        \"\"\"
+        Find records by a list of primary keys together with their {foreign_class}
+        using a single joined query.{attributes_doc}
+        Returns instances in no particular order; ids without a record are skipped.
+        \"\"\"
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = {class_name}._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f\"\"\"
+                SELECT o.*,
+                       {joined_columns}
+                FROM `{table_name}` o
+                LEFT JOIN `{foreign_table}` r ON r.`{foreign_column}` = o.`id`
+                WHERE o.`id` IN ({{placeholders}})
+            \"\"\"
+            cursor.execute(query, tuple(ids))
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+
+        instances = {{}}
+        related = {{}}
+        for row in rows:
+            related_data = {{
+                key[len('{prefix}'):]: row.pop(key)
+                for key in list(row)
+                if key.startswith('{prefix}')
+            }}
+            # Keep the first match, like get_{rel_name}()
+            if row['id'] in instances:
+                continue
+
+            instance = {class_name}()
+            instance._data = row
+            instance._dirty = False
+            related_instance = None
+            if related_data.get('id') is not None:
+                related_instance = {foreign_class}()
+                related_instance._data = related_data
+                related_instance._dirty = False
+                related[row['id']] = related_instance
+            setattr(instance, '_{rel_name}_cache', related_instance)
+            instances[row['id']] = instance{preload_related_attributes}
+
+        return list(instances.values())"""
+
+
+def generate_embedded_list_preload_method(
+    table_name: str,
+    foreign_table: str,
+    foreign_column: str,
+) -> str:
+    """
+    Generate preload_<children>() for a has-many relationship embedded as a
+    Thrift list (e.g., Inventory.entries), loading the children of many
+    records with one IN query.
+    """
+    class_name = TableNaming.to_pascal_case(TableNaming.singularize(table_name))
+    foreign_class = TableNaming.to_pascal_case(TableNaming.singularize(foreign_table))
+
+    return f"""    @staticmethod
+    def preload_{foreign_table}(instances: List['{class_name}']) -> None:
+        \"\"\"
+        Load the {foreign_class} records of many {class_name} records with a single
+        query and cache them on each instance, so that get_{foreign_table}() and
+        into_thrift() do not query once per record.
+        \"\"\"
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+
+        grouped = {{owner_id: [] for owner_id in ids}}
+        connection = {foreign_class}._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(
+                f"SELECT * FROM `{foreign_table}` WHERE `{foreign_column}` IN ({{placeholders}}) ORDER BY `id`",
+                tuple(ids),
+            )
+            rows = cursor.fetchall()
+            for row in rows:
+                related = {foreign_class}()
+                related._data = row
+                related._dirty = False
+                grouped[row['{foreign_column}']].append(related)
+        finally:
+            cursor.close()
+            connection.close()
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_{foreign_table}_cache', grouped[instance.get_id()])"""
+
+
+def generate_embedded_list_write_method(
+    table_name: str,
+    foreign_table: str,
+    foreign_column: str,
+    foreign_columns: List[Dict[str, Any]],
+) -> str:
+    """
+    Generate _write_<children>() for a has-many relationship embedded as a
+    Thrift list: writes the lists of many records over their stored children,
+    matched by id, with at most one DELETE, one UPDATE and one multi-row
+    INSERT however many records there are. save() uses it for one record;
+    callers that lock and write many records in their own transaction use it
+    for all of them.
+    """
+    class_name = TableNaming.to_pascal_case(TableNaming.singularize(table_name))
+    foreign_class = TableNaming.to_pascal_case(TableNaming.singularize(foreign_table))
+    insert_columns = [col["name"] for col in foreign_columns if col["name"] != "id"]
+    column_names = ", ".join(f"`{name}`" for name in insert_columns)
+    placeholders = ", ".join(["%s"] * len(insert_columns))
+    column_tuple = ", ".join(f"'{name}'" for name in insert_columns)
+
+    return f"""    @staticmethod
+    def _write_{foreign_table}(cursor, lists: List[Tuple[int, Dict[int, Dict[str, Any]], List['{foreign_class}']]]) -> None:
+        \"\"\"
+        Write lists of {foreign_class} records over the stored rows, matched by id.
+        lists holds a ({class_name} id, stored rows by id, records) tuple per
+        {class_name}. Stored rows missing from their list are deleted, changed ones
+        UPDATEd and records without a stored id inserted, getting their new ids;
+        one statement each. cursor must be in the caller's transaction.
+        \"\"\"
+        # A repeated id (e.g. a copied entry) is a new row
+        removed = []
+        updated = []
+        inserted = []
+        for owner_id, stored, related_list in lists:
+            kept = set()
+            for related in related_list:
+                related._data['{foreign_column}'] = owner_id
+                related_id = related.get_id()
+                if related_id in stored and related_id not in kept:
+                    kept.add(related_id)
+                    row = stored[related_id]
+                    if any(row.get(col) != related._data.get(col) for col in ({column_tuple})):
+                        updated.append(related)
+                else:
+                    inserted.append(related)
+            removed.extend(related_id for related_id in stored if related_id not in kept)
+
+        if removed:
+            cursor.execute(
+                f"DELETE FROM `{foreign_table}` WHERE `id` IN ({{', '.join(['%s'] * len(removed))}})",
+                tuple(removed),
+            )
+        if updated:
+            cursor.execute(
+                "UPDATE `{foreign_table}` SET "
+                + ", ".join(
+                    f"`{{col}}` = CASE `id` " + " ".join(["WHEN %s THEN %s"] * len(updated)) + " END"
+                    for col in ({column_tuple})
+                )
+                + f" WHERE `id` IN ({{', '.join(['%s'] * len(updated))}})",
+                tuple(
+                    value
+                    for col in ({column_tuple})
+                    for related in updated
+                    for value in (related.get_id(), related._data.get(col))
+                ) + tuple(related.get_id() for related in updated),
+            )
+        if inserted:
+            cursor.executemany(
+                "INSERT INTO `{foreign_table}` ({column_names}) VALUES ({placeholders})",
+                [
+                    tuple(related._data.get(col) for col in ({column_tuple}))
+                    for related in inserted
+                ],
+            )
+            # One multi-row INSERT assigns consecutive ids from lastrowid
+            for offset, related in enumerate(inserted):
+                related._data['id'] = cursor.lastrowid + offset
+        for _, _, related_list in lists:
+            for related in related_list:
+                related._dirty = False"""
+
+
 def generate_has_many_methods(
     table_name: str,
     has_many_rels: List[Dict[str, Any]],
     table_columns: Dict[str, List[Dict[str, Any]]],
+    fk_constraints: Dict[str, List[Dict[str, str]]],
 ) -> str:
     """Generate has-many relationship methods (or 1-to-1 for configured relationships)."""
     methods = []
@@ -1110,6 +1801,20 @@ def generate_has_many_methods(
         setattr(self, cache_key, result)
 
         return result"""
+            methods.append(getter)
+
+            foreign_has_attributes = any(
+                pivot_rel["related_table"] == "attributes"
+                for pivot_rel in get_pivot_owner_relationships(foreign_table, table_columns, fk_constraints)
+            )
+            getter = generate_one_to_one_eager_methods(
+                table_name,
+                rel_name,
+                foreign_table,
+                foreign_column,
+                table_columns[foreign_table],
+                foreign_has_attributes,
+            )
         else:
             # Generate plural getter for 1-to-many relationship
             rel_name = foreign_table  # Plural name (e.g., 'inventory_entries')
@@ -1148,6 +1853,16 @@ def generate_has_many_methods(
 
         return iter(results) if lazy else results"""
 
+            if foreign_table in get_embedded_lists(table_name):
+                methods.append(getter)
+                methods.append(generate_embedded_list_preload_method(table_name, foreign_table, foreign_column))
+                getter = generate_embedded_list_write_method(
+                    table_name,
+                    foreign_table,
+                    foreign_column,
+                    table_columns[foreign_table],
+                )
+
         methods.append(getter)
 
     return "\n\n".join(methods) if methods else ""
@@ -1432,6 +2147,7 @@ def generate_imports(columns: List[Dict[str, Any]], has_relationships: bool = Fa
         imports.append("    InventoryEntry as ThriftInventoryEntry,")
         imports.append("    ItemBlueprint as ThriftItemBlueprint,")
         imports.append("    ItemBlueprintComponent as ThriftItemBlueprintComponent,")
+        imports.append("    Projection as ThriftProjection,")
         imports.append(")")
 
     return "\n".join(imports)
@@ -1440,6 +2156,7 @@ def generate_imports(columns: List[Dict[str, Any]], has_relationships: bool = Fa
 def generate_cascade_save_code(
     belongs_to_rels: List[Dict[str, Any]],
     has_many_rels: List[Dict[str, Any]],
+    table_name: str = None,
 ) -> Tuple[str, str]:
     """
     Generate cascade save code for belongs-to and has-many relationships.
@@ -1463,9 +2180,17 @@ def generate_cascade_save_code(
 
     # Has-many cascade save (save child objects after)
     has_many_code = []
+    embedded_lists = get_embedded_lists(table_name) if table_name else {}
     for rel in has_many_rels:
         rel_name = rel["foreign_table"]
 
+        if rel_name in embedded_lists:
+            has_many_code.append(generate_embedded_list_save_code(
+                rel_name,
+                rel["foreign_column"],
+            ))
+            continue
+
         code = f"""# Save {rel_name} if cached
                 cache_key = '_{rel_name}_cache'
                 if hasattr(self, cache_key):
@@ -1482,6 +2207,50 @@ def generate_cascade_save_code(
     return belongs_to_str, has_many_str
 
 
+def generate_embedded_list_save_code(
+    foreign_table: str,
+    foreign_column: str,
+) -> str:
+    """
+    Generate the cascade save step for a has-many relationship embedded as a
+    Thrift list: the list set by from_thrift() is written over the stored
+    children by _write_<children>(); an unchanged list writes nothing. The
+    stored rows are the ones loaded through get_<children>() when there are
+    any, else one SELECT ... FOR UPDATE reads them. Children loaded from the
+    database and changed individually are saved as for other has-many
+    relationships.
+    """
+    return f"""# Write the list set by from_thrift() over the stored {foreign_table},
+                # matched by id; 'insert' means the record was new, so nothing is stored
+                replace_mode = getattr(self, '_{foreign_table}_replace', None)
+                if replace_mode is not None:
+                    related_list = getattr(self, '_{foreign_table}_cache', None) or []
+                    stored = getattr(self, '_{foreign_table}_stored', None)
+                    replace_cursor = connection.cursor(dictionary=True)
+                    try:
+                        if stored is None:
+                            stored = {{}}
+                            if replace_mode == 'replace':
+                                replace_cursor.execute(
+                                    "SELECT * FROM `{foreign_table}` WHERE `{foreign_column}` = %s FOR UPDATE",
+                                    (self.get_id(),),
+                                )
+                                stored = {{row['id']: row for row in replace_cursor.fetchall()}}
+
+                        self._write_{foreign_table}(replace_cursor, [(self.get_id(), stored, related_list)])
+                    finally:
+                        replace_cursor.close()
+                    self._{foreign_table}_replace = None
+                    self._{foreign_table}_stored = {{related.get_id(): dict(related._data) for related in related_list}}
+                else:
+                    # Otherwise save {foreign_table} changed through get_{foreign_table}()
+                    related_list = getattr(self, '_{foreign_table}_cache', None)
+                    if related_list is not None:
+                        for related in related_list:
+                            if hasattr(related, '_dirty') and related._dirty:
+                                related.save(connection=connection, cascade=cascade)"""
+
+
 def generate_cascade_destroy_code(
     table_name: str,
     has_many_rels: List[Dict[str, Any]],
@@ -1600,10 +2369,15 @@ def generate_from_thrift_method(
         'mobiles.mobile_type': 'ThriftMobileType',
     }
 
-    # Map simple fields (non-FK, non-union fields)
+    # Map simple fields (non-FK, non-union fields); read-only columns are not taken from clients
+    skip_columns = get_thrift_skip_columns(table_name) + get_read_only_columns(table_name)
     for col in columns:
         col_name = col['name']
 
+        # Skip columns the Thrift struct has no field for
+        if col_name in skip_columns:
+            continue
+
         # Skip owner union fields - they're handled specially
         # Flattened pattern
         if col_name in ['owner_player_id', 'owner_mobile_id', 'owner_item_id', 'owner_asset_id']:
@@ -1679,6 +2453,30 @@ def generate_from_thrift_method(
             self._cached_{foreign_singular} = {foreign_singular}_obj
 '''
 
+    # Handle has-many relationships embedded as Thrift lists (e.g., Inventory.entries)
+    for foreign_table, field_name in get_embedded_lists(table_name).items():
+        foreign_class = TableNaming.to_pascal_case(TableNaming.singularize(foreign_table))
+        method_code += f'''
+        # Handle embedded {field_name} ({foreign_table} rows); save() writes them over the
+        # stored rows by id. None leaves the stored rows alone, [] removes them all
+        if hasattr(thrift_obj, '{field_name}') and thrift_obj.{field_name} is not None:
+            # Rows loaded through get_{foreign_table}() and not changed since are
+            # what is stored, so save() need not read them again
+            if getattr(self, '_{foreign_table}_replace', None) is None:
+                loaded = getattr(self, '_{foreign_table}_cache', None)
+                if loaded is not None and not any(related._dirty for related in loaded):
+                    self._{foreign_table}_stored = {{related.get_id(): dict(related._data) for related in loaded}}
+                else:
+                    self._{foreign_table}_stored = None
+            related_list = []
+            for related_thrift in thrift_obj.{field_name}:
+                related = {foreign_class}()
+                related.from_thrift(related_thrift)
+                related_list.append(related)
+            self._{foreign_table}_cache = related_list
+            self._{foreign_table}_replace = 'replace' if self._data.get('id') is not None else 'insert'
+'''
+
     # Mark as dirty
     method_code += '''
         self._dirty = True
@@ -1715,12 +2513,16 @@ def generate_into_thrift_method(
     from_game_ttypes = "from game.ttypes import ThriftGameResult, ThriftStatusType, ThriftGameError"
 
     method_code = f'''
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['{thrift_struct_name}']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['{thrift_struct_name}']]:
         """
         Convert this Model instance to a Thrift {thrift_struct_name} object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -1743,11 +2545,19 @@ def generate_into_thrift_method(
     # Get list of belongs-to foreign key columns to skip (except owner union which is handled specially)
     belongs_to_rels = relationships.get("belongs_to", [])
     belongs_to_columns = [rel["column"] for rel in belongs_to_rels if rel["column"] not in ['owner_player_id', 'owner_mobile_id', 'owner_item_id', 'owner_asset_id']]
+    # Foreign keys the Thrift struct carries as plain ids are mapped like any other column
+    fk_fields = get_thrift_fk_fields(table_name)
+    belongs_to_columns = [column for column in belongs_to_columns if column not in fk_fields]
+    skip_columns = get_thrift_skip_columns(table_name)
 
     # Map simple fields
     for col in columns:
         col_name = col['name']
 
+        # Skip columns the Thrift struct has no field for
+        if col_name in skip_columns:
+            continue
+
         # Skip owner union fields - they're handled specially
         # Flattened pattern
         if col_name in ['owner_player_id', 'owner_mobile_id', 'owner_item_id', 'owner_asset_id']:
@@ -1792,7 +2602,7 @@ def generate_into_thrift_method(
     if attr_rel_type in ['pivot', 'direct']:
         # Both patterns can use get_attributes() method (direct table converts internally)
         method_code += generate_pivot_to_attribute_map_code()
-        method_code += "            thrift_params['attributes'] = attributes_map\n"
+        method_code += "            thrift_params['attributes'] = attributes_map if include_attributes else None\n"
 
     # NOTE: Belongs-to relationships are NOT embedded in Thrift by default
     # Foreign key IDs are included as direct column mappings above
@@ -1812,14 +2622,29 @@ def generate_into_thrift_method(
             # Check if relationship should be embedded in Thrift
             if has_embedded_relationship(table_name, foreign_singular):
                 method_code += f'''
-            # Load embedded {foreign_singular} (1-to-1 relationship)
-            {foreign_singular}_model = self.get_{foreign_singular}()
-            if {foreign_singular}_model is not None:
-                {foreign_singular}_results, {foreign_singular}_thrift = {foreign_singular}_model.into_thrift()
-                if {foreign_singular}_thrift is not None:
-                    thrift_params['{foreign_singular}'] = {foreign_singular}_thrift
+            # Load embedded {foreign_singular} (1-to-1 relationship) unless projected out
+            if projection is None or projection.include_{foreign_singular} is not False:
+                {foreign_singular}_model = self.get_{foreign_singular}()
+                if {foreign_singular}_model is not None:
+                    {foreign_singular}_results, {foreign_singular}_thrift = {foreign_singular}_model.into_thrift(projection)
+                    if {foreign_singular}_thrift is not None:
+                        thrift_params['{foreign_singular}'] = {foreign_singular}_thrift
+                    else:
+                        results.extend({foreign_singular}_results)
+'''
+
+    # Load has-many relationships embedded as Thrift lists (e.g., Inventory.entries)
+    for foreign_table, field_name in get_embedded_lists(table_name).items():
+        method_code += f'''
+            # Load embedded {field_name} ({foreign_table} rows), one query unless preloaded
+            {field_name}_list = []
+            for related_model in self.get_{foreign_table}():
+                related_results, related_thrift = related_model.into_thrift(projection)
+                if related_thrift is not None:
+                    {field_name}_list.append(related_thrift)
                 else:
-                    results.extend({foreign_singular}_results)
+                    results.extend(related_results)
+            thrift_params['{field_name}'] = {field_name}_list
 '''
 
     # Construct the Thrift object
@@ -1827,10 +2652,13 @@ def generate_into_thrift_method(
             # Create Thrift object
             thrift_obj = Thrift{thrift_struct_name}(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {{self.__class__.__name__}} id={{self.get_id()}} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {{self.__class__.__name__}} id={{self.get_id()}} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -1894,7 +2722,8 @@ def generate_model(
     if attr_rel_type == 'direct':
         singular_name = TableNaming.singularize(table_name)
         attribute_table = f"{singular_name}_attributes"
-        direct_attribute_methods = generate_direct_attribute_methods(table_name, attribute_table)
+        template_column = 'item_id' if any(col['name'] == 'item_id' for col in columns) else None
+        direct_attribute_methods = generate_direct_attribute_methods(table_name, attribute_table, template_column)
 
     # Check if this table has Thrift conversion
     has_thrift_conversion = has_thrift_mapping(table_name)
@@ -1912,12 +2741,13 @@ def generate_model(
 
     # Generate relationship methods
     belongs_to_methods = generate_belongs_to_methods(belongs_to_rels, table_columns) if belongs_to_rels else ""
-    has_many_methods = generate_has_many_methods(table_name, has_many_rels, table_columns) if has_many_rels else ""
+    has_many_methods = generate_has_many_methods(table_name, has_many_rels, table_columns, fk_constraints) if has_many_rels else ""
 
     # Generate cascade save code
     cascade_save_belongs_to, cascade_save_has_many = generate_cascade_save_code(
         belongs_to_rels,
         has_many_rels,
+        table_name,
     )
 
     # Generate cascade destroy code
@@ -1961,6 +2791,13 @@ def generate_model(
     indented_lines = ["        " + line for line in create_table_lines]
     formatted_create_table = "\n" + "\n".join(indented_lines) + "\n    "
 
+    # Read-only columns are left out of save()'s INSERT and UPDATE
+    unsaved_columns = ['id'] + get_read_only_columns(table_name)
+    if len(unsaved_columns) == 1:
+        saved_column_test = "col != 'id'"
+    else:
+        saved_column_test = f"col not in {tuple(unsaved_columns)!r}"
+
     # Fill in the template
     model_code = template.format(
         imports=imports,
@@ -1979,6 +2816,7 @@ def generate_model(
         cascade_destroy=cascade_destroy,
         find_by_methods=find_by_methods,
         thrift_conversion_methods=thrift_conversion_methods,
+        saved_column_test=saved_column_test,
     )
 
     return model_code
@@ -3365,7 +4203,12 @@ def main():
         all_imports = set()
         all_imports.add("import mysql.connector")
         all_imports.add("import os")
+        all_imports.add("import threading")
+        all_imports.add("import weakref")
+        all_imports.add("from collections import deque")
+        all_imports.add("from mysql.connector.connection import MySQLConnection")
         all_imports.add("from dotenv import load_dotenv")
+        all_imports.add("from types import MappingProxyType")
         all_imports.add("from typing import Dict, List, Optional, Any, Iterator, Union, Tuple")
 
         # Check if any model needs datetime
@@ -3379,7 +4222,7 @@ def main():
         # Check if any model has Thrift conversion (needs Thrift imports)
         needs_thrift = any(has_thrift_mapping(table) for table in tables)
         if needs_thrift:
-            all_imports.add("from game.ttypes import GameResult as ThriftGameResult, StatusType as ThriftStatusType, GameError as ThriftGameError, Owner as ThriftOwner, AttributeValue as ThriftAttributeValue, AttributeType as ThriftAttributeType, ItemType as ThriftItemType, MobileType as ThriftMobileType, ItemVector3 as ThriftItemVector3, Attribute as ThriftAttribute, Item as ThriftItem, Mobile as ThriftMobile, Player as ThriftPlayer, MobileItem as ThriftMobileItem, Inventory as ThriftInventory, InventoryEntry as ThriftInventoryEntry, ItemBlueprint as ThriftItemBlueprint, ItemBlueprintComponent as ThriftItemBlueprintComponent")
+            all_imports.add("from game.ttypes import GameResult as ThriftGameResult, StatusType as ThriftStatusType, GameError as ThriftGameError, Owner as ThriftOwner, AttributeValue as ThriftAttributeValue, AttributeType as ThriftAttributeType, ItemType as ThriftItemType, MobileType as ThriftMobileType, ItemVector3 as ThriftItemVector3, Attribute as ThriftAttribute, Item as ThriftItem, Mobile as ThriftMobile, Player as ThriftPlayer, MobileItem as ThriftMobileItem, Inventory as ThriftInventory, InventoryEntry as ThriftInventoryEntry, ItemBlueprint as ThriftItemBlueprint, ItemBlueprintComponent as ThriftItemBlueprintComponent, Projection as ThriftProjection")
 
         # Add header
         models_output.append("#!/usr/bin/env python3")
@@ -3406,7 +4249,8 @@ def main():
         models_output.append("DB_USER = os.getenv('DB_USER')")
         models_output.append("DB_PASSWORD = os.getenv('DB_PASSWORD')")
         models_output.append("DB_DATABASE = os.getenv('DB_DATABASE')")
-        models_output.append("")
+        models_output.append(generate_query_accounting_code())
+        models_output.append(generate_attribute_interning_code())
         models_output.append("")
 
         # Generate each model class
@@ -3449,6 +4293,9 @@ def main():
                 }
             )
 
+        # Subclasses of the generated models
+        models_output.append(generate_interned_attribute_code().lstrip("\n"))
+
         # Write single models.py file
         models_file = os.path.join(os.path.dirname(__file__), "models.py")
         with open(models_file, "w") as f:
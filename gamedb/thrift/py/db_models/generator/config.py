@@ -157,10 +157,22 @@ THRIFT_CONVERSION_CONFIG = {
     'mobile_items': {
         'has_attribute_map': True,  # Via direct mobile_item_attributes table, not pivot
         'attribute_relationship': 'direct',  # Distinguishes from pivot pattern
+        'fk_fields': ['item_id', 'mobile_id'],  # Foreign keys that are plain Thrift fields
     },
     'players': {
         'has_embedded_mobile': True,  # Player.mobile is embedded in Thrift
     },
+    'inventories': {
+        # Inventory.entries holds the inventory_entries rows; save() writes
+        # the list set by from_thrift() over the stored rows, matched by id
+        'embedded_lists': {'inventory_entries': 'entries'},
+        # Cached rollup maintained by services/container_tree.py: sent to
+        # clients, but never taken from them or written by save()
+        'read_only_columns': ['contained_volume'],
+    },
+    'inventory_entries': {
+        'fk_fields': ['item_id', 'mobile_item_id'],  # Foreign keys that are plain Thrift fields
+    },
 }
 
 
@@ -334,6 +346,60 @@ def has_embedded_relationship(table_name: str, relationship_name: str) -> bool:
     return config.get(f'has_embedded_{relationship_name}', False)
 
 
+def get_embedded_lists(table_name: str) -> Dict[str, str]:
+    """
+    Get the has-many relationships embedded as Thrift lists.
+
+    Args:
+        table_name: Database table name
+
+    Returns:
+        Dict of child table name -> Thrift list field name
+
+    Examples:
+        >>> get_embedded_lists('inventories')
+        {'inventory_entries': 'entries'}
+        >>> get_embedded_lists('players')
+        {}
+    """
+    return THRIFT_CONVERSION_CONFIG.get(table_name, {}).get('embedded_lists', {})
+
+
+def get_thrift_skip_columns(table_name: str) -> List[str]:
+    """
+    Get the columns that have no field on the table's Thrift struct.
+
+    Examples:
+        >>> get_thrift_skip_columns('inventories')
+        ['contained_volume']
+    """
+    return THRIFT_CONVERSION_CONFIG.get(table_name, {}).get('skip_columns', [])
+
+
+def get_read_only_columns(table_name: str) -> List[str]:
+    """
+    Get the columns that into_thrift() sends but from_thrift() ignores and
+    save() never writes, because dedicated statements maintain them.
+
+    Examples:
+        >>> get_read_only_columns('inventories')
+        ['contained_volume']
+    """
+    return THRIFT_CONVERSION_CONFIG.get(table_name, {}).get('read_only_columns', [])
+
+
+def get_thrift_fk_fields(table_name: str) -> List[str]:
+    """
+    Get the foreign key columns that are mapped to Thrift fields as plain ids
+    instead of being left to belongs-to relationships.
+
+    Examples:
+        >>> get_thrift_fk_fields('inventory_entries')
+        ['item_id', 'mobile_item_id']
+    """
+    return THRIFT_CONVERSION_CONFIG.get(table_name, {}).get('fk_fields', [])
+
+
 def get_valid_owner_types(table_name: str) -> List[str]:
     """
     Get list of valid owner types for a table.
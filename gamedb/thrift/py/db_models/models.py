@@ -12,10 +12,15 @@ thrift_gen_path = '/vagrant/gamedb/thrift/gen-py'
 if thrift_gen_path not in sys.path:
     sys.path.insert(0, thrift_gen_path)
 
+from collections import deque
 from dotenv import load_dotenv
-from game.ttypes import GameResult as ThriftGameResult, StatusType as ThriftStatusType, GameError as ThriftGameError, Owner as ThriftOwner, AttributeValue as ThriftAttributeValue, AttributeType as ThriftAttributeType, ItemType as ThriftItemType, MobileType as ThriftMobileType, ItemVector3 as ThriftItemVector3, Attribute as ThriftAttribute, Item as ThriftItem, Mobile as ThriftMobile, Player as ThriftPlayer, MobileItem as ThriftMobileItem, Inventory as ThriftInventory, InventoryEntry as ThriftInventoryEntry, ItemBlueprint as ThriftItemBlueprint, ItemBlueprintComponent as ThriftItemBlueprintComponent
+from game.ttypes import GameResult as ThriftGameResult, StatusType as ThriftStatusType, GameError as ThriftGameError, Owner as ThriftOwner, AttributeValue as ThriftAttributeValue, AttributeType as ThriftAttributeType, ItemType as ThriftItemType, MobileType as ThriftMobileType, ItemVector3 as ThriftItemVector3, Attribute as ThriftAttribute, Item as ThriftItem, Mobile as ThriftMobile, Player as ThriftPlayer, MobileItem as ThriftMobileItem, Inventory as ThriftInventory, InventoryEntry as ThriftInventoryEntry, ItemBlueprint as ThriftItemBlueprint, ItemBlueprintComponent as ThriftItemBlueprintComponent, Projection as ThriftProjection
+from mysql.connector.connection import MySQLConnection
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any, Iterator, Union, Tuple
 import mysql.connector
+import threading
+import weakref
 
 # Load environment variables
 load_dotenv()
@@ -26,6 +31,190 @@ DB_USER = os.getenv('DB_USER')
 DB_PASSWORD = os.getenv('DB_PASSWORD')
 DB_DATABASE = os.getenv('DB_DATABASE')
 
+# Number of recent statements kept per thread for diagnostics
+QUERY_LOG_SIZE = 100
+
+# Transaction control is bookkeeping, not a query against model data
+_UNCOUNTED_STATEMENTS = ('START TRANSACTION', 'COMMIT', 'ROLLBACK')
+
+
+class QueryStats:
+    """
+    Per-thread counters for the statements sent through model connections.
+
+    Session setup performed while connecting and transaction control statements
+    are not counted. Counters only grow; take a reading before and after a block
+    of work to measure it, or call reset() to start over.
+    """
+
+    _local = threading.local()
+
+    @staticmethod
+    def _state() -> Dict[str, Any]:
+        state = getattr(QueryStats._local, 'state', None)
+        if state is None:
+            state = {
+                'queries': 0,
+                'connections': 0,
+                'statements': deque(maxlen=QUERY_LOG_SIZE),
+            }
+            QueryStats._local.state = state
+        return state
+
+    @staticmethod
+    def reset() -> None:
+        """Reset the counters for the current thread."""
+        QueryStats._local.state = None
+
+    @staticmethod
+    def query_count() -> int:
+        """Return the number of statements the current thread has issued."""
+        return QueryStats._state()['queries']
+
+    @staticmethod
+    def connection_count() -> int:
+        """Return the number of connections the current thread has opened."""
+        return QueryStats._state()['connections']
+
+    @staticmethod
+    def statements() -> List[str]:
+        """Return the most recent statements issued by the current thread, oldest first."""
+        return list(QueryStats._state()['statements'])
+
+    @staticmethod
+    def record_connection() -> None:
+        QueryStats._state()['connections'] += 1
+
+    @staticmethod
+    def record_query(statement: str) -> None:
+        state = QueryStats._state()
+        state['queries'] += 1
+        state['statements'].append(statement)
+
+
+class CountingMySQLConnection(MySQLConnection):
+    """MySQLConnection that reports every statement it sends to QueryStats."""
+
+    def __init__(self, **kwargs):
+        self._count_queries = False
+        super().__init__(**kwargs)
+        QueryStats.record_connection()
+        self._count_queries = True
+
+    def cmd_query(self, query, *args, **kwargs):
+        if self._count_queries:
+            if isinstance(query, (bytes, bytearray)):
+                statement = query.decode('utf-8', errors='replace')
+            else:
+                statement = str(query)
+            statement = ' '.join(statement.split())
+            if not statement.upper().startswith(_UNCOUNTED_STATEMENTS):
+                QueryStats.record_query(statement)
+        return super().cmd_query(query, *args, **kwargs)
+
+
+# Columns holding an attribute's value, shared by attributes and the direct
+# attribute tables; equal values make equal (interned) attributes
+ATTRIBUTE_VALUE_COLUMNS = (
+    'internal_name',
+    'visible',
+    'attribute_type',
+    'bool_value',
+    'double_value',
+    'vector3_x',
+    'vector3_y',
+    'vector3_z',
+    'asset_id',
+)
+
+
+def attribute_types_filter(attribute_types: Optional[List[int]], column: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    SQL condition and params restricting column to some Thrift AttributeType
+    values, or ('', ()) for all of them.
+    """
+    if attribute_types is None:
+        return '', ()
+    names = tuple(sorted(ThriftAttributeType._VALUES_TO_NAMES[t] for t in attribute_types))
+    if not names:
+        return ' AND FALSE', ()
+    return f" AND {column} IN ({', '.join(['%s'] * len(names))})", names
+
+
+class AttributeSet:
+    """An immutable sequence of InternedAttributes, ordered by attribute_type."""
+
+    __slots__ = ('_attributes', '__weakref__')
+
+    def __init__(self, attributes: Tuple['Attribute', ...]):
+        self._attributes = attributes
+
+    def __iter__(self) -> Iterator['Attribute']:
+        return iter(self._attributes)
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def __getitem__(self, index: int) -> 'Attribute':
+        return self._attributes[index]
+
+    def __repr__(self) -> str:
+        return f"AttributeSet({[attribute.get_attribute_type() for attribute in self._attributes]})"
+
+
+class AttributeInterner:
+    """
+    Weak flyweight pool of InternedAttributes and AttributeSets.
+
+    An entry lives as long as some owner still references it. An interned
+    attribute is one stored row, identified by its id and values, and shared
+    by every owner reading that row, e.g. a template attribute read by all of
+    its item instances. Interned attributes are read-only: write the change
+    to the owner's attribute table and reload instead.
+    """
+
+    _lock = threading.Lock()
+    _attributes: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+    _sets: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def key(row: Dict[str, Any]) -> Tuple[Any, ...]:
+        """The identity of an attribute row: its id and ATTRIBUTE_VALUE_COLUMNS values."""
+        return (row.get('id'),) + tuple(row.get(column) for column in ATTRIBUTE_VALUE_COLUMNS)
+
+    @staticmethod
+    def attribute(row: Dict[str, Any]) -> 'InternedAttribute':
+        """The shared, read-only Attribute holding row's id and values."""
+        key = AttributeInterner.key(row)
+        with AttributeInterner._lock:
+            attribute = AttributeInterner._attributes.get(key)
+            if attribute is None:
+                attribute = InternedAttribute(dict(zip(('id',) + ATTRIBUTE_VALUE_COLUMNS, key)))
+                AttributeInterner._attributes[key] = attribute
+            return attribute
+
+    @staticmethod
+    def attribute_set(rows: List[Dict[str, Any]]) -> AttributeSet:
+        """The shared AttributeSet of rows; a later row overrides an earlier one of the same attribute_type."""
+        by_type: Dict[Any, Dict[str, Any]] = {}
+        for row in rows:
+            by_type[row.get('attribute_type')] = row
+        ordered = [by_type[attribute_type] for attribute_type in sorted(by_type, key=str)]
+        key = tuple(AttributeInterner.key(row) for row in ordered)
+        with AttributeInterner._lock:
+            attribute_set = AttributeInterner._sets.get(key)
+            if attribute_set is not None:
+                return attribute_set
+        attribute_set = AttributeSet(tuple(AttributeInterner.attribute(row) for row in ordered))
+        with AttributeInterner._lock:
+            return AttributeInterner._sets.setdefault(key, attribute_set)
+
+    @staticmethod
+    def size() -> Tuple[int, int]:
+        """(distinct attributes, distinct sets) currently interned."""
+        with AttributeInterner._lock:
+            return len(AttributeInterner._attributes), len(AttributeInterner._sets)
+
 
 class AttributeOwner:
     """
@@ -57,7 +246,7 @@ class AttributeOwner:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -519,6 +708,33 @@ class AttributeOwner:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['AttributeOwner']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = AttributeOwner._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `attribute_owners` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = AttributeOwner()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -691,7 +907,7 @@ class Attribute:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -930,12 +1146,16 @@ class Attribute:
         return self
 
 
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['Attribute']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['Attribute']]:
         """
         Convert this Model instance to a Thrift Attribute object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -977,10 +1197,13 @@ class Attribute:
             # Create Thrift object
             thrift_obj = ThriftAttribute(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -1152,6 +1375,33 @@ class Attribute:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['Attribute']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = Attribute._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `attributes` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = Attribute()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -1223,7 +1473,9 @@ class Inventory:
           `max_entries` bigint NOT NULL,
           `max_volume` double NOT NULL,
           `last_calculated_volume` double DEFAULT '0',
-          PRIMARY KEY (`id`)
+          `contained_volume` double NOT NULL DEFAULT '0',
+          PRIMARY KEY (`id`),
+          KEY `owner_type_owner_id` (`owner_type`,`owner_id`)
         ) ENGINE=InnoDB AUTO_INCREMENT=575 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
     """
 
@@ -1236,7 +1488,7 @@ class Inventory:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -1275,6 +1527,9 @@ class Inventory:
     def get_last_calculated_volume(self) -> Optional[float]:
         return self._data.get('last_calculated_volume')
 
+    def get_contained_volume(self) -> float:
+        return self._data.get('contained_volume')
+
     def _set_id(self, value: int) -> 'self.__class__':
         self._data['id'] = value
         self._dirty = True
@@ -1305,6 +1560,11 @@ class Inventory:
         self._dirty = True
         return self
 
+    def set_contained_volume(self, value: float) -> 'self.__class__':
+        self._data['contained_volume'] = value
+        self._dirty = True
+        return self
+
 
     def validate_owner(self) -> None:
         """
@@ -1370,6 +1630,102 @@ class Inventory:
 
         return iter(results) if lazy else results
 
+    @staticmethod
+    def preload_inventory_entries(instances: List['Inventory']) -> None:
+        """
+        Load the InventoryEntry records of many Inventory records with a single
+        query and cache them on each instance, so that get_inventory_entries() and
+        into_thrift() do not query once per record.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+
+        grouped = {owner_id: [] for owner_id in ids}
+        connection = InventoryEntry._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(
+                f"SELECT * FROM `inventory_entries` WHERE `inventory_id` IN ({placeholders}) ORDER BY `id`",
+                tuple(ids),
+            )
+            rows = cursor.fetchall()
+            for row in rows:
+                related = InventoryEntry()
+                related._data = row
+                related._dirty = False
+                grouped[row['inventory_id']].append(related)
+        finally:
+            cursor.close()
+            connection.close()
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_inventory_entries_cache', grouped[instance.get_id()])
+
+    @staticmethod
+    def _write_inventory_entries(cursor, lists: List[Tuple[int, Dict[int, Dict[str, Any]], List['InventoryEntry']]]) -> None:
+        """
+        Write lists of InventoryEntry records over the stored rows, matched by id.
+        lists holds a (Inventory id, stored rows by id, records) tuple per
+        Inventory. Stored rows missing from their list are deleted, changed ones
+        UPDATEd and records without a stored id inserted, getting their new ids;
+        one statement each. cursor must be in the caller's transaction.
+        """
+        # A repeated id (e.g. a copied entry) is a new row
+        removed = []
+        updated = []
+        inserted = []
+        for owner_id, stored, related_list in lists:
+            kept = set()
+            for related in related_list:
+                related._data['inventory_id'] = owner_id
+                related_id = related.get_id()
+                if related_id in stored and related_id not in kept:
+                    kept.add(related_id)
+                    row = stored[related_id]
+                    if any(row.get(col) != related._data.get(col) for col in ('inventory_id', 'item_id', 'quantity', 'is_max_stacked', 'mobile_item_id')):
+                        updated.append(related)
+                else:
+                    inserted.append(related)
+            removed.extend(related_id for related_id in stored if related_id not in kept)
+
+        if removed:
+            cursor.execute(
+                f"DELETE FROM `inventory_entries` WHERE `id` IN ({', '.join(['%s'] * len(removed))})",
+                tuple(removed),
+            )
+        if updated:
+            cursor.execute(
+                "UPDATE `inventory_entries` SET "
+                + ", ".join(
+                    f"`{col}` = CASE `id` " + " ".join(["WHEN %s THEN %s"] * len(updated)) + " END"
+                    for col in ('inventory_id', 'item_id', 'quantity', 'is_max_stacked', 'mobile_item_id')
+                )
+                + f" WHERE `id` IN ({', '.join(['%s'] * len(updated))})",
+                tuple(
+                    value
+                    for col in ('inventory_id', 'item_id', 'quantity', 'is_max_stacked', 'mobile_item_id')
+                    for related in updated
+                    for value in (related.get_id(), related._data.get(col))
+                ) + tuple(related.get_id() for related in updated),
+            )
+        if inserted:
+            cursor.executemany(
+                "INSERT INTO `inventory_entries` (`inventory_id`, `item_id`, `quantity`, `is_max_stacked`, `mobile_item_id`) VALUES (%s, %s, %s, %s, %s)",
+                [
+                    tuple(related._data.get(col) for col in ('inventory_id', 'item_id', 'quantity', 'is_max_stacked', 'mobile_item_id'))
+                    for related in inserted
+                ],
+            )
+            # One multi-row INSERT assigns consecutive ids from lastrowid
+            for offset, related in enumerate(inserted):
+                related._data['id'] = cursor.lastrowid + offset
+        for _, _, related_list in lists:
+            for related in related_list:
+                related._dirty = False
+
     def get_inventory_owners(self, reload: bool = False, lazy: bool = False):
         """
         Get all associated InventoryOwner records.
@@ -1446,16 +1802,39 @@ class Inventory:
                 self._data['owner_id'] = owner.asset_id
                 self._data['owner_type'] = 'asset'
 
+        # Handle embedded entries (inventory_entries rows); save() writes them over the
+        # stored rows by id. None leaves the stored rows alone, [] removes them all
+        if hasattr(thrift_obj, 'entries') and thrift_obj.entries is not None:
+            # Rows loaded through get_inventory_entries() and not changed since are
+            # what is stored, so save() need not read them again
+            if getattr(self, '_inventory_entries_replace', None) is None:
+                loaded = getattr(self, '_inventory_entries_cache', None)
+                if loaded is not None and not any(related._dirty for related in loaded):
+                    self._inventory_entries_stored = {related.get_id(): dict(related._data) for related in loaded}
+                else:
+                    self._inventory_entries_stored = None
+            related_list = []
+            for related_thrift in thrift_obj.entries:
+                related = InventoryEntry()
+                related.from_thrift(related_thrift)
+                related_list.append(related)
+            self._inventory_entries_cache = related_list
+            self._inventory_entries_replace = 'replace' if self._data.get('id') is not None else 'insert'
+
         self._dirty = True
         return self
 
 
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['Inventory']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['Inventory']]:
         """
         Convert this Model instance to a Thrift Inventory object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -1469,6 +1848,7 @@ class Inventory:
             thrift_params['max_entries'] = self._data.get('max_entries')
             thrift_params['max_volume'] = self._data.get('max_volume')
             thrift_params['last_calculated_volume'] = self._data.get('last_calculated_volume')
+            thrift_params['contained_volume'] = self._data.get('contained_volume')
 
             # Convert database owner_id and owner_type to ThriftOwner union
             owner = None
@@ -1485,13 +1865,26 @@ class Inventory:
                     owner = ThriftOwner(asset_id=owner_id)
             thrift_params['owner'] = owner
 
+            # Load embedded entries (inventory_entries rows), one query unless preloaded
+            entries_list = []
+            for related_model in self.get_inventory_entries():
+                related_results, related_thrift = related_model.into_thrift(projection)
+                if related_thrift is not None:
+                    entries_list.append(related_thrift)
+                else:
+                    results.extend(related_results)
+            thrift_params['entries'] = entries_list
+
             # Create Thrift object
             thrift_obj = ThriftInventory(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -1537,15 +1930,15 @@ class Inventory:
 
                 if 'id' in self._data and self._data['id'] is not None:
                     # UPDATE existing record
-                    set_clause = ', '.join([f"`{col}` = %s" for col in self._data.keys() if col != 'id'])
-                    values = [self._data[col] for col in self._data.keys() if col != 'id']
+                    set_clause = ', '.join([f"`{col}` = %s" for col in self._data.keys() if col not in ('id', 'contained_volume')])
+                    values = [self._data[col] for col in self._data.keys() if col not in ('id', 'contained_volume')]
                     values.append(self._data['id'])
 
                     query = f"UPDATE `inventories` SET {set_clause} WHERE `id` = %s"
                     cursor.execute(query, tuple(values))
                 else:
                     # INSERT new record
-                    columns = [col for col in self._data.keys() if col != 'id']
+                    columns = [col for col in self._data.keys() if col not in ('id', 'contained_volume')]
                     placeholders = ', '.join(['%s'] * len(columns))
                     column_names = ', '.join([f"`{col}`" for col in columns])
                     values = [self._data[col] for col in columns]
@@ -1559,10 +1952,31 @@ class Inventory:
 
             # Cascade save has-many relationships (even if parent not dirty)
             if cascade:
-                # Save inventory_entries if cached
-                cache_key = '_inventory_entries_cache'
-                if hasattr(self, cache_key):
-                    related_list = getattr(self, cache_key)
+                # Write the list set by from_thrift() over the stored inventory_entries,
+                # matched by id; 'insert' means the record was new, so nothing is stored
+                replace_mode = getattr(self, '_inventory_entries_replace', None)
+                if replace_mode is not None:
+                    related_list = getattr(self, '_inventory_entries_cache', None) or []
+                    stored = getattr(self, '_inventory_entries_stored', None)
+                    replace_cursor = connection.cursor(dictionary=True)
+                    try:
+                        if stored is None:
+                            stored = {}
+                            if replace_mode == 'replace':
+                                replace_cursor.execute(
+                                    "SELECT * FROM `inventory_entries` WHERE `inventory_id` = %s FOR UPDATE",
+                                    (self.get_id(),),
+                                )
+                                stored = {row['id']: row for row in replace_cursor.fetchall()}
+
+                        self._write_inventory_entries(replace_cursor, [(self.get_id(), stored, related_list)])
+                    finally:
+                        replace_cursor.close()
+                    self._inventory_entries_replace = None
+                    self._inventory_entries_stored = {related.get_id(): dict(related._data) for related in related_list}
+                else:
+                    # Otherwise save inventory_entries changed through get_inventory_entries()
+                    related_list = getattr(self, '_inventory_entries_cache', None)
                     if related_list is not None:
                         for related in related_list:
                             if hasattr(related, '_dirty') and related._dirty:
@@ -1689,6 +2103,33 @@ class Inventory:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['Inventory']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = Inventory._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `inventories` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = Inventory()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -1762,6 +2203,7 @@ class InventoryEntry:
           `mobile_item_id` bigint DEFAULT NULL,
           PRIMARY KEY (`id`),
           KEY `inventory_id` (`inventory_id`),
+          KEY `mobile_item_id` (`mobile_item_id`),
           CONSTRAINT `inventory_entries_ibfk_1` FOREIGN KEY (`inventory_id`) REFERENCES `inventories` (`id`)
         ) ENGINE=InnoDB AUTO_INCREMENT=616 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
     """
@@ -1775,7 +2217,7 @@ class InventoryEntry:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -2033,12 +2475,16 @@ class InventoryEntry:
         return self
 
 
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['InventoryEntry']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['InventoryEntry']]:
         """
         Convert this Model instance to a Thrift InventoryEntry object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -2049,16 +2495,21 @@ class InventoryEntry:
             thrift_params = {}
 
             thrift_params['id'] = self._data.get('id')
+            thrift_params['item_id'] = self._data.get('item_id')
             thrift_params['quantity'] = self._data.get('quantity')
             thrift_params['is_max_stacked'] = self._data.get('is_max_stacked')
+            thrift_params['mobile_item_id'] = self._data.get('mobile_item_id')
 
             # Create Thrift object
             thrift_obj = ThriftInventoryEntry(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -2229,6 +2680,33 @@ class InventoryEntry:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['InventoryEntry']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = InventoryEntry._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `inventory_entries` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = InventoryEntry()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -2357,7 +2835,7 @@ class InventoryOwner:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -2819,6 +3297,33 @@ class InventoryOwner:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['InventoryOwner']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = InventoryOwner._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `inventory_owners` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = InventoryOwner()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -2974,6 +3479,7 @@ class ItemBlueprintComponent:
           `ratio` double NOT NULL,
           PRIMARY KEY (`id`),
           KEY `item_blueprint_id` (`item_blueprint_id`),
+          KEY `component_item_id` (`component_item_id`),
           CONSTRAINT `item_blueprint_components_ibfk_1` FOREIGN KEY (`item_blueprint_id`) REFERENCES `item_blueprints` (`id`)
         ) ENGINE=InnoDB AUTO_INCREMENT=369 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
     """
@@ -2987,7 +3493,7 @@ class ItemBlueprintComponent:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -3123,12 +3629,16 @@ class ItemBlueprintComponent:
         return self
 
 
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['ItemBlueprintComponent']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['ItemBlueprintComponent']]:
         """
         Convert this Model instance to a Thrift ItemBlueprintComponent object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -3145,10 +3655,13 @@ class ItemBlueprintComponent:
             # Create Thrift object
             thrift_obj = ThriftItemBlueprintComponent(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -3303,6 +3816,33 @@ class ItemBlueprintComponent:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['ItemBlueprintComponent']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = ItemBlueprintComponent._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `item_blueprint_components` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = ItemBlueprintComponent()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -3404,7 +3944,7 @@ class ItemBlueprint:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -3571,12 +4111,16 @@ class ItemBlueprint:
         return self
 
 
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['ItemBlueprint']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['ItemBlueprint']]:
         """
         Convert this Model instance to a Thrift ItemBlueprint object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -3592,10 +4136,13 @@ class ItemBlueprint:
             # Create Thrift object
             thrift_obj = ThriftItemBlueprint(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -3819,6 +4366,33 @@ class ItemBlueprint:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['ItemBlueprint']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = ItemBlueprint._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `item_blueprints` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = ItemBlueprint()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -3870,7 +4444,8 @@ class Item:
           `max_stack_size` bigint DEFAULT NULL,
           `item_type` varchar(50) NOT NULL,
           `blueprint_id` bigint DEFAULT NULL,
-          PRIMARY KEY (`id`)
+          PRIMARY KEY (`id`),
+          KEY `blueprint_id` (`blueprint_id`)
         ) ENGINE=InnoDB AUTO_INCREMENT=3414 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
     """
 
@@ -3883,7 +4458,7 @@ class Item:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -4207,20 +4782,23 @@ class Item:
 
         return iter(results) if lazy else results
 
-    def get_attributes(self, reload: bool = False) -> List['Attribute']:
+    def get_attributes(self, reload: bool = False, attribute_types: Optional[List[int]] = None) -> List['Attribute']:
         """
         Get all attributes for this Item through the attribute_owners pivot table.
         Returns a list of Attribute objects.
+        With attribute_types, only attributes of those Thrift AttributeType
+        values are loaded.
         """
         cache_key = '_attributes_cache'
 
-        if not reload and hasattr(self, cache_key):
+        if attribute_types is None and not reload and hasattr(self, cache_key):
             cached = getattr(self, cache_key)
             if cached is not None:
                 return cached
 
         if self.get_id() is None:
             return []
+        types_filter, types_params = attribute_types_filter(attribute_types, 'r.attribute_type')
 
         # Query through pivot table
         self._connect()
@@ -4228,13 +4806,13 @@ class Item:
         results = []
 
         try:
-            query = """
+            query = f"""
                 SELECT r.*
                 FROM attributes r
                 INNER JOIN attribute_owners p ON r.id = p.attribute_id
-                WHERE p.item_id = %s
+                WHERE p.item_id = %s{types_filter}
             """
-            cursor.execute(query, (self.get_id(),))
+            cursor.execute(query, (self.get_id(),) + types_params)
             rows = cursor.fetchall()
 
             for row in rows:
@@ -4246,9 +4824,55 @@ class Item:
             cursor.close()
 
         # Cache results
-        setattr(self, cache_key, results)
+        # Only a complete set is cached
+        if attribute_types is None:
+            setattr(self, cache_key, results)
         return results
 
+    @staticmethod
+    def preload_attributes(instances: List['Item'], attribute_types: Optional[List[int]] = None) -> None:
+        """
+        Load attributes for many Item records with a single query through
+        the attribute_owners pivot table and cache them on each instance, so that
+        get_attributes() and into_thrift() do not query once per record.
+        With attribute_types, only attributes of those Thrift AttributeType
+        values are loaded.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+        types_filter, types_params = attribute_types_filter(attribute_types, 'r.attribute_type')
+
+        grouped = {owner_id: [] for owner_id in ids}
+        connection = Item._create_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f"""
+                SELECT p.item_id AS pivot_owner_id, r.*
+                FROM attributes r
+                INNER JOIN attribute_owners p ON r.id = p.attribute_id
+                WHERE p.item_id IN ({placeholders}){types_filter}
+            """
+            cursor.execute(query, tuple(ids) + types_params)
+            rows = cursor.fetchall()
+
+            for row in rows:
+                owner_id = row.pop('pivot_owner_id')
+                instance = Attribute()
+                instance._data = row
+                instance._dirty = False
+                grouped[owner_id].append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_attributes_cache', grouped[instance.get_id()])
+                setattr(instance, '_attributes_preloaded', True)
+
     def get_attribute_owners(self, reload: bool = False, lazy: bool = False):
         """
         Get all AttributeOwner pivot records for this Item.
@@ -4458,6 +5082,47 @@ class Item:
         setattr(self, cache_key, results)
         return results
 
+    @staticmethod
+    def preload_inventories(instances: List['Item']) -> None:
+        """
+        Load inventories for many Item records with a single query through
+        the inventory_owners pivot table and cache them on each instance, so that
+        get_inventories() and into_thrift() do not query once per record.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+
+        grouped = {owner_id: [] for owner_id in ids}
+        connection = Item._create_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f"""
+                SELECT p.item_id AS pivot_owner_id, r.*
+                FROM inventories r
+                INNER JOIN inventory_owners p ON r.id = p.inventory_id
+                WHERE p.item_id IN ({placeholders})
+            """
+            cursor.execute(query, tuple(ids))
+            rows = cursor.fetchall()
+
+            for row in rows:
+                owner_id = row.pop('pivot_owner_id')
+                instance = Inventory()
+                instance._data = row
+                instance._dirty = False
+                grouped[owner_id].append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_inventories_cache', grouped[instance.get_id()])
+                setattr(instance, '_inventories_preloaded', True)
+
     def get_inventory_owners(self, reload: bool = False, lazy: bool = False):
         """
         Get all InventoryOwner pivot records for this Item.
@@ -4669,12 +5334,16 @@ class Item:
         return self
 
 
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['Item']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['Item']]:
         """
         Convert this Model instance to a Thrift Item object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -4695,24 +5364,38 @@ class Item:
 
             # Load attributes via pivot table and convert to map<AttributeType, Attribute>
             attributes_map = {}
-            if self.get_id() is not None:
-                # Get attributes through the pivot relationship
-                attribute_models = self.get_attributes(reload=True)
+            include_attributes = projection is None or projection.include_attributes is not False
+            attribute_types = None
+            if projection is not None and projection.attribute_types:
+                attribute_types = set(projection.attribute_types)
+            if include_attributes and self.get_id() is not None:
+                # Reuse a batch loaded by preload_attributes() when there is
+                # one, else load only the types the projection asks for
+                if getattr(self, '_attributes_preloaded', False):
+                    attribute_models = self.get_attributes()
+                else:
+                    attribute_models = self.get_attributes(reload=True, attribute_types=attribute_types)
                 for attr_model in attribute_models:
+                    # A preloaded batch may hold types the projection did not ask for
+                    if attribute_types is not None and attr_model.get_attribute_type() not in attribute_types:
+                        continue
                     # Convert each attribute model to Thrift
                     attr_results, attr_thrift = attr_model.into_thrift()
                     if attr_thrift is not None:
                         # Use attribute_type as the map key
                         attributes_map[attr_thrift.attribute_type] = attr_thrift
-            thrift_params['attributes'] = attributes_map
+            thrift_params['attributes'] = attributes_map if include_attributes else None
 
             # Create Thrift object
             thrift_obj = ThriftItem(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -5027,6 +5710,33 @@ class Item:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['Item']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = Item._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `items` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = Item()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -5118,7 +5828,7 @@ class MobileItemAttribute:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -5424,6 +6134,33 @@ class MobileItemAttribute:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['MobileItemAttribute']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = MobileItemAttribute._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `mobile_item_attributes` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = MobileItemAttribute()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -5529,7 +6266,7 @@ class MobileItemBlueprintComponent:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -5779,6 +6516,33 @@ class MobileItemBlueprintComponent:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['MobileItemBlueprintComponent']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = MobileItemBlueprintComponent._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `mobile_item_blueprint_components` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = MobileItemBlueprintComponent()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -5880,7 +6644,7 @@ class MobileItemBlueprint:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -6114,6 +6878,33 @@ class MobileItemBlueprint:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['MobileItemBlueprint']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = MobileItemBlueprint._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `mobile_item_blueprints` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = MobileItemBlueprint()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -6180,7 +6971,7 @@ class MobileItem:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -6521,17 +7312,22 @@ class MobileItem:
         return iter(results) if lazy else results
 
 
-    def get_attributes(self, reload: bool = False) -> List['Attribute']:
+    def get_attributes(self, reload: bool = False, attribute_types: Optional[List[int]] = None) -> AttributeSet:
         """
-        Get all attributes for this MobileItem from mobile_item_attributes table.
-        Converts to standard Attribute objects for Thrift compatibility.
+        Get all attributes for this MobileItem in one query:
+        its template item's attributes with the overrides
+        stored in mobile_item_attributes on top.
+
+        The result is an interned, read-only AttributeSet shared with every
+        owner holding the same attributes; write changes to mobile_item_attributes.
 
         Args:
             reload: If True, ignore cache and reload from database
+            attribute_types: If given, only load attributes of these Thrift AttributeType values
         """
         # Check cache first
         cache_key = '_attributes_cache'
-        if not reload and hasattr(self, cache_key):
+        if attribute_types is None and not reload and hasattr(self, cache_key):
             cached = getattr(self, cache_key)
             if cached is not None:
                 return cached
@@ -6539,30 +7335,82 @@ class MobileItem:
         # Fetch from database
         my_id = self.get_id()
         if my_id is None:
-            return []
+            return AttributeInterner.attribute_set([])
+        types_filter, types_params = attribute_types_filter(attribute_types, 'attribute_type')
+        template_types_filter, _ = attribute_types_filter(attribute_types, 'a.attribute_type')
 
-        # Get direct attribute records
-        direct_attrs = MobileItemAttribute.find_by_mobile_item_id(my_id)
-
-        # Convert to standard Attribute objects
-        attributes = []
-        for direct_attr in direct_attrs:
-            attr = Attribute()
-            attr._data['internal_name'] = direct_attr.get_internal_name()
-            attr._data['visible'] = direct_attr.get_visible()
-            attr._data['attribute_type'] = direct_attr.get_attribute_type()
-            attr._data['bool_value'] = direct_attr.get_bool_value()
-            attr._data['double_value'] = direct_attr.get_double_value()
-            attr._data['vector3_x'] = direct_attr.get_vector3_x()
-            attr._data['vector3_y'] = direct_attr.get_vector3_y()
-            attr._data['vector3_z'] = direct_attr.get_vector3_z()
-            attr._data['asset_id'] = direct_attr.get_asset_id()
-            attributes.append(attr)
+        connection = MobileItem._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            query = f"""
+                SELECT 0 AS layer, a.id, a.internal_name, a.visible, a.attribute_type, a.bool_value, a.double_value, a.vector3_x, a.vector3_y, a.vector3_z, a.asset_id
+                FROM mobile_items t
+                INNER JOIN attribute_owners p ON p.item_id = t.item_id
+                INNER JOIN attributes a ON a.id = p.attribute_id
+                WHERE t.id = %s{template_types_filter}
+                UNION ALL
+                SELECT 1 AS layer, id, internal_name, visible, attribute_type, bool_value, double_value, vector3_x, vector3_y, vector3_z, asset_id
+                FROM mobile_item_attributes
+                WHERE mobile_item_id = %s{types_filter}
+                ORDER BY layer
+            """
+            cursor.execute(query, (my_id,) + types_params + (my_id,) + types_params)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
 
-        # Cache results
-        setattr(self, cache_key, attributes)
+        # Only a complete set is cached
+        attributes = AttributeInterner.attribute_set(rows)
+        if attribute_types is None:
+            setattr(self, cache_key, attributes)
         return attributes
 
+    @staticmethod
+    def preload_attributes(instances: List['MobileItem'], attribute_types: Optional[List[int]] = None) -> None:
+        """
+        Load attributes for many MobileItem records with a single query
+        and cache them on each instance, so that get_attributes() and
+        into_thrift() do not query once per record.
+        With attribute_types, only attributes of those Thrift AttributeType
+        values are loaded.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+        types_filter, types_params = attribute_types_filter(attribute_types, 'attribute_type')
+        template_types_filter, _ = attribute_types_filter(attribute_types, 'a.attribute_type')
+
+        grouped = {owner_id: [] for owner_id in ids}
+        connection = MobileItem._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f"""
+                SELECT t.id AS owner_id, 0 AS layer, a.id, a.internal_name, a.visible, a.attribute_type, a.bool_value, a.double_value, a.vector3_x, a.vector3_y, a.vector3_z, a.asset_id
+                FROM mobile_items t
+                INNER JOIN attribute_owners p ON p.item_id = t.item_id
+                INNER JOIN attributes a ON a.id = p.attribute_id
+                WHERE t.id IN ({placeholders}){template_types_filter}
+                UNION ALL
+                SELECT mobile_item_id AS owner_id, 1 AS layer, id, internal_name, visible, attribute_type, bool_value, double_value, vector3_x, vector3_y, vector3_z, asset_id
+                FROM mobile_item_attributes
+                WHERE mobile_item_id IN ({placeholders}){types_filter}
+                ORDER BY layer
+            """
+            cursor.execute(query, tuple(ids) + types_params + tuple(ids) + types_params)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+
+        for row in rows:
+            grouped[row.pop('owner_id')].append(row)
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_attributes_cache', AttributeInterner.attribute_set(grouped[instance.get_id()]))
+                setattr(instance, '_attributes_preloaded', True)
+
 
     def from_thrift(self, thrift_obj: 'MobileItem') -> 'MobileItem':
         """
@@ -6604,12 +7452,16 @@ class MobileItem:
         return self
 
 
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['MobileItem']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['MobileItem']]:
         """
         Convert this Model instance to a Thrift MobileItem object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -6620,6 +7472,7 @@ class MobileItem:
             thrift_params = {}
 
             thrift_params['id'] = self._data.get('id')
+            thrift_params['mobile_id'] = self._data.get('mobile_id')
             thrift_params['internal_name'] = self._data.get('internal_name')
             thrift_params['max_stack_size'] = self._data.get('max_stack_size')
             item_type_value = self._data.get('item_type')
@@ -6627,27 +7480,42 @@ class MobileItem:
                 thrift_params['item_type'] = ThriftItemType._NAMES_TO_VALUES[item_type_value]
             else:
                 thrift_params['item_type'] = None
+            thrift_params['item_id'] = self._data.get('item_id')
 
             # Load attributes via pivot table and convert to map<AttributeType, Attribute>
             attributes_map = {}
-            if self.get_id() is not None:
-                # Get attributes through the pivot relationship
-                attribute_models = self.get_attributes(reload=True)
+            include_attributes = projection is None or projection.include_attributes is not False
+            attribute_types = None
+            if projection is not None and projection.attribute_types:
+                attribute_types = set(projection.attribute_types)
+            if include_attributes and self.get_id() is not None:
+                # Reuse a batch loaded by preload_attributes() when there is
+                # one, else load only the types the projection asks for
+                if getattr(self, '_attributes_preloaded', False):
+                    attribute_models = self.get_attributes()
+                else:
+                    attribute_models = self.get_attributes(reload=True, attribute_types=attribute_types)
                 for attr_model in attribute_models:
+                    # A preloaded batch may hold types the projection did not ask for
+                    if attribute_types is not None and attr_model.get_attribute_type() not in attribute_types:
+                        continue
                     # Convert each attribute model to Thrift
                     attr_results, attr_thrift = attr_model.into_thrift()
                     if attr_thrift is not None:
                         # Use attribute_type as the map key
                         attributes_map[attr_thrift.attribute_type] = attr_thrift
-            thrift_params['attributes'] = attributes_map
+            thrift_params['attributes'] = attributes_map if include_attributes else None
 
             # Create Thrift object
             thrift_obj = ThriftMobileItem(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -6868,6 +7736,33 @@ class MobileItem:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['MobileItem']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = MobileItem._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `mobile_items` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = MobileItem()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -6995,7 +7890,7 @@ class Mobile:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -7409,20 +8304,23 @@ class Mobile:
 
         return iter(results) if lazy else results
 
-    def get_attributes(self, reload: bool = False) -> List['Attribute']:
+    def get_attributes(self, reload: bool = False, attribute_types: Optional[List[int]] = None) -> List['Attribute']:
         """
         Get all attributes for this Mobile through the attribute_owners pivot table.
         Returns a list of Attribute objects.
+        With attribute_types, only attributes of those Thrift AttributeType
+        values are loaded.
         """
         cache_key = '_attributes_cache'
 
-        if not reload and hasattr(self, cache_key):
+        if attribute_types is None and not reload and hasattr(self, cache_key):
             cached = getattr(self, cache_key)
             if cached is not None:
                 return cached
 
         if self.get_id() is None:
             return []
+        types_filter, types_params = attribute_types_filter(attribute_types, 'r.attribute_type')
 
         # Query through pivot table
         self._connect()
@@ -7430,13 +8328,13 @@ class Mobile:
         results = []
 
         try:
-            query = """
+            query = f"""
                 SELECT r.*
                 FROM attributes r
                 INNER JOIN attribute_owners p ON r.id = p.attribute_id
-                WHERE p.mobile_id = %s
+                WHERE p.mobile_id = %s{types_filter}
             """
-            cursor.execute(query, (self.get_id(),))
+            cursor.execute(query, (self.get_id(),) + types_params)
             rows = cursor.fetchall()
 
             for row in rows:
@@ -7448,9 +8346,55 @@ class Mobile:
             cursor.close()
 
         # Cache results
-        setattr(self, cache_key, results)
+        # Only a complete set is cached
+        if attribute_types is None:
+            setattr(self, cache_key, results)
         return results
 
+    @staticmethod
+    def preload_attributes(instances: List['Mobile'], attribute_types: Optional[List[int]] = None) -> None:
+        """
+        Load attributes for many Mobile records with a single query through
+        the attribute_owners pivot table and cache them on each instance, so that
+        get_attributes() and into_thrift() do not query once per record.
+        With attribute_types, only attributes of those Thrift AttributeType
+        values are loaded.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+        types_filter, types_params = attribute_types_filter(attribute_types, 'r.attribute_type')
+
+        grouped = {owner_id: [] for owner_id in ids}
+        connection = Mobile._create_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f"""
+                SELECT p.mobile_id AS pivot_owner_id, r.*
+                FROM attributes r
+                INNER JOIN attribute_owners p ON r.id = p.attribute_id
+                WHERE p.mobile_id IN ({placeholders}){types_filter}
+            """
+            cursor.execute(query, tuple(ids) + types_params)
+            rows = cursor.fetchall()
+
+            for row in rows:
+                owner_id = row.pop('pivot_owner_id')
+                instance = Attribute()
+                instance._data = row
+                instance._dirty = False
+                grouped[owner_id].append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_attributes_cache', grouped[instance.get_id()])
+                setattr(instance, '_attributes_preloaded', True)
+
     def get_attribute_owners(self, reload: bool = False, lazy: bool = False):
         """
         Get all AttributeOwner pivot records for this Mobile.
@@ -7660,6 +8604,47 @@ class Mobile:
         setattr(self, cache_key, results)
         return results
 
+    @staticmethod
+    def preload_inventories(instances: List['Mobile']) -> None:
+        """
+        Load inventories for many Mobile records with a single query through
+        the inventory_owners pivot table and cache them on each instance, so that
+        get_inventories() and into_thrift() do not query once per record.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+
+        grouped = {owner_id: [] for owner_id in ids}
+        connection = Mobile._create_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f"""
+                SELECT p.mobile_id AS pivot_owner_id, r.*
+                FROM inventories r
+                INNER JOIN inventory_owners p ON r.id = p.inventory_id
+                WHERE p.mobile_id IN ({placeholders})
+            """
+            cursor.execute(query, tuple(ids))
+            rows = cursor.fetchall()
+
+            for row in rows:
+                owner_id = row.pop('pivot_owner_id')
+                instance = Inventory()
+                instance._data = row
+                instance._dirty = False
+                grouped[owner_id].append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_inventories_cache', grouped[instance.get_id()])
+                setattr(instance, '_inventories_preloaded', True)
+
     def get_inventory_owners(self, reload: bool = False, lazy: bool = False):
         """
         Get all InventoryOwner pivot records for this Mobile.
@@ -7886,12 +8871,16 @@ class Mobile:
         return self
 
 
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['Mobile']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['Mobile']]:
         """
         Convert this Model instance to a Thrift Mobile object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -7923,24 +8912,38 @@ class Mobile:
 
             # Load attributes via pivot table and convert to map<AttributeType, Attribute>
             attributes_map = {}
-            if self.get_id() is not None:
-                # Get attributes through the pivot relationship
-                attribute_models = self.get_attributes(reload=True)
+            include_attributes = projection is None or projection.include_attributes is not False
+            attribute_types = None
+            if projection is not None and projection.attribute_types:
+                attribute_types = set(projection.attribute_types)
+            if include_attributes and self.get_id() is not None:
+                # Reuse a batch loaded by preload_attributes() when there is
+                # one, else load only the types the projection asks for
+                if getattr(self, '_attributes_preloaded', False):
+                    attribute_models = self.get_attributes()
+                else:
+                    attribute_models = self.get_attributes(reload=True, attribute_types=attribute_types)
                 for attr_model in attribute_models:
+                    # A preloaded batch may hold types the projection did not ask for
+                    if attribute_types is not None and attr_model.get_attribute_type() not in attribute_types:
+                        continue
                     # Convert each attribute model to Thrift
                     attr_results, attr_thrift = attr_model.into_thrift()
                     if attr_thrift is not None:
                         # Use attribute_type as the map key
                         attributes_map[attr_thrift.attribute_type] = attr_thrift
-            thrift_params['attributes'] = attributes_map
+            thrift_params['attributes'] = attributes_map if include_attributes else None
 
             # Create Thrift object
             thrift_obj = ThriftMobile(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -8219,6 +9222,33 @@ class Mobile:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['Mobile']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = Mobile._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `mobiles` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = Mobile()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -8367,7 +9397,7 @@ class Player:
     @staticmethod
     def _create_connection():
         """Create a new database connection."""
-        return mysql.connector.connect(
+        return CountingMySQLConnection(
             host=DB_HOST,
             user=DB_USER,
             password=DB_PASSWORD,
@@ -8546,20 +9576,131 @@ class Player:
 
         return result
 
-    def get_attributes(self, reload: bool = False) -> List['Attribute']:
+    @staticmethod
+    def preload_mobile(instances: List['Player'], include_attributes: bool = True, attribute_types: Optional[List[int]] = None) -> None:
+        """
+        Load the Mobile of many Player records with a single query and
+        cache it on each instance, so that get_mobile() and into_thrift() do not
+        query once per record.
+        With include_attributes, the attributes of the Mobile records are
+        batch loaded too with one more query, only those of attribute_types when
+        given.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+
+        connection = Mobile._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(
+                f"SELECT * FROM `mobiles` WHERE `owner_player_id` IN ({placeholders})",
+                tuple(ids),
+            )
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+
+        related = {}
+        for row in rows:
+            related_instance = Mobile()
+            related_instance._data = row
+            related_instance._dirty = False
+            # Keep the first match, like get_mobile()
+            related.setdefault(row['owner_player_id'], related_instance)
+
+        if include_attributes and related:
+            Mobile.preload_attributes(list(related.values()), attribute_types)
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_mobile_cache', related.get(instance.get_id()))
+
+    @staticmethod
+    def find_many_with_mobile(ids: List[int], include_attributes: bool = True, attribute_types: Optional[List[int]] = None) -> List['Player']:
+        """
+        Find records by a list of primary keys together with their Mobile
+        using a single joined query.
+        With include_attributes, the attributes of the Mobile records are
+        batch loaded too with one more query, only those of attribute_types when
+        given.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = Player._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f"""
+                SELECT o.*,
+                       r.`id` AS `mobile__id`,
+                       r.`mobile_type` AS `mobile__mobile_type`,
+                       r.`owner_mobile_id` AS `mobile__owner_mobile_id`,
+                       r.`owner_item_id` AS `mobile__owner_item_id`,
+                       r.`owner_asset_id` AS `mobile__owner_asset_id`,
+                       r.`owner_player_id` AS `mobile__owner_player_id`,
+                       r.`what_we_call_you` AS `mobile__what_we_call_you`
+                FROM `players` o
+                LEFT JOIN `mobiles` r ON r.`owner_player_id` = o.`id`
+                WHERE o.`id` IN ({placeholders})
+            """
+            cursor.execute(query, tuple(ids))
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+
+        instances = {}
+        related = {}
+        for row in rows:
+            related_data = {
+                key[len('mobile__'):]: row.pop(key)
+                for key in list(row)
+                if key.startswith('mobile__')
+            }
+            # Keep the first match, like get_mobile()
+            if row['id'] in instances:
+                continue
+
+            instance = Player()
+            instance._data = row
+            instance._dirty = False
+            related_instance = None
+            if related_data.get('id') is not None:
+                related_instance = Mobile()
+                related_instance._data = related_data
+                related_instance._dirty = False
+                related[row['id']] = related_instance
+            setattr(instance, '_mobile_cache', related_instance)
+            instances[row['id']] = instance
+
+        if include_attributes and related:
+            Mobile.preload_attributes(list(related.values()), attribute_types)
+
+        return list(instances.values())
+
+    def get_attributes(self, reload: bool = False, attribute_types: Optional[List[int]] = None) -> List['Attribute']:
         """
         Get all attributes for this Player through the attribute_owners pivot table.
         Returns a list of Attribute objects.
+        With attribute_types, only attributes of those Thrift AttributeType
+        values are loaded.
         """
         cache_key = '_attributes_cache'
 
-        if not reload and hasattr(self, cache_key):
+        if attribute_types is None and not reload and hasattr(self, cache_key):
             cached = getattr(self, cache_key)
             if cached is not None:
                 return cached
 
         if self.get_id() is None:
             return []
+        types_filter, types_params = attribute_types_filter(attribute_types, 'r.attribute_type')
 
         # Query through pivot table
         self._connect()
@@ -8567,13 +9708,13 @@ class Player:
         results = []
 
         try:
-            query = """
+            query = f"""
                 SELECT r.*
                 FROM attributes r
                 INNER JOIN attribute_owners p ON r.id = p.attribute_id
-                WHERE p.player_id = %s
+                WHERE p.player_id = %s{types_filter}
             """
-            cursor.execute(query, (self.get_id(),))
+            cursor.execute(query, (self.get_id(),) + types_params)
             rows = cursor.fetchall()
 
             for row in rows:
@@ -8585,9 +9726,55 @@ class Player:
             cursor.close()
 
         # Cache results
-        setattr(self, cache_key, results)
+        # Only a complete set is cached
+        if attribute_types is None:
+            setattr(self, cache_key, results)
         return results
 
+    @staticmethod
+    def preload_attributes(instances: List['Player'], attribute_types: Optional[List[int]] = None) -> None:
+        """
+        Load attributes for many Player records with a single query through
+        the attribute_owners pivot table and cache them on each instance, so that
+        get_attributes() and into_thrift() do not query once per record.
+        With attribute_types, only attributes of those Thrift AttributeType
+        values are loaded.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+        types_filter, types_params = attribute_types_filter(attribute_types, 'r.attribute_type')
+
+        grouped = {owner_id: [] for owner_id in ids}
+        connection = Player._create_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f"""
+                SELECT p.player_id AS pivot_owner_id, r.*
+                FROM attributes r
+                INNER JOIN attribute_owners p ON r.id = p.attribute_id
+                WHERE p.player_id IN ({placeholders}){types_filter}
+            """
+            cursor.execute(query, tuple(ids) + types_params)
+            rows = cursor.fetchall()
+
+            for row in rows:
+                owner_id = row.pop('pivot_owner_id')
+                instance = Attribute()
+                instance._data = row
+                instance._dirty = False
+                grouped[owner_id].append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_attributes_cache', grouped[instance.get_id()])
+                setattr(instance, '_attributes_preloaded', True)
+
     def get_attribute_owners(self, reload: bool = False, lazy: bool = False):
         """
         Get all AttributeOwner pivot records for this Player.
@@ -8797,6 +9984,47 @@ class Player:
         setattr(self, cache_key, results)
         return results
 
+    @staticmethod
+    def preload_inventories(instances: List['Player']) -> None:
+        """
+        Load inventories for many Player records with a single query through
+        the inventory_owners pivot table and cache them on each instance, so that
+        get_inventories() and into_thrift() do not query once per record.
+        """
+        ids = [instance.get_id() for instance in instances if instance.get_id() is not None]
+        if not ids:
+            return
+
+        grouped = {owner_id: [] for owner_id in ids}
+        connection = Player._create_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            query = f"""
+                SELECT p.player_id AS pivot_owner_id, r.*
+                FROM inventories r
+                INNER JOIN inventory_owners p ON r.id = p.inventory_id
+                WHERE p.player_id IN ({placeholders})
+            """
+            cursor.execute(query, tuple(ids))
+            rows = cursor.fetchall()
+
+            for row in rows:
+                owner_id = row.pop('pivot_owner_id')
+                instance = Inventory()
+                instance._data = row
+                instance._dirty = False
+                grouped[owner_id].append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+
+        for instance in instances:
+            if instance.get_id() is not None:
+                setattr(instance, '_inventories_cache', grouped[instance.get_id()])
+                setattr(instance, '_inventories_preloaded', True)
+
     def get_inventory_owners(self, reload: bool = False, lazy: bool = False):
         """
         Get all InventoryOwner pivot records for this Player.
@@ -9007,12 +10235,16 @@ class Player:
         return self
 
 
-    def into_thrift(self) -> Tuple[list[ThriftGameResult], Optional['Player']]:
+    def into_thrift(self, projection: Optional['ThriftProjection'] = None) -> Tuple[list[ThriftGameResult], Optional['Player']]:
         """
         Convert this Model instance to a Thrift Player object.
 
         Loads all relationships recursively and converts them to Thrift.
 
+        Args:
+            projection: Optional Projection limiting what is loaded and returned.
+                        None returns the full object.
+
         Returns:
             Tuple of (list[ThriftGameResult], Optional[Thrift object])
         """
@@ -9030,22 +10262,26 @@ class Player:
             thrift_params['year_of_birth'] = self._data.get('year_of_birth')
             thrift_params['email'] = self._data.get('email')
 
-            # Load embedded mobile (1-to-1 relationship)
-            mobile_model = self.get_mobile()
-            if mobile_model is not None:
-                mobile_results, mobile_thrift = mobile_model.into_thrift()
-                if mobile_thrift is not None:
-                    thrift_params['mobile'] = mobile_thrift
-                else:
-                    results.extend(mobile_results)
+            # Load embedded mobile (1-to-1 relationship) unless projected out
+            if projection is None or projection.include_mobile is not False:
+                mobile_model = self.get_mobile()
+                if mobile_model is not None:
+                    mobile_results, mobile_thrift = mobile_model.into_thrift(projection)
+                    if mobile_thrift is not None:
+                        thrift_params['mobile'] = mobile_thrift
+                    else:
+                        results.extend(mobile_results)
 
             # Create Thrift object
             thrift_obj = ThriftPlayer(**thrift_params)
 
-            results.append(ThriftGameResult(
-                status=ThriftStatusType.SUCCESS,
-                message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
-            ))
+            if projection is not None and projection.compact_results:
+                results.append(ThriftGameResult(status=ThriftStatusType.SUCCESS))
+            else:
+                results.append(ThriftGameResult(
+                    status=ThriftStatusType.SUCCESS,
+                    message=f"Successfully converted {self.__class__.__name__} id={self.get_id()} to Thrift",
+                ))
 
             return (results, thrift_obj)
 
@@ -9301,6 +10537,33 @@ class Player:
         finally:
             cursor.close()
 
+    @staticmethod
+    def find_many(ids: List[int]) -> List['Player']:
+        """
+        Find records by a list of primary keys with a single query.
+        Returns instances in no particular order; ids without a record are skipped.
+        """
+        ids = list(dict.fromkeys(id for id in ids if id is not None))
+        if not ids:
+            return []
+
+        connection = Player._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        results = []
+        try:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"SELECT * FROM `players` WHERE `id` IN ({placeholders})", tuple(ids))
+            rows = cursor.fetchall()
+            for row in rows:
+                instance = Player()
+                instance._data = row
+                instance._dirty = False
+                results.append(instance)
+        finally:
+            cursor.close()
+            connection.close()
+        return results
+
     def reload(self) -> None:
         """
         Reload this record from the database and reload cached relationships.
@@ -9337,3 +10600,27 @@ class Player:
     # No find_by methods (no columns ending with _id)
 
 
+
+class InternedAttribute(Attribute):
+    """
+    A read-only Attribute shared through AttributeInterner. Its data cannot
+    be changed, and setters, from_thrift(), save(), destroy() and reload()
+    raise TypeError: change the owner's attribute rows and reload the owner.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__()
+        self._data = MappingProxyType(data)
+        self._dirty = False
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            f"Attribute id={self.get_id()} is interned and read-only; change its owner's attribute rows instead"
+        )
+
+
+for _name in [name for name in vars(Attribute) if name.startswith(('set_', '_set_'))]:
+    setattr(InternedAttribute, _name, InternedAttribute._read_only)
+for _name in ('from_thrift', 'save', 'destroy', 'reload'):
+    setattr(InternedAttribute, _name, InternedAttribute._read_only)
+del _name
@@ -66,6 +66,12 @@ def get_item_volume(item: Item, item_quantity: Optional[float] = None) -> float:
     return 0.0
 
 
+def _is_stack_of(entry: InventoryEntry, item_id: int) -> bool:
+    # Entries of item instances (mobile_item_id set) carry their own state:
+    # nothing is stacked onto, counted with or taken from them
+    return entry.item_id == item_id and entry.mobile_item_id is None
+
+
 def is_item_in_inventory(
     inventory: Inventory, item_id: int, quantity: Optional[float] = None
 ) -> GameResult:
@@ -73,7 +79,7 @@ def is_item_in_inventory(
     item_found = False
 
     for entry in inventory.entries:
-        if entry.item_id == item_id:
+        if _is_stack_of(entry, item_id):
             item_found = True
             total_quantity += entry.quantity
 
@@ -119,7 +125,9 @@ def _can_add_item_to_inventory(
     # Now we need to ask, is the item in inventory, but all those items are maxxed, so
     # we cannot add one more because of that...
     if item_is_in_inventory:
-        max_stacked_items = [entry.is_max_stacked for entry in inventory.entries]
+        max_stacked_items = [
+            entry.is_max_stacked for entry in inventory.entries if _is_stack_of(entry, item.id)
+        ]
         if all(max_stacked_items) and inventory.max_entries == len(inventory.entries):
             return GameResult(
                 status=StatusType.FAILURE,
@@ -127,7 +135,8 @@ def _can_add_item_to_inventory(
                 error_code=GameError.INV_ALL_ENTRIES_MAX_STACKED,
             )
 
-    new_volume = item_volume + inventory.last_calculated_volume
+    # Inventories nested in the containers held here fill it as well
+    new_volume = item_volume + inventory.last_calculated_volume + (inventory.contained_volume or 0.0)
     if new_volume > inventory.max_volume:
         return GameResult(
             status=StatusType.FAILURE,
@@ -185,7 +194,7 @@ def add_item_to_inventory(
     if item_quantity is None:
         item_quantity = get_item_quantity(item=item)
     for entry in inventory.entries:
-        if entry.item_id == item.id:
+        if _is_stack_of(entry, item.id):
             can_add_quantity = get_entry_free_quantity(entry=entry, item=item)
             if can_add_quantity > 0.0:
                 if can_add_quantity > item_quantity:
@@ -276,6 +285,102 @@ def add_item_to_inventory(
         return results
 
 
+def remove_item_from_inventory(
+    inventory: Inventory,
+    item: Item,
+    item_quantity: float,
+) -> list[GameResult]:
+    """
+    Take item_quantity of an item out of an inventory, emptying stacks in
+    order and dropping the ones that reach 0. Nothing is removed unless the
+    inventory holds the whole quantity. Entries of item instances
+    (mobile_item_id set) carry their own state and are never taken.
+    """
+    logger.info(
+        f"=== REMOVE_ITEM_FROM_INVENTORY: inventory_id={inventory.id}, item_id={item.id}, "
+        f"quantity={item_quantity}"
+    )
+
+    stacks = [entry for entry in inventory.entries if _is_stack_of(entry, item.id)]
+    available = sum(entry.quantity for entry in stacks)
+    if not stacks:
+        in_inventory_result = GameResult(
+            status=StatusType.FAILURE,
+            message="item not found in inventory",
+            error_code=GameError.INV_ITEM_NOT_FOUND,
+        )
+    elif available < item_quantity:
+        in_inventory_result = GameResult(
+            status=StatusType.FAILURE,
+            message=f"insufficient quantity: requested {item_quantity}, available {available}",
+            error_code=GameError.INV_INSUFFICIENT_QUANTITY,
+        )
+    else:
+        in_inventory_result = None
+    if in_inventory_result is not None:
+        logger.warning(f"Cannot remove item: {in_inventory_result.message}")
+        return [in_inventory_result]
+
+    remaining = item_quantity
+    new_entries = []
+    for entry in inventory.entries:
+        if _is_stack_of(entry, item.id) and remaining > 0.0:
+            taken = min(entry.quantity, remaining)
+            entry.quantity -= taken
+            entry.is_max_stacked = False
+            remaining -= taken
+        if entry.quantity > 0.0:
+            new_entries.append(entry)
+    inventory.entries = new_entries
+    inventory.last_calculated_volume = max(
+        0.0,
+        (inventory.last_calculated_volume or 0.0)
+        - get_item_volume(item=item, item_quantity=item_quantity),
+    )
+    logger.debug(
+        f"Removed {item_quantity} of item_id={item.id}, {len(inventory.entries)} entries left"
+    )
+    return [
+        GameResult(
+            status=StatusType.SUCCESS,
+            message=f"removed {item_quantity} of {item.id} from inventory",
+        )
+    ]
+
+
+def breakdown_item_in_inventory(
+    inventory: Inventory,
+    item: Item,
+    item_quantity: float,
+    outputs: list[tuple[Item, float]],
+) -> list[GameResult]:
+    """
+    Break item_quantity of an item in an inventory down into outputs, a list
+    of (item, quantity) it yields, e.g. its blueprint components scaled by
+    their ratios. The item is taken out first, so the space it frees can hold
+    the outputs. The inventory may be left half changed on failure; callers
+    only keep it when every result is ok.
+    """
+    logger.info(
+        f"=== BREAKDOWN_ITEM_IN_INVENTORY: inventory_id={inventory.id}, item_id={item.id}, "
+        f"quantity={item_quantity}, outputs={len(outputs)}"
+    )
+
+    results = remove_item_from_inventory(
+        inventory=inventory, item=item, item_quantity=item_quantity
+    )
+    if not is_ok(results):
+        return results
+    for output_item, output_quantity in outputs:
+        results += add_item_to_inventory(
+            inventory=inventory, item=output_item, item_quantity=output_quantity
+        )
+        if not is_ok(results):
+            logger.warning(f"Cannot add output item_id={output_item.id} of the breakdown")
+            return results
+    return results
+
+
 def can_transfer_item(
     from_inventory: Inventory,
     to_inventory: Inventory,
@@ -285,7 +390,8 @@ def can_transfer_item(
     """
     Check if a transfer_item operation would be successful without actually
     performing the transfer. Returns a list of GameResult objects indicating
-    whether the transfer would succeed.
+    whether the transfer would succeed. Only stacks are transferred; item
+    instances move whole with transfer_instance.
     """
     results: list[GameResult] = []
 
@@ -294,7 +400,7 @@ def can_transfer_item(
     available_quantity = 0.0
 
     for entry in from_inventory.entries:
-        if entry.item_id == item.id:
+        if _is_stack_of(entry, item.id):
             item_found = True
             available_quantity += entry.quantity
 
@@ -380,7 +486,7 @@ def transfer_item(
     results: list[GameResult] = []
     new_entries = []
     for entry in from_inventory.entries:
-        if entry.item_id == item.id:
+        if _is_stack_of(entry, item.id):
             if item_quantity is None:
                 item_quantity = entry.quantity
             logger.debug(
@@ -425,6 +531,114 @@ def transfer_item(
     return results
 
 
+def can_transfer_instance(
+    from_inventory: Inventory,
+    to_inventory: Inventory,
+    item: Item,
+    mobile_item_id: int,
+    contained_volume: float = 0.0,
+) -> list[GameResult]:
+    """
+    Check if the entry holding the item instance mobile_item_id can move from
+    from_inventory to to_inventory. An instance moves as a whole entry, with
+    the inventory it owns when it is a container: contained_volume is that
+    inventory's total volume and counts towards to_inventory's max_volume.
+    """
+    entry = next(
+        (
+            entry
+            for entry in from_inventory.entries
+            if entry.mobile_item_id == mobile_item_id and entry.item_id == item.id
+        ),
+        None,
+    )
+    if entry is None:
+        return [
+            GameResult(
+                status=StatusType.FAILURE,
+                message=f"instance {mobile_item_id} of item {item.id} not found in from_inventory",
+                error_code=GameError.INV_ITEM_NOT_FOUND,
+            )
+        ]
+    if item.item_type != ItemType.VIRTUAL:
+        if len(to_inventory.entries) >= to_inventory.max_entries:
+            return [
+                GameResult(
+                    status=StatusType.FAILURE,
+                    message="inventory has reached max items",
+                    error_code=GameError.INV_MAX_ITEMS_REACHED,
+                )
+            ]
+        new_volume = (
+            get_item_volume(item=item, item_quantity=entry.quantity)
+            + contained_volume
+            + to_inventory.last_calculated_volume
+            + (to_inventory.contained_volume or 0.0)
+        )
+        if new_volume > to_inventory.max_volume:
+            return [
+                GameResult(
+                    status=StatusType.FAILURE,
+                    message=f"the new_volume={new_volume} is too high",
+                    error_code=GameError.INV_NEW_VOLUME_TOO_HIGH,
+                )
+            ]
+    return [
+        GameResult(
+            status=StatusType.SUCCESS,
+            message=f"transfer of instance {mobile_item_id} would be successful",
+        )
+    ]
+
+
+def transfer_instance(
+    from_inventory: Inventory,
+    to_inventory: Inventory,
+    item: Item,
+    mobile_item_id: int,
+    contained_volume: float = 0.0,
+) -> list[GameResult]:
+    """
+    Move the entry holding the item instance mobile_item_id from
+    from_inventory to to_inventory, in memory. The instance keeps its
+    attributes and, when it is a container, its inventory: contained_volume
+    (that inventory's total volume) moves from one inventory's
+    contained_volume to the other's. Storing the moved volume for the
+    ancestors of both is left to the caller (services/container_tree.py).
+    """
+    logger.info(
+        f"=== TRANSFER_INSTANCE: from_inventory_id={from_inventory.id}, "
+        f"to_inventory_id={to_inventory.id}, item_id={item.id}, mobile_item_id={mobile_item_id}"
+    )
+    results = can_transfer_instance(
+        from_inventory=from_inventory,
+        to_inventory=to_inventory,
+        item=item,
+        mobile_item_id=mobile_item_id,
+        contained_volume=contained_volume,
+    )
+    if not is_ok(results):
+        logger.warning(f"Transfer check failed: {results[0].message}")
+        return results
+
+    entry = next(entry for entry in from_inventory.entries if entry.mobile_item_id == mobile_item_id)
+    from_inventory.entries = [other for other in from_inventory.entries if other is not entry]
+    entry.id = None  # saved as a new row of to_inventory
+    to_inventory.entries.append(entry)
+
+    item_volume = get_item_volume(item=item, item_quantity=entry.quantity)
+    from_inventory.last_calculated_volume = max(0.0, from_inventory.last_calculated_volume - item_volume)
+    to_inventory.last_calculated_volume += item_volume
+    from_inventory.contained_volume = max(0.0, (from_inventory.contained_volume or 0.0) - contained_volume)
+    to_inventory.contained_volume = (to_inventory.contained_volume or 0.0) + contained_volume
+    return [
+        GameResult(
+            status=StatusType.SUCCESS,
+            message=f"transferred instance {mobile_item_id} of {item.id} to {to_inventory.id}",
+        )
+    ]
+
+
 def transfer_item_to_first_available_inventory(
     from_inventory: Inventory,
     to_inventories: list[Inventory],
@@ -521,6 +735,7 @@ def split_stack(
         f"Splitting: original={entry.quantity}, split={new_quantity}, remaining={entry.quantity - new_quantity}"
     )
     new_entry = copy.deepcopy(entry)
+    new_entry.id = None  # the split-off stack is saved as a new row
     entry.quantity -= new_quantity
     new_entry.quantity = new_quantity
     inventory.entries.append(new_entry)
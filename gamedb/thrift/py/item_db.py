@@ -1,6 +1,6 @@
 import sys
 import glob
-from typing import Optional, Any
+from typing import Optional, Any, Dict
 sys.path.append('../gen-py')
 
 from game.ttypes import *
@@ -153,12 +153,20 @@ for metal, sources in refined_metallic_materials.items():
     for source_item in source_items:
         CONFIG.items.append(source_item.build())
 
+# Name index over CONFIG.items; items are only ever appended, so it is
+# extended with whatever was added since the last lookup
+_ITEMS_BY_NAME: Dict[str, Item] = {}
+_INDEXED_COUNT = 0
+
 def find_item_by_name(name: str) -> Item:
-    global CONFIG
-    for item in CONFIG.items:
-        if item.internal_name == name:
-            return item
-    raise Exception(f"Could not find item of name {name}")
+    global CONFIG, _INDEXED_COUNT
+    for item in CONFIG.items[_INDEXED_COUNT:]:
+        _ITEMS_BY_NAME.setdefault(item.internal_name, item)
+    _INDEXED_COUNT = len(CONFIG.items)
+    item = _ITEMS_BY_NAME.get(name)
+    if item is None:
+        raise Exception(f"Could not find item of name {name}")
+    return item
 
 CARBON = ItemBuilder(
     internal_name="carbon",
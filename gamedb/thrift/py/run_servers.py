@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Start multiple Thrift servers (InventoryService, ItemService, and PlayerService).
+Start multiple Thrift servers (InventoryService, ItemService, PlayerService, and WorldService).
 Each service runs in a separate process on different ports.
 """
 
@@ -24,11 +24,18 @@ from thrift.protocol import TBinaryProtocol
 from thrift.server import TServer
 
 from game.InventoryService import Processor as InventoryProcessor
-from game.ItemService import Processor as ItemProcessor
 from game.PlayerService import Processor as PlayerProcessor
+from game.WorldService import Processor as WorldProcessor
 from services.inventory_service import InventoryServiceHandler
 from services.item_service import ItemServiceHandler
+from services.response_cache import CachingItemProcessor
+from services.item_catalog import ItemCatalog
+from services.shared_catalog import SharedCatalogReader
+from services.invalidation_bus import InvalidationBus
+from common import SHARED_CATALOG_PATH
 from services.player_service import PlayerServiceHandler
+from services.world_service import WorldServiceHandler
+from services.position_store import PositionStore
 
 
 class PrefixedFormatter(logging.Formatter):
@@ -73,8 +80,18 @@ def run_inventory_service(config: Dict[str, Any]):
     service_name = config['name']
     setup_logging(service_name)
 
+    # Item templates are read from the catalog file the ItemService publishes
+    catalog = SharedCatalogReader(SHARED_CATALOG_PATH)
+
+    # Writes in the other service processes invalidate this one's caches
+    bus = InvalidationBus(service_name)
+
     # Create handler (uses db_models which load config from environment)
-    handler = InventoryServiceHandler()
+    handler = InventoryServiceHandler(catalog=catalog, bus=bus)
+    bus.start()
+
+    # Completes crafting jobs as their bake times elapse
+    handler.crafting.start()
 
     # Create processor and server
     processor = InventoryProcessor(handler)
@@ -95,6 +112,8 @@ def run_inventory_service(config: Dict[str, Any]):
     except KeyboardInterrupt:
         pass
     finally:
+        handler.crafting.stop()
+        bus.stop()
         print_prefixed(service_name, "Shutting down...")
 
 
@@ -103,11 +122,20 @@ def run_item_service(config: Dict[str, Any]):
     service_name = config['name']
     setup_logging(service_name)
 
+    # Load the item catalog up front; reads are served from it and writes
+    # publish a new snapshot, shared with the other processes through the
+    # catalog file
+    catalog = ItemCatalog(publish_path=SHARED_CATALOG_PATH)
+    catalog.load()
+
     # Create handler (uses db_models which load config from environment)
-    handler = ItemServiceHandler()
+    bus = InvalidationBus(service_name)
+    handler = ItemServiceHandler(catalog=catalog, bus=bus)
+    bus.start()
 
-    # Create processor and server
-    processor = ItemProcessor(handler)
+    # Create processor and server; repeated catalog reads are answered
+    # from pre-serialized replies
+    processor = CachingItemProcessor(handler)
     transport = TSocket.TServerSocket(host=config['host'], port=config['port'])
     tfactory = TTransport.TBufferedTransportFactory()
     pfactory = TBinaryProtocol.TBinaryProtocolFactory()
@@ -125,6 +153,9 @@ def run_item_service(config: Dict[str, Any]):
     except KeyboardInterrupt:
         pass
     finally:
+        # Publish a snapshot still waiting for its debounced write
+        catalog.flush()
+        bus.stop()
         print_prefixed(service_name, "Shutting down...")
 
 
@@ -133,8 +164,13 @@ def run_player_service(config: Dict[str, Any]):
     service_name = config['name']
     setup_logging(service_name)
 
+    # Session items are read from the catalog file the ItemService publishes
+    catalog = SharedCatalogReader(SHARED_CATALOG_PATH)
+
     # Create handler (uses db_models which load config from environment)
-    handler = PlayerServiceHandler()
+    bus = InvalidationBus(service_name)
+    handler = PlayerServiceHandler(catalog=catalog, bus=bus)
+    bus.start()
 
     # Create processor and server
     processor = PlayerProcessor(handler)
@@ -155,6 +191,47 @@ def run_player_service(config: Dict[str, Any]):
     except KeyboardInterrupt:
         pass
     finally:
+        bus.stop()
+        print_prefixed(service_name, "Shutting down...")
+
+
+def run_world_service(config: Dict[str, Any]):
+    """Run the WorldService in a separate process."""
+    service_name = config['name']
+    setup_logging(service_name)
+
+    # Index every position up front; item and player saves in the other
+    # service processes refresh the entities they touched
+    bus = InvalidationBus(service_name)
+    store = PositionStore()
+    handler = WorldServiceHandler(store=store, bus=bus)
+    handler.load()
+    bus.start()
+
+    # Position updates are written to the database in bulk on an interval
+    store.start()
+
+    # Create processor and server
+    processor = WorldProcessor(handler)
+    transport = TSocket.TServerSocket(host=config['host'], port=config['port'])
+    tfactory = TTransport.TBufferedTransportFactory()
+    pfactory = TBinaryProtocol.TBinaryProtocolFactory()
+    server = TServer.TThreadPoolServer(processor, transport, tfactory, pfactory)
+
+    # Print startup banner
+    print_prefixed(service_name, "=" * 60)
+    print_prefixed(service_name, f"Starting {service_name}...")
+    print_prefixed(service_name, f"Host: {config['host']}")
+    print_prefixed(service_name, f"Port: {config['port']}")
+    print_prefixed(service_name, "=" * 60)
+
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.stop()
+        bus.stop()
         print_prefixed(service_name, "Shutting down...")
 
 
@@ -188,6 +265,15 @@ SERVICES = [
             'port': 9092,
         },
     },
+    {
+        'name': 'WorldService',
+        'runner': run_world_service,
+        'config': {
+            'name': 'WorldService',
+            'host': '0.0.0.0',
+            'port': 9093,
+        },
+    },
 ]
 
 
@@ -204,6 +290,10 @@ def main():
 
     processes = []
 
+    # Publish the shared item catalog before any service needs to map it
+    ItemCatalog(publish_path=SHARED_CATALOG_PATH).load()
+    print(f"[Main] Published item catalog to {SHARED_CATALOG_PATH}")
+
     # Start each service in a separate process
     for service_def in SERVICES:
         process = multiprocessing.Process(
@@ -33,6 +33,8 @@ from game.ttypes import (
     GameError,
     ItemType,
     AttributeType,
+    EntityKind,
+    CraftingJobState,
 )
 from game.BaseService import Iface as BaseServiceIface
 
@@ -43,15 +45,22 @@ class BaseServiceHandler(BaseServiceIface):
     Concrete services inherit from this to get the describe() method.
     """
 
-    def __init__(self, klass: Any):
+    def __init__(self, klass: Any, bus: Any = None):
         """
         Initialize BaseService with the concrete service class.
 
         Args:
             klass: The concrete service class (e.g., InventoryServiceHandler,
-                   ItemServiceHandler, PlayerServiceHandler)
+                   ItemServiceHandler, PlayerServiceHandler, WorldServiceHandler)
+            bus: Optional InvalidationBus shared with the other service processes
         """
         self.klass = klass
+        self.bus = bus
+
+    def publish_invalidation(self, topic: str, key: Any) -> None:
+        """Tell the other service processes that key on topic changed."""
+        if self.bus is not None:
+            self.bus.publish(topic, key)
 
     def describe(self) -> ServiceMetadata:
         """
@@ -63,6 +72,7 @@ class BaseServiceHandler(BaseServiceIface):
         from services.inventory_service import InventoryServiceHandler
         from services.item_service import ItemServiceHandler
         from services.player_service import PlayerServiceHandler
+        from services.world_service import WorldServiceHandler
 
         if self.klass == InventoryServiceHandler or isinstance(self, InventoryServiceHandler):
             return self._describe_inventory_service()
@@ -70,6 +80,8 @@ class BaseServiceHandler(BaseServiceIface):
             return self._describe_item_service()
         elif self.klass == PlayerServiceHandler or isinstance(self, PlayerServiceHandler):
             return self._describe_player_service()
+        elif self.klass == WorldServiceHandler or isinstance(self, WorldServiceHandler):
+            return self._describe_world_service()
         else:
             raise ValueError(f"Unknown service class: {self.klass}")
 
@@ -130,6 +142,25 @@ class BaseServiceHandler(BaseServiceIface):
 
     def _describe_inventory_service(self) -> ServiceMetadata:
         """Generate metadata for InventoryService."""
+        enums = self._get_common_enums()
+        enums.extend([
+            EnumDefinition(
+                enum_name="CraftingJobState",
+                values={
+                    "PENDING": int(CraftingJobState.PENDING),
+                    "COMPLETED": int(CraftingJobState.COMPLETED),
+                    "FAILED": int(CraftingJobState.FAILED),
+                    "CANCELLED": int(CraftingJobState.CANCELLED),
+                },
+                description="State of a crafting job",
+            ),
+            EnumDefinition(
+                enum_name="AttributeType",
+                values={name: value for value, name in AttributeType._VALUES_TO_NAMES.items()},
+                description="Attribute types for items",
+            ),
+        ])
+
         methods = [
             MethodDescription(
                 method_name="load",
@@ -179,6 +210,117 @@ class BaseServiceHandler(BaseServiceIface):
                 request_enum_fields=[],
                 response_enum_fields=self._get_common_response_enum_fields(),
             ),
+            MethodDescription(
+                method_name="load_many",
+                description="Load many inventories by ID in one call, with per-id errors for missing records",
+                example_request_json=_load_snippet('inventory_load_many_request.json'),
+                example_response_json=_load_snippet('inventory_load_many_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="owner_item_totals",
+                description="Total quantity per item across every inventory of an owner, computed with one aggregate query",
+                example_request_json=_load_snippet('inventory_owner_item_totals_request.json'),
+                example_response_json=_load_snippet('inventory_owner_item_totals_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="owner_capacity",
+                description="Used and free entries and volume of every inventory of an owner",
+                example_request_json=_load_snippet('inventory_owner_capacity_request.json'),
+                example_response_json=_load_snippet('inventory_owner_capacity_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="owner_has_items",
+                description="Whether each requested item is present in any inventory of an owner",
+                example_request_json=_load_snippet('inventory_owner_has_items_request.json'),
+                example_response_json=_load_snippet('inventory_owner_has_items_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="load_container_tree",
+                description="Load an inventory with every inventory nested in its containers, with cached contained volumes",
+                example_request_json=_load_snippet('inventory_load_container_tree_request.json'),
+                example_response_json=_load_snippet('inventory_load_container_tree_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="owner_craftable",
+                description="Which items an owner can craft from the materials in all of its inventories, and how many of each",
+                example_request_json=_load_snippet('inventory_owner_craftable_request.json'),
+                example_response_json=_load_snippet('inventory_owner_craftable_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="start_crafting",
+                description="Queue a crafting job in an inventory holding the blueprint's components; they are consumed when its bake time has elapsed",
+                example_request_json=_load_snippet('inventory_start_crafting_request.json'),
+                example_response_json=_load_snippet('inventory_start_crafting_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields() + [
+                    FieldEnumMapping(
+                        field_path="response_data.start_crafting.job.state",
+                        enum_name="CraftingJobState",
+                    ),
+                ],
+            ),
+            MethodDescription(
+                method_name="cancel_crafting",
+                description="Cancel a pending crafting job",
+                example_request_json=_load_snippet('inventory_cancel_crafting_request.json'),
+                example_response_json=_load_snippet('inventory_cancel_crafting_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="list_crafting_jobs",
+                description="List the crafting jobs of an inventory, soonest first",
+                example_request_json=_load_snippet('inventory_list_crafting_jobs_request.json'),
+                example_response_json=_load_snippet('inventory_list_crafting_jobs_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields() + [
+                    FieldEnumMapping(
+                        field_path="response_data.list_crafting_jobs.jobs[].state",
+                        enum_name="CraftingJobState",
+                    ),
+                ],
+            ),
+            MethodDescription(
+                method_name="breakdown_item",
+                description="Recycle units of an item in an inventory into its blueprint components, or all the way to raw materials",
+                example_request_json=_load_snippet('inventory_breakdown_item_request.json'),
+                example_response_json=_load_snippet('inventory_breakdown_item_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="salvage_containers",
+                description="Recycle every stack with a blueprint in many container inventories in one transaction",
+                example_request_json=_load_snippet('inventory_salvage_containers_request.json'),
+                example_response_json=_load_snippet('inventory_salvage_containers_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="set_item_attributes",
+                description="Change an item's attributes; a stack referencing its template is copied into mobile_items only when they diverge",
+                example_request_json=_load_snippet('inventory_set_item_attributes_request.json'),
+                example_response_json=_load_snippet('inventory_set_item_attributes_response.json'),
+                request_enum_fields=[
+                    FieldEnumMapping(
+                        field_path="data.set_item_attributes.attributes[].attribute_type",
+                        enum_name="AttributeType",
+                    ),
+                ],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
         ]
 
         return ServiceMetadata(
@@ -186,7 +328,7 @@ class BaseServiceHandler(BaseServiceIface):
             version="1.0",
             description="Service for managing game inventories with create, load, save, split, transfer, and list operations",
             methods=methods,
-            enums=self._get_common_enums(),
+            enums=enums,
         )
 
     def _describe_item_service(self) -> ServiceMetadata:
@@ -267,6 +409,30 @@ class BaseServiceHandler(BaseServiceIface):
                 request_enum_fields=[],
                 response_enum_fields=self._get_common_response_enum_fields(),
             ),
+            MethodDescription(
+                method_name="load_many",
+                description="Load many items by ID in one call, with per-id errors for missing records",
+                example_request_json=_load_snippet('item_load_many_request.json'),
+                example_response_json=_load_snippet('item_load_many_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="load_bill_of_materials",
+                description="Load the flattened raw materials and total bake time of many items, with per-id errors for missing records",
+                example_request_json=_load_snippet('item_load_bill_of_materials_request.json'),
+                example_response_json=_load_snippet('item_load_bill_of_materials_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="load_dependents",
+                description="Load the items whose blueprints use an item, directly or through other blueprints, with their depth",
+                example_request_json=_load_snippet('item_load_dependents_request.json'),
+                example_response_json=_load_snippet('item_load_dependents_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
         ]
 
         return ServiceMetadata(
@@ -320,6 +486,22 @@ class BaseServiceHandler(BaseServiceIface):
                 request_enum_fields=[],
                 response_enum_fields=self._get_common_response_enum_fields(),
             ),
+            MethodDescription(
+                method_name="load_many",
+                description="Load many players by ID in one call, with per-id errors for missing records",
+                example_request_json=_load_snippet('player_load_many_request.json'),
+                example_response_json=_load_snippet('player_load_many_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="load_session",
+                description="Load a player's working set (player, mobile, owned inventories with entries, referenced items) in one call",
+                example_request_json=_load_snippet('player_load_session_request.json'),
+                example_response_json=_load_snippet('player_load_session_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
         ]
 
         return ServiceMetadata(
@@ -329,3 +511,128 @@ class BaseServiceHandler(BaseServiceIface):
             methods=methods,
             enums=self._get_common_enums(),
         )
+
+    def _describe_world_service(self) -> ServiceMetadata:
+        """Generate metadata for WorldService."""
+        enums = self._get_common_enums()
+        enums.extend([
+            EnumDefinition(
+                enum_name="EntityKind",
+                values={
+                    "ITEM": int(EntityKind.ITEM),
+                    "MOBILE": int(EntityKind.MOBILE),
+                },
+                description="Kind of entity a position belongs to",
+            ),
+            EnumDefinition(
+                enum_name="AttributeType",
+                values={
+                    "GALACTIC_POSITION": int(AttributeType.GALACTIC_POSITION),
+                    "SOLAR_POSITION": int(AttributeType.SOLAR_POSITION),
+                    "GLOBAL_POSITION": int(AttributeType.GLOBAL_POSITION),
+                    "LOCAL_POSITION": int(AttributeType.LOCAL_POSITION),
+                },
+                description="Position levels, outermost first",
+            ),
+        ])
+
+        methods = [
+            MethodDescription(
+                method_name="query_radius",
+                description="Find items and mobiles whose position at a level is within a radius of a point, nearest first",
+                example_request_json=_load_snippet('world_query_radius_request.json'),
+                example_response_json=_load_snippet('world_query_radius_response.json'),
+                request_enum_fields=[
+                    FieldEnumMapping(
+                        field_path="data.query_radius.level",
+                        enum_name="AttributeType",
+                    ),
+                    FieldEnumMapping(
+                        field_path="data.query_radius.kind",
+                        enum_name="EntityKind",
+                    ),
+                ],
+                response_enum_fields=self._get_common_response_enum_fields() + [
+                    FieldEnumMapping(
+                        field_path="response_data.query_radius.entities[].kind",
+                        enum_name="EntityKind",
+                    ),
+                ],
+            ),
+            MethodDescription(
+                method_name="update_positions",
+                description="Apply a batch of position changes in memory; they are written to the database on the next periodic flush",
+                example_request_json=_load_snippet('world_update_positions_request.json'),
+                example_response_json=_load_snippet('world_update_positions_response.json'),
+                request_enum_fields=[
+                    FieldEnumMapping(
+                        field_path="data.update_positions.updates[].kind",
+                        enum_name="EntityKind",
+                    ),
+                    FieldEnumMapping(
+                        field_path="data.update_positions.updates[].level",
+                        enum_name="AttributeType",
+                    ),
+                ],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+            MethodDescription(
+                method_name="subscribe_area",
+                description="Watch an area, fixed or around a followed mobile; returns the entities in it now",
+                example_request_json=_load_snippet('world_subscribe_area_request.json'),
+                example_response_json=_load_snippet('world_subscribe_area_response.json'),
+                request_enum_fields=[
+                    FieldEnumMapping(
+                        field_path="data.subscribe_area.level",
+                        enum_name="AttributeType",
+                    ),
+                    FieldEnumMapping(
+                        field_path="data.subscribe_area.kind",
+                        enum_name="EntityKind",
+                    ),
+                ],
+                response_enum_fields=self._get_common_response_enum_fields() + [
+                    FieldEnumMapping(
+                        field_path="response_data.subscribe_area.entities[].kind",
+                        enum_name="EntityKind",
+                    ),
+                ],
+            ),
+            MethodDescription(
+                method_name="poll_area",
+                description="Entities that entered, moved within or left a subscribed area since the last poll",
+                example_request_json=_load_snippet('world_poll_area_request.json'),
+                example_response_json=_load_snippet('world_poll_area_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields() + [
+                    FieldEnumMapping(
+                        field_path="response_data.poll_area.entered[].kind",
+                        enum_name="EntityKind",
+                    ),
+                    FieldEnumMapping(
+                        field_path="response_data.poll_area.moved[].kind",
+                        enum_name="EntityKind",
+                    ),
+                    FieldEnumMapping(
+                        field_path="response_data.poll_area.left[].kind",
+                        enum_name="EntityKind",
+                    ),
+                ],
+            ),
+            MethodDescription(
+                method_name="unsubscribe_area",
+                description="Stop watching a subscribed area",
+                example_request_json=_load_snippet('world_unsubscribe_area_request.json'),
+                example_response_json=_load_snippet('world_unsubscribe_area_response.json'),
+                request_enum_fields=[],
+                response_enum_fields=self._get_common_response_enum_fields(),
+            ),
+        ]
+
+        return ServiceMetadata(
+            service_name="WorldService",
+            version="1.0",
+            description="Service for spatial queries, area subscriptions and batched updates of item and mobile positions",
+            methods=methods,
+            enums=enums,
+        )
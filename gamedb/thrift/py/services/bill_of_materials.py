@@ -0,0 +1,159 @@
+"""
+Flattened bills of materials for blueprinted items.
+
+A blueprint lists the components of an item and their ratios, and components
+can have blueprints of their own. Crafting checks only care about the leaves:
+how much of each raw material (an item without blueprint components) one unit
+of the item needs, and the total bake time. That is the blueprint tree with
+the ratios multiplied down every path and summed per raw material.
+
+Bake times follow the crafting model: a blueprint's bake_time_ms is the time
+to make one unit from its direct components, so a crafting job of quantity
+units takes bake_time_ms x quantity (see services/crafting.py). The total for
+one unit made from raw materials is therefore the item's own bake time plus
+each component's total weighted by its ratio, like the materials.
+
+BOMs are computed once per catalog snapshot, each from the BOMs of its
+components, so shared sub-assemblies are flattened only once. When items
+change, only their BOMs and those of the items using them, found through the
+reverse (used_in) index, are recomputed; every other BOM is carried over.
+The same reverse walk answers what an item can be made into, for crafting UIs.
+"""
+
+from typing import Callable, Dict, Iterable, Mapping, Optional, Set, Tuple
+
+from game.ttypes import (
+    BillOfMaterials as ThriftBillOfMaterials,
+    ItemBlueprintComponent as ThriftItemBlueprintComponent,
+)
+
+
+class BillOfMaterials:
+    """
+    Raw materials and total bake time for one unit of an item, made from raw
+    materials one blueprint at a time.
+
+    materials maps raw material item id -> quantity. An item without
+    blueprint components is its own raw material.
+    """
+
+    __slots__ = ("item_id", "materials", "total_bake_time_ms", "cycle_detected")
+
+    def __init__(
+        self,
+        item_id: int,
+        materials: Mapping[int, float],
+        total_bake_time_ms: int = 0,
+        cycle_detected: bool = False,
+    ):
+        self.item_id = item_id
+        self.materials = materials
+        self.total_bake_time_ms = total_bake_time_ms
+        self.cycle_detected = cycle_detected
+
+    @classmethod
+    def raw(cls, item_id: int, bake_time_ms: int = 0) -> "BillOfMaterials":
+        return cls(item_id, {item_id: 1.0}, bake_time_ms)
+
+    def to_thrift(self) -> ThriftBillOfMaterials:
+        return ThriftBillOfMaterials(
+            item_id=self.item_id,
+            materials=dict(self.materials),
+            total_bake_time_ms=self.total_bake_time_ms,
+            cycle_detected=self.cycle_detected,
+        )
+
+
+def build_boms(
+    item_ids: Iterable[int],
+    components_of: Callable[[int], Mapping[int, ThriftItemBlueprintComponent]],
+    bake_time_of: Callable[[int], int],
+    boms: Dict[int, BillOfMaterials],
+) -> Dict[int, BillOfMaterials]:
+    """
+    Compute the BOM of every item in item_ids that has blueprint components,
+    reusing and adding to boms (item id -> BOM). Raw materials are not stored.
+
+    Components that lead back to an item being flattened are skipped and the
+    BOMs on the cycle are marked cycle_detected, as load_with_blueprint_tree
+    does for its nodes.
+    """
+    visiting: Set[int] = set()
+
+    def build(item_id: int) -> BillOfMaterials:
+        bom = boms.get(item_id)
+        if bom is not None:
+            return bom
+        components = components_of(item_id)
+        if not components:
+            return BillOfMaterials.raw(item_id, bake_time_of(item_id))
+
+        visiting.add(item_id)
+        materials: Dict[int, float] = {}
+        total_bake_time_ms = float(bake_time_of(item_id))
+        cycle_detected = False
+        for component_item_id, component in components.items():
+            if component_item_id in visiting:
+                cycle_detected = True
+                continue
+            component_bom = build(component_item_id)
+            cycle_detected = cycle_detected or component_bom.cycle_detected
+            total_bake_time_ms += component.ratio * component_bom.total_bake_time_ms
+            for material_id, quantity in component_bom.materials.items():
+                materials[material_id] = materials.get(material_id, 0.0) + component.ratio * quantity
+        visiting.discard(item_id)
+
+        bom = BillOfMaterials(item_id, materials, int(round(total_bake_time_ms)), cycle_detected)
+        boms[item_id] = bom
+        return bom
+
+    for item_id in item_ids:
+        build(item_id)
+    return boms
+
+
+def dependents_by_depth(
+    item_ids: Iterable[int],
+    used_in: Callable[[int], Iterable[int]],
+    max_depth: Optional[int] = None,
+) -> Tuple[Dict[int, int], bool]:
+    """
+    Every item whose blueprint uses one of item_ids, directly or through other
+    blueprints, with the fewest blueprint steps to it (1 = direct use).
+
+    Returns (item id -> depth, truncated), where truncated is True if items
+    beyond max_depth were left out. The given items themselves are not listed.
+    """
+    seen = set(item_ids)
+    depths: Dict[int, int] = {}
+    frontier = list(seen)
+    depth = 0
+    while frontier:
+        if max_depth is not None and depth >= max_depth:
+            return depths, any(
+                dependent_id not in seen for item_id in frontier for dependent_id in used_in(item_id)
+            )
+        depth += 1
+        next_frontier = []
+        for item_id in frontier:
+            for dependent_id in used_in(item_id):
+                if dependent_id not in seen:
+                    seen.add(dependent_id)
+                    depths[dependent_id] = depth
+                    next_frontier.append(dependent_id)
+        frontier = next_frontier
+    return depths, False
+
+
+def dependents_closure(
+    item_ids: Iterable[int],
+    used_in: Callable[[int], Iterable[int]],
+) -> Set[int]:
+    """
+    The given items and every item whose blueprint uses one of them, directly
+    or through other blueprints.
+    """
+    item_ids = set(item_ids)
+    depths, _ = dependents_by_depth(item_ids, used_in)
+    return item_ids | set(depths)
+
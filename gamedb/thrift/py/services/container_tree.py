@@ -0,0 +1,204 @@
+"""
+Nested container inventories and their cached volume rollup.
+
+A container item (ItemType.CONTAINER) held in an inventory can own an
+inventory of its own: the entry's mobile_item_id is the container instance and
+the nested inventory has owner_type 'item' and owner_id equal to it. Cargo
+hierarchies are therefore chains of inventories -> entries -> inventories.
+
+Walking that tree from Python costs one query per level. Here it is walked in
+the database with recursive CTEs instead: the whole subtree of an inventory is
+loaded with one query, and the ancestor chain of an inventory is updated with
+one statement.
+
+Every inventory caches contained_volume: the sum of last_calculated_volume over
+all inventories nested below it, at any depth. When a nested inventory's volume
+changes, the delta is added to each ancestor, so the total volume of any
+container is last_calculated_volume + contained_volume and no add has to walk
+the tree. Moving a container moves its whole subtree total from one chain of
+inventories to the other. The updates run on the caller's cursor, in the same
+transaction as the change they account for.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from db_models.models import Inventory
+
+logger = logging.getLogger(__name__)
+
+# Deepest nesting followed when walking container trees; also stops cycles
+CONTAINER_TREE_MAX_DEPTH = 16
+
+# The children of the inventories already in the tree: inventories owned by a
+# container instance held in one of their entries
+_SUBTREE_SQL = """
+    WITH RECURSIVE tree (id, parent_id, depth) AS (
+        SELECT id, CAST(NULL AS SIGNED), 0
+        FROM inventories
+        WHERE id = %s
+        UNION ALL
+        SELECT child.id, tree.id, tree.depth + 1
+        FROM tree
+        JOIN inventory_entries e ON e.inventory_id = tree.id
+        JOIN inventories child ON child.owner_type = 'item' AND child.owner_id = e.mobile_item_id
+        WHERE tree.depth < %s
+    )
+    SELECT inventories.*, tree.parent_id AS tree_parent_id, tree.depth AS tree_depth
+    FROM tree
+    JOIN inventories ON inventories.id = tree.id
+    ORDER BY tree.depth, inventories.id
+"""
+
+# The inventories holding the container that owns an inventory, up to the root
+_ADD_TO_ANCESTORS_SQL = """
+    WITH RECURSIVE chain (id, owner_type, owner_id, depth) AS (
+        SELECT id, owner_type, owner_id, 0
+        FROM inventories
+        WHERE id = %s
+        UNION ALL
+        SELECT parent.id, parent.owner_type, parent.owner_id, chain.depth + 1
+        FROM chain
+        JOIN inventory_entries e ON chain.owner_type = 'item' AND e.mobile_item_id = chain.owner_id
+        JOIN inventories parent ON parent.id = e.inventory_id
+        WHERE chain.depth < %s
+    )
+    UPDATE inventories
+    JOIN chain ON inventories.id = chain.id
+    SET inventories.contained_volume = inventories.contained_volume + IF(chain.depth = 0, %s, %s)
+"""
+
+# Total volume of the inventories owned by container instances
+_SUBTREE_VOLUMES_SQL = """
+    SELECT owner_id, last_calculated_volume + contained_volume AS total_volume
+    FROM inventories
+    WHERE owner_type = 'item' AND owner_id IN ({placeholders})
+"""
+
+
+class ContainerNode:
+    """One inventory of a container tree."""
+
+    def __init__(self, inventory: Inventory, parent_id: Optional[int], depth: int):
+        self.inventory = inventory
+        self.parent_id = parent_id
+        self.depth = depth
+
+    @property
+    def contained_volume(self) -> float:
+        return self.inventory.get_contained_volume() or 0.0
+
+    @property
+    def total_volume(self) -> float:
+        return (self.inventory.get_last_calculated_volume() or 0.0) + self.contained_volume
+
+
+def is_nested(inventory: Inventory) -> bool:
+    """Returns True if the inventory belongs to a container item and may have ancestors."""
+    return inventory.get_owner_type() == "item"
+
+
+def load_container_tree(
+    inventory_id: int,
+    max_depth: int = CONTAINER_TREE_MAX_DEPTH,
+) -> List[ContainerNode]:
+    """
+    Load an inventory and every inventory nested below it with one query.
+    Nodes are ordered by depth, so parents always come before their children.
+    """
+    connection = Inventory._create_connection()
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute(_SUBTREE_SQL, (inventory_id, max_depth))
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+        connection.close()
+
+    nodes = []
+    seen = set()
+    for row in rows:
+        parent_id = row.pop("tree_parent_id")
+        depth = row.pop("tree_depth")
+        # A container listed twice would repeat its whole subtree
+        if row["id"] in seen:
+            continue
+        seen.add(row["id"])
+        inventory = Inventory()
+        inventory._data = row
+        inventory._dirty = False
+        nodes.append(ContainerNode(inventory, parent_id, depth))
+    return nodes
+
+
+def add_to_ancestors(
+    cursor,
+    inventory_id: int,
+    volume_delta: float,
+    own_delta: float = 0.0,
+    max_depth: int = CONTAINER_TREE_MAX_DEPTH,
+) -> None:
+    """
+    Add volume_delta to contained_volume of every inventory the given one is
+    nested in, and own_delta to its own, with one statement on cursor. Call
+    it in the transaction that changed the volumes.
+    """
+    if not volume_delta and not own_delta:
+        return
+    cursor.execute(_ADD_TO_ANCESTORS_SQL, (inventory_id, max_depth, own_delta, volume_delta))
+    logger.debug(
+        f"Added {volume_delta} to contained_volume of the ancestors of inventory_id={inventory_id} "
+        f"and {own_delta} to its own"
+    )
+
+
+def subtree_volumes(cursor, mobile_item_ids: Iterable[int]) -> Dict[int, float]:
+    """
+    Total volume (last_calculated_volume + contained_volume) of the inventory
+    each container instance owns, with one query on a dictionary cursor.
+    Instances without an inventory are absent.
+    """
+    ids = sorted(set(mobile_item_ids))
+    if not ids:
+        return {}
+    cursor.execute(
+        _SUBTREE_VOLUMES_SQL.format(placeholders=", ".join(["%s"] * len(ids))),
+        tuple(ids),
+    )
+    return {row['owner_id']: row['total_volume'] or 0.0 for row in cursor.fetchall()}
+
+
+def rebuild_contained_volume(nodes: List[ContainerNode]) -> int:
+    """
+    Recompute contained_volume bottom-up for a loaded tree and store the values
+    that changed. Returns the number of inventories updated.
+    Use it to repair rows written outside the services, e.g. by hand.
+    """
+    totals: Dict[int, float] = {node.inventory.get_id(): 0.0 for node in nodes}
+    for node in reversed(nodes):
+        if node.parent_id is not None:
+            totals[node.parent_id] += (
+                node.inventory.get_last_calculated_volume() or 0.0
+            ) + totals[node.inventory.get_id()]
+
+    changed: List[Tuple[float, int]] = []
+    for node in nodes:
+        total = totals[node.inventory.get_id()]
+        if total != node.contained_volume:
+            node.inventory._data["contained_volume"] = total
+            changed.append((total, node.inventory.get_id()))
+    if not changed:
+        return 0
+
+    connection = Inventory._create_connection()
+    cursor = connection.cursor()
+    try:
+        cursor.executemany(
+            "UPDATE inventories SET contained_volume = %s WHERE id = %s",
+            changed,
+        )
+        connection.commit()
+    finally:
+        cursor.close()
+        connection.close()
+    return len(changed)
@@ -0,0 +1,122 @@
+"""
+Which items an owner's materials can be crafted into, and how many times.
+
+Blueprints form a (blueprints x materials) requirement matrix of component
+ratios. The quantities an owner holds are a vector over the same materials.
+Blueprint b can be crafted floor(min over its materials m of
+held[m] / ratio[b, m]) times. Evaluating every blueprint then takes a few
+NumPy operations over the whole matrix, instead of a tree load and a Python
+scan per blueprint.
+
+Each blueprint uses only a few of the many materials, so the matrix is stored
+in compressed sparse row form: for each blueprint, the columns and ratios of
+its nonzero entries.
+"""
+
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+
+from db_models.models import Item
+
+# Absorbs rounding in held / ratio, so 0.3 held at ratio 0.1 crafts 3, not 2
+_EPSILON = 1e-9
+
+
+class CraftingMatrix:
+    """
+    Requirement matrix of every blueprint with components.
+
+    Usage:
+        matrix = CraftingMatrix.from_catalog(catalog.snapshot())
+        matrix.craftable({iron_ore_id: 40.0, coal_id: 3.0})  # -> {iron_ingot_id: 20, ...}
+    """
+
+    def __init__(self, components: Iterable[Tuple[int, int, float]]):
+        """components: (item_id, component_item_id, ratio) for every blueprint component."""
+        rows: Dict[int, Dict[int, float]] = {}
+        for item_id, component_item_id, ratio in components:
+            if ratio and ratio > 0:
+                row = rows.setdefault(item_id, {})
+                row[component_item_id] = row.get(component_item_id, 0.0) + ratio
+
+        self.item_ids = np.array(sorted(rows), dtype=np.int64)
+        self.material_ids = np.array(
+            sorted({material_id for row in rows.values() for material_id in row}), dtype=np.int64
+        )
+        column_of = {material_id: column for column, material_id in enumerate(self.material_ids.tolist())}
+
+        # Row r holds entries _offsets[r]:_offsets[r + 1] of _columns and _ratios
+        self._offsets = np.zeros(len(self.item_ids) + 1, dtype=np.int64)
+        self._offsets[1:] = np.cumsum([len(rows[item_id]) for item_id in self.item_ids.tolist()])
+        self._columns = np.array(
+            [column_of[material_id] for item_id in self.item_ids.tolist() for material_id in rows[item_id]],
+            dtype=np.int64,
+        )
+        self._ratios = np.array(
+            [ratio for item_id in self.item_ids.tolist() for ratio in rows[item_id].values()],
+            dtype=np.float64,
+        )
+
+    @classmethod
+    def from_catalog(cls, snapshot) -> "CraftingMatrix":
+        """Build from a CatalogSnapshot or MappedCatalog."""
+        return cls(
+            (item_id, component_item_id, component.ratio)
+            for item_id in snapshot.item_ids()
+            for component_item_id, component in snapshot.components_of(item_id).items()
+        )
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+    def _held_vector(self, held: Mapping[int, float]) -> np.ndarray:
+        """The held quantities as a vector over material_ids; other items are dropped."""
+        quantities = np.zeros(len(self.material_ids), dtype=np.float64)
+        if not held or not len(self.material_ids):
+            return quantities
+        held_ids = np.fromiter(held.keys(), dtype=np.int64, count=len(held))
+        held_quantities = np.fromiter(held.values(), dtype=np.float64, count=len(held))
+        columns = np.searchsorted(self.material_ids, held_ids)
+        columns[columns == len(self.material_ids)] = 0
+        found = self.material_ids[columns] == held_ids
+        quantities[columns[found]] = held_quantities[found]
+        return quantities
+
+    def craftable(self, held: Mapping[int, float], item_ids: Optional[Iterable[int]] = None) -> Dict[int, int]:
+        """
+        Returns item id -> times its blueprint can be crafted from held
+        (item id -> quantity), counting each blueprint on its own. Only items
+        that can be crafted at least once are returned; item_ids limits the
+        check to those items.
+        """
+        if not len(self.item_ids):
+            return {}
+
+        quantities = self._held_vector(held)
+        per_component = quantities[self._columns] / self._ratios
+        counts = np.floor(np.minimum.reduceat(per_component, self._offsets[:-1]) + _EPSILON)
+
+        rows = np.arange(len(self.item_ids))
+        if item_ids is not None:
+            wanted = np.fromiter(item_ids, dtype=np.int64)
+            rows = rows[np.isin(self.item_ids, wanted)]
+        rows = rows[counts[rows] >= 1]
+        return dict(zip(self.item_ids[rows].tolist(), counts[rows].astype(np.int64).tolist()))
+
+
+def load_crafting_matrix() -> CraftingMatrix:
+    """Build the requirement matrix from the database with one query."""
+    connection = Item._create_connection()
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "SELECT i.id, c.component_item_id, c.ratio"
+            " FROM items i"
+            " JOIN item_blueprint_components c ON c.item_blueprint_id = i.blueprint_id"
+        )
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+        connection.close()
+    return CraftingMatrix(rows)
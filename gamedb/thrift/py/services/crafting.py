@@ -0,0 +1,348 @@
+"""
+Crafting over time, driven by blueprint bake times.
+
+A crafting job turns the components of an item's blueprint, taken from an
+inventory, into quantity units of the item in the same inventory once
+bake_time_ms x quantity has elapsed: a blueprint's bake_time_ms is the time to
+make one unit from its direct components, the same model as the ratio-weighted
+total_bake_time_ms of bills of materials (services/bill_of_materials.py).
+Components with blueprints of their own must already be in the inventory;
+crafting them is a job of its own. Jobs are rows of crafting_jobs, so they
+survive restarts. The inventory service process keeps every pending job in a
+TimingWheel keyed by job id, so queuing a job, cancelling it and finding the
+jobs that are due cost O(1) however many are pending.
+
+Inputs are checked when a job starts and consumed only when it completes. The
+completion is one transaction: it locks the job and inventory rows, takes the
+inputs and adds the output with inventory.py, saves the entries and marks the
+job completed. If the inputs are gone or the output no longer fits, the job
+fails and the inventory is left untouched.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from game.ttypes import (
+    CraftingJob,
+    CraftingJobState,
+    GameResult,
+    StatusType,
+    GameError,
+    Item as ThriftItem,
+)
+from db_models.models import Inventory
+from common import is_ok, is_true
+from inventory import add_item_to_inventory, is_item_in_inventory, remove_item_from_inventory
+from services.container_tree import add_to_ancestors, is_nested
+from services.inventory_batch import lock_inventories, write_inventories
+from services.item_catalog import load_items
+from services.timing_wheel import WHEEL_TICK_MS, TimingWheel
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds before a job whose completion raised is tried again
+CRAFTING_RETRY_MS = 5000
+
+CREATE_CRAFTING_JOBS_TABLE_STATEMENT = """
+    CREATE TABLE IF NOT EXISTS `crafting_jobs` (
+      `id` bigint NOT NULL AUTO_INCREMENT,
+      `inventory_id` bigint NOT NULL,
+      `item_id` bigint NOT NULL,
+      `quantity` double NOT NULL,
+      `state` varchar(16) NOT NULL,
+      `ready_at_ms` bigint NOT NULL,
+      `created_at_ms` bigint NOT NULL,
+      `completed_at_ms` bigint DEFAULT NULL,
+      `error` varchar(255) DEFAULT NULL,
+      PRIMARY KEY (`id`),
+      KEY `state_ready_at_ms` (`state`,`ready_at_ms`),
+      KEY `inventory_id_state` (`inventory_id`,`state`)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+"""
+
+_PENDING = CraftingJobState._VALUES_TO_NAMES[CraftingJobState.PENDING]
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _job_from_row(row: dict) -> CraftingJob:
+    return CraftingJob(
+        id=row["id"],
+        inventory_id=row["inventory_id"],
+        item_id=row["item_id"],
+        quantity=row["quantity"],
+        state=CraftingJobState._NAMES_TO_VALUES[row["state"]],
+        ready_at_ms=row["ready_at_ms"],
+        error=row["error"],
+    )
+
+
+def _failure(message: str, error_code: int) -> GameResult:
+    return GameResult(status=StatusType.FAILURE, message=message, error_code=error_code)
+
+
+class CraftingScheduler:
+    """
+    Queues crafting jobs and completes them when their bake time has elapsed.
+
+    on_complete(inventory_id) is called after a job changed an inventory, so
+    the owner can drop cached copies of it.
+
+    Usage:
+        scheduler = CraftingScheduler(catalog=catalog, on_complete=forget_inventory)
+        scheduler.start()  # schedules the pending jobs in crafting_jobs
+        results, job = scheduler.start_job(inventory_id, item_id, 5.0)
+        ...
+        scheduler.stop()
+    """
+
+    def __init__(
+        self,
+        catalog=None,
+        on_complete: Optional[Callable[[int], None]] = None,
+        tick_ms: int = WHEEL_TICK_MS,
+    ):
+        # When set, item templates are read from the catalog (ItemCatalog or SharedCatalogReader)
+        self.catalog = catalog
+        self.on_complete = on_complete
+        self.tick_ms = tick_ms
+        self._lock = threading.Lock()
+        self._wheel = TimingWheel(_now_ms(), tick_ms)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._wheel)
+
+    def _templates(self, item_ids: Iterable[int]) -> Dict[int, ThriftItem]:
+        """Item templates by id; unknown ids are absent."""
+        if self.catalog is None:
+            return load_items(item_ids)
+        snapshot = self.catalog.snapshot()
+        templates = {}
+        for item_id in item_ids:
+            item = snapshot.get(item_id)
+            if item is not None:
+                templates[item_id] = item
+        return templates
+
+    @staticmethod
+    def _execute(sql: str, params: tuple = ()) -> List[dict]:
+        """
+        Run one statement in its own transaction. Returns the rows of a SELECT,
+        otherwise one row with the statement's lastrowid and rowcount.
+        """
+        connection = Inventory._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            cursor.execute(sql, params)
+            if cursor.with_rows:
+                rows = cursor.fetchall()
+            else:
+                rows = [{"id": cursor.lastrowid, "rowcount": cursor.rowcount}]
+            connection.commit()
+            return rows
+        finally:
+            cursor.close()
+            connection.close()
+
+    def load(self) -> int:
+        """Schedule every pending job in crafting_jobs. Returns how many."""
+        rows = self._execute(
+            "SELECT id, ready_at_ms FROM crafting_jobs WHERE state = %s",
+            (_PENDING,),
+        )
+        with self._lock:
+            for row in rows:
+                self._wheel.schedule(row["id"], row["ready_at_ms"])
+        logger.info(f"Scheduled {len(rows)} pending crafting jobs")
+        return len(rows)
+
+    def start_job(
+        self,
+        inventory_id: int,
+        item_id: int,
+        quantity: float,
+    ) -> Tuple[List[GameResult], Optional[CraftingJob]]:
+        """Queue crafting quantity units of item_id in an inventory that holds the inputs."""
+        if quantity is None or quantity <= 0.0:
+            return [_failure("quantity must be positive", GameError.DB_INVALID_DATA)], None
+
+        item = self._templates([item_id]).get(item_id)
+        if item is None:
+            return [_failure(f"Item {item_id} not found", GameError.DB_RECORD_NOT_FOUND)], None
+        if item.blueprint is None or not item.blueprint.components:
+            return [_failure(f"Item {item_id} has no blueprint to craft from", GameError.DB_INVALID_DATA)], None
+
+        inventory_model = Inventory.find(inventory_id)
+        if inventory_model is None:
+            return [_failure(f"Inventory {inventory_id} not found", GameError.DB_RECORD_NOT_FOUND)], None
+        results, inventory = inventory_model.into_thrift()
+        if inventory is None:
+            return results, None
+        for component_item_id, component in item.blueprint.components.items():
+            result = is_item_in_inventory(inventory, component_item_id, component.ratio * quantity)
+            if not is_true(result):
+                return [result], None
+
+        # Only this blueprint bakes: its components are already crafted
+        now_ms = _now_ms()
+        ready_at_ms = now_ms + int((item.blueprint.bake_time_ms or 0) * quantity)
+        job_id = self._execute(
+            "INSERT INTO crafting_jobs (inventory_id, item_id, quantity, state, ready_at_ms, created_at_ms)"
+            " VALUES (%s, %s, %s, %s, %s, %s)",
+            (inventory_id, item_id, quantity, _PENDING, ready_at_ms, now_ms),
+        )[0]["id"]
+        with self._lock:
+            self._wheel.schedule(job_id, ready_at_ms)
+
+        logger.info(f"Queued crafting job {job_id}: {quantity} of item_id={item_id} in inventory_id={inventory_id}")
+        job = CraftingJob(
+            id=job_id,
+            inventory_id=inventory_id,
+            item_id=item_id,
+            quantity=quantity,
+            state=CraftingJobState.PENDING,
+            ready_at_ms=ready_at_ms,
+        )
+        return [GameResult(status=StatusType.SUCCESS, message=f"Crafting job {job_id} queued")], job
+
+    def cancel_job(self, job_id: int) -> bool:
+        """Cancel a pending job. Returns False if it had already finished."""
+        cancelled = self._execute(
+            "UPDATE crafting_jobs SET state = %s, completed_at_ms = %s WHERE id = %s AND state = %s",
+            (CraftingJobState._VALUES_TO_NAMES[CraftingJobState.CANCELLED], _now_ms(), job_id, _PENDING),
+        )[0]["rowcount"] == 1
+        with self._lock:
+            self._wheel.cancel(job_id)
+        return cancelled
+
+    def list_jobs(self, inventory_id: int, pending_only: bool = True) -> List[CraftingJob]:
+        """Jobs of an inventory ordered by ready_at_ms."""
+        sql = "SELECT * FROM crafting_jobs WHERE inventory_id = %s"
+        params = (inventory_id,)
+        if pending_only:
+            sql += " AND state = %s"
+            params += (_PENDING,)
+        sql += " ORDER BY ready_at_ms, id"
+        return [_job_from_row(row) for row in self._execute(sql, params)]
+
+    def complete_job(self, job_id: int) -> Optional[CraftingJob]:
+        """
+        Consume the inputs and add the output of a due job in one transaction.
+        Returns the finished job, or None if it was no longer pending.
+        """
+        connection = Inventory._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            connection.start_transaction()
+            cursor.execute("SELECT * FROM crafting_jobs WHERE id = %s FOR UPDATE", (job_id,))
+            row = cursor.fetchone()
+            if row is None or row["state"] != _PENDING:
+                connection.rollback()
+                return None
+            job = _job_from_row(row)
+
+            inventory_model = lock_inventories(cursor, [job.inventory_id]).get(job.inventory_id)
+            inventory = None
+            if inventory_model is None:
+                results = [_failure(f"Inventory {job.inventory_id} not found", GameError.DB_RECORD_NOT_FOUND)]
+            else:
+                results, inventory = inventory_model.into_thrift()
+                if inventory is not None:
+                    results = self._craft(inventory, job)
+
+            now_ms = _now_ms()
+            if is_ok(results):
+                write_inventories(cursor, [inventory], {inventory.id: inventory_model})
+                if is_nested(inventory_model):
+                    add_to_ancestors(
+                        cursor,
+                        inventory.id,
+                        inventory.last_calculated_volume - (inventory_model.get_last_calculated_volume() or 0.0),
+                    )
+                job.state = CraftingJobState.COMPLETED
+            else:
+                job.state = CraftingJobState.FAILED
+                job.error = next(
+                    (result.message for result in results if result.status == StatusType.FAILURE),
+                    "crafting failed",
+                )[:255]
+                logger.warning(f"Crafting job {job_id} failed: {job.error}")
+            cursor.execute(
+                "UPDATE crafting_jobs SET state = %s, completed_at_ms = %s, error = %s WHERE id = %s",
+                (CraftingJobState._VALUES_TO_NAMES[job.state], now_ms, job.error, job_id),
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+
+        if job.state == CraftingJobState.COMPLETED:
+            if self.on_complete is not None:
+                self.on_complete(job.inventory_id)
+            logger.debug(f"Completed crafting job {job_id}")
+        return job
+
+    def _craft(self, inventory, job: CraftingJob) -> List[GameResult]:
+        """Take the inputs of job out of inventory and add its output, in memory."""
+        item = self._templates([job.item_id]).get(job.item_id)
+        if item is None or item.blueprint is None or not item.blueprint.components:
+            return [_failure(f"Item {job.item_id} has no blueprint to craft from", GameError.DB_RECORD_NOT_FOUND)]
+        components = item.blueprint.components
+        templates = self._templates(components)
+
+        results: List[GameResult] = []
+        for component_item_id, component in components.items():
+            component_item = templates.get(component_item_id)
+            if component_item is None:
+                return [_failure(f"Item {component_item_id} not found", GameError.DB_RECORD_NOT_FOUND)]
+            results += remove_item_from_inventory(inventory, component_item, component.ratio * job.quantity)
+            if not is_ok(results):
+                return results
+        return results + add_item_to_inventory(inventory, item, job.quantity)
+
+    def run_due(self, now_ms: Optional[int] = None) -> int:
+        """Complete every job due by now_ms. Returns how many finished."""
+        with self._lock:
+            due = self._wheel.advance(now_ms if now_ms is not None else _now_ms())
+        finished = 0
+        for job_id in due:
+            try:
+                if self.complete_job(job_id) is not None:
+                    finished += 1
+            except Exception as e:
+                logger.error(f"Crafting job {job_id} could not complete: {type(e).__name__}: {str(e)}")
+                with self._lock:
+                    self._wheel.schedule(job_id, _now_ms() + CRAFTING_RETRY_MS)
+        return finished
+
+    def _run_loop(self) -> None:
+        while not self._stop.wait(self.tick_ms / 1000.0):
+            self.run_due()
+
+    def start(self) -> None:
+        """Schedule the pending jobs and complete due jobs every tick in a daemon thread."""
+        self.load()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="crafting",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the crafting thread; pending jobs stay in crafting_jobs for the next start."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
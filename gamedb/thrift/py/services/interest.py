@@ -0,0 +1,301 @@
+"""
+Area-of-interest subscriptions over the spatial index.
+
+A game server subscribes to an area, a sphere at one position level, fixed
+or centred on a mobile it follows, and polls for what changed since its last
+poll: the entities that entered, moved within or left the area. It no longer
+has to load every nearby entity to find out.
+
+Each subscription registers in the grid cells its sphere overlaps. When an
+entity moves, only the subscriptions registered in its new cell, plus those it
+already belonged to, are checked, so the cost of keeping every interest set
+current follows the number of movers and not the size of the world. Only a
+followed mobile's own moves recompute its subscription from the index.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from services.spatial_index import SpatialIndex, Vector3, distance, frame_key
+
+logger = logging.getLogger(__name__)
+
+# Subscriptions covering more cells than this are checked against every mover
+INTEREST_MAX_CELLS = 4096
+
+# Seconds a subscription survives without being polled
+INTEREST_IDLE_TIMEOUT = 60.0
+
+
+class AreaSubscription:
+    """One watched area and the changes not yet polled from it."""
+
+    def __init__(
+        self,
+        subscription_id: int,
+        level: int,
+        radius: float,
+        center: Optional[Vector3] = None,
+        frame: Optional[Dict[int, Vector3]] = None,
+        follow: Optional[Hashable] = None,
+        accept: Optional[Callable[[Hashable], bool]] = None,
+    ):
+        self.subscription_id = subscription_id
+        self.level = level
+        self.radius = radius
+        self.center = center
+        self.frame = frame
+        self.follow = follow
+        self.accept = accept
+        self.cells: Optional[List[tuple]] = []
+        self.members: Dict[Hashable, Vector3] = {}
+        self.entered: Dict[Hashable, Vector3] = {}
+        self.moved: Dict[Hashable, Vector3] = {}
+        self.left: Set[Hashable] = set()
+        self.last_polled = time.monotonic()
+
+    def contains(self, entity: Hashable, positions: Dict[int, Vector3]) -> bool:
+        """Returns True if an entity at positions is inside the area."""
+        if self.center is None or entity == self.follow or self.level not in positions:
+            return False
+        if self.accept is not None and not self.accept(entity):
+            return False
+        if self.frame is not None and frame_key(positions, self.level) != frame_key(self.frame, self.level):
+            return False
+        return distance(self.center, positions[self.level]) <= self.radius
+
+    def set_member(self, entity: Hashable, position: Optional[Vector3]) -> None:
+        """Record that entity is now at position inside the area, or outside it (None)."""
+        if position is None:
+            if entity not in self.members:
+                return
+            del self.members[entity]
+            self.moved.pop(entity, None)
+            if self.entered.pop(entity, None) is None:
+                self.left.add(entity)
+        elif entity not in self.members:
+            self.members[entity] = position
+            if entity in self.left:
+                # Left and came back between polls: the poller still knows it
+                self.left.discard(entity)
+                self.moved[entity] = position
+            else:
+                self.entered[entity] = position
+        elif self.members[entity] != position:
+            self.members[entity] = position
+            if entity in self.entered:
+                self.entered[entity] = position
+            else:
+                self.moved[entity] = position
+
+    def take_changes(self) -> Tuple[Dict[Hashable, Vector3], Dict[Hashable, Vector3], Set[Hashable]]:
+        """The changes since the last call, as (entered, moved, left)."""
+        changes = (self.entered, self.moved, self.left)
+        self.entered, self.moved, self.left = {}, {}, set()
+        self.last_polled = time.monotonic()
+        return changes
+
+
+class InterestManager:
+    """
+    Keeps area subscriptions current as entities move in a SpatialIndex.
+
+    Usage:
+        interest = InterestManager(index)
+        subscription = interest.subscribe(AttributeType.LOCAL_POSITION, 20.0, follow=(EntityKind.MOBILE, 7))
+        ...
+        center, entered, moved, left = interest.poll(subscription.subscription_id)
+    """
+
+    def __init__(self, index: SpatialIndex, idle_timeout: float = INTEREST_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._subscriptions: Dict[int, AreaSubscription] = {}
+        # (level, cell) -> subscriptions whose area overlaps the cell
+        self._cell_subscriptions: Dict[Tuple[int, tuple], Set[int]] = {}
+        # Subscriptions too large to register cell by cell
+        self._wide_subscriptions: Set[int] = set()
+        # entity -> subscriptions it is a member of
+        self._memberships: Dict[Hashable, Set[int]] = {}
+        # followed entity -> subscriptions following it
+        self._followers: Dict[Hashable, Set[int]] = {}
+        self.index = index
+        index.add_listener(lambda entity: self._on_move(index, entity))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    def attach(self, index: SpatialIndex) -> None:
+        """Switch to a rebuilt index and bring every subscription up to date with it."""
+        with self._lock:
+            self.index = index
+            index.add_listener(lambda entity: self._on_move(index, entity))
+            for subscription in self._subscriptions.values():
+                self._recompute(subscription)
+
+    def _register(self, subscription: AreaSubscription) -> None:
+        subscription_id = subscription.subscription_id
+        for cell in subscription.cells or []:
+            self._cell_subscriptions.setdefault((subscription.level, cell), set()).add(subscription_id)
+        if subscription.cells is None:
+            self._wide_subscriptions.add(subscription_id)
+
+    def _unregister(self, subscription: AreaSubscription) -> None:
+        subscription_id = subscription.subscription_id
+        for cell in subscription.cells or []:
+            key = (subscription.level, cell)
+            registered = self._cell_subscriptions.get(key)
+            if registered is not None:
+                registered.discard(subscription_id)
+                if not registered:
+                    del self._cell_subscriptions[key]
+        self._wide_subscriptions.discard(subscription_id)
+
+    def _set_member(self, subscription: AreaSubscription, entity: Hashable, position: Optional[Vector3]) -> None:
+        subscription.set_member(entity, position)
+        if position is None:
+            memberships = self._memberships.get(entity)
+            if memberships is not None:
+                memberships.discard(subscription.subscription_id)
+                if not memberships:
+                    del self._memberships[entity]
+        else:
+            self._memberships.setdefault(entity, set()).add(subscription.subscription_id)
+
+    def _recompute(self, subscription: AreaSubscription) -> None:
+        """Re-place a subscription's area and recompute its members from the index."""
+        if subscription.follow is not None:
+            followed = self.index.positions_of(subscription.follow)
+            subscription.center = followed.get(subscription.level)
+            subscription.frame = followed if subscription.center is not None else None
+
+        self._unregister(subscription)
+        if subscription.center is None:
+            subscription.cells = []
+            found = {}
+        else:
+            subscription.cells = self.index.cells_within(
+                subscription.level, subscription.center, subscription.radius, INTEREST_MAX_CELLS
+            )
+            self._register(subscription)
+            found = {
+                entity: position
+                for entity, position, _ in self.index.query_radius(
+                    subscription.level,
+                    subscription.center,
+                    subscription.radius,
+                    frame=subscription.frame,
+                    accept=lambda entity: entity != subscription.follow and (
+                        subscription.accept is None or subscription.accept(entity)
+                    ),
+                )
+            }
+
+        for entity in list(subscription.members):
+            if entity not in found:
+                self._set_member(subscription, entity, None)
+        for entity, position in found.items():
+            self._set_member(subscription, entity, position)
+
+    def _on_move(self, index: SpatialIndex, entity: Hashable) -> None:
+        with self._lock:
+            if index is not self.index:
+                return
+            positions = index.positions_of(entity)
+
+            for subscription_id in list(self._followers.get(entity, ())):
+                self._recompute(self._subscriptions[subscription_id])
+
+            candidates = set(self._memberships.get(entity, ())) | self._wide_subscriptions
+            for level, position in positions.items():
+                candidates |= self._cell_subscriptions.get((level, index.cell_of(level, position)), set())
+
+            for subscription_id in candidates:
+                subscription = self._subscriptions[subscription_id]
+                if subscription.contains(entity, positions):
+                    self._set_member(subscription, entity, positions[subscription.level])
+                else:
+                    self._set_member(subscription, entity, None)
+
+    def _expire_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout
+        for subscription in list(self._subscriptions.values()):
+            if subscription.last_polled < cutoff:
+                logger.info(f"Dropping idle area subscription {subscription.subscription_id}")
+                self._remove(subscription.subscription_id)
+
+    def subscribe(
+        self,
+        level: int,
+        radius: float,
+        center: Optional[Vector3] = None,
+        frame: Optional[Dict[int, Vector3]] = None,
+        follow: Optional[Hashable] = None,
+        accept: Optional[Callable[[Hashable], bool]] = None,
+    ) -> Tuple[AreaSubscription, Dict[Hashable, Vector3]]:
+        """
+        Start watching an area, fixed at center within frame or around the
+        entity to follow. Returns the subscription and the entities already
+        inside it; later changes are returned by poll().
+        """
+        with self._lock:
+            self._expire_idle()
+            subscription = AreaSubscription(
+                next(self._ids),
+                level,
+                radius,
+                center=tuple(center) if center is not None else None,
+                frame=frame,
+                follow=follow,
+                accept=accept,
+            )
+            self._subscriptions[subscription.subscription_id] = subscription
+            if follow is not None:
+                self._followers.setdefault(follow, set()).add(subscription.subscription_id)
+            self._recompute(subscription)
+            subscription.take_changes()
+            return subscription, dict(subscription.members)
+
+    def poll(
+        self,
+        subscription_id: int,
+    ) -> Optional[Tuple[Optional[Vector3], Dict[Hashable, Vector3], Dict[Hashable, Vector3], Set[Hashable]]]:
+        """
+        The area's current center and the (entered, moved, left) changes
+        since the last poll, or None for an unknown subscription.
+        """
+        with self._lock:
+            self._expire_idle()
+            subscription = self._subscriptions.get(subscription_id)
+            if subscription is None:
+                return None
+            return (subscription.center,) + subscription.take_changes()
+
+    def _remove(self, subscription_id: int) -> bool:
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return False
+        self._unregister(subscription)
+        for entity in subscription.members:
+            memberships = self._memberships.get(entity)
+            if memberships is not None:
+                memberships.discard(subscription_id)
+                if not memberships:
+                    del self._memberships[entity]
+        if subscription.follow is not None:
+            followers = self._followers.get(subscription.follow)
+            if followers is not None:
+                followers.discard(subscription_id)
+                if not followers:
+                    del self._followers[subscription.follow]
+        return True
+
+    def unsubscribe(self, subscription_id: int) -> bool:
+        """Stop watching an area. Returns False for an unknown subscription."""
+        with self._lock:
+            return self._remove(subscription_id)
@@ -0,0 +1,193 @@
+"""
+Cross-process cache invalidation over UNIX-domain datagram sockets.
+
+Every service process binds one socket in a shared directory. A handler that
+writes a record publishes (topic, key) to every other socket it finds there;
+subscribers drop whatever they cached for that key. There is no broker: the
+directory listing is the membership list, and sockets whose process has gone
+away are removed by the next publisher that fails to reach them.
+
+Each publisher numbers its messages 1, 2, 3, ... A subscriber that sees a
+publisher's sequence jump (a dropped datagram, or joining after the
+publisher started) cannot know what it missed, so it calls its gap handlers,
+which flush everything.
+"""
+
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+from typing import Callable, Dict, Hashable, List
+
+logger = logging.getLogger(__name__)
+
+TOPIC_ITEM = "item"
+TOPIC_INVENTORY = "inventory"
+TOPIC_PLAYER = "player"
+
+# Directory holding one socket per subscribed process
+INVALIDATION_BUS_DIR = os.getenv(
+    "INVALIDATION_BUS_DIR",
+    os.path.join(tempfile.gettempdir(), "gamedb_invalidation_bus"),
+)
+
+_MAX_DATAGRAM = 4096
+
+# Longest the receive thread blocks before checking whether stop() was called
+_RECEIVE_TIMEOUT_SECONDS = 0.5
+
+
+class InvalidationBus:
+    """
+    Publishes and receives invalidations for one process.
+
+    Usage:
+        bus = InvalidationBus("ItemService")
+        bus.subscribe(TOPIC_ITEM, lambda item_id: cache.forget(item_id))
+        bus.on_gap(cache.clear)
+        bus.start()
+        ...
+        bus.publish(TOPIC_ITEM, item.get_id())
+    """
+
+    def __init__(self, name: str, directory: str = INVALIDATION_BUS_DIR):
+        self.name = name
+        self.directory = directory
+        self.origin = f"{name}-{os.getpid()}"
+        self.path = os.path.join(directory, f"{self.origin}.sock")
+
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._last_seen: Dict[str, int] = {}
+        self._subscribers: Dict[str, List[Callable[[Hashable], None]]] = {}
+        self._gap_handlers: List[Callable[[], None]] = []
+
+        self._send_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        # Never block a request on a slow subscriber; a dropped datagram
+        # shows up as a sequence gap on the other side
+        self._send_socket.setblocking(False)
+        self._receive_socket = None
+        self._thread = None
+        self._stopping = threading.Event()
+
+    def subscribe(self, topic: str, callback: Callable[[Hashable], None]) -> None:
+        """Call callback(key) whenever another process publishes key on topic."""
+        self._subscribers.setdefault(topic, []).append(callback)
+
+    def on_gap(self, callback: Callable[[], None]) -> None:
+        """Call callback() when invalidations may have been missed."""
+        self._gap_handlers.append(callback)
+
+    def start(self) -> None:
+        """Bind this process's socket and start receiving in a daemon thread."""
+        os.makedirs(self.directory, exist_ok=True)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._stopping.clear()
+        self._receive_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._receive_socket.bind(self.path)
+        self._receive_socket.settimeout(_RECEIVE_TIMEOUT_SECONDS)
+        self._thread = threading.Thread(
+            target=self._receive_loop,
+            name=f"invalidation-bus-{self.name}",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Invalidation bus listening on {self.path}")
+
+    def stop(self) -> None:
+        """Stop the receive thread, waiting for it to exit, and unbind this process's socket."""
+        self._stopping.set()
+        receive_socket = self._receive_socket
+        if receive_socket is not None:
+            # close() alone does not wake a thread blocked in recv on Linux
+            try:
+                receive_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if receive_socket is not None:
+            receive_socket.close()
+            self._receive_socket = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def publish(self, topic: str, key: Hashable) -> int:
+        """
+        Tell every other process that key on topic changed.
+
+        Returns:
+            The sequence number of the message
+        """
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        payload = json.dumps(
+            {"origin": self.origin, "seq": seq, "topic": topic, "key": key}
+        ).encode("utf-8")
+
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return seq
+
+        for name in names:
+            if not name.endswith(".sock"):
+                continue
+            path = os.path.join(self.directory, name)
+            if path == self.path:
+                continue
+            try:
+                self._send_socket.sendto(payload, path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Its process is gone
+                logger.debug(f"Removing stale invalidation socket {path}")
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            except BlockingIOError:
+                logger.warning(f"Invalidation to {path} dropped: receiver is backed up")
+            except OSError as e:
+                logger.warning(f"Invalidation to {path} failed: {e}")
+        return seq
+
+    def _receive_loop(self) -> None:
+        receive_socket = self._receive_socket
+        while not self._stopping.is_set():
+            try:
+                data = receive_socket.recv(_MAX_DATAGRAM)
+            except socket.timeout:
+                continue
+            except OSError:
+                # Socket shut down by stop()
+                return
+            if not data:
+                # An empty read after shutdown(); an empty datagram is never published
+                continue
+            try:
+                self.dispatch(json.loads(data.decode("utf-8")))
+            except Exception as e:
+                logger.error(f"Failed to handle invalidation: {type(e).__name__}: {str(e)}")
+
+    def dispatch(self, message: Dict) -> None:
+        """Run gap handlers if message skips a sequence number, then its subscribers."""
+        origin = message["origin"]
+        seq = message["seq"]
+        with self._lock:
+            last = self._last_seen.get(origin, 0)
+            self._last_seen[origin] = max(last, seq)
+
+        if seq != last + 1:
+            logger.warning(
+                f"Invalidation gap from {origin}: expected {last + 1}, got {seq}; flushing"
+            )
+            for handler in self._gap_handlers:
+                handler()
+
+        for callback in self._subscribers.get(message["topic"], []):
+            callback(message["key"])
@@ -0,0 +1,98 @@
+"""
+Reading and writing many inventories inside a caller's transaction, with a
+fixed number of statements however many inventories there are.
+
+lock_inventories() locks the inventory rows and reads all of their entries
+in two queries. write_inventories() stores the entries and volumes changed
+by inventory.py over those rows, matched by id like Inventory.save(): one
+UPDATE of every last_calculated_volume, one DELETE of the entries that are
+gone, one UPDATE of the changed entries and one batched INSERT of the new
+ones.
+"""
+
+from typing import Dict, Iterable, List
+
+from game.ttypes import Inventory as ThriftInventory
+from db_models.models import Inventory, InventoryEntry
+
+
+def _placeholders(count: int) -> str:
+    return ", ".join(["%s"] * count)
+
+
+def lock_inventories(cursor, inventory_ids: Iterable[int]) -> Dict[int, Inventory]:
+    """
+    Lock inventory_ids (SELECT ... FOR UPDATE, in id order so concurrent
+    callers cannot deadlock) and load their entries.
+
+    cursor must be a dictionary cursor in an open transaction. Returns
+    inventory id -> model with its entries cached; missing ids are absent.
+    """
+    ids = sorted(set(inventory_ids))
+    if not ids:
+        return {}
+    cursor.execute(
+        f"SELECT * FROM inventories WHERE id IN ({_placeholders(len(ids))}) ORDER BY id FOR UPDATE",
+        tuple(ids),
+    )
+    inventories: Dict[int, Inventory] = {}
+    for row in cursor.fetchall():
+        inventory = Inventory()
+        inventory._data = row
+        inventory._dirty = False
+        inventory._inventory_entries_cache = []
+        inventories[row["id"]] = inventory
+    if not inventories:
+        return inventories
+
+    cursor.execute(
+        f"SELECT * FROM inventory_entries WHERE inventory_id IN ({_placeholders(len(inventories))}) ORDER BY id",
+        tuple(inventories),
+    )
+    for row in cursor.fetchall():
+        entry = InventoryEntry()
+        entry._data = row
+        entry._dirty = False
+        inventories[row["inventory_id"]]._inventory_entries_cache.append(entry)
+    return inventories
+
+
+def write_inventories(
+    cursor,
+    inventories: Iterable[ThriftInventory],
+    locked: Dict[int, Inventory],
+) -> None:
+    """
+    Store the entries and last_calculated_volume of Thrift inventories
+    changed in memory. Other columns are left as they are.
+
+    locked is what lock_inventories() returned for them in this transaction;
+    entries are written over its rows by id, and new entries get their ids.
+    """
+    inventories: List[ThriftInventory] = list(inventories)
+    if not inventories:
+        return
+    ids = tuple(inventory.id for inventory in inventories)
+
+    cursor.execute(
+        "UPDATE inventories SET last_calculated_volume = CASE id "
+        + " ".join(["WHEN %s THEN %s"] * len(inventories))
+        + f" END WHERE id IN ({_placeholders(len(ids))})",
+        tuple(
+            value
+            for inventory in inventories
+            for value in (inventory.id, inventory.last_calculated_volume or 0.0)
+        ) + ids,
+    )
+    lists = [
+        (
+            inventory.id,
+            {entry.get_id(): entry._data for entry in locked[inventory.id].get_inventory_entries()},
+            [InventoryEntry().from_thrift(entry) for entry in inventory.entries],
+        )
+        for inventory in inventories
+    ]
+    Inventory._write_inventory_entries(cursor, lists)
+    for inventory, (_, _, entries) in zip(inventories, lists):
+        for thrift_entry, entry in zip(inventory.entries, entries):
+            thrift_entry.id = entry.get_id()
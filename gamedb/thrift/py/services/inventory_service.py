@@ -4,6 +4,7 @@ sys.path.append("../../gen-py")
 sys.path.append("..")
 
 import logging
+from typing import Dict, List, Optional, Tuple, Union
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +30,32 @@ from game.ttypes import (
     TransferItemResponseData,
     ListInventoryRequestData,
     ListInventoryResponseData,
+    LoadManyInventoriesRequestData,
+    LoadManyInventoriesResponseData,
+    OwnerItemTotalsRequestData,
+    OwnerItemTotalsResponseData,
+    OwnerCapacityRequestData,
+    OwnerCapacityResponseData,
+    OwnerHasItemsRequestData,
+    OwnerHasItemsResponseData,
+    OwnerCraftableRequestData,
+    OwnerCraftableResponseData,
+    StartCraftingRequestData,
+    StartCraftingResponseData,
+    CancelCraftingRequestData,
+    CancelCraftingResponseData,
+    ListCraftingJobsRequestData,
+    ListCraftingJobsResponseData,
+    BreakdownItemRequestData,
+    BreakdownItemResponseData,
+    SalvageContainersRequestData,
+    SalvageContainersResponseData,
+    SetItemAttributesRequestData,
+    SetItemAttributesResponseData,
+    InventoryCapacity,
+    LoadContainerTreeRequestData,
+    LoadContainerTreeResponseData,
+    ContainerNode as ThriftContainerNode,
     Inventory,
     InventoryEntry,
     GameResult,
@@ -41,9 +68,31 @@ from game.ttypes import (
 )
 from game.InventoryService import Iface as InventoryServiceIface
 from db_models.models import Inventory, InventoryEntry, Item, MobileItem
-from inventory import split_stack, transfer_item
-from common import is_ok
+from inventory import split_stack, transfer_instance, transfer_item
+from common import is_ok, LOAD_MANY_MAX_IDS
 from services.base_service import BaseServiceHandler
+from services.single_flight import SingleFlight
+from services.negative_cache import NegativeCache
+from services.item_catalog import ItemCatalog, load_blueprint_snapshot, load_items
+from services.craftability import CraftingMatrix, load_crafting_matrix
+from services.crafting import CraftingScheduler
+from services.recycling import breakdown_in_inventory, salvage_inventories
+from services.mobile_items import set_item_attributes
+from services.inventory_batch import lock_inventories
+from services.container_tree import (
+    CONTAINER_TREE_MAX_DEPTH,
+    add_to_ancestors,
+    is_nested,
+    load_container_tree,
+    rebuild_contained_volume,
+    subtree_volumes,
+)
+from services.shared_catalog import SharedCatalogReader
+from services.invalidation_bus import (
+    InvalidationBus,
+    TOPIC_INVENTORY,
+    TOPIC_ITEM,
+)
 
 
 class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
@@ -52,8 +101,56 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
     Handles inventory operations using db_models and inventory.py functions.
     """
 
-    def __init__(self):
-        BaseServiceHandler.__init__(self, InventoryServiceHandler)
+    def __init__(
+        self,
+        catalog: Optional[Union[ItemCatalog, SharedCatalogReader]] = None,
+        bus: Optional[InvalidationBus] = None,
+    ):
+        BaseServiceHandler.__init__(self, InventoryServiceHandler, bus)
+        # Concurrent loads of the same inventory share one DB fetch and conversion
+        self.load_flight = SingleFlight("inventory_load")
+        # Recently missed ids are answered without a query
+        self.missing = NegativeCache("inventory")
+        # When set, item templates are read from the in-memory catalog
+        self.catalog = catalog
+        # (catalog snapshot, requirement matrix built from it)
+        self._crafting: Optional[Tuple[object, CraftingMatrix]] = None
+        # Pending crafting jobs; run_servers starts its completion thread
+        self.crafting = CraftingScheduler(catalog=catalog, on_complete=self._on_inventory_written)
+        if bus is not None:
+            bus.subscribe(TOPIC_INVENTORY, self._on_inventory_invalidated)
+            bus.subscribe(TOPIC_ITEM, self._on_item_invalidated)
+            bus.on_gap(self._on_invalidation_gap)
+
+    def _on_inventory_invalidated(self, inventory_id: int) -> None:
+        """Another process wrote inventory_id."""
+        self.load_flight.forget(inventory_id)
+        self.missing.forget(inventory_id)
+
+    def _on_inventory_written(self, inventory_id: int) -> None:
+        """A crafting job or recycling changed inventory_id in this process."""
+        self.load_flight.forget(inventory_id)
+        self.publish_invalidation(TOPIC_INVENTORY, inventory_id)
+
+    def _on_invalidation_gap(self) -> None:
+        """Invalidations may have been missed; forget every remembered miss."""
+        self.missing.clear()
+        self._on_item_invalidated()
+
+    def _on_item_invalidated(self, item_id: Optional[int] = None) -> None:
+        """An item template changed elsewhere; pick up the republished catalog."""
+        if isinstance(self.catalog, SharedCatalogReader):
+            self.catalog.invalidate()
+
+    def _fetch_inventory(self, inventory_id: int):
+        """Load an inventory and convert it to Thrift, or return None if missing."""
+        if self.missing.is_missing(inventory_id):
+            return None
+        inventory = Inventory.find(inventory_id)
+        if not inventory:
+            self.missing.remember(inventory_id)
+            return None
+        return inventory.into_thrift()
 
     def load(self, request: InventoryRequest) -> InventoryResponse:
         """Load an inventory by ID."""
@@ -76,16 +173,19 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
             inventory_id = load_data.inventory_id
             logger.info(f"Loading inventory_id={inventory_id}")
 
-            # Load from database using ActiveRecord
-            inventory = Inventory.find(inventory_id)
+            # Load from database using ActiveRecord, sharing the fetch with
+            # any identical load already in flight
+            loaded = self.load_flight.do(
+                inventory_id,
+                lambda: self._fetch_inventory(inventory_id),
+            )
 
-            if inventory:
+            if loaded:
                 logger.info(
                     f"SUCCESS: Loaded inventory_id={inventory_id} from DATABASE"
                 )
 
-                # Convert to Thrift
-                results, thrift_inventory = inventory.into_thrift()
+                results, thrift_inventory = loaded
 
                 if thrift_inventory:
                     response_data = InventoryResponseData(
@@ -160,7 +260,9 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
             inventory.from_thrift(create_data.inventory)
 
             # Save to database
-            inventory.save()
+            self._save_inventory(inventory)
+            self.missing.forget(inventory.get_id())
+            self.publish_invalidation(TOPIC_INVENTORY, inventory.get_id())
 
             logger.info(
                 f"SUCCESS: Created inventory with id={inventory.get_id()}"
@@ -227,7 +329,10 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
             inventory.from_thrift(save_data.inventory)
 
             # Save to database
-            inventory.save()
+            self._save_inventory(inventory)
+            self.load_flight.forget(inventory.get_id())
+            self.missing.forget(inventory.get_id())
+            self.publish_invalidation(TOPIC_INVENTORY, inventory.get_id())
 
             logger.info(f"SUCCESS: Saved inventory_id={inventory.get_id()}")
 
@@ -314,7 +419,7 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
             )
             entry_index = None
             for idx, entry in enumerate(thrift_inventory.entries):
-                if entry.item_id == split_data.item_id:
+                if entry.item_id == split_data.item_id and entry.mobile_item_id is None:
                     entry_index = idx
                     logger.debug(
                         f"Found item at entry_index={idx}, current quantity={entry.quantity}"
@@ -364,6 +469,8 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
             logger.debug("Saving updated inventory to database...")
             inventory_model.from_thrift(thrift_inventory)
             inventory_model.save()
+            self.load_flight.forget(inventory_id)
+            self.publish_invalidation(TOPIC_INVENTORY, inventory_id)
 
             logger.info(
                 f"SUCCESS: Split stack completed for inventory_id={inventory_id}"
@@ -420,11 +527,15 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
                 f"Transferring item_id={transfer_data.item_id}, quantity={transfer_data.quantity} from inventory_id={source_id} to inventory_id={dest_id}"
             )
 
-            # Load the item from database using ActiveRecord
-            logger.debug(f"Loading item_id={transfer_data.item_id} from database...")
-            item_model = Item.find(transfer_data.item_id)
-            if not item_model:
-                logger.error(f"Item_id={transfer_data.item_id} not found in database")
+            # Load the item template from the catalog, or the database using ActiveRecord
+            logger.debug(f"Loading item_id={transfer_data.item_id}...")
+            if self.catalog is not None:
+                thrift_item = self.catalog.snapshot().get(transfer_data.item_id)
+            else:
+                item_model = Item.find(transfer_data.item_id)
+                thrift_item = item_model.into_thrift()[1] if item_model else None
+            if not thrift_item:
+                logger.error(f"Item_id={transfer_data.item_id} not found")
                 return InventoryResponse(
                     results=[
                         GameResult(
@@ -436,82 +547,123 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
                     response_data=None,
                 )
 
-            # Convert item to Thrift for inventory.py function
-            _, thrift_item = item_model.into_thrift()
             logger.debug(f"Loaded item: {thrift_item.internal_name}")
 
-            # Load source inventory using ActiveRecord
-            logger.debug(f"Loading source inventory_id={source_id}...")
-            source_model = Inventory.find(source_id)
-            if not source_model:
-                logger.error(f"Source inventory_id={source_id} not found")
-                return InventoryResponse(
-                    results=[
-                        GameResult(
-                            status=StatusType.FAILURE,
-                            message=f"Source inventory {source_id} not found",
-                            error_code=GameError.DB_RECORD_NOT_FOUND,
-                        ),
-                    ],
-                    response_data=None,
-                )
-
-            # Convert source to Thrift
-            _, thrift_source_inv = source_model.into_thrift()
-
-            # Load destination inventory using ActiveRecord
-            logger.debug(f"Loading destination inventory_id={dest_id}...")
-            dest_model = Inventory.find(dest_id)
-            if not dest_model:
-                logger.error(f"Destination inventory_id={dest_id} not found")
-                return InventoryResponse(
-                    results=[
-                        GameResult(
-                            status=StatusType.FAILURE,
-                            message=f"Destination inventory {dest_id} not found",
-                            error_code=GameError.DB_RECORD_NOT_FOUND,
-                        ),
-                    ],
-                    response_data=None,
+            # The transfer, both saves and the volume moved between the two
+            # container chains are one transaction
+            connection = Inventory._create_connection()
+            cursor = connection.cursor(dictionary=True)
+            try:
+                connection.start_transaction()
+
+                # Lock both inventories, so that crafting or salvage cannot
+                # rewrite them between this read and the saves
+                logger.debug(f"Locking inventory_ids={source_id}, {dest_id}...")
+                locked = lock_inventories(cursor, [source_id, dest_id])
+                source_model = locked.get(source_id)
+                dest_model = locked.get(dest_id)
+                for inventory_id, model, role in (
+                    (source_id, source_model, "Source"),
+                    (dest_id, dest_model, "Destination"),
+                ):
+                    if not model:
+                        connection.rollback()
+                        logger.error(f"{role} inventory_id={inventory_id} not found")
+                        return InventoryResponse(
+                            results=[
+                                GameResult(
+                                    status=StatusType.FAILURE,
+                                    message=f"{role} inventory {inventory_id} not found",
+                                    error_code=GameError.DB_RECORD_NOT_FOUND,
+                                ),
+                            ],
+                            response_data=None,
+                        )
+
+                # Convert both to Thrift
+                _, thrift_source_inv = source_model.into_thrift()
+                _, thrift_dest_inv = dest_model.into_thrift()
+
+                # Perform the transfer - inventory.py function mutates both Thrift inventories
+                logger.debug(
+                    f"Source has {len(thrift_source_inv.entries)} entries, destination has {len(thrift_dest_inv.entries)} entries"
                 )
+                moved_volume = 0.0
+                if transfer_data.mobile_item_id is not None:
+                    # An instance moves whole, with the inventory it owns when it is a container
+                    mobile_item_id = transfer_data.mobile_item_id
+                    moved_volume = subtree_volumes(cursor, [mobile_item_id]).get(mobile_item_id, 0.0)
+                    logger.debug(
+                        f"Calling transfer_instance() with mobile_item_id={mobile_item_id}, contained_volume={moved_volume}"
+                    )
+                    transfer_results = transfer_instance(
+                        thrift_source_inv,
+                        thrift_dest_inv,
+                        thrift_item,
+                        mobile_item_id,
+                        moved_volume,
+                    )
+                else:
+                    logger.debug(
+                        f"Calling transfer_item() with quantity={transfer_data.quantity}"
+                    )
+                    transfer_results = transfer_item(
+                        thrift_source_inv,
+                        thrift_dest_inv,
+                        thrift_item,
+                        transfer_data.quantity,
+                    )
 
-            # Convert destination to Thrift
-            _, thrift_dest_inv = dest_model.into_thrift()
-
-            # Perform the transfer - inventory.py function mutates both Thrift inventories
-            logger.debug(
-                f"Calling transfer_item() with quantity={transfer_data.quantity}"
-            )
-            logger.debug(
-                f"Source has {len(thrift_source_inv.entries)} entries, destination has {len(thrift_dest_inv.entries)} entries"
-            )
-            transfer_results = transfer_item(
-                thrift_source_inv,
-                thrift_dest_inv,
-                thrift_item,
-                transfer_data.quantity,
-            )
+                if not is_ok(transfer_results):
+                    connection.rollback()
+                    logger.warning(
+                        f"Transfer failed: {transfer_results[0].message if transfer_results else 'unknown'}"
+                    )
+                    return InventoryResponse(
+                        results=transfer_results,
+                        response_data=None,
+                    )
 
-            if not is_ok(transfer_results):
-                logger.warning(
-                    f"Transfer failed: {transfer_results[0].message if transfer_results else 'unknown'}"
-                )
-                return InventoryResponse(
-                    results=transfer_results,
-                    response_data=None,
+                logger.debug(
+                    f"Transfer successful. Source now has {len(thrift_source_inv.entries)} entries, destination has {len(thrift_dest_inv.entries)} entries"
                 )
 
-            logger.debug(
-                f"Transfer successful. Source now has {len(thrift_source_inv.entries)} entries, destination has {len(thrift_dest_inv.entries)} entries"
-            )
-
-            # Convert modified Thrift objects back to models and save both
-            logger.debug("Saving both inventories to database...")
-            source_model.from_thrift(thrift_source_inv)
-            dest_model.from_thrift(thrift_dest_inv)
-
-            source_model.save()
-            dest_model.save()
+                # Convert modified Thrift objects back to models and save both
+                logger.debug("Saving both inventories to database...")
+                previous_volumes = [
+                    source_model.get_last_calculated_volume() or 0.0,
+                    dest_model.get_last_calculated_volume() or 0.0,
+                ]
+                source_model.from_thrift(thrift_source_inv)
+                dest_model.from_thrift(thrift_dest_inv)
+
+                source_model.save(connection=connection)
+                dest_model.save(connection=connection)
+                # Each inventory's volume change reaches its ancestors; a moved
+                # container's subtree leaves one chain and joins the other
+                for model, thrift_inventory, previous_volume, moved in (
+                    (source_model, thrift_source_inv, previous_volumes[0], -moved_volume),
+                    (dest_model, thrift_dest_inv, previous_volumes[1], moved_volume),
+                ):
+                    if is_nested(model) or moved:
+                        add_to_ancestors(
+                            cursor,
+                            model.get_id(),
+                            (model.get_last_calculated_volume() or 0.0) - previous_volume + moved,
+                            own_delta=moved,
+                        )
+                    model.set_contained_volume(thrift_inventory.contained_volume)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+                connection.close()
+            self.load_flight.forget(source_id)
+            self.load_flight.forget(dest_id)
+            self.publish_invalidation(TOPIC_INVENTORY, source_id)
+            self.publish_invalidation(TOPIC_INVENTORY, dest_id)
 
             logger.info(
                 f"SUCCESS: Transfer completed from inventory_id={source_id} to inventory_id={dest_id}"
@@ -587,11 +739,16 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
                 )
                 rows = cursor.fetchall()
 
-                # Convert to models then to Thrift
-                thrift_inventories = []
+                # Convert to models, load every page's entries at once, then to Thrift
+                inventories = []
                 for row in rows:
                     inventory = Inventory()
                     inventory._data = row
+                    inventories.append(inventory)
+                Inventory.preload_inventory_entries(inventories)
+
+                thrift_inventories = []
+                for inventory in inventories:
                     _, thrift_inv = inventory.into_thrift()
                     if thrift_inv:
                         thrift_inventories.append(thrift_inv)
@@ -632,3 +789,839 @@ class InventoryServiceHandler(BaseServiceHandler, InventoryServiceIface):
                 ],
                 response_data=None,
             )
+
+    def load_many(self, request: InventoryRequest) -> InventoryResponse:
+        """Load many inventories by ID with a single query."""
+        logger.info("=== LOAD_MANY inventory request ===")
+        try:
+            if not request.data.load_many_inventories:
+                logger.error("Request data missing load_many_inventories field")
+                return InventoryResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="Request data must contain load_many_inventories",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            inventory_ids = list(
+                dict.fromkeys(request.data.load_many_inventories.inventory_ids or [])
+            )
+            if len(inventory_ids) > LOAD_MANY_MAX_IDS:
+                logger.error(f"Too many ids requested: {len(inventory_ids)}")
+                return InventoryResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message=f"Cannot load more than {LOAD_MANY_MAX_IDS} inventories at once",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            logger.info(f"Loading {len(inventory_ids)} inventories")
+
+            inventories = {}
+            errors = {}
+            known_missing = set(self.missing.missing_of(inventory_ids))
+            queried_ids = [
+                inventory_id for inventory_id in inventory_ids if inventory_id not in known_missing
+            ]
+            found = Inventory.find_many(queried_ids)
+            Inventory.preload_inventory_entries(found)
+            for inventory in found:
+                conversion_results, thrift_inventory = inventory.into_thrift()
+                if thrift_inventory:
+                    inventories[inventory.get_id()] = thrift_inventory
+                else:
+                    errors[inventory.get_id()] = conversion_results[0]
+
+            for inventory_id in queried_ids:
+                if inventory_id not in inventories and inventory_id not in errors:
+                    self.missing.remember(inventory_id)
+
+            for inventory_id in inventory_ids:
+                if inventory_id not in inventories and inventory_id not in errors:
+                    errors[inventory_id] = GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Inventory {inventory_id} not found",
+                        error_code=GameError.DB_RECORD_NOT_FOUND,
+                    )
+
+            logger.info(
+                f"SUCCESS: Loaded {len(inventories)} of {len(inventory_ids)} inventories"
+            )
+            response_data = InventoryResponseData(
+                load_many_inventories=LoadManyInventoriesResponseData(
+                    inventories=inventories,
+                    errors=errors,
+                ),
+            )
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Loaded {len(inventories)} of {len(inventory_ids)} inventories",
+                    ),
+                ],
+                response_data=response_data,
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in load_many: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to load inventories: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    # ------------------------------------------------------------------
+    # Owner-scoped aggregates
+    #
+    # These answer questions about everything an owner holds with one
+    # aggregate query over inventories joined to inventory_entries, using the
+    # (owner_type, owner_id) index, instead of loading every inventory and
+    # scanning its entries.
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _owner_key(owner) -> Optional[Tuple[str, int]]:
+        """Returns the (owner_type, owner_id) stored on inventories for a Thrift Owner."""
+        if owner is None:
+            return None
+        for owner_type in ("mobile", "item", "asset", "player"):
+            owner_id = getattr(owner, f"{owner_type}_id")
+            if owner_id is not None:
+                return owner_type, owner_id
+        return None
+
+    @staticmethod
+    def _query_owner(sql: str, params: tuple) -> List[dict]:
+        """Run one owner-scoped aggregate query and return its rows."""
+        connection = Inventory._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+
+    def _owner_quantities(self, owner_key: Tuple[str, int], item_ids: List[int] = ()) -> Dict[int, float]:
+        """Total quantity per item id held by an owner, optionally only of item_ids."""
+        sql = (
+            "SELECT e.item_id, SUM(e.quantity) AS quantity"
+            " FROM inventories i"
+            " JOIN inventory_entries e ON e.inventory_id = i.id"
+            " WHERE i.owner_type = %s AND i.owner_id = %s"
+        )
+        params = owner_key
+        if item_ids:
+            sql += f" AND e.item_id IN ({', '.join(['%s'] * len(item_ids))})"
+            params += tuple(item_ids)
+        sql += " GROUP BY e.item_id"
+
+        return {
+            row["item_id"]: float(row["quantity"])
+            for row in self._query_owner(sql, params)
+        }
+
+    @staticmethod
+    def _save_inventory(inventory: Inventory) -> None:
+        """
+        Save an inventory. A nested one passes its volume change on to the
+        containers it is held in, in the same transaction.
+        """
+        if not is_nested(inventory):
+            inventory.save()
+            return
+        connection = Inventory._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            connection.start_transaction()
+            previous_volume = 0.0
+            if inventory.get_id() is not None:
+                cursor.execute(
+                    "SELECT last_calculated_volume FROM inventories WHERE id = %s FOR UPDATE",
+                    (inventory.get_id(),),
+                )
+                row = cursor.fetchone()
+                if row is not None:
+                    previous_volume = row["last_calculated_volume"] or 0.0
+            inventory.save(connection=connection)
+            add_to_ancestors(
+                cursor,
+                inventory.get_id(),
+                (inventory.get_last_calculated_volume() or 0.0) - previous_volume,
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+
+    @staticmethod
+    def _invalid_request(message: str) -> InventoryResponse:
+        """Failure response for a request missing required data."""
+        return InventoryResponse(
+            results=[
+                GameResult(
+                    status=StatusType.FAILURE,
+                    message=message,
+                    error_code=GameError.DB_INVALID_DATA,
+                ),
+            ],
+            response_data=None,
+        )
+
+    def owner_item_totals(self, request: InventoryRequest) -> InventoryResponse:
+        """Total quantity per item across every inventory of an owner."""
+        logger.info("=== OWNER_ITEM_TOTALS request ===")
+        try:
+            totals_data = request.data.owner_item_totals
+            if not totals_data:
+                logger.error("Request data missing owner_item_totals field")
+                return self._invalid_request("Request data must contain owner_item_totals")
+
+            owner_key = self._owner_key(totals_data.owner)
+            if owner_key is None:
+                logger.error("Request has no owner")
+                return self._invalid_request("owner_item_totals requires an owner")
+
+            item_ids = list(dict.fromkeys(totals_data.item_ids or []))
+            if len(item_ids) > LOAD_MANY_MAX_IDS:
+                logger.error(f"Too many ids requested: {len(item_ids)}")
+                return self._invalid_request(
+                    f"Cannot total more than {LOAD_MANY_MAX_IDS} items at once"
+                )
+
+            logger.info(f"Totalling items for owner {owner_key[0]}={owner_key[1]}")
+
+            quantities = self._owner_quantities(owner_key, item_ids)
+
+            logger.info(f"SUCCESS: Owner holds {len(quantities)} distinct items")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Owner holds {len(quantities)} distinct items",
+                    ),
+                ],
+                response_data=InventoryResponseData(
+                    owner_item_totals=OwnerItemTotalsResponseData(quantities=quantities),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in owner_item_totals: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to total owner items: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def owner_capacity(self, request: InventoryRequest) -> InventoryResponse:
+        """Used and free entries and volume of every inventory of an owner."""
+        logger.info("=== OWNER_CAPACITY request ===")
+        try:
+            capacity_data = request.data.owner_capacity
+            if not capacity_data:
+                logger.error("Request data missing owner_capacity field")
+                return self._invalid_request("Request data must contain owner_capacity")
+
+            owner_key = self._owner_key(capacity_data.owner)
+            if owner_key is None:
+                logger.error("Request has no owner")
+                return self._invalid_request("owner_capacity requires an owner")
+
+            logger.info(f"Reading capacity for owner {owner_key[0]}={owner_key[1]}")
+
+            rows = self._query_owner(
+                "SELECT i.id, i.max_entries, i.max_volume, i.last_calculated_volume, i.contained_volume,"
+                " COUNT(e.id) AS used_entries"
+                " FROM inventories i"
+                " LEFT JOIN inventory_entries e ON e.inventory_id = i.id"
+                " WHERE i.owner_type = %s AND i.owner_id = %s"
+                " GROUP BY i.id"
+                " ORDER BY i.id",
+                owner_key,
+            )
+            capacities = [
+                InventoryCapacity(
+                    inventory_id=row["id"],
+                    used_entries=row["used_entries"],
+                    free_entries=max(0, row["max_entries"] - row["used_entries"]),
+                    free_volume=max(
+                        0.0,
+                        row["max_volume"] - (row["last_calculated_volume"] or 0.0) - (row["contained_volume"] or 0.0),
+                    ),
+                )
+                for row in rows
+            ]
+
+            logger.info(f"SUCCESS: Owner has {len(capacities)} inventories")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Owner has {len(capacities)} inventories",
+                    ),
+                ],
+                response_data=InventoryResponseData(
+                    owner_capacity=OwnerCapacityResponseData(inventories=capacities),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in owner_capacity: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to read owner capacity: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def owner_has_items(self, request: InventoryRequest) -> InventoryResponse:
+        """Whether items are present in any inventory of an owner."""
+        logger.info("=== OWNER_HAS_ITEMS request ===")
+        try:
+            has_items_data = request.data.owner_has_items
+            if not has_items_data:
+                logger.error("Request data missing owner_has_items field")
+                return self._invalid_request("Request data must contain owner_has_items")
+
+            owner_key = self._owner_key(has_items_data.owner)
+            if owner_key is None:
+                logger.error("Request has no owner")
+                return self._invalid_request("owner_has_items requires an owner")
+
+            item_ids = list(dict.fromkeys(has_items_data.item_ids or []))
+            if len(item_ids) > LOAD_MANY_MAX_IDS:
+                logger.error(f"Too many ids requested: {len(item_ids)}")
+                return self._invalid_request(
+                    f"Cannot check more than {LOAD_MANY_MAX_IDS} items at once"
+                )
+
+            logger.info(
+                f"Checking {len(item_ids)} items for owner {owner_key[0]}={owner_key[1]}"
+            )
+
+            found = set()
+            if item_ids:
+                rows = self._query_owner(
+                    "SELECT DISTINCT e.item_id"
+                    " FROM inventories i"
+                    " JOIN inventory_entries e ON e.inventory_id = i.id"
+                    " WHERE i.owner_type = %s AND i.owner_id = %s"
+                    f" AND e.item_id IN ({', '.join(['%s'] * len(item_ids))})"
+                    " AND e.quantity > 0",
+                    owner_key + tuple(item_ids),
+                )
+                found = {row["item_id"] for row in rows}
+            present = {item_id: item_id in found for item_id in item_ids}
+
+            logger.info(f"SUCCESS: {len(found)} of {len(item_ids)} items present")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"{len(found)} of {len(item_ids)} items present",
+                    ),
+                ],
+                response_data=InventoryResponseData(
+                    owner_has_items=OwnerHasItemsResponseData(present=present),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in owner_has_items: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to check owner items: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def load_container_tree(self, request: InventoryRequest) -> InventoryResponse:
+        """
+        Load an inventory and every inventory nested in the containers it holds,
+        with one recursive query for the tree and one for all of the entries.
+        """
+        logger.info("=== LOAD_CONTAINER_TREE request ===")
+        try:
+            tree_data = request.data.load_container_tree
+            if not tree_data:
+                logger.error("Request data missing load_container_tree field")
+                return self._invalid_request("Request data must contain load_container_tree")
+
+            inventory_id = tree_data.inventory_id
+            max_depth = CONTAINER_TREE_MAX_DEPTH
+            if tree_data.max_depth is not None:
+                max_depth = max(0, min(tree_data.max_depth, CONTAINER_TREE_MAX_DEPTH))
+            logger.info(f"Loading container tree of inventory_id={inventory_id}, max_depth={max_depth}")
+
+            nodes = [] if self.missing.is_missing(inventory_id) else load_container_tree(inventory_id, max_depth)
+            if not nodes:
+                self.missing.remember(inventory_id)
+                logger.warning(f"Inventory_id={inventory_id} not found")
+                return InventoryResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message=f"Inventory {inventory_id} not found",
+                            error_code=GameError.DB_RECORD_NOT_FOUND,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            if tree_data.rebuild:
+                updated = rebuild_contained_volume(nodes)
+                logger.info(f"Rebuilt contained volume of {updated} inventories")
+
+            Inventory.preload_inventory_entries([node.inventory for node in nodes])
+            thrift_nodes = []
+            for node in nodes:
+                results, thrift_inventory = node.inventory.into_thrift()
+                if thrift_inventory is None:
+                    return InventoryResponse(results=results, response_data=None)
+                thrift_nodes.append(
+                    ThriftContainerNode(
+                        inventory=thrift_inventory,
+                        parent_inventory_id=node.parent_id,
+                        depth=node.depth,
+                        contained_volume=node.contained_volume,
+                        total_volume=node.total_volume,
+                    )
+                )
+
+            logger.info(f"SUCCESS: Loaded {len(thrift_nodes)} inventories in the container tree")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Loaded {len(thrift_nodes)} inventories in the container tree",
+                    ),
+                ],
+                response_data=InventoryResponseData(
+                    load_container_tree=LoadContainerTreeResponseData(nodes=thrift_nodes),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in load_container_tree: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to load container tree: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def _crafting_matrix(self) -> CraftingMatrix:
+        """The requirement matrix of the current catalog, rebuilt when the catalog changes."""
+        if self.catalog is None:
+            return load_crafting_matrix()
+        snapshot = self.catalog.snapshot()
+        crafting = self._crafting
+        if crafting is None or crafting[0] is not snapshot:
+            crafting = (snapshot, CraftingMatrix.from_catalog(snapshot))
+            self._crafting = crafting
+        return crafting[1]
+
+    def owner_craftable(self, request: InventoryRequest) -> InventoryResponse:
+        """Which items an owner can craft from the materials it holds, and how many."""
+        logger.info("=== OWNER_CRAFTABLE request ===")
+        try:
+            craftable_data = request.data.owner_craftable
+            if not craftable_data:
+                logger.error("Request data missing owner_craftable field")
+                return self._invalid_request("Request data must contain owner_craftable")
+
+            owner_key = self._owner_key(craftable_data.owner)
+            if owner_key is None:
+                logger.error("Request has no owner")
+                return self._invalid_request("owner_craftable requires an owner")
+
+            item_ids = list(dict.fromkeys(craftable_data.item_ids or []))
+            if len(item_ids) > LOAD_MANY_MAX_IDS:
+                logger.error(f"Too many ids requested: {len(item_ids)}")
+                return self._invalid_request(
+                    f"Cannot check more than {LOAD_MANY_MAX_IDS} items at once"
+                )
+
+            logger.info(f"Checking craftable items for owner {owner_key[0]}={owner_key[1]}")
+
+            matrix = self._crafting_matrix()
+            craftable = matrix.craftable(
+                self._owner_quantities(owner_key),
+                item_ids or None,
+            )
+
+            logger.info(f"SUCCESS: Owner can craft {len(craftable)} of {len(matrix)} blueprints")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Owner can craft {len(craftable)} items",
+                    ),
+                ],
+                response_data=InventoryResponseData(
+                    owner_craftable=OwnerCraftableResponseData(craftable=craftable),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in owner_craftable: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to check craftable items: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def start_crafting(self, request: InventoryRequest) -> InventoryResponse:
+        """Queue a crafting job that turns an inventory's components into an item."""
+        logger.info("=== START_CRAFTING request ===")
+        try:
+            start_data = request.data.start_crafting
+            if not start_data:
+                logger.error("Request data missing start_crafting field")
+                return self._invalid_request("Request data must contain start_crafting")
+
+            logger.info(
+                f"Crafting {start_data.quantity} of item_id={start_data.item_id} "
+                f"in inventory_id={start_data.inventory_id}"
+            )
+            results, job = self.crafting.start_job(
+                start_data.inventory_id,
+                start_data.item_id,
+                start_data.quantity,
+            )
+            if job is None:
+                logger.warning(f"Crafting not started: {results[0].message if results else ''}")
+                return InventoryResponse(results=results, response_data=None)
+
+            logger.info(f"SUCCESS: Crafting job {job.id} ready at {job.ready_at_ms}")
+            return InventoryResponse(
+                results=results,
+                response_data=InventoryResponseData(
+                    start_crafting=StartCraftingResponseData(job=job),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in start_crafting: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to start crafting: {str(e)}",
+                        error_code=GameError.DB_INSERT_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def cancel_crafting(self, request: InventoryRequest) -> InventoryResponse:
+        """Cancel a pending crafting job; its inputs were never taken."""
+        logger.info("=== CANCEL_CRAFTING request ===")
+        try:
+            cancel_data = request.data.cancel_crafting
+            if not cancel_data:
+                logger.error("Request data missing cancel_crafting field")
+                return self._invalid_request("Request data must contain cancel_crafting")
+
+            logger.info(f"Cancelling crafting job {cancel_data.job_id}")
+            cancelled = self.crafting.cancel_job(cancel_data.job_id)
+
+            message = (
+                f"Crafting job {cancel_data.job_id} cancelled"
+                if cancelled
+                else f"Crafting job {cancel_data.job_id} is not pending"
+            )
+            logger.info(f"SUCCESS: {message}")
+            return InventoryResponse(
+                results=[
+                    GameResult(status=StatusType.SUCCESS, message=message),
+                ],
+                response_data=InventoryResponseData(
+                    cancel_crafting=CancelCraftingResponseData(
+                        job_id=cancel_data.job_id,
+                        cancelled=cancelled,
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in cancel_crafting: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to cancel crafting: {str(e)}",
+                        error_code=GameError.DB_UPDATE_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def list_crafting_jobs(self, request: InventoryRequest) -> InventoryResponse:
+        """List the crafting jobs of an inventory, soonest first."""
+        logger.info("=== LIST_CRAFTING_JOBS request ===")
+        try:
+            list_data = request.data.list_crafting_jobs
+            if not list_data:
+                logger.error("Request data missing list_crafting_jobs field")
+                return self._invalid_request("Request data must contain list_crafting_jobs")
+
+            pending_only = list_data.pending_only is not False
+            logger.info(f"Listing crafting jobs of inventory_id={list_data.inventory_id}, pending_only={pending_only}")
+            jobs = self.crafting.list_jobs(list_data.inventory_id, pending_only)
+
+            logger.info(f"SUCCESS: Found {len(jobs)} crafting jobs")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Found {len(jobs)} crafting jobs",
+                    ),
+                ],
+                response_data=InventoryResponseData(
+                    list_crafting_jobs=ListCraftingJobsResponseData(jobs=jobs),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in list_crafting_jobs: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to list crafting jobs: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def _blueprint_snapshot(self, item_ids):
+        """The catalog to break items down with, or their blueprint trees loaded without one."""
+        if self.catalog is not None:
+            return self.catalog.snapshot()
+        return load_blueprint_snapshot(item_ids)
+
+    def breakdown_item(self, request: InventoryRequest) -> InventoryResponse:
+        """Recycle units of an item in an inventory into its blueprint components."""
+        logger.info("=== BREAKDOWN_ITEM request ===")
+        try:
+            breakdown_data = request.data.breakdown_item
+            if not breakdown_data:
+                logger.error("Request data missing breakdown_item field")
+                return self._invalid_request("Request data must contain breakdown_item")
+
+            logger.info(
+                f"Breaking down {breakdown_data.quantity} of item_id={breakdown_data.item_id} "
+                f"in inventory_id={breakdown_data.inventory_id}, "
+                f"to_raw_materials={bool(breakdown_data.to_raw_materials)}"
+            )
+            results, inventory, produced = breakdown_in_inventory(
+                breakdown_data.inventory_id,
+                breakdown_data.item_id,
+                breakdown_data.quantity,
+                self._blueprint_snapshot,
+                bool(breakdown_data.to_raw_materials),
+            )
+            if inventory is None:
+                logger.warning(f"Breakdown failed: {results[0].message if results else ''}")
+                return InventoryResponse(results=results, response_data=None)
+
+            self._on_inventory_written(inventory.id)
+            logger.info(f"SUCCESS: Broke item_id={breakdown_data.item_id} down into {len(produced)} items")
+            return InventoryResponse(
+                results=results,
+                response_data=InventoryResponseData(
+                    breakdown_item=BreakdownItemResponseData(
+                        inventory=inventory,
+                        produced=produced,
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in breakdown_item: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to break down item: {str(e)}",
+                        error_code=GameError.DB_UPDATE_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def salvage_containers(self, request: InventoryRequest) -> InventoryResponse:
+        """Recycle everything with a blueprint in many inventories, in one transaction."""
+        logger.info("=== SALVAGE_CONTAINERS request ===")
+        try:
+            salvage_data = request.data.salvage_containers
+            if not salvage_data:
+                logger.error("Request data missing salvage_containers field")
+                return self._invalid_request("Request data must contain salvage_containers")
+
+            inventory_ids = list(dict.fromkeys(salvage_data.inventory_ids or []))
+            if not inventory_ids:
+                return self._invalid_request("salvage_containers requires inventory_ids")
+            if len(inventory_ids) > LOAD_MANY_MAX_IDS:
+                logger.error(f"Too many ids requested: {len(inventory_ids)}")
+                return self._invalid_request(
+                    f"Cannot salvage more than {LOAD_MANY_MAX_IDS} inventories at once"
+                )
+
+            logger.info(
+                f"Salvaging {len(inventory_ids)} inventories, "
+                f"to_raw_materials={bool(salvage_data.to_raw_materials)}"
+            )
+            results, inventories, consumed, produced = salvage_inventories(
+                inventory_ids,
+                self._blueprint_snapshot,
+                bool(salvage_data.to_raw_materials),
+            )
+            if not inventories:
+                logger.warning(f"Salvage failed: {results[0].message if results else ''}")
+                return InventoryResponse(results=results, response_data=None)
+
+            for inventory in inventories:
+                self._on_inventory_written(inventory.id)
+            logger.info(f"SUCCESS: Salvaged {len(consumed)} items into {len(produced)} items")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Salvaged {len(consumed)} items in {len(inventories)} inventories",
+                    ),
+                ],
+                response_data=InventoryResponseData(
+                    salvage_containers=SalvageContainersResponseData(
+                        inventories=inventories,
+                        consumed=consumed,
+                        produced=produced,
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in salvage_containers: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to salvage inventories: {str(e)}",
+                        error_code=GameError.DB_UPDATE_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def set_item_attributes(self, request: InventoryRequest) -> InventoryResponse:
+        """Change an item's attributes, copying its template into mobile_items only when they diverge."""
+        logger.info("=== SET_ITEM_ATTRIBUTES request ===")
+        try:
+            attributes_data = request.data.set_item_attributes
+            if not attributes_data:
+                logger.error("Request data missing set_item_attributes field")
+                return self._invalid_request("Request data must contain set_item_attributes")
+            if not attributes_data.attributes or any(
+                attribute.attribute_type is None for attribute in attributes_data.attributes
+            ):
+                return self._invalid_request("set_item_attributes requires attributes with an attribute_type")
+
+            if self.catalog is not None:
+                template = self.catalog.snapshot().get(attributes_data.item_id)
+            else:
+                template = load_items([attributes_data.item_id]).get(attributes_data.item_id)
+            if template is None:
+                logger.warning(f"Item not found: item_id={attributes_data.item_id}")
+                return InventoryResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message=f"Item {attributes_data.item_id} not found",
+                            error_code=GameError.DB_RECORD_NOT_FOUND,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            logger.info(
+                f"Setting {len(attributes_data.attributes)} attributes of item_id={attributes_data.item_id} "
+                f"in inventory_id={attributes_data.inventory_id}, mobile_item_id={attributes_data.mobile_item_id}"
+            )
+            results, mobile_item_id, materialized = set_item_attributes(
+                attributes_data.inventory_id,
+                template,
+                attributes_data.attributes,
+                attributes_data.mobile_item_id,
+                attributes_data.quantity,
+            )
+            if not is_ok(results):
+                logger.warning(f"Attributes not set: {results[0].message}")
+                return InventoryResponse(results=results, response_data=None)
+
+            if materialized:
+                self._on_inventory_written(attributes_data.inventory_id)
+            logger.info(f"SUCCESS: mobile_item_id={mobile_item_id}, materialized={materialized}")
+            return InventoryResponse(
+                results=results,
+                response_data=InventoryResponseData(
+                    set_item_attributes=SetItemAttributesResponseData(
+                        mobile_item_id=mobile_item_id,
+                        materialized=materialized,
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in set_item_attributes: {type(e).__name__}: {str(e)}")
+            return InventoryResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to set item attributes: {str(e)}",
+                        error_code=GameError.DB_UPDATE_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
@@ -0,0 +1,526 @@
+"""
+Versioned in-memory catalog of item templates.
+
+Item templates (items, their attributes and blueprints) are read far more
+often than they are written. ItemCatalog loads the whole template set once,
+indexes it, and serves reads from an immutable CatalogSnapshot. Writers build
+a new snapshot and swap it in with a single assignment, so readers never take
+a lock and always see one consistent version.
+
+Thrift objects held by a snapshot are shared between requests and must be
+treated as read-only; copy them before changing anything.
+"""
+
+import bisect
+import copy
+import logging
+import threading
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from game.ttypes import (
+    Item as ThriftItem,
+    ItemBlueprint as ThriftItemBlueprint,
+    ItemBlueprintComponent as ThriftItemBlueprintComponent,
+)
+from db_models.models import Item
+from common import wants_attributes
+from services.bill_of_materials import BillOfMaterials, build_boms, dependents_by_depth, dependents_closure
+from services.shared_catalog import write_catalog
+
+logger = logging.getLogger(__name__)
+
+# Deepest blueprint nesting followed when walking dependents; also stops cycles
+DEPENDENTS_MAX_DEPTH = 32
+
+# Seconds a write waits before the shared catalog file is rewritten, so a
+# burst of writes is published once
+PUBLISH_DELAY_SECONDS = 0.25
+
+# Items whose blueprints use the items already found. UNION rather than
+# UNION ALL keeps one row per item and depth however many paths lead there.
+_DEPENDENTS_SQL = """
+    WITH RECURSIVE dependents (item_id, depth) AS (
+        SELECT id, 0
+        FROM items
+        WHERE id = %s
+        UNION
+        SELECT i.id, dependents.depth + 1
+        FROM dependents
+        JOIN item_blueprint_components c ON c.component_item_id = dependents.item_id
+        JOIN items i ON i.blueprint_id = c.item_blueprint_id
+        WHERE dependents.depth < %s
+    )
+    SELECT item_id, MIN(depth) AS depth
+    FROM dependents
+    GROUP BY item_id
+"""
+
+
+
+def _sort_key(item: ThriftItem) -> Tuple[str, int]:
+    """Case-insensitive like the table's collation, so pages match ORDER BY internal_name."""
+    return item.internal_name.casefold(), item.id
+
+
+class CatalogSnapshot:
+    """
+    Immutable, indexed view of every item template at one catalog version.
+
+    Indexes:
+        items_by_id: item id -> Thrift Item (with attributes and blueprint)
+        ids_by_name: internal_name -> item id
+        ids_by_type: ItemType -> item ids ordered by internal_name
+        used_in: component item id -> ids of items whose blueprint uses it, ordered by internal_name
+        boms: item id -> flattened BillOfMaterials, for items with blueprint components
+
+    When previous is given, its indexes are updated for the changed items
+    only, and only the BOMs of the changed items and of the items using them
+    are recomputed; the rest are carried over from previous.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        items: Dict[int, ThriftItem],
+        previous: Optional["CatalogSnapshot"] = None,
+        changed: Iterable[int] = (),
+    ):
+        self.version = version
+        self.items_by_id: Mapping[int, ThriftItem] = MappingProxyType(dict(items))
+
+        if previous is None:
+            self._index_all()
+            boms: Dict[int, BillOfMaterials] = {}
+            build_boms(self.items_by_id, self.components_of, self.bake_time_of, boms)
+        else:
+            changed = set(changed)
+            self._index_changed(previous, changed)
+            stale = dependents_closure(changed, lambda item_id: self.used_in.get(item_id, ()))
+            boms = dict(previous.boms)
+            for item_id in stale:
+                boms.pop(item_id, None)
+            build_boms(
+                [item_id for item_id in stale if item_id in self.items_by_id],
+                self.components_of,
+                self.bake_time_of,
+                boms,
+            )
+        self.boms: Mapping[int, BillOfMaterials] = MappingProxyType(boms)
+
+    def _index_all(self) -> None:
+        """Build every index from items_by_id."""
+        ordered = sorted(self.items_by_id.values(), key=_sort_key)
+        self._order: List[Tuple[str, int]] = [_sort_key(item) for item in ordered]
+        self.ids_by_name: Mapping[str, int] = MappingProxyType(
+            {item.internal_name: item.id for item in ordered}
+        )
+
+        by_type: Dict[int, List[int]] = {}
+        used_in: Dict[int, List[int]] = {}
+        for item in ordered:
+            by_type.setdefault(item.item_type, []).append(item.id)
+            if item.blueprint and item.blueprint.components:
+                for component_item_id in item.blueprint.components:
+                    used_in.setdefault(component_item_id, []).append(item.id)
+        self.ids_by_type: Mapping[int, Tuple[int, ...]] = MappingProxyType(
+            {item_type: tuple(ids) for item_type, ids in by_type.items()}
+        )
+        self.used_in: Mapping[int, Tuple[int, ...]] = MappingProxyType(
+            {item_id: tuple(ids) for item_id, ids in used_in.items()}
+        )
+
+    def _index_changed(self, previous: "CatalogSnapshot", changed: Iterable[int]) -> None:
+        """Copy previous's indexes, moving only the changed items' entries."""
+        order = list(previous._order)
+        ids_by_name = dict(previous.ids_by_name)
+        ids_by_type = dict(previous.ids_by_type)
+        used_in = dict(previous.used_in)
+        # Entries being changed, as lists copied from previous on first touch
+        touched_types: Dict[int, List[int]] = {}
+        touched_used_in: Dict[int, List[int]] = {}
+
+        def key_of(item_id: int) -> Tuple[str, int]:
+            return _sort_key(self.items_by_id[item_id])
+
+        def touch(touched: Dict[int, List[int]], index: Dict[int, Tuple[int, ...]], key: int) -> List[int]:
+            if key not in touched:
+                touched[key] = list(index.get(key, ()))
+            return touched[key]
+
+        def components(item: Optional[ThriftItem]) -> Iterable[int]:
+            if item is None or item.blueprint is None:
+                return ()
+            return item.blueprint.components or ()
+
+        for item_id in changed:
+            old = previous.items_by_id.get(item_id)
+            new = self.items_by_id.get(item_id)
+            if old is not None:
+                del order[bisect.bisect_left(order, _sort_key(old))]
+                if ids_by_name.get(old.internal_name) == item_id:
+                    del ids_by_name[old.internal_name]
+                touch(touched_types, ids_by_type, old.item_type).remove(item_id)
+                for component_item_id in components(old):
+                    touch(touched_used_in, used_in, component_item_id).remove(item_id)
+            if new is not None:
+                bisect.insort(order, _sort_key(new))
+                ids_by_name[new.internal_name] = item_id
+                bisect.insort(touch(touched_types, ids_by_type, new.item_type), item_id, key=key_of)
+                for component_item_id in components(new):
+                    bisect.insort(touch(touched_used_in, used_in, component_item_id), item_id, key=key_of)
+
+        for index, touched in ((ids_by_type, touched_types), (used_in, touched_used_in)):
+            for key, ids in touched.items():
+                if ids:
+                    index[key] = tuple(ids)
+                else:
+                    index.pop(key, None)
+
+        self._order = order
+        self.ids_by_name = MappingProxyType(ids_by_name)
+        self.ids_by_type = MappingProxyType(ids_by_type)
+        self.used_in = MappingProxyType(used_in)
+
+    def __len__(self) -> int:
+        return len(self.items_by_id)
+
+    def get(self, item_id: int) -> Optional[ThriftItem]:
+        """Returns the shared Thrift item for item_id, or None."""
+        return self.items_by_id.get(item_id)
+
+    def find_by_name(self, internal_name: str) -> Optional[ThriftItem]:
+        """Returns the item with exactly this internal_name, or None."""
+        item_id = self.ids_by_name.get(internal_name)
+        return self.items_by_id.get(item_id) if item_id is not None else None
+
+    def item_ids(self) -> List[int]:
+        """Returns every item id in ascending order."""
+        return sorted(self.items_by_id)
+
+    def components_of(self, item_id: int) -> Dict[int, ThriftItemBlueprintComponent]:
+        """Returns the blueprint components of item_id, keyed by component item id."""
+        item = self.items_by_id.get(item_id)
+        if item is None or item.blueprint is None:
+            return {}
+        return item.blueprint.components or {}
+
+    def dependents(self, item_id: int, max_depth: Optional[int] = None) -> Tuple[Dict[int, int], bool]:
+        """
+        Returns the items whose blueprints use item_id, directly or through
+        other blueprints, as (item id -> depth, truncated).
+        """
+        return dependents_by_depth([item_id], lambda dependent_id: self.used_in.get(dependent_id, ()), max_depth)
+
+    def bake_time_of(self, item_id: int) -> int:
+        """Returns the bake time of item_id's own blueprint, 0 without one."""
+        item = self.items_by_id.get(item_id)
+        if item is None or item.blueprint is None:
+            return 0
+        return item.blueprint.bake_time_ms or 0
+
+    def bom(self, item_id: int) -> Optional[BillOfMaterials]:
+        """Returns the flattened bill of materials of item_id, or None for an unknown item."""
+        bom = self.boms.get(item_id)
+        if bom is None and item_id in self.items_by_id:
+            bom = BillOfMaterials.raw(item_id, self.bake_time_of(item_id))
+        return bom
+
+    def search(self, search_string: Optional[str] = None) -> List[int]:
+        """
+        Returns the ids of items whose internal_name contains search_string
+        (case-insensitive, like the LIKE queries it replaces), ordered by name.
+        """
+        if not search_string:
+            return [item_id for _, item_id in self._order]
+        needle = search_string.casefold()
+        return [item_id for name, item_id in self._order if needle in name]
+
+
+def project_item(item: ThriftItem, projection) -> ThriftItem:
+    """
+    Apply a request Projection to a shared catalog item.
+
+    Returns the item itself when nothing is projected out, otherwise a
+    shallow copy with the attribute map trimmed.
+    """
+    if projection is None:
+        return item
+    if not wants_attributes(projection):
+        projected = copy.copy(item)
+        projected.attributes = None
+        return projected
+    if projection.attribute_types:
+        wanted = set(projection.attribute_types)
+        projected = copy.copy(item)
+        projected.attributes = {
+            attribute_type: attribute
+            for attribute_type, attribute in (item.attributes or {}).items()
+            if attribute_type in wanted
+        }
+        return projected
+    return item
+
+
+def load_items(item_ids: Optional[Iterable[int]] = None) -> Dict[int, ThriftItem]:
+    """
+    Load item templates with their attributes and blueprints in four queries.
+
+    Args:
+        item_ids: Ids to load, or None for every item
+
+    Returns:
+        Dict of item id -> Thrift Item; ids without a record are absent
+    """
+    if item_ids is None:
+        connection = Item._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            cursor.execute("SELECT * FROM items")
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+        item_models = []
+        for row in rows:
+            item = Item()
+            item._data = row
+            item._dirty = False
+            item_models.append(item)
+    else:
+        item_models = Item.find_many(list(item_ids))
+
+    if not item_models:
+        return {}
+
+    Item.preload_attributes(item_models)
+    blueprints = _load_blueprints(
+        [item.get_blueprint_id() for item in item_models if item.get_blueprint_id() is not None]
+    )
+
+    items = {}
+    for item in item_models:
+        results, thrift_item = item.into_thrift()
+        if thrift_item is None:
+            logger.warning(f"Skipping item id={item.get_id()}: {results[0].message}")
+            continue
+        thrift_item.blueprint = blueprints.get(item.get_blueprint_id())
+        items[thrift_item.id] = thrift_item
+    return items
+
+
+def load_blueprint_snapshot(item_ids: Iterable[int]) -> CatalogSnapshot:
+    """
+    A snapshot of item_ids and every item below them in their blueprint trees,
+    loaded one tree level per batch, for callers without a catalog.
+    """
+    items = {}
+    requested = set()
+    frontier = list(dict.fromkeys(item_ids))
+    while frontier:
+        requested.update(frontier)
+        loaded = load_items(frontier)
+        items.update(loaded)
+        frontier = list({
+            component_item_id
+            for item in loaded.values()
+            if item.blueprint and item.blueprint.components
+            for component_item_id in item.blueprint.components
+            if component_item_id not in requested
+        })
+    return CatalogSnapshot(0, items)
+
+
+def load_dependents(item_id: int, max_depth: int = DEPENDENTS_MAX_DEPTH) -> Optional[Tuple[Dict[int, int], bool]]:
+    """
+    CatalogSnapshot.dependents() without a catalog: the blueprint graph is
+    walked in the database with one query instead of one per step.
+    Returns None if item_id does not exist.
+    """
+    connection = Item._create_connection()
+    cursor = connection.cursor()
+    try:
+        # One step further than asked, to tell whether anything was cut off
+        cursor.execute(_DEPENDENTS_SQL, (item_id, max_depth + 1))
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+        connection.close()
+
+    if not rows:
+        return None
+    depths = {}
+    truncated = False
+    for dependent_id, depth in rows:
+        # The item itself, also when reached again through a blueprint cycle
+        if dependent_id == item_id:
+            continue
+        if depth > max_depth:
+            truncated = True
+        else:
+            depths[dependent_id] = depth
+    return depths, truncated
+
+
+def _load_blueprints(blueprint_ids: List[int]) -> Dict[int, ThriftItemBlueprint]:
+    """Load blueprints and their components with one query each."""
+    blueprint_ids = list(dict.fromkeys(blueprint_ids))
+    if not blueprint_ids:
+        return {}
+
+    connection = Item._create_connection()
+    cursor = connection.cursor(dictionary=True)
+    try:
+        placeholders = ", ".join(["%s"] * len(blueprint_ids))
+        cursor.execute(
+            f"SELECT * FROM item_blueprints WHERE id IN ({placeholders})",
+            tuple(blueprint_ids),
+        )
+        blueprint_rows = cursor.fetchall()
+        cursor.execute(
+            f"SELECT * FROM item_blueprint_components WHERE item_blueprint_id IN ({placeholders})",
+            tuple(blueprint_ids),
+        )
+        component_rows = cursor.fetchall()
+    finally:
+        cursor.close()
+        connection.close()
+
+    blueprints = {
+        row["id"]: ThriftItemBlueprint(
+            id=row["id"],
+            components={},
+            bake_time_ms=row["bake_time_ms"],
+        )
+        for row in blueprint_rows
+    }
+    for row in component_rows:
+        blueprint = blueprints.get(row["item_blueprint_id"])
+        if blueprint is not None:
+            blueprint.components[row["component_item_id"]] = ThriftItemBlueprintComponent(
+                ratio=row["ratio"],
+                item_id=row["component_item_id"],
+            )
+    return blueprints
+
+
+class ItemCatalog:
+    """
+    Holds the current CatalogSnapshot and replaces it on writes.
+
+    Readers call snapshot() and keep using the returned object for the whole
+    request. Writers are serialized by a lock, build the next snapshot from
+    the current one and publish it with a single reference swap.
+
+    With publish_path, snapshots are also written to the shared catalog file,
+    outside the write lock: a full load immediately, later writes
+    publish_delay seconds after the first of a burst, once for the whole
+    burst. flush() publishes a pending snapshot right away. Readers of the
+    file (SharedCatalogReader) therefore lag a write by up to publish_delay
+    plus their check interval, unless the writer flushes before announcing
+    the write on the invalidation bus, as ItemServiceHandler does.
+    """
+
+    def __init__(
+        self,
+        name: str = "item_catalog",
+        publish_path: Optional[str] = None,
+        publish_delay: float = PUBLISH_DELAY_SECONDS,
+    ):
+        self.name = name
+        self.publish_path = publish_path
+        self.publish_delay = publish_delay
+        self._write_lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        # Guards _publish_timer; _file_lock keeps file writes in version order
+        self._publish_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._publish_timer: Optional[threading.Timer] = None
+        self._published_version = 0
+
+    def is_loaded(self) -> bool:
+        return self._snapshot is not None
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Returns the current snapshot, loading the catalog on first use."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.load()
+        return snapshot
+
+    @property
+    def version(self) -> int:
+        snapshot = self._snapshot
+        return snapshot.version if snapshot is not None else 0
+
+    def load(self) -> CatalogSnapshot:
+        """Load every item template from the database and publish it."""
+        with self._write_lock:
+            items = load_items()
+            snapshot = CatalogSnapshot(self.version + 1, items)
+            self._publish(snapshot)
+        self.flush()
+        logger.info(f"{self.name}: loaded {len(snapshot)} items at version {snapshot.version}")
+        return snapshot
+
+    def refresh(self, item_ids: Iterable[int]) -> CatalogSnapshot:
+        """Reload the given items from the database; ids no longer present are dropped."""
+        item_ids = list(dict.fromkeys(item_ids))
+        with self._write_lock:
+            current = self._snapshot
+            if current is None:
+                items = load_items()
+            else:
+                items = dict(current.items_by_id)
+                loaded = load_items(item_ids)
+                for item_id in item_ids:
+                    if item_id in loaded:
+                        items[item_id] = loaded[item_id]
+                    else:
+                        items.pop(item_id, None)
+            snapshot = CatalogSnapshot(self.version + 1, items, current, item_ids)
+            self._publish(snapshot)
+        logger.debug(f"{self.name}: refreshed {item_ids} at version {snapshot.version}")
+        return snapshot
+
+    def remove(self, item_ids: Iterable[int]) -> CatalogSnapshot:
+        """Drop the given items without touching the database."""
+        item_ids = list(item_ids)
+        with self._write_lock:
+            current = self._snapshot
+            if current is None:
+                items = load_items()
+            else:
+                items = dict(current.items_by_id)
+            for item_id in item_ids:
+                items.pop(item_id, None)
+            snapshot = CatalogSnapshot(self.version + 1, items, current, item_ids)
+            self._publish(snapshot)
+        logger.debug(f"{self.name}: removed {item_ids} at version {snapshot.version}")
+        return snapshot
+
+    def flush(self) -> None:
+        """Write the current snapshot to publish_path now, unless it already is."""
+        if self.publish_path is None:
+            return
+        with self._file_lock:
+            with self._publish_lock:
+                timer, self._publish_timer = self._publish_timer, None
+            if timer is not None:
+                timer.cancel()
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version == self._published_version:
+                return
+            write_catalog(self.publish_path, snapshot.items_by_id.values(), snapshot.version)
+            self._published_version = snapshot.version
+
+    def _publish(self, snapshot: CatalogSnapshot) -> None:
+        """Swap in snapshot and schedule its file write; must be called with the write lock held."""
+        self._snapshot = snapshot
+        if self.publish_path is None:
+            return
+        with self._publish_lock:
+            if self._publish_timer is None:
+                self._publish_timer = threading.Timer(self.publish_delay, self.flush)
+                self._publish_timer.daemon = True
+                self._publish_timer.start()
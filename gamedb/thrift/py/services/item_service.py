@@ -5,6 +5,7 @@ sys.path.append("..")
 
 from typing import Optional
 import logging
+import threading
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +33,12 @@ from game.ttypes import (
     AutocompleteItemResponseData,
     LoadItemWithBlueprintTreeRequestData,
     LoadItemWithBlueprintTreeResponseData,
+    LoadManyItemsRequestData,
+    LoadManyItemsResponseData,
+    LoadBillOfMaterialsRequestData,
+    LoadBillOfMaterialsResponseData,
+    LoadDependentsRequestData,
+    LoadDependentsResponseData,
     ItemAutocompleteResult,
     BlueprintTreeNode,
     Item,
@@ -49,7 +56,19 @@ from db_models.models import (
     ItemBlueprint,
     ItemBlueprintComponent,
 )
+from common import LOAD_MANY_MAX_IDS, wants_attributes, wanted_attribute_types, result_message
 from services.base_service import BaseServiceHandler
+from services.single_flight import SingleFlight
+from services.negative_cache import NegativeCache
+from services.item_catalog import (
+    DEPENDENTS_MAX_DEPTH,
+    CatalogSnapshot,
+    ItemCatalog,
+    load_blueprint_snapshot,
+    load_dependents,
+    project_item,
+)
+from services.invalidation_bus import InvalidationBus, TOPIC_ITEM
 
 
 class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
@@ -58,8 +77,89 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
     Handles item CRUD operations using the ItemModel layer.
     """
 
-    def __init__(self):
-        BaseServiceHandler.__init__(self, ItemServiceHandler)
+    def __init__(
+        self,
+        catalog: Optional[ItemCatalog] = None,
+        bus: Optional[InvalidationBus] = None,
+    ):
+        BaseServiceHandler.__init__(self, ItemServiceHandler, bus)
+        # Concurrent loads of the same item share one DB fetch and conversion
+        self.load_flight = SingleFlight("item_load")
+        # Recently missed ids are answered without a query
+        self.missing = NegativeCache("item")
+        # When set, every read is served from the in-memory catalog
+        self.catalog = catalog
+        # Bumped by every successful write so cached read responses go stale
+        self.catalog_version = 0
+        self._catalog_version_lock = threading.Lock()
+        if bus is not None:
+            bus.subscribe(TOPIC_ITEM, self._on_item_invalidated)
+            bus.on_gap(self._on_invalidation_gap)
+
+    def bump_catalog_version(self) -> int:
+        """Mark every cached catalog read as stale and return the new version."""
+        with self._catalog_version_lock:
+            self.catalog_version += 1
+            return self.catalog_version
+
+    def _on_item_invalidated(self, item_id: int) -> None:
+        """Another process wrote item_id; drop everything derived from the old row."""
+        logger.debug(f"Invalidating item_id={item_id}")
+        self.load_flight.forget(item_id)
+        self.missing.forget(item_id)
+        self._refresh_catalog(item_id)
+        self.bump_catalog_version()
+
+    def _on_invalidation_gap(self) -> None:
+        """Invalidations may have been missed; rebuild the catalog from scratch."""
+        self.missing.clear()
+        if self.catalog is not None:
+            self.catalog.load()
+        self.bump_catalog_version()
+
+    def _fetch_item(self, item_id: int, projection=None):
+        """Load an item and convert it to Thrift, or return None if missing."""
+        if self.missing.is_missing(item_id):
+            return None
+        item = Item.find(item_id)
+        if not item:
+            self.missing.remember(item_id)
+            return None
+        return item.into_thrift(projection)
+
+    def _catalog_item(self, item_id: int, projection=None):
+        """Same as _fetch_item(), but read from the catalog snapshot."""
+        item = self.catalog.snapshot().get(item_id)
+        if item is None:
+            return None
+        results = [
+            GameResult(
+                status=StatusType.SUCCESS,
+                message=result_message(projection, f"Successfully loaded Item id={item_id}"),
+            ),
+        ]
+        return results, project_item(item, projection)
+
+    def _get_thrift_item(self, item_id: int) -> Optional[Item]:
+        """Returns the Thrift item for item_id from the catalog or the database."""
+        if self.catalog is not None:
+            return self.catalog.snapshot().get(item_id)
+        loaded = self._fetch_item(item_id)
+        return loaded[1] if loaded else None
+
+    def _publish_item_invalidation(self, item_id: int) -> None:
+        """
+        Write the catalog file, then announce that item_id changed, so other
+        processes that remap on the message find the new file in place.
+        """
+        if self.catalog is not None:
+            self.catalog.flush()
+        self.publish_invalidation(TOPIC_ITEM, item_id)
+
+    def _refresh_catalog(self, item_id: int) -> None:
+        """Publish a new catalog snapshot after item_id was written."""
+        if self.catalog is not None:
+            self.catalog.refresh([item_id])
 
     def create(self, request: ItemRequest) -> ItemResponse:
         """Create a new item."""
@@ -85,6 +185,10 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
             item = Item()
             item.from_thrift(thrift_item)
             item.save()
+            self.missing.forget(item.get_id())
+            self._refresh_catalog(item.get_id())
+            self.bump_catalog_version()
+            self._publish_item_invalidation(item.get_id())
 
             logger.info(f"SUCCESS: Created item with id={item.get_id()}")
             results, created_thrift_item = item.into_thrift()
@@ -130,13 +234,24 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
 
             load_data = request.data.load_item
             item_id = load_data.item_id
+            projection = load_data.projection
             logger.info(f"Loading item_id={item_id}")
 
-            item = Item.find(item_id)
+            # Only full loads are coalesced; projected loads are already cheap
+            # and would need the projection in the key
+            if self.catalog is not None:
+                loaded = self._catalog_item(item_id, projection)
+            elif projection is None:
+                loaded = self.load_flight.do(
+                    item_id,
+                    lambda: self._fetch_item(item_id),
+                )
+            else:
+                loaded = self._fetch_item(item_id, projection)
 
-            if item:
+            if loaded:
                 logger.info(f"SUCCESS: Loaded item_id={item_id}")
-                results, thrift_item = item.into_thrift()
+                results, thrift_item = loaded
                 response_data = ItemResponseData(
                     load_item=LoadItemResponseData(
                         item=thrift_item,
@@ -197,6 +312,11 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
             item = Item()
             item.from_thrift(thrift_item)
             item.save()
+            self.load_flight.forget(item.get_id())
+            self.missing.forget(item.get_id())
+            self._refresh_catalog(item.get_id())
+            self.bump_catalog_version()
+            self._publish_item_invalidation(item.get_id())
 
             logger.info(f"SUCCESS: Saved item_id={item.get_id()}")
             results, saved_thrift_item = item.into_thrift()
@@ -261,6 +381,12 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
 
             item._disconnect()
             item.destroy()
+            self.load_flight.forget(item_id)
+            self.missing.remember(item_id)
+            if self.catalog is not None:
+                self.catalog.remove([item_id])
+            self.bump_catalog_version()
+            self._publish_item_invalidation(item_id)
 
             logger.info(f"SUCCESS: Destroyed item_id={item_id}")
             response_data = ItemResponseData(
@@ -291,6 +417,90 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                 response_data=None,
             )
 
+    def _list_from_db(self, search_string, page, results_per_page, projection):
+        """Query one page of items, returning (thrift items, total_count)."""
+        connection = Item._create_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        offset = page * results_per_page
+
+        if search_string:
+            count_query = """
+                SELECT COUNT(*) as total
+                FROM items
+                WHERE internal_name LIKE %s
+            """
+            query = """
+                SELECT *
+                FROM items
+                WHERE internal_name LIKE %s
+                ORDER BY internal_name
+                LIMIT %s OFFSET %s
+            """
+            search_pattern = f"%{search_string}%"
+            cursor.execute(
+                count_query,
+                (search_pattern,),
+            )
+            total_count = cursor.fetchone()["total"]
+            cursor.execute(
+                query,
+                (
+                    search_pattern,
+                    results_per_page,
+                    offset,
+                ),
+            )
+        else:
+            count_query = "SELECT COUNT(*) as total FROM items"
+            query = """
+                SELECT *
+                FROM items
+                ORDER BY internal_name
+                LIMIT %s OFFSET %s
+            """
+            cursor.execute(count_query)
+            total_count = cursor.fetchone()["total"]
+            cursor.execute(
+                query,
+                (
+                    results_per_page,
+                    offset,
+                ),
+            )
+
+        rows = cursor.fetchall()
+        cursor.close()
+        connection.close()
+
+        item_models = []
+        for row in rows:
+            item = Item()
+            item._data = row
+            item_models.append(item)
+
+        # One query for the attributes of the whole page instead of one per item
+        if wants_attributes(projection):
+            Item.preload_attributes(item_models, wanted_attribute_types(projection))
+
+        items = []
+        for item in item_models:
+            _, thrift_item = item.into_thrift(projection)
+            items.append(thrift_item)
+
+        return items, total_count
+
+    def _list_from_catalog(self, search_string, page, results_per_page, projection):
+        """Slice one page of items from the catalog snapshot, returning (thrift items, total_count)."""
+        snapshot = self.catalog.snapshot()
+        matching_ids = snapshot.search(search_string)
+        offset = page * results_per_page
+        items = [
+            project_item(snapshot.get(item_id), projection)
+            for item_id in matching_ids[offset:offset + results_per_page]
+        ]
+        return items, len(matching_ids)
+
     def list_records(self, request: ItemRequest) -> ItemResponse:
         """List items with pagination and optional search."""
         logger.info("=== LIST item records request ===")
@@ -309,6 +519,7 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                 )
 
             list_data = request.data.list_item
+            projection = list_data.projection
             page = max(0, list_data.page)
             results_per_page = list_data.results_per_page
             search_string = (
@@ -319,67 +530,15 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                 f"Listing items: page={page}, results_per_page={results_per_page}, search_string={search_string}"
             )
 
-            connection = Item._create_connection()
-            cursor = connection.cursor(dictionary=True)
-
-            offset = page * results_per_page
-
-            if search_string:
-                count_query = """
-                    SELECT COUNT(*) as total
-                    FROM items
-                    WHERE internal_name LIKE %s
-                """
-                query = """
-                    SELECT *
-                    FROM items
-                    WHERE internal_name LIKE %s
-                    ORDER BY internal_name
-                    LIMIT %s OFFSET %s
-                """
-                search_pattern = f"%{search_string}%"
-                cursor.execute(
-                    count_query,
-                    (search_pattern,),
-                )
-                total_count = cursor.fetchone()["total"]
-                cursor.execute(
-                    query,
-                    (
-                        search_pattern,
-                        results_per_page,
-                        offset,
-                    ),
+            if self.catalog is not None:
+                items, total_count = self._list_from_catalog(
+                    search_string, page, results_per_page, projection
                 )
             else:
-                count_query = "SELECT COUNT(*) as total FROM items"
-                query = """
-                    SELECT *
-                    FROM items
-                    ORDER BY internal_name
-                    LIMIT %s OFFSET %s
-                """
-                cursor.execute(count_query)
-                total_count = cursor.fetchone()["total"]
-                cursor.execute(
-                    query,
-                    (
-                        results_per_page,
-                        offset,
-                    ),
+                items, total_count = self._list_from_db(
+                    search_string, page, results_per_page, projection
                 )
 
-            rows = cursor.fetchall()
-            cursor.close()
-            connection.close()
-
-            items = []
-            for row in rows:
-                item = Item()
-                item._data = row
-                _, thrift_item = item.into_thrift()
-                items.append(thrift_item)
-
             logger.info(f"SUCCESS: Listed {len(items)} items (total: {total_count})")
             response_data = ItemResponseData(
                 list_item=ListItemResponseData(
@@ -391,7 +550,7 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                 results=[
                     GameResult(
                         status=StatusType.SUCCESS,
-                        message=f"Found {len(items)} items",
+                        message=result_message(projection, f"Found {len(items)} items"),
                     ),
                 ],
                 response_data=response_data,
@@ -439,28 +598,35 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                 f"Autocomplete search: search_string={search_string}, max_results={max_results}"
             )
 
-            connection = Item._create_connection()
-            cursor = connection.cursor(dictionary=True)
+            if self.catalog is not None:
+                snapshot = self.catalog.snapshot()
+                rows = [
+                    {"id": item_id, "internal_name": snapshot.get(item_id).internal_name}
+                    for item_id in snapshot.search(search_string)[:max_results]
+                ]
+            else:
+                connection = Item._create_connection()
+                cursor = connection.cursor(dictionary=True)
 
-            query = """
-                SELECT id, internal_name
-                FROM items
-                WHERE internal_name LIKE %s
-                ORDER BY internal_name
-                LIMIT %s
-            """
+                query = """
+                    SELECT id, internal_name
+                    FROM items
+                    WHERE internal_name LIKE %s
+                    ORDER BY internal_name
+                    LIMIT %s
+                """
 
-            search_pattern = f"%{search_string}%"
-            cursor.execute(
-                query,
-                (
-                    search_pattern,
-                    max_results,
-                ),
-            )
-            rows = cursor.fetchall()
-            cursor.close()
-            connection.close()
+                search_pattern = f"%{search_string}%"
+                cursor.execute(
+                    query,
+                    (
+                        search_pattern,
+                        max_results,
+                    ),
+                )
+                rows = cursor.fetchall()
+                cursor.close()
+                connection.close()
 
             results = [
                 ItemAutocompleteResult(
@@ -526,9 +692,9 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                 f"Loading blueprint tree for item_id={item_id}, max_depth={max_depth}"
             )
 
-            item_model = Item.find(item_id)
+            thrift_item = self._get_thrift_item(item_id)
 
-            if not item_model:
+            if not thrift_item:
                 logger.warning(f"FAILURE: Item_id={item_id} not found")
                 return ItemResponse(
                     results=[
@@ -541,8 +707,6 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                     response_data=None,
                 )
 
-            _, thrift_item = item_model.into_thrift()
-
             visited_items = set()
             tree = self._build_blueprint_tree_node(
                 thrift_item,
@@ -589,6 +753,285 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                 response_data=None,
             )
 
+    def load_many(self, request: ItemRequest) -> ItemResponse:
+        """Load many items by ID with one query for the items and one for their attributes."""
+        logger.info("=== LOAD_MANY item request ===")
+        try:
+            if not request.data.load_many_items:
+                logger.error("Request data missing load_many_items field")
+                return ItemResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="Request data must contain load_many_items",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            projection = request.data.load_many_items.projection
+            item_ids = list(dict.fromkeys(request.data.load_many_items.item_ids or []))
+            if len(item_ids) > LOAD_MANY_MAX_IDS:
+                logger.error(f"Too many ids requested: {len(item_ids)}")
+                return ItemResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message=f"Cannot load more than {LOAD_MANY_MAX_IDS} items at once",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            logger.info(f"Loading {len(item_ids)} items")
+
+            items = {}
+            errors = {}
+            if self.catalog is not None:
+                snapshot = self.catalog.snapshot()
+                for item_id in item_ids:
+                    thrift_item = snapshot.get(item_id)
+                    if thrift_item:
+                        items[item_id] = project_item(thrift_item, projection)
+            else:
+                known_missing = set(self.missing.missing_of(item_ids))
+                queried_ids = [item_id for item_id in item_ids if item_id not in known_missing]
+                item_models = Item.find_many(queried_ids)
+                if wants_attributes(projection):
+                    Item.preload_attributes(item_models, wanted_attribute_types(projection))
+
+                for item in item_models:
+                    conversion_results, thrift_item = item.into_thrift(projection)
+                    if thrift_item:
+                        items[item.get_id()] = thrift_item
+                    else:
+                        errors[item.get_id()] = conversion_results[0]
+
+                found_ids = {item.get_id() for item in item_models}
+                for item_id in queried_ids:
+                    if item_id not in found_ids:
+                        self.missing.remember(item_id)
+
+            for item_id in item_ids:
+                if item_id not in items and item_id not in errors:
+                    errors[item_id] = GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Item {item_id} not found",
+                        error_code=GameError.DB_RECORD_NOT_FOUND,
+                    )
+
+            logger.info(f"SUCCESS: Loaded {len(items)} of {len(item_ids)} items")
+            response_data = ItemResponseData(
+                load_many_items=LoadManyItemsResponseData(
+                    items=items,
+                    errors=errors,
+                ),
+            )
+            return ItemResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=result_message(
+                            projection,
+                            f"Loaded {len(items)} of {len(item_ids)} items",
+                        ),
+                    ),
+                ],
+                response_data=response_data,
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in load_many: {type(e).__name__}: {str(e)}")
+            return ItemResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to load items: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def _blueprint_snapshot(self, item_ids) -> CatalogSnapshot:
+        """
+        The catalog to flatten bills of materials from: the live snapshot, or
+        without a catalog, the blueprint graph below item_ids loaded one tree
+        level per batch.
+        """
+        if self.catalog is not None:
+            return self.catalog.snapshot()
+        return load_blueprint_snapshot(
+            [item_id for item_id in item_ids if not self.missing.is_missing(item_id)]
+        )
+
+    def load_bill_of_materials(self, request: ItemRequest) -> ItemResponse:
+        """Load the flattened raw materials and total bake time of many items."""
+        logger.info("=== LOAD_BILL_OF_MATERIALS item request ===")
+        try:
+            if not request.data.load_bill_of_materials:
+                logger.error("Request data missing load_bill_of_materials field")
+                return ItemResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="Request data must contain load_bill_of_materials",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            item_ids = list(dict.fromkeys(request.data.load_bill_of_materials.item_ids or []))
+            if len(item_ids) > LOAD_MANY_MAX_IDS:
+                logger.error(f"Too many ids requested: {len(item_ids)}")
+                return ItemResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message=f"Cannot load more than {LOAD_MANY_MAX_IDS} bills of materials at once",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            logger.info(f"Loading bills of materials for {len(item_ids)} items")
+
+            snapshot = self._blueprint_snapshot(item_ids)
+            boms = {}
+            errors = {}
+            for item_id in item_ids:
+                bom = snapshot.bom(item_id)
+                if bom is None:
+                    errors[item_id] = GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Item {item_id} not found",
+                        error_code=GameError.DB_RECORD_NOT_FOUND,
+                    )
+                else:
+                    boms[item_id] = bom.to_thrift()
+
+            logger.info(f"SUCCESS: Loaded {len(boms)} of {len(item_ids)} bills of materials")
+            return ItemResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Loaded {len(boms)} of {len(item_ids)} bills of materials",
+                    ),
+                ],
+                response_data=ItemResponseData(
+                    load_bill_of_materials=LoadBillOfMaterialsResponseData(
+                        boms=boms,
+                        errors=errors,
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in load_bill_of_materials: {type(e).__name__}: {str(e)}")
+            return ItemResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to load bills of materials: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def load_dependents(self, request: ItemRequest) -> ItemResponse:
+        """Load the items whose blueprints use an item, directly or through other blueprints."""
+        logger.info("=== LOAD_DEPENDENTS item request ===")
+        try:
+            if not request.data.load_dependents:
+                logger.error("Request data missing load_dependents field")
+                return ItemResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="Request data must contain load_dependents",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            item_id = request.data.load_dependents.item_id
+            max_depth = request.data.load_dependents.max_depth
+            if max_depth is None or max_depth < 0:
+                logger.error(f"Invalid max_depth: {max_depth}")
+                return ItemResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="max_depth must be zero or more",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+            max_depth = min(max_depth, DEPENDENTS_MAX_DEPTH)
+
+            logger.info(f"Loading dependents of item_id={item_id}, max_depth={max_depth}")
+
+            found = None
+            if self.catalog is not None:
+                snapshot = self.catalog.snapshot()
+                if snapshot.get(item_id) is not None:
+                    found = snapshot.dependents(item_id, max_depth)
+            elif not self.missing.is_missing(item_id):
+                found = load_dependents(item_id, max_depth)
+                if found is None:
+                    self.missing.remember(item_id)
+
+            if found is None:
+                logger.warning(f"FAILURE: Item_id={item_id} not found")
+                return ItemResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message=f"Item {item_id} not found",
+                            error_code=GameError.DB_RECORD_NOT_FOUND,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            depths, truncated = found
+            logger.info(f"SUCCESS: {len(depths)} items use item_id={item_id} (truncated={truncated})")
+            return ItemResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Loaded {len(depths)} dependents of item {item_id}",
+                    ),
+                ],
+                response_data=ItemResponseData(
+                    load_dependents=LoadDependentsResponseData(
+                        item_id=item_id,
+                        depths=depths,
+                        truncated=truncated,
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in load_dependents: {type(e).__name__}: {str(e)}")
+            return ItemResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to load dependents: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
     def _build_blueprint_tree_node(
         self,
         item: Item,
@@ -619,7 +1062,7 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
         cycle_detected = False
 
         if item.blueprint:
-            total_bake_time = item.blueprint.bake_time_ms
+            total_bake_time = item.blueprint.bake_time_ms or 0
             logger.debug(
                 f"Item has blueprint with bake_time={item.blueprint.bake_time_ms}ms"
             )
@@ -640,11 +1083,9 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                         cycle_detected = True
                         continue
 
-                    component_item_model = Item.find(component_item_id)
-
-                    if component_item_model:
-                        _, component_thrift_item = component_item_model.into_thrift()
+                    component_thrift_item = self._get_thrift_item(component_item_id)
 
+                    if component_thrift_item:
                         new_visited = visited_items.copy()
                         new_visited.add(item.id)
 
@@ -658,7 +1099,8 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
                         component_nodes.append(component_node)
                         component_ratios.append(component.ratio)
 
-                        total_bake_time += component_node.total_bake_time_ms
+                        # Bake times are per unit: ratio units of the component are baked first
+                        total_bake_time += component.ratio * component_node.total_bake_time_ms
                     else:
                         logger.warning(
                             f"Could not load component item_id={component_item_id}"
@@ -673,7 +1115,7 @@ class ItemServiceHandler(BaseServiceHandler, ItemServiceIface):
             blueprint=item.blueprint,
             component_nodes=component_nodes,
             component_ratios=component_ratios,
-            total_bake_time_ms=total_bake_time,
+            total_bake_time_ms=int(round(total_bake_time)),
             max_depth_reached=max_depth_reached,
             cycle_detected=cycle_detected,
         )
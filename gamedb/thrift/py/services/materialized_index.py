@@ -0,0 +1,223 @@
+"""
+Indexed, memory-mapped loader for materialized.bin.
+
+compile.py writes the whole ItemDb as one TBinaryProtocol struct. Decoding it
+with deserialize() builds every Item up front, and tools such as read.py then
+resolve blueprint components with nested loops over the item list.
+
+MaterializedIndex maps the file and walks it once, reading only each item's
+id, internal_name and blueprint. It records where each item starts and ends,
+then builds id and name hash indexes and the blueprint adjacency lists. A
+full Item is decoded from its byte range only when it is asked for.
+"""
+
+import mmap
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from thrift.Thrift import TType
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+from thrift.transport.TTransport import TTransportBase, TTransportException
+
+from game.ttypes import (
+    Item as ThriftItem,
+    ItemBlueprint as ThriftItemBlueprint,
+    ItemBlueprintComponent as ThriftItemBlueprintComponent,
+)
+from services.bill_of_materials import BillOfMaterials, build_boms, dependents_by_depth
+
+# Field ids of the Item struct read while scanning
+_ITEM_ID_FIELD = 1
+_ITEM_NAME_FIELD = 2
+_ITEM_BLUEPRINT_FIELD = 6
+
+
+class MappedTransport(TTransportBase):
+    """Read-only transport over a buffer such as an mmap, with a movable position."""
+
+    def __init__(self, buffer, position: int = 0):
+        self._buffer = buffer
+        self._position = position
+
+    def isOpen(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, position: int) -> None:
+        self._position = position
+
+    def read(self, sz: int) -> bytes:
+        end = self._position + sz
+        if end > len(self._buffer):
+            raise TTransportException(
+                TTransportException.END_OF_FILE,
+                "Read past the end of the mapped buffer",
+            )
+        data = self._buffer[self._position:end]
+        self._position = end
+        return data
+
+
+def scan_item(protocol) -> Tuple[Optional[int], Optional[str], Optional[ThriftItemBlueprint]]:
+    """
+    Read one encoded Item from protocol, decoding only its id, internal_name
+    and blueprint and skipping every other field.
+
+    Returns:
+        Tuple of (id, internal_name, blueprint)
+    """
+    item_id = None
+    internal_name = None
+    blueprint = None
+
+    protocol.readStructBegin()
+    while True:
+        _, field_type, field_id = protocol.readFieldBegin()
+        if field_type == TType.STOP:
+            break
+        if field_id == _ITEM_ID_FIELD and field_type == TType.I64:
+            item_id = protocol.readI64()
+        elif field_id == _ITEM_NAME_FIELD and field_type == TType.STRING:
+            internal_name = protocol.readString()
+        elif field_id == _ITEM_BLUEPRINT_FIELD and field_type == TType.STRUCT:
+            blueprint = ThriftItemBlueprint()
+            blueprint.read(protocol)
+        else:
+            protocol.skip(field_type)
+        protocol.readFieldEnd()
+    protocol.readStructEnd()
+
+    return item_id, internal_name, blueprint
+
+
+class ItemIndexes:
+    """
+    id/name hash indexes and blueprint adjacency over TBinaryProtocol-encoded
+    items in buffer (an mmap or bytes).
+
+    The byte range of each item is supplied through add(); items are decoded
+    from their range on first use.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._ranges: Dict[int, Tuple[int, int]] = {}
+        self._ids_by_name: Dict[str, int] = {}
+        self._components: Dict[int, Dict[int, ThriftItemBlueprintComponent]] = {}
+        self._used_in: Dict[int, List[int]] = {}
+        self._bake_times: Dict[int, int] = {}
+        self._boms: Dict[int, BillOfMaterials] = {}
+        self._decoded: Dict[int, ThriftItem] = {}
+
+    def add(self, item_id: int, internal_name: str, blueprint, start: int, end: int) -> None:
+        self._ranges[item_id] = (start, end)
+        # First item wins, matching item_db.find_item_by_name
+        self._ids_by_name.setdefault(internal_name, item_id)
+        if blueprint is not None and blueprint.bake_time_ms:
+            self._bake_times[item_id] = blueprint.bake_time_ms
+        if blueprint is not None and blueprint.components:
+            self._components[item_id] = blueprint.components
+            for component_item_id in blueprint.components:
+                self._used_in.setdefault(component_item_id, []).append(item_id)
+
+    def decode(self, start: int, end: int) -> ThriftItem:
+        """Decode the item encoded in buffer[start:end]."""
+        item = ThriftItem()
+        item.read(TBinaryProtocol(MappedTransport(self._buffer[start:end])))
+        return item
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._ranges
+
+    def ids(self) -> List[int]:
+        return list(self._ranges)
+
+    def by_id(self, item_id: int) -> Optional[ThriftItem]:
+        """Returns the item with item_id, decoding it on first use."""
+        item = self._decoded.get(item_id)
+        if item is None:
+            byte_range = self._ranges.get(item_id)
+            if byte_range is None:
+                return None
+            item = self.decode(*byte_range)
+            self._decoded[item_id] = item
+        return item
+
+    def by_name(self, internal_name: str) -> Optional[ThriftItem]:
+        """Returns the item with exactly this internal_name, or None."""
+        item_id = self._ids_by_name.get(internal_name)
+        return self.by_id(item_id) if item_id is not None else None
+
+    def id_of(self, internal_name: str) -> Optional[int]:
+        return self._ids_by_name.get(internal_name)
+
+    def components_of(self, item_id: int) -> Dict[int, ThriftItemBlueprintComponent]:
+        """Returns the blueprint components of item_id without decoding the item."""
+        return self._components.get(item_id, {})
+
+    def used_in(self, item_id: int) -> List[int]:
+        """Returns the ids of items whose blueprint uses item_id."""
+        return self._used_in.get(item_id, [])
+
+    def dependents(self, item_id: int, max_depth: Optional[int] = None) -> Tuple[Dict[int, int], bool]:
+        """Returns the items whose blueprints use item_id at any depth, as (item id -> depth, truncated)."""
+        return dependents_by_depth([item_id], self.used_in, max_depth)
+
+    def bake_time_of(self, item_id: int) -> int:
+        return self._bake_times.get(item_id, 0)
+
+    def bom(self, item_id: int) -> Optional[BillOfMaterials]:
+        """Returns the flattened bill of materials of item_id, computed on first use."""
+        if item_id not in self._ranges:
+            return None
+        if item_id not in self._components:
+            return BillOfMaterials.raw(item_id, self.bake_time_of(item_id))
+        return build_boms([item_id], self.components_of, self.bake_time_of, self._boms)[item_id]
+
+    def items(self) -> Iterator[ThriftItem]:
+        for item_id in self._ranges:
+            yield self.by_id(item_id)
+
+
+class MaterializedIndex(ItemIndexes):
+    """
+    Indexed view of an ItemDb written by compile.py.
+
+    Usage:
+        index = MaterializedIndex("./materialized.bin")
+        steel = index.by_name("steel")
+        for component_id, component in index.components_of(steel.id).items():
+            print(index.by_id(component_id).internal_name, component.ratio)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        ItemIndexes.__init__(self, self._map)
+        self._scan()
+
+    def _scan(self) -> None:
+        transport = MappedTransport(self._map)
+        protocol = TBinaryProtocol(transport)
+
+        protocol.readStructBegin()
+        while True:
+            _, field_type, field_id = protocol.readFieldBegin()
+            if field_type == TType.STOP:
+                break
+            if field_id == 1 and field_type == TType.LIST:
+                _, size = protocol.readListBegin()
+                for _ in range(size):
+                    start = transport.tell()
+                    item_id, internal_name, blueprint = scan_item(protocol)
+                    self.add(item_id, internal_name, blueprint, start, transport.tell())
+                protocol.readListEnd()
+            else:
+                protocol.skip(field_type)
+            protocol.readFieldEnd()
+        protocol.readStructEnd()
@@ -0,0 +1,236 @@
+"""
+Lazy, copy-on-write materialization of item instances.
+
+An inventory entry without a mobile_item_id references its template item:
+its attributes, blueprint and everything else are the template's, so moving
+or picking it up writes nothing but the entry. The template is copied into
+mobile_items, mobile_item_blueprints and mobile_item_blueprint_components
+only when one of the entry's attributes is set to a value the template does
+not have, and attribute changes that match the template leave the entry a
+plain reference.
+
+Attributes are flyweights: mobile_item_attributes only holds an instance's
+overrides, and MobileItem.get_attributes() layers them over the template's
+attributes into an interned AttributeSet. Setting an attribute back to the
+template's value drops the override.
+
+Only the units being customized become the instance: they are split off the
+stack into an entry of their own (one unit unless asked otherwise), and the
+rest of the stack keeps referencing the template.
+
+The copy is a handful of set-based INSERT ... SELECT statements that run on
+the server, together with the entry update and the attribute changes, sent
+as one multi-statement batch: one round trip whatever the size of the item.
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from game.ttypes import (
+    Attribute as ThriftAttribute,
+    GameResult,
+    StatusType,
+    GameError,
+    Item as ThriftItem,
+)
+from db_models.models import ATTRIBUTE_VALUE_COLUMNS, Attribute, MobileItem
+
+logger = logging.getLogger(__name__)
+
+# The entry to change, locked, and the mobile that will own its instance:
+# the inventory's mobile, or the first mobile of the inventory's player
+_FIND_ENTRY_SQL = """
+    SELECT e.id, e.mobile_item_id, e.quantity, inv.max_entries,
+           (SELECT COUNT(*) FROM inventory_entries c WHERE c.inventory_id = e.inventory_id) AS entry_count,
+           CASE inv.owner_type
+               WHEN 'mobile' THEN inv.owner_id
+               WHEN 'player' THEN (
+                   SELECT m.id FROM mobiles m WHERE m.owner_player_id = inv.owner_id ORDER BY m.id LIMIT 1
+               )
+           END AS mobile_id
+    FROM inventory_entries e
+    JOIN inventories inv ON inv.id = e.inventory_id
+    WHERE e.inventory_id = %(inventory_id)s
+      AND e.item_id = %(item_id)s
+      AND e.mobile_item_id <=> %(mobile_item_id)s
+    ORDER BY e.id
+    LIMIT 1
+    FOR UPDATE
+"""
+
+_COPY_TEMPLATE_STATEMENTS = (
+    "INSERT INTO mobile_item_blueprints (bake_time_ms)"
+    " SELECT b.bake_time_ms FROM items i JOIN item_blueprints b ON b.id = i.blueprint_id"
+    " WHERE i.id = %(item_id)s",
+    "SET @blueprint_id = IF(ROW_COUNT() > 0, LAST_INSERT_ID(), NULL)",
+    "INSERT INTO mobile_item_blueprint_components (item_blueprint_id, component_item_id, ratio)"
+    " SELECT @blueprint_id, c.component_item_id, c.ratio FROM items i"
+    " JOIN item_blueprint_components c ON c.item_blueprint_id = i.blueprint_id"
+    " WHERE i.id = %(item_id)s AND @blueprint_id IS NOT NULL",
+    "INSERT INTO mobile_items (mobile_id, internal_name, max_stack_size, item_type, blueprint_id, item_id)"
+    " SELECT %(mobile_id)s, internal_name, max_stack_size, item_type, @blueprint_id, id FROM items"
+    " WHERE id = %(item_id)s",
+    "SET @mobile_item_id = LAST_INSERT_ID()",
+)
+
+# The whole entry becomes the instance
+_CLAIM_ENTRY_STATEMENT = "UPDATE inventory_entries SET mobile_item_id = @mobile_item_id WHERE id = %(entry_id)s"
+
+# Part of the stack becomes the instance, in an entry of its own
+_SPLIT_ENTRY_STATEMENTS = (
+    "UPDATE inventory_entries SET quantity = quantity - %(quantity)s, is_max_stacked = 0 WHERE id = %(entry_id)s",
+    "INSERT INTO inventory_entries (inventory_id, item_id, quantity, is_max_stacked, mobile_item_id)"
+    " VALUES (%(inventory_id)s, %(item_id)s, %(quantity)s, 0, @mobile_item_id)",
+)
+
+
+def attribute_columns(attribute: ThriftAttribute) -> Dict[str, object]:
+    """The attribute's ATTRIBUTE_VALUE_COLUMNS values, as stored in attributes and mobile_item_attributes."""
+    data = Attribute().from_thrift(attribute)._data
+    return {column: data.get(column) for column in ATTRIBUTE_VALUE_COLUMNS}
+
+
+def diverging_attributes(template: ThriftItem, attributes: List[ThriftAttribute]) -> List[ThriftAttribute]:
+    """The attributes whose stored values differ from the template's."""
+    template_attributes = template.attributes or {}
+    diverging = []
+    for attribute in attributes:
+        template_attribute = template_attributes.get(attribute.attribute_type)
+        if template_attribute is None or attribute_columns(template_attribute) != attribute_columns(attribute):
+            diverging.append(attribute)
+    return diverging
+
+
+def _write_attributes_statements(
+    attributes: List[ThriftAttribute],
+    diverging: List[ThriftAttribute],
+    params: Dict[str, object],
+) -> List[str]:
+    """
+    Statements replacing the instance's overrides of the given attribute
+    types: only diverging attributes are stored, the others fall back to the
+    template. Adds their params.
+    """
+    statements = []
+    for position, attribute in enumerate(attributes):
+        columns = attribute_columns(attribute)
+        for column, value in columns.items():
+            params[f"{column}_{position}"] = value
+        statements.append(
+            "DELETE FROM mobile_item_attributes WHERE mobile_item_id = @mobile_item_id"
+            f" AND attribute_type = %(attribute_type_{position})s"
+        )
+        if any(attribute is other for other in diverging):
+            statements.append(
+                f"INSERT INTO mobile_item_attributes (mobile_item_id, {', '.join(ATTRIBUTE_VALUE_COLUMNS)})"
+                f" VALUES (@mobile_item_id, {', '.join(f'%({column}_{position})s' for column in ATTRIBUTE_VALUE_COLUMNS)})"
+            )
+    return statements
+
+
+def _failure(message: str, error_code: int) -> GameResult:
+    return GameResult(status=StatusType.FAILURE, message=message, error_code=error_code)
+
+
+def set_item_attributes(
+    inventory_id: int,
+    template: ThriftItem,
+    attributes: List[ThriftAttribute],
+    mobile_item_id: Optional[int] = None,
+    quantity: float = 1.0,
+) -> Tuple[List[GameResult], Optional[int], bool]:
+    """
+    Set attributes of an item in an inventory: the instance mobile_item_id,
+    or without one, quantity units of the first stack of the template that
+    still references it.
+
+    Those units are materialized first if any attribute diverges from the
+    template, split off into their own entry unless they are the whole
+    stack; if none diverges, nothing is written. Returns (results,
+    mobile_item_id or None for a stack left as a reference, materialized).
+    """
+    if mobile_item_id is None and (quantity is None or quantity <= 0.0):
+        return [_failure("quantity must be positive", GameError.DB_INVALID_DATA)], None, False
+    connection = MobileItem._create_connection()
+    cursor = connection.cursor(dictionary=True)
+    try:
+        connection.start_transaction()
+        params: Dict[str, object] = {
+            "inventory_id": inventory_id,
+            "item_id": template.id,
+            "mobile_item_id": mobile_item_id,
+        }
+        cursor.execute(_FIND_ENTRY_SQL, params)
+        entry = cursor.fetchone()
+        if entry is None:
+            connection.rollback()
+            return [_failure(
+                f"Item {template.id} not found in inventory {inventory_id}",
+                GameError.INV_ITEM_NOT_FOUND,
+            )], None, False
+
+        statements: List[str] = []
+        materialized = False
+        diverging = diverging_attributes(template, attributes)
+        if mobile_item_id is None:
+            attributes = diverging
+            if not attributes:
+                connection.rollback()
+                logger.debug(f"Attributes match item_id={template.id}, entry {entry['id']} stays a reference")
+                return [GameResult(
+                    status=StatusType.SUCCESS,
+                    message="attributes match the template, nothing to materialize",
+                )], None, False
+            if entry["mobile_id"] is None:
+                connection.rollback()
+                return [_failure(
+                    f"Inventory {inventory_id} has no mobile to own an item instance",
+                    GameError.DB_INVALID_DATA,
+                )], None, False
+            if quantity > entry["quantity"]:
+                connection.rollback()
+                return [_failure(
+                    f"insufficient quantity: requested {quantity}, available {entry['quantity']}",
+                    GameError.INV_INSUFFICIENT_QUANTITY,
+                )], None, False
+            split = quantity < entry["quantity"]
+            if split and entry["entry_count"] >= entry["max_entries"]:
+                connection.rollback()
+                return [_failure(
+                    f"Inventory {inventory_id} has no free entry to split {quantity} off the stack",
+                    GameError.INV_MAX_ITEMS_REACHED,
+                )], None, False
+            params["mobile_id"] = entry["mobile_id"]
+            params["entry_id"] = entry["id"]
+            params["quantity"] = quantity
+            statements.extend(_COPY_TEMPLATE_STATEMENTS)
+            if split:
+                statements.extend(_SPLIT_ENTRY_STATEMENTS)
+            else:
+                statements.append(_CLAIM_ENTRY_STATEMENT)
+            materialized = True
+        else:
+            statements.append("SET @mobile_item_id = %(mobile_item_id)s")
+        statements.extend(_write_attributes_statements(attributes, diverging, params))
+        statements.append("SELECT @mobile_item_id AS mobile_item_id")
+
+        # One round trip for the copy, the entry and the attribute changes
+        cursor.execute(";\n".join(statements), params)
+        rows = []
+        for _, result_set in cursor.fetchsets():
+            rows = result_set or rows
+        mobile_item_id = rows[0]["mobile_item_id"]
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+        connection.close()
+
+    if materialized:
+        logger.info(f"Materialized item_id={template.id} in inventory_id={inventory_id} as mobile_item_id={mobile_item_id}")
+    return [GameResult(
+        status=StatusType.SUCCESS,
+        message=f"Set {len(attributes)} attributes of mobile item {mobile_item_id}",
+    )], mobile_item_id, materialized
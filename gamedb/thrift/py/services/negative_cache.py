@@ -0,0 +1,94 @@
+"""
+Short-lived memory of ids that were not found.
+
+Tools probing for records often ask for the same missing ids over and over,
+and every miss costs a connection and a query that returns nothing. A
+NegativeCache remembers those misses for a few seconds so repeated
+DB_RECORD_NOT_FOUND answers are produced without touching the database.
+
+A TTL is used rather than a Bloom filter of existing ids: the filter would
+have to be loaded up front for every table and kept in step with inserts made
+by every process, while a TTL bounds how long a miss can outlive the record
+being created elsewhere. Writers in this process (and, through the
+invalidation bus, in other processes) forget an id as soon as it is created.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# How long a miss is trusted, in seconds
+NEGATIVE_CACHE_TTL_SECONDS = 5.0
+
+# Default number of missing ids remembered per cache
+NEGATIVE_CACHE_MAX_ENTRIES = 10000
+
+
+class NegativeCache:
+    """
+    Thread-safe, size-bounded set of missing keys that expire after ttl seconds.
+
+    Usage:
+        missing = NegativeCache("item")
+        if missing.is_missing(item_id):
+            return None
+        item = Item.find(item_id)
+        if not item:
+            missing.remember(item_id)
+    """
+
+    def __init__(
+        self,
+        name: str = "negative_cache",
+        ttl: float = NEGATIVE_CACHE_TTL_SECONDS,
+        max_entries: int = NEGATIVE_CACHE_MAX_ENTRIES,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._expires: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.hits = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._expires)
+
+    def is_missing(self, key: Hashable) -> bool:
+        """Returns True if key was recorded as missing less than ttl seconds ago."""
+        with self._lock:
+            expires = self._expires.get(key)
+            if expires is None:
+                return False
+            if expires <= time.monotonic():
+                del self._expires[key]
+                return False
+            self.hits += 1
+            return True
+
+    def missing_of(self, keys: Iterable[Hashable]) -> List[Hashable]:
+        """Returns the keys that are currently recorded as missing."""
+        return [key for key in keys if self.is_missing(key)]
+
+    def remember(self, key: Hashable) -> None:
+        """Record key as missing for the next ttl seconds."""
+        with self._lock:
+            self._expires.pop(key, None)
+            self._expires[key] = time.monotonic() + self.ttl
+            # Oldest entries expire first, so evict from the front
+            while len(self._expires) > self.max_entries:
+                self._expires.popitem(last=False)
+
+    def forget(self, key: Hashable) -> None:
+        """Drop key, e.g. because a record with it was just created."""
+        with self._lock:
+            self._expires.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expires.clear()
+        logger.debug(f"{self.name}: cleared")
@@ -4,6 +4,7 @@ sys.path.append("../../gen-py")
 sys.path.append("..")
 
 import logging
+from typing import Dict, List, Optional, Union
 
 # Configure logging
 logging.basicConfig(
@@ -27,7 +28,14 @@ from game.ttypes import (
     DeletePlayerResponseData,
     ListPlayerRequestData,
     ListPlayerResponseData,
+    LoadManyPlayersRequestData,
+    LoadManyPlayersResponseData,
+    LoadSessionRequestData,
+    LoadSessionResponseData,
     Player,
+    Inventory as ThriftInventory,
+    Item as ThriftItem,
+    MobileItem as ThriftMobileItem,
     GameResult,
     StatusType,
     GameError,
@@ -37,9 +45,20 @@ from game.ttypes import (
     FieldEnumMapping,
 )
 from game.PlayerService import Iface as PlayerServiceIface
-from db_models.models import Player
-from common import is_ok
+from db_models.models import Player, Inventory, MobileItem
+from common import (
+    is_ok,
+    LOAD_MANY_MAX_IDS,
+    wants_attributes,
+    wanted_attribute_types,
+    wants_mobile,
+    result_message,
+)
 from services.base_service import BaseServiceHandler
+from services.invalidation_bus import InvalidationBus, TOPIC_ITEM, TOPIC_PLAYER
+from services.negative_cache import NegativeCache
+from services.item_catalog import ItemCatalog, load_items, project_item
+from services.shared_catalog import SharedCatalogReader
 
 
 class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
@@ -48,8 +67,37 @@ class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
     Handles player operations using the db_models layer.
     """
 
-    def __init__(self):
-        BaseServiceHandler.__init__(self, PlayerServiceHandler)
+    def __init__(
+        self,
+        catalog: Optional[Union[ItemCatalog, SharedCatalogReader]] = None,
+        bus: Optional[InvalidationBus] = None,
+    ):
+        BaseServiceHandler.__init__(self, PlayerServiceHandler, bus)
+        # Recently missed ids are answered without a query
+        self.missing = NegativeCache("player")
+        # When set, session items are read from the item catalog
+        self.catalog = catalog
+        if bus is not None:
+            bus.subscribe(TOPIC_PLAYER, self.missing.forget)
+            bus.subscribe(TOPIC_ITEM, self._on_item_invalidated)
+            bus.on_gap(self.missing.clear)
+            bus.on_gap(self._on_item_invalidated)
+
+    def _on_item_invalidated(self, item_id: Optional[int] = None) -> None:
+        """An item template changed elsewhere; pick up the republished catalog."""
+        if isinstance(self.catalog, SharedCatalogReader):
+            self.catalog.invalidate()
+
+    def _find_player(self, player_id: int, projection=None) -> Optional[Player]:
+        """Find a player, joining in its mobile when the projection wants it."""
+        if not wants_mobile(projection):
+            return Player.find(player_id)
+        players = Player.find_many_with_mobile(
+            [player_id],
+            wants_attributes(projection),
+            wanted_attribute_types(projection),
+        )
+        return players[0] if players else None
 
     def load(self, request: PlayerRequest) -> PlayerResponse:
         """Load a player by ID."""
@@ -72,11 +120,15 @@ class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
             player_id = load_data.player_id
             logger.info(f"Loading player_id={player_id}")
 
-            player = Player.find(player_id)
+            player = None
+            if not self.missing.is_missing(player_id):
+                player = self._find_player(player_id, load_data.projection)
+                if not player:
+                    self.missing.remember(player_id)
 
             if player:
                 logger.info(f"SUCCESS: Loaded player_id={player_id}")
-                results, thrift_player = player.into_thrift()
+                results, thrift_player = player.into_thrift(load_data.projection)
                 response_data = PlayerResponseData(
                     load_player=LoadPlayerResponseData(
                         player=thrift_player,
@@ -136,6 +188,8 @@ class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
             player = Player()
             player.from_thrift(thrift_player)
             player.save()
+            self.missing.forget(player.get_id())
+            self.publish_invalidation(TOPIC_PLAYER, player.get_id())
 
             logger.info(f"SUCCESS: Created player with id={player.get_id()}")
 
@@ -189,6 +243,8 @@ class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
             player = Player()
             player.from_thrift(thrift_player)
             player.save()
+            self.missing.forget(player.get_id())
+            self.publish_invalidation(TOPIC_PLAYER, player.get_id())
 
             logger.info(f"SUCCESS: Saved player_id={player.get_id()}")
 
@@ -253,6 +309,8 @@ class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
 
             player._disconnect()
             player.destroy()
+            self.missing.remember(player_id)
+            self.publish_invalidation(TOPIC_PLAYER, player_id)
             logger.info(f"SUCCESS: Deleted player_id={player_id}")
 
             response_data = PlayerResponseData(
@@ -301,6 +359,7 @@ class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
                 )
 
             list_data = request.data.list_player
+            projection = list_data.projection
             page = max(0, list_data.page)
             results_per_page = list_data.results_per_page
             search_string = (
@@ -347,12 +406,22 @@ class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
 
             rows = cursor.fetchall()
 
-            players = []
+            player_models = []
             for row in rows:
                 player = Player()
                 player._data = row
                 player._dirty = False
-                results, thrift_player = player.into_thrift()
+                player_models.append(player)
+            if wants_mobile(projection):
+                Player.preload_mobile(
+                    player_models,
+                    wants_attributes(projection),
+                    wanted_attribute_types(projection),
+                )
+
+            players = []
+            for player in player_models:
+                results, thrift_player = player.into_thrift(projection)
                 if thrift_player:
                     players.append(thrift_player)
 
@@ -366,7 +435,10 @@ class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
             )
             result = GameResult(
                 status=StatusType.SUCCESS,
-                message=f"Successfully listed {len(players)} players",
+                message=result_message(
+                    projection,
+                    f"Successfully listed {len(players)} players",
+                ),
             )
             return PlayerResponse(
                 results=[result],
@@ -388,3 +460,290 @@ class PlayerServiceHandler(BaseServiceHandler, PlayerServiceIface):
         finally:
             if connection:
                 connection.close()
+
+    def load_many(self, request: PlayerRequest) -> PlayerResponse:
+        """Load many players by ID with batched player, mobile and attribute queries."""
+        logger.info("=== LOAD_MANY player request ===")
+        try:
+            if not request.data.load_many_players:
+                logger.error("Request data missing load_many_players field")
+                return PlayerResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="Request data must contain load_many_players",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            projection = request.data.load_many_players.projection
+            player_ids = list(dict.fromkeys(request.data.load_many_players.player_ids or []))
+            if len(player_ids) > LOAD_MANY_MAX_IDS:
+                logger.error(f"Too many ids requested: {len(player_ids)}")
+                return PlayerResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message=f"Cannot load more than {LOAD_MANY_MAX_IDS} players at once",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            logger.info(f"Loading {len(player_ids)} players")
+
+            known_missing = set(self.missing.missing_of(player_ids))
+            queried_ids = [player_id for player_id in player_ids if player_id not in known_missing]
+            if wants_mobile(projection):
+                player_models = Player.find_many_with_mobile(
+                    queried_ids,
+                    wants_attributes(projection),
+                    wanted_attribute_types(projection),
+                )
+            else:
+                player_models = Player.find_many(queried_ids)
+
+            found_ids = {player.get_id() for player in player_models}
+            for player_id in queried_ids:
+                if player_id not in found_ids:
+                    self.missing.remember(player_id)
+
+            players = {}
+            errors = {}
+            for player in player_models:
+                conversion_results, thrift_player = player.into_thrift(projection)
+                if thrift_player:
+                    players[player.get_id()] = thrift_player
+                else:
+                    errors[player.get_id()] = conversion_results[0]
+
+            for player_id in player_ids:
+                if player_id not in players and player_id not in errors:
+                    errors[player_id] = GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Player {player_id} not found",
+                        error_code=GameError.DB_RECORD_NOT_FOUND,
+                    )
+
+            logger.info(f"SUCCESS: Loaded {len(players)} of {len(player_ids)} players")
+            response_data = PlayerResponseData(
+                load_many_players=LoadManyPlayersResponseData(
+                    players=players,
+                    errors=errors,
+                ),
+            )
+            return PlayerResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=result_message(
+                            projection,
+                            f"Loaded {len(players)} of {len(player_ids)} players",
+                        ),
+                    ),
+                ],
+                response_data=response_data,
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in load_many: {type(e).__name__}: {str(e)}")
+            return PlayerResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to load players: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def _load_owned_inventories(self, player_id: int, mobile_id: Optional[int]) -> List[ThriftInventory]:
+        """
+        Load every inventory owned by the player or its mobile, with entries,
+        using one query for the inventories and one for all of their entries.
+        """
+        owners = [("player", player_id)]
+        if mobile_id is not None:
+            owners.append(("mobile", mobile_id))
+
+        connection = Inventory._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            owner_clause = " OR ".join(["(owner_type = %s AND owner_id = %s)"] * len(owners))
+            cursor.execute(
+                f"SELECT * FROM inventories WHERE {owner_clause} ORDER BY id",
+                tuple(value for owner in owners for value in owner),
+            )
+            inventory_rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+
+        models = []
+        for row in inventory_rows:
+            inventory = Inventory()
+            inventory._data = row
+            inventory._dirty = False
+            models.append(inventory)
+        Inventory.preload_inventory_entries(models)
+
+        inventories = []
+        for inventory in models:
+            results, thrift_inventory = inventory.into_thrift()
+            if thrift_inventory is None:
+                logger.warning(f"Skipping inventory id={inventory.get_id()}: {results[0].message}")
+                continue
+            inventories.append(thrift_inventory)
+        return inventories
+
+    def _load_session_items(self, item_ids: List[int], projection=None) -> Dict[int, ThriftItem]:
+        """Load the referenced items from the catalog when there is one, else in batch."""
+        if not item_ids:
+            return {}
+        if self.catalog is not None:
+            snapshot = self.catalog.snapshot()
+            items = {}
+            for item_id in item_ids:
+                item = snapshot.get(item_id)
+                if item is not None:
+                    items[item_id] = item
+        else:
+            items = load_items(item_ids)
+        return {item_id: project_item(item, projection) for item_id, item in items.items()}
+
+    def _load_session_mobile_items(self, mobile_item_ids: List[int], projection=None) -> Dict[int, ThriftMobileItem]:
+        """
+        Load the mobile item instances the entries point at: one query for the
+        rows and, when the projection wants attributes, one for all of their
+        attributes.
+        """
+        if not mobile_item_ids:
+            return {}
+        models = MobileItem.find_many(mobile_item_ids)
+        if wants_attributes(projection):
+            MobileItem.preload_attributes(models, wanted_attribute_types(projection))
+
+        mobile_items = {}
+        for model in models:
+            _, thrift_mobile_item = model.into_thrift(projection)
+            if thrift_mobile_item is not None:
+                mobile_items[model.get_id()] = thrift_mobile_item
+        return mobile_items
+
+    def load_session(self, request: PlayerRequest) -> PlayerResponse:
+        """
+        Load everything a game server needs when a player logs in: the player
+        and its mobile, every inventory owned by either (with entries), the
+        item templates those entries reference and the mobile item instances
+        they hold, in a fixed number of queries.
+        """
+        logger.info("=== LOAD_SESSION player request ===")
+        try:
+            if not request.data.load_session:
+                logger.error("Request data missing load_session field")
+                return PlayerResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="Request data must contain load_session",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            load_data = request.data.load_session
+            player_id = load_data.player_id
+            projection = load_data.projection
+            logger.info(f"Loading session for player_id={player_id}")
+
+            player = None
+            if not self.missing.is_missing(player_id):
+                # The mobile is needed for its inventories even when the
+                # projection leaves it out of the response
+                players = Player.find_many_with_mobile(
+                    [player_id],
+                    wants_attributes(projection),
+                    wanted_attribute_types(projection),
+                )
+                player = players[0] if players else None
+                if not player:
+                    self.missing.remember(player_id)
+
+            if not player:
+                logger.warning(f"FAILURE: Player_id={player_id} not found")
+                return PlayerResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message=f"Player id={player_id} not found",
+                            error_code=GameError.DB_RECORD_NOT_FOUND,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            results, thrift_player = player.into_thrift(projection)
+            if thrift_player is None:
+                return PlayerResponse(results=results, response_data=None)
+
+            mobile = player.get_mobile()
+            inventories = self._load_owned_inventories(
+                player_id,
+                mobile.get_id() if mobile is not None else None,
+            )
+            item_ids = list(dict.fromkeys(
+                entry.item_id for inventory in inventories for entry in inventory.entries
+            ))
+            items = self._load_session_items(item_ids, projection)
+            mobile_item_ids = list(dict.fromkeys(
+                entry.mobile_item_id
+                for inventory in inventories
+                for entry in inventory.entries
+                if entry.mobile_item_id is not None
+            ))
+            mobile_items = self._load_session_mobile_items(mobile_item_ids, projection)
+
+            logger.info(
+                f"SUCCESS: Loaded session for player_id={player_id} with "
+                f"{len(inventories)} inventories, {len(items)} items and "
+                f"{len(mobile_items)} mobile items"
+            )
+            response_data = PlayerResponseData(
+                load_session=LoadSessionResponseData(
+                    player=thrift_player,
+                    inventories=inventories,
+                    items=items,
+                    mobile_items=mobile_items,
+                ),
+            )
+            return PlayerResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=result_message(
+                            projection,
+                            f"Loaded session for player id={player_id} with "
+                            f"{len(inventories)} inventories and {len(items)} items",
+                        ),
+                    ),
+                ],
+                response_data=response_data,
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in load_session: {type(e).__name__}: {str(e)}")
+            return PlayerResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to load session: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
@@ -0,0 +1,267 @@
+"""
+Write-optimized store of current entity positions.
+
+Positions change many times a second, far more often than anything else in
+the game, and saving each change through Attribute.save() costs a connection
+and an UPDATE per attribute row. Here positions are applied in memory instead:
+every (entity, level) position owns a slot in contiguous NumPy arrays, an
+update overwrites its slot's row and marks it dirty, and a background thread
+writes all dirty rows to the attributes table on an interval, with one UPDATE
+per FLUSH_CHUNK_ROWS rows.
+
+Between flushes the store, not the database, holds the truth about dirty
+positions, so positions re-read from the database never overwrite them.
+
+Only positions that already have an attributes row are tracked: slots come
+from merge_loaded, updates to anything else are rejected, and a flush only
+ever UPDATEs rows. Attributes and attribute_owners rows are created and
+deleted by the services that own the entity, never on this write-behind path.
+"""
+
+import logging
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from db_models.models import Attribute
+
+logger = logging.getLogger(__name__)
+
+Vector3 = Tuple[float, float, float]
+
+# Seconds between writes of dirty positions to the database
+POSITION_FLUSH_INTERVAL = 1.0
+
+# Rows written by one UPDATE statement
+FLUSH_CHUNK_ROWS = 500
+
+_INITIAL_CAPACITY = 1024
+
+def _bulk_update_sql(rows: int) -> str:
+    values = " UNION ALL ".join(
+        ["SELECT %s AS id, %s AS x, %s AS y, %s AS z"] + ["SELECT %s, %s, %s, %s"] * (rows - 1)
+    )
+    return (
+        "UPDATE attributes a"
+        f" JOIN ({values}) v ON a.id = v.id"
+        " SET a.vector3_x = v.x, a.vector3_y = v.y, a.vector3_z = v.z"
+    )
+
+
+class PositionStore:
+    """
+    Thread-safe store of entity positions with deferred, batched writes.
+
+    Entities are (EntityKind, id) pairs, as in SpatialIndex.
+
+    Usage:
+        store = PositionStore()
+        store.merge_loaded({(EntityKind.MOBILE, 7): {
+            AttributeType.LOCAL_POSITION: (1234, (10.0, 3.5, 0.0)),
+        }})
+        store.update([((EntityKind.MOBILE, 7), AttributeType.LOCAL_POSITION, (11.0, 3.5, 0.0))])
+        store.start()
+        ...
+        store.stop()  # writes whatever is still dirty
+    """
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self._lock = threading.Lock()
+        # Held for a whole flush, so two flushes never write the same rows
+        self._flush_lock = threading.Lock()
+        self._coords = np.zeros((capacity, 3), dtype=np.float64)
+        self._attribute_ids = np.zeros(capacity, dtype=np.int64)
+        self._dirty = np.zeros(capacity, dtype=bool)
+        self._keys: List[Optional[Tuple[Hashable, int]]] = []
+        self._free: List[int] = []
+        self._slots: Dict[Hashable, Dict[int, int]] = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._slots)
+
+    def _allocate(self, entity: Hashable, level: int) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._keys[slot] = (entity, level)
+        else:
+            slot = len(self._keys)
+            if slot == len(self._coords):
+                grow = len(self._coords)
+                self._coords = np.concatenate([self._coords, np.zeros((grow, 3), dtype=np.float64)])
+                self._attribute_ids = np.concatenate([self._attribute_ids, np.zeros(grow, dtype=np.int64)])
+                self._dirty = np.concatenate([self._dirty, np.zeros(grow, dtype=bool)])
+            self._keys.append((entity, level))
+        self._dirty[slot] = False
+        self._slots.setdefault(entity, {})[level] = slot
+        return slot
+
+    def _release(self, entity: Hashable, level: int) -> None:
+        slot = self._slots[entity].pop(level)
+        if not self._slots[entity]:
+            del self._slots[entity]
+        self._keys[slot] = None
+        self._dirty[slot] = False
+        self._free.append(slot)
+
+    def _positions_of(self, entity: Hashable) -> Dict[int, Vector3]:
+        return {
+            level: tuple(self._coords[slot].tolist())
+            for level, slot in self._slots.get(entity, {}).items()
+        }
+
+    def positions_of(self, entity: Hashable) -> Dict[int, Vector3]:
+        with self._lock:
+            return self._positions_of(entity)
+
+    def snapshot(self) -> Dict[Hashable, Dict[int, Vector3]]:
+        """Every entity's current positions."""
+        with self._lock:
+            return {entity: self._positions_of(entity) for entity in self._slots}
+
+    def dirty_count(self) -> int:
+        with self._lock:
+            return int(np.count_nonzero(self._dirty[:len(self._keys)]))
+
+    def merge_loaded(
+        self,
+        loaded: Dict[Hashable, Dict[int, Tuple[int, Vector3]]],
+        entities: Optional[Iterable[Hashable]] = None,
+    ) -> Dict[Hashable, Dict[int, Vector3]]:
+        """
+        Take positions read from the database, as entity -> level ->
+        (attribute_id, position), for the given entities, or for every entity
+        when entities is None. Clean positions are replaced; dirty positions
+        keep their unflushed value. Positions no longer stored are dropped
+        even when dirty, since their row, or their owner, is gone.
+
+        Returns the resulting positions of every affected entity.
+        """
+        with self._lock:
+            if entities is None:
+                affected = set(self._slots) | set(loaded)
+            else:
+                affected = set(entities)
+
+            for entity in affected:
+                rows = loaded.get(entity, {})
+                for level in list(self._slots.get(entity, {})):
+                    if level not in rows:
+                        self._release(entity, level)
+                for level, (attribute_id, position) in rows.items():
+                    slot = self._slots.get(entity, {}).get(level)
+                    if slot is None:
+                        slot = self._allocate(entity, level)
+                    self._attribute_ids[slot] = attribute_id
+                    if not self._dirty[slot]:
+                        self._coords[slot] = position
+
+            return {entity: self._positions_of(entity) for entity in affected}
+
+    def update(self, updates: List[Tuple[Hashable, int, Vector3]]) -> List[int]:
+        """
+        Apply (entity, level, position) updates; the last one wins for repeated
+        positions. Updates of positions not stored are skipped.
+
+        Returns the indices of the skipped updates.
+        """
+        rejected: List[int] = []
+        if not updates:
+            return rejected
+        with self._lock:
+            latest: Dict[int, Vector3] = {}
+            for i, (entity, level, position) in enumerate(updates):
+                slot = self._slots.get(entity, {}).get(level)
+                if slot is None:
+                    rejected.append(i)
+                    continue
+                latest[slot] = position
+            if not latest:
+                return rejected
+            slots = np.fromiter(latest.keys(), dtype=np.int64, count=len(latest))
+            self._coords[slots] = np.array(list(latest.values()), dtype=np.float64)
+            self._dirty[slots] = True
+        return rejected
+
+    def remove(self, entity: Hashable) -> None:
+        """Forget an entity, including positions not flushed yet."""
+        with self._lock:
+            for level in list(self._slots.get(entity, {})):
+                self._release(entity, level)
+
+    def _take_dirty(self):
+        with self._lock:
+            slots = np.flatnonzero(self._dirty[:len(self._keys)])
+            self._dirty[slots] = False
+            keys = [self._keys[slot] for slot in slots]
+            return slots, keys, self._attribute_ids[slots].copy(), self._coords[slots].copy()
+
+    def _restore_dirty(self, slots: np.ndarray, keys: list) -> None:
+        with self._lock:
+            for slot, key in zip(slots, keys):
+                if self._keys[slot] == key:
+                    self._dirty[slot] = True
+
+    def flush(self) -> int:
+        """
+        Write every dirty position to the database.
+        Returns the number of positions written.
+        """
+        with self._flush_lock:
+            slots, keys, attribute_ids, coords = self._take_dirty()
+            if not len(slots):
+                return 0
+
+            connection = Attribute._create_connection()
+            cursor = connection.cursor()
+            try:
+                connection.start_transaction()
+                for start in range(0, len(slots), FLUSH_CHUNK_ROWS):
+                    chunk_ids = attribute_ids[start:start + FLUSH_CHUNK_ROWS].tolist()
+                    chunk_coords = coords[start:start + FLUSH_CHUNK_ROWS].tolist()
+                    values = [
+                        value
+                        for attribute_id, position in zip(chunk_ids, chunk_coords)
+                        for value in (attribute_id, *position)
+                    ]
+                    cursor.execute(_bulk_update_sql(len(chunk_ids)), tuple(values))
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                self._restore_dirty(slots, keys)
+                raise
+            finally:
+                cursor.close()
+                connection.close()
+
+            logger.debug(f"Flushed {len(slots)} positions")
+            return len(slots)
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Position flush failed: {type(e).__name__}: {str(e)}")
+
+    def start(self, interval: float = POSITION_FLUSH_INTERVAL) -> None:
+        """Flush dirty positions every interval seconds in a daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._flush_loop,
+            args=(interval,),
+            name="position-flush",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread and write whatever is still dirty."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
@@ -0,0 +1,205 @@
+"""
+Recycling: breaking items in inventories back down into what their
+blueprints are made of.
+
+Breaking down q units of an item yields ratio x q of each of its blueprint
+components, the reverse of crafting. With to_raw_materials the flattened
+bill of materials is used instead, so one step goes all the way down to raw
+materials.
+
+Every request is one transaction. The inventories are locked and read with
+two queries, changed in memory with inventory.py and written back with three
+(see inventory_batch), however many inventories and stacks are salvaged. If
+any output does not fit, nothing is changed.
+"""
+
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from game.ttypes import (
+    GameResult,
+    StatusType,
+    GameError,
+    Inventory as ThriftInventory,
+)
+from db_models.models import Inventory
+from common import is_ok
+from inventory import breakdown_item_in_inventory
+from services.container_tree import add_to_ancestors, is_nested
+from services.inventory_batch import lock_inventories, write_inventories
+
+logger = logging.getLogger(__name__)
+
+# snapshot_of(item_ids): a CatalogSnapshot or MappedCatalog holding item_ids
+# and everything below them in their blueprint trees
+SnapshotOf = Callable[[Iterable[int]], object]
+
+
+def _failure(message: str, error_code: int) -> GameResult:
+    return GameResult(status=StatusType.FAILURE, message=message, error_code=error_code)
+
+
+def breakdown_outputs(snapshot, item_id: int, quantity: float, to_raw_materials: bool = False) -> Dict[int, float]:
+    """What quantity units of item_id break down into, by item id; empty without blueprint components."""
+    components = snapshot.components_of(item_id)
+    if not components:
+        return {}
+    if to_raw_materials:
+        materials = snapshot.bom(item_id).materials
+        return {material_id: amount * quantity for material_id, amount in materials.items()}
+    return {component_item_id: component.ratio * quantity for component_item_id, component in components.items()}
+
+
+def breakdown(
+    inventory: ThriftInventory,
+    snapshot,
+    item_id: int,
+    quantity: float,
+    to_raw_materials: bool = False,
+) -> Tuple[List[GameResult], Dict[int, float]]:
+    """Break quantity units of item_id in a Thrift inventory down, in memory. Returns (results, produced)."""
+    item = snapshot.get(item_id)
+    if item is None:
+        return [_failure(f"Item {item_id} not found", GameError.DB_RECORD_NOT_FOUND)], {}
+    produced = breakdown_outputs(snapshot, item_id, quantity, to_raw_materials)
+    if not produced:
+        return [_failure(f"Item {item_id} has no blueprint to break down into", GameError.DB_INVALID_DATA)], {}
+
+    outputs = []
+    for output_item_id, output_quantity in produced.items():
+        output_item = snapshot.get(output_item_id)
+        if output_item is None:
+            return [_failure(f"Item {output_item_id} not found", GameError.DB_RECORD_NOT_FOUND)], {}
+        outputs.append((output_item, output_quantity))
+    return breakdown_item_in_inventory(inventory, item, quantity, outputs), produced
+
+
+def salvage(
+    inventory: ThriftInventory,
+    snapshot,
+    to_raw_materials: bool = False,
+) -> Tuple[List[GameResult], Dict[int, float], Dict[int, float]]:
+    """
+    Break down every stack with blueprint components in a Thrift inventory,
+    in memory. Item instances (entries with a mobile_item_id) are kept.
+    Returns (results, consumed, produced).
+    """
+    consumed: Dict[int, float] = {}
+    for entry in inventory.entries:
+        if entry.mobile_item_id is None and snapshot.components_of(entry.item_id):
+            consumed[entry.item_id] = consumed.get(entry.item_id, 0.0) + entry.quantity
+
+    results: List[GameResult] = []
+    produced: Dict[int, float] = {}
+    for item_id, quantity in consumed.items():
+        item_results, item_produced = breakdown(inventory, snapshot, item_id, quantity, to_raw_materials)
+        results += item_results
+        if not is_ok(results):
+            return results, consumed, produced
+        for output_item_id, output_quantity in item_produced.items():
+            produced[output_item_id] = produced.get(output_item_id, 0.0) + output_quantity
+    return results, consumed, produced
+
+
+def _recycle(
+    inventory_ids: List[int],
+    snapshot_of: SnapshotOf,
+    change: Callable[[ThriftInventory, object], List[GameResult]],
+) -> Tuple[List[GameResult], List[ThriftInventory]]:
+    """
+    Lock inventory_ids, apply change(inventory, snapshot) to each and write
+    them back, all in one transaction. Nothing is written unless every
+    change is ok. Returns (results, inventories in the order requested).
+    """
+    connection = Inventory._create_connection()
+    cursor = connection.cursor(dictionary=True)
+    try:
+        connection.start_transaction()
+        models = lock_inventories(cursor, inventory_ids)
+        missing = [inventory_id for inventory_id in inventory_ids if inventory_id not in models]
+        if missing:
+            connection.rollback()
+            return [_failure(f"Inventories not found: {missing}", GameError.DB_RECORD_NOT_FOUND)], []
+
+        inventories: List[ThriftInventory] = []
+        for inventory_id in inventory_ids:
+            results, inventory = models[inventory_id].into_thrift()
+            if inventory is None:
+                connection.rollback()
+                return results, []
+            inventories.append(inventory)
+
+        snapshot = snapshot_of({entry.item_id for inventory in inventories for entry in inventory.entries})
+        results: List[GameResult] = []
+        for inventory in inventories:
+            results += change(inventory, snapshot)
+            if not is_ok(results):
+                connection.rollback()
+                logger.warning(f"Recycling in inventory_id={inventory.id} failed, nothing was changed")
+                return results, []
+
+        write_inventories(cursor, inventories, models)
+        for inventory in inventories:
+            model = models[inventory.id]
+            if is_nested(model):
+                add_to_ancestors(
+                    cursor,
+                    inventory.id,
+                    inventory.last_calculated_volume - (model.get_last_calculated_volume() or 0.0),
+                )
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+        connection.close()
+    return results, inventories
+
+
+def breakdown_in_inventory(
+    inventory_id: int,
+    item_id: int,
+    quantity: float,
+    snapshot_of: SnapshotOf,
+    to_raw_materials: bool = False,
+) -> Tuple[List[GameResult], Optional[ThriftInventory], Dict[int, float]]:
+    """Break quantity units of item_id in a stored inventory down. Returns (results, inventory, produced)."""
+    if quantity is None or quantity <= 0.0:
+        return [_failure("quantity must be positive", GameError.DB_INVALID_DATA)], None, {}
+
+    produced: Dict[int, float] = {}
+
+    def change(inventory: ThriftInventory, snapshot) -> List[GameResult]:
+        results, item_produced = breakdown(inventory, snapshot, item_id, quantity, to_raw_materials)
+        produced.update(item_produced)
+        return results
+
+    results, inventories = _recycle([inventory_id], lambda item_ids: snapshot_of([item_id]), change)
+    return results, (inventories[0] if inventories else None), produced
+
+
+def salvage_inventories(
+    inventory_ids: List[int],
+    snapshot_of: SnapshotOf,
+    to_raw_materials: bool = False,
+) -> Tuple[List[GameResult], List[ThriftInventory], Dict[int, float], Dict[int, float]]:
+    """
+    Salvage every stack with blueprint components in many stored inventories
+    at once. Returns (results, inventories, consumed, produced), with the
+    totals summed over every inventory.
+    """
+    consumed: Dict[int, float] = {}
+    produced: Dict[int, float] = {}
+
+    def change(inventory: ThriftInventory, snapshot) -> List[GameResult]:
+        results, inventory_consumed, inventory_produced = salvage(inventory, snapshot, to_raw_materials)
+        for totals, amounts in ((consumed, inventory_consumed), (produced, inventory_produced)):
+            for item_id, quantity in amounts.items():
+                totals[item_id] = totals.get(item_id, 0.0) + quantity
+        return results
+
+    results, inventories = _recycle(list(dict.fromkeys(inventory_ids)), snapshot_of, change)
+    if not inventories:
+        return results, [], {}, {}
+    return results, inventories, consumed, produced
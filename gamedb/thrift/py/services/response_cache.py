@@ -0,0 +1,168 @@
+"""
+Pre-serialized response cache for catalog reads.
+
+Item templates change rarely, yet every ItemService.load / list_records call
+re-queries the database, rebuilds Thrift objects and re-encodes them. The
+CachingItemProcessor keeps the encoded reply of successful reads keyed by the
+encoded request and the handler's catalog version, and writes cached bytes
+straight to the transport on a hit without running the handler at all.
+
+Writes through the handler bump its catalog_version, which makes every entry
+recorded under an older version unreachable.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from thrift.Thrift import TApplicationException, TMessageType
+from thrift.TSerialization import serialize
+from thrift.protocol import TBinaryProtocol
+from thrift.transport import TTransport
+
+from game.ItemService import (
+    Processor as ItemProcessor,
+    load_args,
+    load_result,
+    list_records_args,
+    list_records_result,
+)
+from common import is_ok
+
+logger = logging.getLogger(__name__)
+
+# Default number of encoded replies kept per processor
+RESPONSE_CACHE_MAX_ENTRIES = 10000
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of encoded replies for a single catalog version.
+
+    Entries are stored against the version they were produced under. Storing
+    an entry for a newer version drops everything recorded before it, and
+    lookups for any other version miss.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, name: str = "response_cache"):
+        self.name = name
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, version: int, key: Hashable) -> Optional[bytes]:
+        """Returns the cached bytes for key under version, or None."""
+        with self._lock:
+            if version != self._version or key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, version: int, key: Hashable, data: bytes) -> None:
+        """Stores data for key, unless version is older than the cache's."""
+        with self._lock:
+            if version < self._version:
+                return
+            if version > self._version:
+                self._entries.clear()
+                self._version = version
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class CachingItemProcessor(ItemProcessor):
+    """
+    ItemService processor that serves repeated load and list_records calls
+    from a ResponseCache.
+
+    Only the binary protocol is cached, because cached bytes are written to
+    the transport as they are. Failed responses are never cached.
+    """
+
+    CACHED_METHODS = {
+        "load": (load_args, load_result),
+        "list_records": (list_records_args, list_records_result),
+    }
+
+    def __init__(self, handler, cache: Optional[ResponseCache] = None):
+        ItemProcessor.__init__(self, handler)
+        self.cache = cache if cache is not None else ResponseCache(name="item_responses")
+        self._protocol_factory = TBinaryProtocol.TBinaryProtocolFactory()
+        self._processMap["load"] = CachingItemProcessor.process_load
+        self._processMap["list_records"] = CachingItemProcessor.process_list_records
+
+    def process_load(self, seqid, iprot, oprot):
+        if not isinstance(oprot, TBinaryProtocol.TBinaryProtocol):
+            return ItemProcessor.process_load(self, seqid, iprot, oprot)
+        self._process_cached("load", seqid, iprot, oprot)
+
+    def process_list_records(self, seqid, iprot, oprot):
+        if not isinstance(oprot, TBinaryProtocol.TBinaryProtocol):
+            return ItemProcessor.process_list_records(self, seqid, iprot, oprot)
+        self._process_cached("list_records", seqid, iprot, oprot)
+
+    def _process_cached(self, name: str, seqid: int, iprot, oprot) -> None:
+        args_class, result_class = self.CACHED_METHODS[name]
+        args = args_class()
+        args.read(iprot)
+        iprot.readMessageEnd()
+
+        # Read the version before running the handler so a write that lands
+        # mid-request leaves this reply under the old, unreachable version
+        version = self._handler.catalog_version
+        key = (name, serialize(args.request, self._protocol_factory))
+
+        data = self.cache.get(version, key)
+        if data is not None:
+            logger.debug(f"{self.cache.name}: serving cached {name} reply")
+        else:
+            result = result_class()
+            try:
+                result.success = getattr(self._handler, name)(args.request)
+            except TTransport.TTransportException:
+                raise
+            except TApplicationException as ex:
+                logging.exception('TApplication exception in handler')
+                self._write_exception(name, seqid, oprot, ex)
+                return
+            except Exception:
+                logging.exception('Unexpected exception in handler')
+                self._write_exception(
+                    name,
+                    seqid,
+                    oprot,
+                    TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error'),
+                )
+                return
+
+            data = serialize(result, self._protocol_factory)
+            if result.success is not None and is_ok(result.success.results or []):
+                self.cache.put(version, key, data)
+
+        oprot.writeMessageBegin(name, TMessageType.REPLY, seqid)
+        oprot.trans.write(data)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def _write_exception(self, name: str, seqid: int, oprot, ex: TApplicationException) -> None:
+        oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
+        ex.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
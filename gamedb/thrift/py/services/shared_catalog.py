@@ -0,0 +1,242 @@
+"""
+Memory-mapped item catalog shared by every service process.
+
+run_servers.py starts each service in its own spawned process, so an
+in-process ItemCatalog would be duplicated once per process. Instead the
+catalog is published as a single file that every process maps read-only:
+the kernel keeps one copy of its pages no matter how many processes read it.
+
+File layout (little endian):
+
+    header   magic "GCAT", format version (u32), catalog version (u64),
+             item count (u32)
+    index    one (item_id i64, offset u64, length u32) entry per item,
+             sorted by item_id
+    payload  each Item encoded with TBinaryProtocol, at its index offset
+
+Publishing writes a new file next to the old one and renames it over the
+top, which is atomic. Readers keep using the pages of the file they mapped
+until they notice the rename and remap.
+"""
+
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol, TBinaryProtocolFactory
+from thrift.TSerialization import serialize, deserialize
+
+from game.ttypes import (
+    Item as ThriftItem,
+    ItemBlueprintComponent as ThriftItemBlueprintComponent,
+)
+from services.bill_of_materials import BillOfMaterials
+from services.materialized_index import ItemIndexes, MappedTransport, scan_item
+
+logger = logging.getLogger(__name__)
+
+CATALOG_MAGIC = b"GCAT"
+CATALOG_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sIQI")
+_INDEX_ENTRY = struct.Struct("<qQI")
+
+_protocol_factory = TBinaryProtocolFactory()
+
+
+def write_catalog(path: str, items: Iterable[ThriftItem], version: int) -> None:
+    """
+    Atomically publish items as a memory-mappable catalog file at path.
+
+    Args:
+        path: Destination file
+        items: Thrift items to publish; each must have an id
+        version: Catalog version recorded in the header
+    """
+    encoded = sorted(
+        ((item.id, serialize(item, _protocol_factory)) for item in items),
+        key=lambda pair: pair[0],
+    )
+
+    index = bytearray()
+    offset = _HEADER.size + _INDEX_ENTRY.size * len(encoded)
+    for item_id, data in encoded:
+        index += _INDEX_ENTRY.pack(item_id, offset, len(data))
+        offset += len(data)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".catalog-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(CATALOG_MAGIC, CATALOG_FORMAT_VERSION, version, len(encoded)))
+            f.write(index)
+            for _, data in encoded:
+                f.write(data)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    logger.info(f"Published {len(encoded)} items at catalog version {version} to {path}")
+
+
+class MappedCatalog:
+    """
+    One mapped version of the catalog file.
+
+    Offers the read side of CatalogSnapshot (get, bom, dependents, __len__, version) so
+    handlers can use either. Lookups by id binary search the index inside the
+    mapping; nothing is copied into the process until an item is decoded.
+    Name and blueprint lookups build hash indexes on first use by scanning
+    only the id, name and blueprint of each item.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self.inode = (stat.st_dev, stat.st_ino)
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, format_version, self.version, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != CATALOG_MAGIC or format_version != CATALOG_FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {CATALOG_FORMAT_VERSION} item catalog")
+        self._indexes: Optional[ItemIndexes] = None
+        self._indexes_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, position: int):
+        return _INDEX_ENTRY.unpack_from(self._map, _HEADER.size + position * _INDEX_ENTRY.size)
+
+    def _find(self, item_id: int) -> Optional[int]:
+        low, high = 0, self._count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            entry_id = self._entry(middle)[0]
+            if entry_id == item_id:
+                return middle
+            if entry_id < item_id:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def _decode(self, offset: int, length: int) -> ThriftItem:
+        return deserialize(ThriftItem(), self._map[offset:offset + length], _protocol_factory)
+
+    def get(self, item_id: int) -> Optional[ThriftItem]:
+        """Decode the item with item_id, or return None."""
+        position = self._find(item_id)
+        if position is None:
+            return None
+        _, offset, length = self._entry(position)
+        return self._decode(offset, length)
+
+    by_id = get
+
+    def _name_indexes(self) -> ItemIndexes:
+        indexes = self._indexes
+        if indexes is not None:
+            return indexes
+        with self._indexes_lock:
+            if self._indexes is None:
+                indexes = ItemIndexes(self._map)
+                for position in range(self._count):
+                    _, offset, length = self._entry(position)
+                    item_id, internal_name, blueprint = scan_item(
+                        TBinaryProtocol(MappedTransport(self._map, offset))
+                    )
+                    indexes.add(item_id, internal_name, blueprint, offset, offset + length)
+                self._indexes = indexes
+            return self._indexes
+
+    def by_name(self, internal_name: str) -> Optional[ThriftItem]:
+        """Decode the item with exactly this internal_name, or return None."""
+        item_id = self._name_indexes().id_of(internal_name)
+        return self.get(item_id) if item_id is not None else None
+
+    def components_of(self, item_id: int) -> Dict[int, ThriftItemBlueprintComponent]:
+        """Returns the blueprint components of item_id without decoding the item."""
+        return self._name_indexes().components_of(item_id)
+
+    def used_in(self, item_id: int) -> List[int]:
+        """Returns the ids of items whose blueprint uses item_id."""
+        return self._name_indexes().used_in(item_id)
+
+    def dependents(self, item_id: int, max_depth: Optional[int] = None) -> Tuple[Dict[int, int], bool]:
+        """Returns the items whose blueprints use item_id at any depth, as (item id -> depth, truncated)."""
+        return self._name_indexes().dependents(item_id, max_depth)
+
+    def bom(self, item_id: int) -> Optional[BillOfMaterials]:
+        """Returns the flattened bill of materials of item_id, computed once per mapped version."""
+        return self._name_indexes().bom(item_id)
+
+    def item_ids(self) -> List[int]:
+        """Returns every item id in ascending order."""
+        return [self._entry(position)[0] for position in range(self._count)]
+
+    def items(self) -> Iterator[ThriftItem]:
+        """Decode every item in ascending id order."""
+        for position in range(self._count):
+            _, offset, length = self._entry(position)
+            yield self._decode(offset, length)
+
+
+class SharedCatalogReader:
+    """
+    Follows the catalog file at path, remapping when a new version is published.
+
+    snapshot() returns the current MappedCatalog. The file is checked for a
+    replacement at most once per check_interval seconds.
+    """
+
+    def __init__(self, path: str, check_interval: float = 1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mapped: Optional[MappedCatalog] = None
+        self._next_check = 0.0
+
+    @property
+    def version(self) -> int:
+        mapped = self._mapped
+        return mapped.version if mapped is not None else 0
+
+    def invalidate(self) -> None:
+        """Check for a newly published file on the next snapshot() call."""
+        self._next_check = 0.0
+
+    def snapshot(self) -> MappedCatalog:
+        mapped = self._mapped
+        if mapped is not None and time.monotonic() < self._next_check:
+            return mapped
+        return self._remap_if_changed()
+
+    def _remap_if_changed(self) -> MappedCatalog:
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            mapped = self._mapped
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                if mapped is None:
+                    raise
+                logger.warning(f"{self.path} disappeared; keeping catalog version {mapped.version}")
+                return mapped
+
+            if mapped is None or mapped.inode != (stat.st_dev, stat.st_ino):
+                # The old mapping is released once no request holds it
+                mapped = MappedCatalog(self.path)
+                self._mapped = mapped
+                logger.info(f"Mapped {len(mapped)} items at catalog version {mapped.version}")
+            return mapped
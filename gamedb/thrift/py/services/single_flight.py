@@ -0,0 +1,100 @@
+"""
+Single-flight request coalescing for service handlers.
+
+When many threads ask for the same record at the same time, only the first
+one (the leader) runs the fetch; the others wait for it and receive a copy of
+its result. This flattens thundering herds on popular items and inventories
+after restarts or invalidations without changing what callers see.
+"""
+
+import copy
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """An in-flight fetch that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+
+    Waiters receive a deep copy of the leader's value so that no two requests
+    ever hold the same mutable Thrift object. Exceptions raised by the leader
+    are re-raised in every waiter.
+    """
+
+    def __init__(self, name: str = "single_flight"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn() for key, or wait for the identical call already in flight.
+
+        Args:
+            key: Identifies the work, e.g. the id being loaded
+            fn: Zero-argument callable performing the fetch
+
+        Returns:
+            The value returned by fn()
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            logger.debug(f"{self.name}: joining in-flight call for key={key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.value)
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            if call.waiters:
+                logger.debug(
+                    f"{self.name}: shared result for key={key} with {call.waiters} waiters"
+                )
+            call.done.set()
+
+        return call.value
+
+    def forget(self, key: Hashable) -> None:
+        """
+        Detach the in-flight call for key, if any.
+
+        Calls already waiting still get its result, but calls made after a
+        write start a fresh fetch instead of joining one that may predate it.
+        """
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        """Returns the number of keys currently being fetched."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,287 @@
+"""
+Hierarchical spatial index over position attributes.
+
+Positions are stored as vector3 attributes at four nested levels: where the
+galaxy-scale system is (GALACTIC_POSITION), where in that system
+(SOLAR_POSITION), where on that planet (GLOBAL_POSITION) and where in the local
+area (LOCAL_POSITION). A position only means something together with the
+positions above it, so every level is indexed per frame: the entity's positions
+at the enclosing levels. Two mobiles on different planets never share a
+GLOBAL_POSITION grid, whatever their coordinates.
+
+Within a frame, entities are bucketed in a uniform grid whose cell size suits
+the level. A radius query visits only the cells overlapping the sphere's
+bounding box (or, when the radius spans more cells than are occupied, only the
+occupied cells), so its cost follows the number of nearby entities rather than
+the size of the world.
+"""
+
+import math
+import threading
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from game.ttypes import AttributeType
+
+Vector3 = Tuple[float, float, float]
+
+# Position levels, outermost first
+POSITION_LEVELS = (
+    AttributeType.GALACTIC_POSITION,
+    AttributeType.SOLAR_POSITION,
+    AttributeType.GLOBAL_POSITION,
+    AttributeType.LOCAL_POSITION,
+)
+
+# Grid cell edge per level, in that level's position units
+SPATIAL_CELL_SIZES = {
+    AttributeType.GALACTIC_POSITION: 1000.0,
+    AttributeType.SOLAR_POSITION: 100.0,
+    AttributeType.GLOBAL_POSITION: 10.0,
+    AttributeType.LOCAL_POSITION: 1.0,
+}
+
+FrameKey = Tuple[Tuple[int, Vector3], ...]
+Cell = Tuple[int, int, int]
+
+
+def frame_key(positions: Dict[int, Vector3], level: int) -> FrameKey:
+    """The positions at the levels enclosing level, as a hashable key."""
+    key = []
+    for outer in POSITION_LEVELS:
+        if outer == level:
+            break
+        if outer in positions:
+            key.append((outer, positions[outer]))
+    return tuple(key)
+
+
+def distance(a: Vector3, b: Vector3) -> float:
+    return math.sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2)
+
+
+class SpatialIndex:
+    """
+    Thread-safe index of entity positions.
+
+    Entities are any hashable key; the services use (EntityKind, id) pairs.
+
+    Usage:
+        index = SpatialIndex()
+        index.set_positions((EntityKind.MOBILE, 7), {
+            AttributeType.GLOBAL_POSITION: (1.0, 2.0, 0.0),
+            AttributeType.LOCAL_POSITION: (10.0, 3.5, 0.0),
+        })
+        nearby = index.query_radius(
+            AttributeType.LOCAL_POSITION,
+            (10.0, 3.0, 0.0),
+            5.0,
+            frame={AttributeType.GLOBAL_POSITION: (1.0, 2.0, 0.0)},
+        )
+    """
+
+    def __init__(self, cell_sizes: Optional[Dict[int, float]] = None):
+        self.cell_sizes = dict(SPATIAL_CELL_SIZES)
+        if cell_sizes:
+            self.cell_sizes.update(cell_sizes)
+        self._lock = threading.RLock()
+        self._positions: Dict[Hashable, Dict[int, Vector3]] = {}
+        # level -> frame -> cell -> entities
+        self._grids: Dict[int, Dict[FrameKey, Dict[Cell, Set[Hashable]]]] = {
+            level: {} for level in POSITION_LEVELS
+        }
+        self._listeners: List[Callable[[Hashable], None]] = []
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._positions)
+
+    def __contains__(self, entity: Hashable) -> bool:
+        with self._lock:
+            return entity in self._positions
+
+    def add_listener(self, callback: Callable[[Hashable], None]) -> None:
+        """
+        Call callback(entity) after any of entity's positions changed.
+        Callbacks run after the index lock is released, so they may query it.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, entities: Iterable[Hashable]) -> None:
+        for entity in entities:
+            for callback in self._listeners:
+                callback(entity)
+
+    def _cell(self, level: int, position: Vector3) -> Cell:
+        size = self.cell_sizes[level]
+        return (
+            math.floor(position[0] / size),
+            math.floor(position[1] / size),
+            math.floor(position[2] / size),
+        )
+
+    def cell_of(self, level: int, position: Vector3) -> Cell:
+        """The grid cell holding position at level."""
+        return self._cell(level, position)
+
+    def cells_within(
+        self,
+        level: int,
+        center: Vector3,
+        radius: float,
+        max_cells: int,
+    ) -> Optional[List[Cell]]:
+        """
+        The grid cells overlapping the bounding box of a sphere at level, or
+        None when there are more than max_cells of them.
+        """
+        low = self._cell(level, (center[0] - radius, center[1] - radius, center[2] - radius))
+        high = self._cell(level, (center[0] + radius, center[1] + radius, center[2] + radius))
+        span = (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+        if span > max_cells:
+            return None
+        return [
+            (x, y, z)
+            for x in range(low[0], high[0] + 1)
+            for y in range(low[1], high[1] + 1)
+            for z in range(low[2], high[2] + 1)
+        ]
+
+    def _insert(self, entity: Hashable, positions: Dict[int, Vector3]) -> None:
+        for level, position in positions.items():
+            cells = self._grids[level].setdefault(frame_key(positions, level), {})
+            cells.setdefault(self._cell(level, position), set()).add(entity)
+
+    def _discard(self, entity: Hashable, positions: Dict[int, Vector3]) -> None:
+        for level, position in positions.items():
+            key = frame_key(positions, level)
+            cells = self._grids[level].get(key)
+            if cells is None:
+                continue
+            cell = self._cell(level, position)
+            members = cells.get(cell)
+            if members is None:
+                continue
+            members.discard(entity)
+            if not members:
+                del cells[cell]
+                if not cells:
+                    del self._grids[level][key]
+
+    def positions_of(self, entity: Hashable) -> Dict[int, Vector3]:
+        with self._lock:
+            return dict(self._positions.get(entity, {}))
+
+    def _replace(self, entity: Hashable, positions: Dict[int, Vector3]) -> bool:
+        positions = {
+            level: tuple(position)
+            for level, position in positions.items()
+            if level in self.cell_sizes and position is not None
+        }
+        previous = self._positions.get(entity)
+        if previous == positions or (previous is None and not positions):
+            return False
+        if previous is not None:
+            self._discard(entity, previous)
+        if positions:
+            self._positions[entity] = positions
+            self._insert(entity, positions)
+        else:
+            self._positions.pop(entity, None)
+        return True
+
+    def set_positions(self, entity: Hashable, positions: Dict[int, Vector3]) -> None:
+        """
+        Replace every indexed position of entity. Moving an outer level moves
+        the entity into other frames at every level inside it.
+        """
+        with self._lock:
+            changed = self._replace(entity, positions)
+        if changed:
+            self._notify([entity])
+
+    def set_position(self, entity: Hashable, level: int, position: Vector3) -> None:
+        """Update one level of entity's position."""
+        with self._lock:
+            positions = dict(self._positions.get(entity, {}))
+            positions[level] = position
+            changed = self._replace(entity, positions)
+        if changed:
+            self._notify([entity])
+
+    def remove(self, entity: Hashable) -> None:
+        self.set_positions(entity, {})
+
+    def clear(self) -> None:
+        with self._lock:
+            removed = list(self._positions)
+            self._positions.clear()
+            for level in POSITION_LEVELS:
+                self._grids[level].clear()
+        self._notify(removed)
+
+    def _candidate_cells(
+        self,
+        level: int,
+        cells: Dict[Cell, Set[Hashable]],
+        center: Vector3,
+        radius: float,
+    ) -> Iterable[Set[Hashable]]:
+        low = self._cell(level, (center[0] - radius, center[1] - radius, center[2] - radius))
+        high = self._cell(level, (center[0] + radius, center[1] + radius, center[2] + radius))
+        span = (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+        if span > len(cells):
+            # Fewer occupied cells than cells in the box; test those instead
+            for cell, members in cells.items():
+                if all(low[axis] <= cell[axis] <= high[axis] for axis in range(3)):
+                    yield members
+            return
+        for x in range(low[0], high[0] + 1):
+            for y in range(low[1], high[1] + 1):
+                for z in range(low[2], high[2] + 1):
+                    members = cells.get((x, y, z))
+                    if members:
+                        yield members
+
+    def query_radius(
+        self,
+        level: int,
+        center: Vector3,
+        radius: float,
+        frame: Optional[Dict[int, Vector3]] = None,
+        accept=None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Hashable, Vector3, float]]:
+        """
+        Entities whose position at level is within radius of center, nearest
+        first, as (entity, position, distance).
+
+        frame gives the positions of enclosing levels; only entities in that
+        frame are returned. With frame None every frame at level is searched.
+        accept, if given, is called with each entity and filters the results.
+        """
+        if level not in self.cell_sizes:
+            raise ValueError(f"Not a position level: {level}")
+        center = tuple(center)
+        with self._lock:
+            grids = self._grids[level]
+            if frame is not None:
+                wanted = frame_key({outer: tuple(p) for outer, p in frame.items()}, level)
+                frames = [grids[wanted]] if wanted in grids else []
+            else:
+                frames = list(grids.values())
+
+            found = []
+            for cells in frames:
+                for members in self._candidate_cells(level, cells, center, radius):
+                    for entity in members:
+                        if accept is not None and not accept(entity):
+                            continue
+                        position = self._positions[entity][level]
+                        entity_distance = distance(center, position)
+                        if entity_distance <= radius:
+                            found.append((entity, position, entity_distance))
+
+        found.sort(key=lambda match: match[2])
+        if limit is not None:
+            found = found[:limit]
+        return found
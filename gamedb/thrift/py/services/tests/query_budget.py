@@ -0,0 +1,30 @@
+"""
+Query budget helpers for the service test suite.
+
+Budgets are measured with db_models.models.QueryStats, which counts every
+statement sent through a model connection on the current thread.
+"""
+
+from contextlib import contextmanager
+
+from db_models.models import QueryStats
+
+
+@contextmanager
+def assert_max_queries(max_queries: int):
+    """
+    Fail if the wrapped block issues more than max_queries statements.
+
+    Usage:
+        with assert_max_queries(2):
+            service.load(request)
+    """
+    start = QueryStats.query_count()
+    yield
+    used = QueryStats.query_count() - start
+    if used > max_queries:
+        recent = QueryStats.statements()[-used:]
+        details = "\n".join(f"  {statement}" for statement in recent)
+        raise AssertionError(
+            f"Query budget exceeded: {used} queries issued, budget is {max_queries}\n{details}"
+        )
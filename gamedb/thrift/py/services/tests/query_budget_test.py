@@ -0,0 +1,1769 @@
+#!/usr/bin/env python3
+"""
+Query budget tests for every service method.
+
+Each test runs one request inside assert_max_queries() so that a model
+regeneration or handler change that adds queries per request fails here
+instead of reaching production.
+"""
+
+import sys
+import os
+import uuid
+
+thrift_gen_path = "/vagrant/gamedb/thrift/gen-py"
+if thrift_gen_path not in sys.path:
+    sys.path.insert(0, thrift_gen_path)
+
+py_path = "/vagrant/gamedb/thrift/py"
+if py_path not in sys.path:
+    sys.path.insert(0, py_path)
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import mysql.connector
+from services.item_service import ItemServiceHandler
+from services.inventory_service import InventoryServiceHandler
+from services.player_service import PlayerServiceHandler
+from services.world_service import WorldServiceHandler
+from services.crafting import CREATE_CRAFTING_JOBS_TABLE_STATEMENT, CraftingScheduler
+from services.item_catalog import ItemCatalog
+from services.tests.query_budget import assert_max_queries
+from game.ttypes import (
+    ItemRequest,
+    ItemRequestData,
+    CreateItemRequestData,
+    LoadItemRequestData,
+    SaveItemRequestData,
+    DestroyItemRequestData,
+    ListItemRequestData,
+    AutocompleteItemRequestData,
+    LoadItemWithBlueprintTreeRequestData,
+    LoadManyItemsRequestData,
+    LoadBillOfMaterialsRequestData,
+    LoadDependentsRequestData,
+    InventoryRequest,
+    InventoryRequestData,
+    LoadInventoryRequestData,
+    CreateInventoryRequestData,
+    SaveInventoryRequestData,
+    SplitStackRequestData,
+    TransferItemRequestData,
+    ListInventoryRequestData,
+    LoadManyInventoriesRequestData,
+    PlayerRequest,
+    PlayerRequestData,
+    CreatePlayerRequestData,
+    LoadPlayerRequestData,
+    SavePlayerRequestData,
+    DeletePlayerRequestData,
+    ListPlayerRequestData,
+    LoadManyPlayersRequestData,
+    LoadSessionRequestData,
+    OwnerItemTotalsRequestData,
+    OwnerCapacityRequestData,
+    OwnerHasItemsRequestData,
+    OwnerCraftableRequestData,
+    StartCraftingRequestData,
+    CancelCraftingRequestData,
+    ListCraftingJobsRequestData,
+    BreakdownItemRequestData,
+    SalvageContainersRequestData,
+    SetItemAttributesRequestData,
+    CraftingJobState,
+    LoadContainerTreeRequestData,
+    WorldRequest,
+    WorldRequestData,
+    QueryRadiusRequestData,
+    UpdatePositionsRequestData,
+    PositionUpdate,
+    SubscribeAreaRequestData,
+    PollAreaRequestData,
+    UnsubscribeAreaRequestData,
+    GameError,
+    Item as ThriftItem,
+    Inventory as ThriftInventory,
+    Attribute as ThriftAttribute,
+    AttributeValue,
+    Player as ThriftPlayer,
+    ItemType,
+    MobileType,
+    AttributeType,
+    EntityKind,
+    ItemVector3,
+    Owner,
+    Projection,
+)
+from common import is_ok
+from db_models.models import (
+    Attribute,
+    AttributeOwner,
+    Inventory,
+    InventoryEntry,
+    InventoryOwner,
+    Item,
+    ItemBlueprint,
+    ItemBlueprintComponent,
+    Mobile,
+    MobileItem,
+    MobileItemAttribute,
+    MobileItemBlueprint,
+    MobileItemBlueprintComponent,
+    Player,
+    QueryStats,
+)
+import db_models.models
+
+TEST_DATABASE = None
+
+# An id no test database row will ever have
+MISSING_ID = 2**62
+
+ALL_MODELS = [
+    Attribute,
+    AttributeOwner,
+    Inventory,
+    InventoryEntry,
+    InventoryOwner,
+    Item,
+    ItemBlueprint,
+    ItemBlueprintComponent,
+    Mobile,
+    MobileItem,
+    MobileItemAttribute,
+    MobileItemBlueprint,
+    MobileItemBlueprintComponent,
+    Player,
+]
+
+
+def setUpModule():
+    """Set up test database before running tests."""
+    global TEST_DATABASE
+    TEST_DATABASE = f"gamedb_test_{uuid.uuid4().hex[:8]}"
+
+    connection = mysql.connector.connect(
+        host="localhost",
+        user="admin",
+        password="minda",
+        auth_plugin="mysql_native_password",
+        ssl_disabled=True,
+        use_pure=True,
+    )
+    cursor = connection.cursor()
+
+    cursor.execute(f"CREATE DATABASE `{TEST_DATABASE}`")
+    connection.database = TEST_DATABASE
+
+    cursor.execute("SET FOREIGN_KEY_CHECKS=0")
+    for model in ALL_MODELS:
+        cursor.execute(model.CREATE_TABLE_STATEMENT)
+    cursor.execute(CREATE_CRAFTING_JOBS_TABLE_STATEMENT)
+    cursor.execute("SET FOREIGN_KEY_CHECKS=1")
+
+    connection.commit()
+    cursor.close()
+    connection.close()
+
+    os.environ["DB_DATABASE"] = TEST_DATABASE
+    db_models.models.DB_DATABASE = TEST_DATABASE
+    print(f"\n✓ Test database '{TEST_DATABASE}' created")
+
+
+def tearDownModule():
+    """Tear down test database after running tests."""
+    global TEST_DATABASE
+
+    if TEST_DATABASE:
+        connection = mysql.connector.connect(
+            host="localhost",
+            user="admin",
+            password="minda",
+            auth_plugin="mysql_native_password",
+            ssl_disabled=True,
+            use_pure=True,
+        )
+        cursor = connection.cursor()
+        cursor.execute(f"DROP DATABASE IF EXISTS `{TEST_DATABASE}`")
+        connection.commit()
+        cursor.close()
+        connection.close()
+        print(f"\n✓ Test database '{TEST_DATABASE}' dropped")
+
+
+def create_test_item(internal_name):
+    """Helper function to create a test item outside of any budget."""
+    service = ItemServiceHandler()
+    item = ThriftItem(
+        id=None,
+        internal_name=internal_name,
+        attributes={},
+        max_stack_size=1000,
+        item_type=ItemType.RAWMATERIAL,
+    )
+    response = service.create(
+        ItemRequest(
+            data=ItemRequestData(
+                create_item=CreateItemRequestData(item=item),
+            ),
+        ),
+    )
+    assert is_ok(response.results), f"Create failed: {response.results[0].message}"
+    return response.response_data.create_item.item
+
+
+def create_test_inventory(mobile_id=100):
+    """Helper function to create a test inventory outside of any budget."""
+    service = InventoryServiceHandler()
+    inventory = ThriftInventory(
+        id=None,
+        max_entries=10,
+        max_volume=500.0,
+        entries=[],
+        owner=Owner(mobile_id=mobile_id),
+    )
+    response = service.create(
+        InventoryRequest(
+            data=InventoryRequestData(
+                create_inventory=CreateInventoryRequestData(inventory=inventory),
+            ),
+        ),
+    )
+    assert is_ok(response.results), f"Create failed: {response.results[0].message}"
+    return response.response_data.create_inventory.inventory
+
+
+def create_test_entry(inventory_id, item_id, quantity=10.0, mobile_item_id=None):
+    """Helper function to add an entry to an inventory outside of any budget."""
+    entry = InventoryEntry()
+    entry.set_inventory_id(inventory_id)
+    entry.set_item_id(item_id)
+    entry.set_quantity(quantity)
+    if mobile_item_id is not None:
+        entry.set_mobile_item_id(mobile_item_id)
+    entry.save()
+
+
+def create_test_blueprint(item_id, components, bake_time_ms=1000):
+    """Helper function to give an item a blueprint of {component item id: ratio} outside of any budget."""
+    blueprint = ItemBlueprint()
+    blueprint.set_bake_time_ms(bake_time_ms)
+    blueprint.save()
+    for component_item_id, ratio in components.items():
+        component = ItemBlueprintComponent()
+        component.set_item_blueprint_id(blueprint.get_id())
+        component.set_component_item_id(component_item_id)
+        component.set_ratio(ratio)
+        component.save()
+    item = Item.find(item_id)
+    item.set_blueprint_id(blueprint.get_id())
+    item.save()
+
+
+def create_test_player(name, with_mobile=True):
+    """Helper function to create a player (and its mobile) outside of any budget."""
+    player = Player()
+    player.set_full_name(f"{name} Full Name")
+    player.set_what_we_call_you(name)
+    player.set_security_token("hashed_password")
+    player.set_over_13(1)
+    player.set_year_of_birth(1990)
+    player.set_email(f"{name}@example.com")
+    player.save()
+
+    if with_mobile:
+        mobile = Mobile()
+        mobile.set_mobile_type(MobileType.PLAYER)
+        mobile.set_what_we_call_you(name)
+        mobile.set_owner_player_id(player.get_id())
+        mobile.save()
+
+    return player.get_id()
+
+
+# ============================================================================
+# ItemService
+# ============================================================================
+
+
+def test_item_load_budget():
+    """Item load: one SELECT for the item, one JOIN for its attributes."""
+    service = ItemServiceHandler()
+    item = create_test_item(f"budget_load_{uuid.uuid4().hex[:6]}")
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            load_item=LoadItemRequestData(item_id=item.id),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.load(request)
+    assert is_ok(response.results)
+
+
+def test_item_load_missing_budget():
+    """A repeated miss is answered from the negative cache without a query."""
+    service = ItemServiceHandler()
+    request = ItemRequest(
+        data=ItemRequestData(
+            load_item=LoadItemRequestData(item_id=MISSING_ID),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.load(request)
+    assert response.results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+    with assert_max_queries(0):
+        response = service.load(request)
+    assert response.results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+
+
+def test_item_create_budget():
+    service = ItemServiceHandler()
+    item = ThriftItem(
+        id=None,
+        internal_name=f"budget_create_{uuid.uuid4().hex[:6]}",
+        attributes={},
+        max_stack_size=1000,
+        item_type=ItemType.RAWMATERIAL,
+    )
+    request = ItemRequest(
+        data=ItemRequestData(
+            create_item=CreateItemRequestData(item=item),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.create(request)
+    assert is_ok(response.results)
+
+
+def test_item_save_budget():
+    service = ItemServiceHandler()
+    item = create_test_item(f"budget_save_{uuid.uuid4().hex[:6]}")
+    item.max_stack_size = 500
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            save_item=SaveItemRequestData(item=item),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.save(request)
+    assert is_ok(response.results)
+
+
+def test_item_destroy_budget():
+    """Item destroy checks every child table before deleting the row."""
+    service = ItemServiceHandler()
+    item = create_test_item(f"budget_destroy_{uuid.uuid4().hex[:6]}")
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            destroy_item=DestroyItemRequestData(item_id=item.id),
+        ),
+    )
+    with assert_max_queries(11):
+        response = service.destroy(request)
+    assert is_ok(response.results)
+
+
+def test_item_list_records_budget():
+    """A 50 item page: COUNT, page SELECT and one batched attribute query."""
+    service = ItemServiceHandler()
+    prefix = f"budget_list_{uuid.uuid4().hex[:6]}"
+    for i in range(50):
+        create_test_item(f"{prefix}_{i:02d}")
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            list_item=ListItemRequestData(
+                page=0,
+                results_per_page=50,
+                search_string=prefix,
+            ),
+        ),
+    )
+    with assert_max_queries(3):
+        response = service.list_records(request)
+    assert is_ok(response.results)
+    assert len(response.response_data.list_item.items) == 50
+
+
+def test_item_list_records_without_attributes_budget():
+    """Projecting attributes out drops the batched attribute query."""
+    service = ItemServiceHandler()
+    prefix = f"budget_sparse_{uuid.uuid4().hex[:6]}"
+    for i in range(20):
+        create_test_item(f"{prefix}_{i:02d}")
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            list_item=ListItemRequestData(
+                page=0,
+                results_per_page=20,
+                search_string=prefix,
+                projection=Projection(include_attributes=False, compact_results=True),
+            ),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.list_records(request)
+    assert is_ok(response.results)
+    assert response.results[0].message is None
+    assert all(item.attributes is None for item in response.response_data.list_item.items)
+
+
+def test_item_list_records_attribute_types_budget():
+    """Projecting attributes to some types filters them in the attribute query itself."""
+    service = ItemServiceHandler()
+    prefix = f"budget_typed_{uuid.uuid4().hex[:6]}"
+    for i in range(5):
+        item = create_test_item(f"{prefix}_{i:02d}")
+        create_test_position(item.id, AttributeType.LOCAL_POSITION, (1.0, 2.0, 3.0))
+        create_test_position(item.id, AttributeType.SIZE, (1.0, 1.0, 1.0))
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            list_item=ListItemRequestData(
+                page=0,
+                results_per_page=5,
+                search_string=prefix,
+                projection=Projection(attribute_types=[AttributeType.SIZE]),
+            ),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.list_records(request)
+    assert is_ok(response.results)
+    assert "attribute_type IN" in QueryStats.statements()[-1]
+    items = response.response_data.list_item.items
+    assert len(items) == 5
+    assert all(list(item.attributes) == [AttributeType.SIZE] for item in items)
+
+
+def test_item_load_many_budget():
+    """Many items: one IN query for the items, one for all their attributes."""
+    service = ItemServiceHandler()
+    prefix = f"budget_many_{uuid.uuid4().hex[:6]}"
+    item_ids = [create_test_item(f"{prefix}_{i:02d}").id for i in range(20)]
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            load_many_items=LoadManyItemsRequestData(item_ids=item_ids + [999999999]),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.load_many(request)
+    assert is_ok(response.results)
+    assert len(response.response_data.load_many_items.items) == 20
+    assert 999999999 in response.response_data.load_many_items.errors
+
+
+def test_item_autocomplete_budget():
+    service = ItemServiceHandler()
+    create_test_item(f"budget_autocomplete_{uuid.uuid4().hex[:6]}")
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            autocomplete_item=AutocompleteItemRequestData(
+                search_string="budget_autocomplete",
+                max_results=10,
+            ),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.autocomplete(request)
+    assert is_ok(response.results)
+
+
+def test_item_load_with_blueprint_tree_budget():
+    service = ItemServiceHandler()
+    item = create_test_item(f"budget_tree_{uuid.uuid4().hex[:6]}")
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            load_with_blueprint_tree=LoadItemWithBlueprintTreeRequestData(
+                item_id=item.id,
+                max_depth=10,
+            ),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.load_with_blueprint_tree(request)
+    assert is_ok(response.results)
+
+
+def test_item_load_bill_of_materials_budget():
+    """
+    Without a catalog: the items, their attributes, blueprints and blueprint
+    components per level of the blueprint trees. Raw materials stop after one.
+    """
+    service = ItemServiceHandler()
+    prefix = f"budget_bom_{uuid.uuid4().hex[:6]}"
+    item_ids = [create_test_item(f"{prefix}_{i:02d}").id for i in range(20)]
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            load_bill_of_materials=LoadBillOfMaterialsRequestData(item_ids=item_ids + [999999999]),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.load_bill_of_materials(request)
+    assert is_ok(response.results)
+    boms = response.response_data.load_bill_of_materials.boms
+    assert len(boms) == 20
+    assert boms[item_ids[0]].materials == {item_ids[0]: 1.0}
+    assert 999999999 in response.response_data.load_bill_of_materials.errors
+
+
+def test_item_load_dependents_budget():
+    """Without a catalog: one recursive query over the blueprint graph, whatever the depth."""
+    service = ItemServiceHandler()
+    item = create_test_item(f"budget_dependents_{uuid.uuid4().hex[:6]}")
+
+    request = ItemRequest(
+        data=ItemRequestData(
+            load_dependents=LoadDependentsRequestData(item_id=item.id, max_depth=10),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.load_dependents(request)
+    assert is_ok(response.results)
+    assert response.response_data.load_dependents.depths == {}
+
+    request.data.load_dependents.item_id = 999999999
+    with assert_max_queries(1):
+        response = service.load_dependents(request)
+    assert response.results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+
+
+# ============================================================================
+# InventoryService
+# ============================================================================
+
+
+def test_inventory_load_budget():
+    """Inventory load: one SELECT for the inventory, one for its entries."""
+    service = InventoryServiceHandler()
+    inventory = create_test_inventory()
+    create_test_entry(inventory.id, create_test_item(f"budget_inv_load_{uuid.uuid4().hex[:6]}").id)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            load_inventory=LoadInventoryRequestData(inventory_id=inventory.id),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.load(request)
+    assert is_ok(response.results)
+    assert len(response.response_data.load_inventory.inventory.entries) == 1
+
+
+def test_inventory_load_missing_budget():
+    service = InventoryServiceHandler()
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            load_inventory=LoadInventoryRequestData(inventory_id=MISSING_ID),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.load(request)
+    assert response.results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+    with assert_max_queries(0):
+        response = service.load(request)
+    assert response.results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+
+
+def test_inventory_create_budget():
+    service = InventoryServiceHandler()
+    inventory = ThriftInventory(
+        id=None,
+        max_entries=10,
+        max_volume=500.0,
+        entries=[],
+        owner=Owner(mobile_id=100),
+    )
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            create_inventory=CreateInventoryRequestData(inventory=inventory),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.create(request)
+    assert is_ok(response.results)
+
+
+def test_inventory_save_budget():
+    """Inventory save: the UPDATE, then one SELECT of the stored entries to match the list against."""
+    service = InventoryServiceHandler()
+    inventory = create_test_inventory()
+    inventory.max_entries = 20
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            save_inventory=SaveInventoryRequestData(inventory=inventory),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.save(request)
+    assert is_ok(response.results)
+
+
+def test_inventory_save_entries_budget():
+    """
+    Inventory save with entries: None leaves the stored entries alone, an
+    unchanged list writes none of them, and a changed list writes only the
+    entries that changed, keeping their ids.
+    """
+    service = InventoryServiceHandler()
+    inventory = create_test_inventory()
+    items = [create_test_item(f"budget_save_{uuid.uuid4().hex[:6]}") for _ in range(3)]
+    for item in items:
+        create_test_entry(inventory.id, item.id, 5.0)
+    stored_ids = [entry.get_id() for entry in Inventory.find(inventory.id).get_inventory_entries()]
+
+    def save(thrift_inventory):
+        return service.save(
+            InventoryRequest(
+                data=InventoryRequestData(
+                    save_inventory=SaveInventoryRequestData(inventory=thrift_inventory),
+                ),
+            ),
+        )
+
+    inventory.entries = None
+    with assert_max_queries(1):
+        response = save(inventory)
+    assert is_ok(response.results)
+    assert len(Inventory.find(inventory.id).get_inventory_entries()) == 3
+
+    _, thrift_inventory = Inventory.find(inventory.id).into_thrift()
+    assert [entry.id for entry in thrift_inventory.entries] == stored_ids
+    with assert_max_queries(2):
+        response = save(thrift_inventory)
+    assert is_ok(response.results)
+
+    thrift_inventory.entries[0].quantity = 2.0
+    del thrift_inventory.entries[1]
+    with assert_max_queries(4):
+        response = save(thrift_inventory)
+    assert is_ok(response.results)
+    entries = Inventory.find(inventory.id).get_inventory_entries()
+    assert [entry.get_id() for entry in entries] == [stored_ids[0], stored_ids[2]]
+    assert entries[0].get_quantity() == 2.0
+
+    thrift_inventory.entries = []
+    with assert_max_queries(3):
+        response = save(thrift_inventory)
+    assert is_ok(response.results)
+    assert Inventory.find(inventory.id).get_inventory_entries() == []
+
+
+def test_inventory_split_stack_budget():
+    """Split: load with entries (2), then the UPDATE, the split entry's UPDATE and the new entry's INSERT."""
+    service = InventoryServiceHandler()
+    inventory = create_test_inventory()
+    item = create_test_item(f"budget_split_{uuid.uuid4().hex[:6]}")
+    create_test_entry(inventory.id, item.id)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            split_stack=SplitStackRequestData(
+                inventory_id=inventory.id,
+                item_id=item.id,
+                quantity_to_split=5.0,
+            ),
+        ),
+    )
+    with assert_max_queries(5):
+        response = service.split_stack(request)
+    assert is_ok(response.results)
+    assert len(response.response_data.split_stack.inventory.entries) == 2
+    entries = Inventory.find(inventory.id).get_inventory_entries()
+    assert len(entries) == 2
+    assert entries[0].get_id() != entries[1].get_id()
+
+
+def test_inventory_transfer_item_budget():
+    """
+    Transfer without a catalog, so the item is loaded from the database (2):
+    both inventories locked with their entries (2), then for each inventory
+    its UPDATE and the one entry that changed or is new (4). With a catalog
+    the item costs nothing and the transfer takes 6.
+    """
+    service = InventoryServiceHandler()
+    source = create_test_inventory(mobile_id=100)
+    destination = create_test_inventory(mobile_id=101)
+    item = create_test_item(f"budget_transfer_{uuid.uuid4().hex[:6]}")
+    create_test_entry(source.id, item.id)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            transfer_item=TransferItemRequestData(
+                source_inventory_id=source.id,
+                destination_inventory_id=destination.id,
+                item_id=item.id,
+                quantity=5.0,
+            ),
+        ),
+    )
+    with assert_max_queries(8):
+        response = service.transfer_item(request)
+    assert is_ok(response.results)
+    assert Inventory.find(source.id).get_inventory_entries()[0].get_quantity() == 5.0
+    assert Inventory.find(destination.id).get_inventory_entries()[0].get_quantity() == 5.0
+
+
+def test_inventory_list_records_budget():
+    service = InventoryServiceHandler()
+    for i in range(10):
+        create_test_inventory(mobile_id=200 + i)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            list_inventory=ListInventoryRequestData(
+                page=0,
+                results_per_page=10,
+            ),
+        ),
+    )
+    with assert_max_queries(3):
+        response = service.list_records(request)
+    assert is_ok(response.results)
+
+
+def test_inventory_load_many_budget():
+    service = InventoryServiceHandler()
+    inventory_ids = [create_test_inventory(mobile_id=300 + i).id for i in range(10)]
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            load_many_inventories=LoadManyInventoriesRequestData(
+                inventory_ids=inventory_ids,
+            ),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.load_many(request)
+    assert is_ok(response.results)
+    assert len(response.response_data.load_many_inventories.inventories) == 10
+
+
+def test_inventory_owner_item_totals_budget():
+    """Owner totals: one aggregate query however many inventories the owner has."""
+    service = InventoryServiceHandler()
+    item = create_test_item(f"budget_totals_{uuid.uuid4().hex[:6]}")
+    for _ in range(3):
+        create_test_entry(create_test_inventory(mobile_id=400).id, item.id, 4.0)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            owner_item_totals=OwnerItemTotalsRequestData(
+                owner=Owner(mobile_id=400),
+                item_ids=[item.id],
+            ),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.owner_item_totals(request)
+    assert is_ok(response.results)
+    assert response.response_data.owner_item_totals.quantities == {item.id: 12.0}
+
+
+def test_inventory_owner_capacity_budget():
+    service = InventoryServiceHandler()
+    item = create_test_item(f"budget_capacity_{uuid.uuid4().hex[:6]}")
+    inventory_ids = [create_test_inventory(mobile_id=401).id for _ in range(3)]
+    create_test_entry(inventory_ids[0], item.id)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            owner_capacity=OwnerCapacityRequestData(owner=Owner(mobile_id=401)),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.owner_capacity(request)
+    assert is_ok(response.results)
+    capacities = response.response_data.owner_capacity.inventories
+    assert [capacity.inventory_id for capacity in capacities] == inventory_ids
+    assert [capacity.free_entries for capacity in capacities] == [9, 10, 10]
+
+
+def test_inventory_owner_has_items_budget():
+    service = InventoryServiceHandler()
+    held = create_test_item(f"budget_has_{uuid.uuid4().hex[:6]}")
+    create_test_entry(create_test_inventory(mobile_id=402).id, held.id)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            owner_has_items=OwnerHasItemsRequestData(
+                owner=Owner(mobile_id=402),
+                item_ids=[held.id, MISSING_ID],
+            ),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.owner_has_items(request)
+    assert is_ok(response.results)
+    assert response.response_data.owner_has_items.present == {held.id: True, MISSING_ID: False}
+
+
+def create_nested_inventory(container_item_id, volume):
+    """Create an inventory owned by a container item, holding volume."""
+    service = InventoryServiceHandler()
+    inventory = ThriftInventory(
+        id=None,
+        max_entries=10,
+        max_volume=500.0,
+        entries=[],
+        last_calculated_volume=volume,
+        owner=Owner(item_id=container_item_id),
+    )
+    return service.create(
+        InventoryRequest(
+            data=InventoryRequestData(
+                create_inventory=CreateInventoryRequestData(inventory=inventory),
+            ),
+        ),
+    )
+
+
+def test_inventory_load_container_tree_budget():
+    """
+    Container tree: creating a nested inventory adds its volume to every
+    ancestor in one statement; the tree loads with one recursive query plus one
+    for all of the entries, however deep it is.
+    """
+    service = InventoryServiceHandler()
+    container = create_test_item(f"budget_container_{uuid.uuid4().hex[:6]}")
+    root = create_test_inventory(mobile_id=403)
+    outer_instance, inner_instance = 10_000_000 + root.id * 2, 10_000_001 + root.id * 2
+
+    create_test_entry(root.id, container.id, 1.0, mobile_item_id=outer_instance)
+    outer = create_nested_inventory(outer_instance, 25.0).response_data.create_inventory.inventory
+    create_test_entry(outer.id, container.id, 1.0, mobile_item_id=inner_instance)
+    with assert_max_queries(2):
+        response = create_nested_inventory(inner_instance, 10.0)
+    assert is_ok(response.results)
+    inner = response.response_data.create_inventory.inventory
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            load_container_tree=LoadContainerTreeRequestData(inventory_id=root.id),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.load_container_tree(request)
+    assert is_ok(response.results)
+    nodes = response.response_data.load_container_tree.nodes
+    assert [node.inventory.id for node in nodes] == [root.id, outer.id, inner.id]
+    assert [node.parent_inventory_id for node in nodes] == [None, root.id, outer.id]
+    assert [node.contained_volume for node in nodes] == [35.0, 10.0, 0.0]
+    assert nodes[0].total_volume == 35.0
+
+
+def test_inventory_transfer_container_budget():
+    """
+    Moving a container instance: the item (2), both inventories locked with
+    their entries (2), the nested inventory's total (1), each inventory's
+    UPDATE and entry change (4), then one statement per container chain (2),
+    in one transaction.
+    """
+    service = InventoryServiceHandler()
+    container = create_test_item(f"budget_container_{uuid.uuid4().hex[:6]}")
+    source = create_test_inventory(mobile_id=405)
+    destination = create_test_inventory(mobile_id=406)
+    instance = 10_000_000 + source.id * 2
+    create_test_entry(source.id, container.id, 1.0, mobile_item_id=instance)
+    assert is_ok(create_nested_inventory(instance, 25.0).results)
+    assert Inventory.find(source.id).get_contained_volume() == 25.0
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            transfer_item=TransferItemRequestData(
+                source_inventory_id=source.id,
+                destination_inventory_id=destination.id,
+                item_id=container.id,
+                quantity=1.0,
+                mobile_item_id=instance,
+            ),
+        ),
+    )
+    with assert_max_queries(11):
+        response = service.transfer_item(request)
+    assert is_ok(response.results)
+    transferred = response.response_data.transfer_item
+    assert transferred.source_inventory.entries == []
+    assert [entry.mobile_item_id for entry in transferred.destination_inventory.entries] == [instance]
+    assert transferred.destination_inventory.contained_volume == 25.0
+    assert Inventory.find(source.id).get_contained_volume() == 0.0
+    assert Inventory.find(destination.id).get_contained_volume() == 25.0
+
+
+def test_inventory_owner_craftable_budget():
+    """
+    Craftable: without a catalog, one query for every blueprint component and
+    one aggregate query for what the owner holds, however many blueprints exist.
+    """
+    service = InventoryServiceHandler()
+    item = create_test_item(f"budget_craftable_{uuid.uuid4().hex[:6]}")
+    for _ in range(3):
+        create_test_entry(create_test_inventory(mobile_id=404).id, item.id, 4.0)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            owner_craftable=OwnerCraftableRequestData(owner=Owner(mobile_id=404)),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.owner_craftable(request)
+    assert is_ok(response.results)
+    assert item.id not in response.response_data.owner_craftable.craftable
+
+
+def _crafting_fixture(name):
+    """An inventory holding 10 of a component and an item made from 2 of it."""
+    component = create_test_item(f"{name}_component_{uuid.uuid4().hex[:6]}")
+    product = create_test_item(f"{name}_product_{uuid.uuid4().hex[:6]}")
+    create_test_blueprint(product.id, {component.id: 2.0})
+    inventory = create_test_inventory()
+    create_test_entry(inventory.id, component.id, 10.0)
+    return inventory, component, product
+
+
+def test_inventory_start_crafting_budget():
+    """
+    Start crafting without a catalog: the item template (four queries), the
+    inventory with its entries to check the inputs, and the job INSERT.
+    """
+    service = InventoryServiceHandler()
+    inventory, _, product = _crafting_fixture("budget_start_crafting")
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            start_crafting=StartCraftingRequestData(
+                inventory_id=inventory.id,
+                item_id=product.id,
+                quantity=3.0,
+            ),
+        ),
+    )
+    with assert_max_queries(7):
+        response = service.start_crafting(request)
+    assert is_ok(response.results)
+    job = response.response_data.start_crafting.job
+    assert job.state == CraftingJobState.PENDING
+    assert len(service.crafting) == 1
+
+    # More than the inventory holds is refused before anything is written
+    request.data.start_crafting.quantity = 6.0
+    response = service.start_crafting(request)
+    assert not is_ok(response.results)
+    assert response.results[0].error_code == GameError.INV_INSUFFICIENT_QUANTITY
+
+
+def test_inventory_cancel_and_list_crafting_budget():
+    """Cancelling is one conditional UPDATE; listing is one SELECT."""
+    service = InventoryServiceHandler()
+    inventory, _, product = _crafting_fixture("budget_cancel_crafting")
+    _, job = service.crafting.start_job(inventory.id, product.id, 1.0)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            cancel_crafting=CancelCraftingRequestData(job_id=job.id),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.cancel_crafting(request)
+    assert is_ok(response.results)
+    assert response.response_data.cancel_crafting.cancelled
+    assert len(service.crafting) == 0
+    response = service.cancel_crafting(request)
+    assert not response.response_data.cancel_crafting.cancelled
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            list_crafting_jobs=ListCraftingJobsRequestData(
+                inventory_id=inventory.id,
+                pending_only=False,
+            ),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.list_crafting_jobs(request)
+    assert is_ok(response.results)
+    jobs = response.response_data.list_crafting_jobs.jobs
+    assert [(j.id, j.state) for j in jobs] == [(job.id, CraftingJobState.CANCELLED)]
+
+
+def test_inventory_complete_crafting_budget():
+    """
+    Completing a job with a catalog: the job, the inventory and its entries
+    locked, the inventory UPDATE, the component entry UPDATE and the product
+    entry INSERT, and the job UPDATE, all in one transaction.
+    """
+    inventory, component, product = _crafting_fixture("budget_complete_crafting")
+    catalog = ItemCatalog()
+    catalog.load()
+    scheduler = CraftingScheduler(catalog=catalog)
+    _, job = scheduler.start_job(inventory.id, product.id, 3.0)
+
+    with assert_max_queries(7):
+        completed = scheduler.complete_job(job.id)
+    assert completed.state == CraftingJobState.COMPLETED
+    quantities = {
+        entry.get_item_id(): entry.get_quantity()
+        for entry in Inventory.find(inventory.id).get_inventory_entries()
+    }
+    assert quantities == {component.id: 4.0, product.id: 3.0}
+
+    # Both jobs pass the start check, but the first one uses up the inputs
+    _, first = scheduler.start_job(inventory.id, product.id, 2.0)
+    _, second = scheduler.start_job(inventory.id, product.id, 2.0)
+    assert scheduler.complete_job(first.id).state == CraftingJobState.COMPLETED
+    failed = scheduler.complete_job(second.id)
+    assert failed.state == CraftingJobState.FAILED
+    assert failed.error == "item not found in inventory"
+    assert scheduler.complete_job(second.id) is None
+
+
+def test_inventory_breakdown_item_budget():
+    """
+    Breakdown with a catalog: the inventory locked with its entries, then the
+    inventory UPDATE and one UPDATE of both changed entries. The entries keep
+    their ids.
+    """
+    inventory, component, product = _crafting_fixture("budget_breakdown")
+    create_test_entry(inventory.id, product.id, 3.0)
+    catalog = ItemCatalog()
+    catalog.load()
+    service = InventoryServiceHandler(catalog=catalog)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            breakdown_item=BreakdownItemRequestData(
+                inventory_id=inventory.id,
+                item_id=product.id,
+                quantity=2.0,
+            ),
+        ),
+    )
+    entry_ids = {entry.get_id() for entry in Inventory.find(inventory.id).get_inventory_entries()}
+    with assert_max_queries(4):
+        response = service.breakdown_item(request)
+    assert is_ok(response.results)
+    breakdown = response.response_data.breakdown_item
+    assert breakdown.produced == {component.id: 4.0}
+    quantities = {entry.item_id: entry.quantity for entry in breakdown.inventory.entries}
+    assert quantities == {component.id: 14.0, product.id: 1.0}
+    assert {entry.id for entry in breakdown.inventory.entries} == entry_ids
+    assert {entry.get_id() for entry in Inventory.find(inventory.id).get_inventory_entries()} == entry_ids
+
+
+def test_inventory_salvage_containers_budget():
+    """
+    Salvaging many inventories with a catalog costs the same five queries as
+    one: the lock with entries (2), the volume UPDATE, one DELETE of the
+    salvaged entries and one UPDATE of the components they became.
+    """
+    inventory, component, product = _crafting_fixture("budget_salvage")
+    catalog = ItemCatalog()
+    catalog.load()
+    service = InventoryServiceHandler(catalog=catalog)
+    inventory_ids = []
+    for _ in range(4):
+        salvaged = create_test_inventory()
+        create_test_entry(salvaged.id, product.id, 2.0)
+        create_test_entry(salvaged.id, component.id, 1.0)
+        inventory_ids.append(salvaged.id)
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            salvage_containers=SalvageContainersRequestData(inventory_ids=inventory_ids),
+        ),
+    )
+    with assert_max_queries(5):
+        response = service.salvage_containers(request)
+    assert is_ok(response.results)
+    salvage = response.response_data.salvage_containers
+    assert [salvaged.id for salvaged in salvage.inventories] == inventory_ids
+    assert salvage.consumed == {product.id: 8.0}
+    assert salvage.produced == {component.id: 16.0}
+    assert all(
+        [(entry.item_id, entry.quantity) for entry in salvaged.entries] == [(component.id, 5.0)]
+        for salvaged in salvage.inventories
+    )
+
+    # A missing inventory fails the whole request
+    request.data.salvage_containers.inventory_ids = inventory_ids + [MISSING_ID]
+    response = service.salvage_containers(request)
+    assert not is_ok(response.results)
+    assert response.results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+
+
+def test_inventory_set_item_attributes_budget():
+    """
+    Attributes matching the template: only the entry lookup. Diverging ones:
+    the lookup, then the template copy, the entry (split off the stack when
+    only part of it is customized) and the attributes in one multi-statement
+    round trip.
+    """
+    inventory, _, product = _crafting_fixture("budget_materialize")
+    create_test_entry(inventory.id, product.id, 1.0)
+    create_test_position(product.id, AttributeType.LOCAL_POSITION, (1.0, 2.0, 3.0))
+    catalog = ItemCatalog()
+    catalog.load()
+    service = InventoryServiceHandler(catalog=catalog)
+    template_position = catalog.snapshot().get(product.id).attributes[AttributeType.LOCAL_POSITION]
+
+    request = InventoryRequest(
+        data=InventoryRequestData(
+            set_item_attributes=SetItemAttributesRequestData(
+                inventory_id=inventory.id,
+                item_id=product.id,
+                attributes=[template_position],
+            ),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.set_item_attributes(request)
+    assert is_ok(response.results)
+    assert not response.response_data.set_item_attributes.materialized
+    assert response.response_data.set_item_attributes.mobile_item_id is None
+
+    purity = ThriftAttribute(
+        internal_name="purity",
+        visible=True,
+        value=AttributeValue(double_value=0.9),
+        attribute_type=AttributeType.PURITY,
+    )
+    request.data.set_item_attributes.attributes = [template_position, purity]
+    with assert_max_queries(2):
+        response = service.set_item_attributes(request)
+    assert is_ok(response.results)
+    assert response.response_data.set_item_attributes.materialized
+    mobile_item_id = response.response_data.set_item_attributes.mobile_item_id
+
+    mobile_item = MobileItem.find(mobile_item_id)
+    assert mobile_item.get_item_id() == product.id
+    assert mobile_item.get_mobile_id() == 100
+    assert mobile_item.get_blueprint_id() is not None
+    assert len(MobileItemBlueprintComponent.find_by_item_blueprint_id(mobile_item.get_blueprint_id())) == 1
+    _, thrift_mobile_item = mobile_item.into_thrift()
+    assert thrift_mobile_item.attributes[AttributeType.LOCAL_POSITION].value.vector3.z == 3.0
+    assert thrift_mobile_item.attributes[AttributeType.PURITY].value.double_value == 0.9
+    assert [entry.get_mobile_item_id() for entry in InventoryEntry.find_by_inventory_id(inventory.id)].count(mobile_item_id) == 1
+
+    # Changing the instance again overwrites its attribute in place
+    purity.value = AttributeValue(double_value=0.5)
+    request.data.set_item_attributes.attributes = [purity]
+    request.data.set_item_attributes.mobile_item_id = mobile_item_id
+    with assert_max_queries(2):
+        response = service.set_item_attributes(request)
+    assert is_ok(response.results)
+    assert not response.response_data.set_item_attributes.materialized
+    _, thrift_mobile_item = MobileItem.find(mobile_item_id).into_thrift()
+    assert len(thrift_mobile_item.attributes) == 2
+    assert thrift_mobile_item.attributes[AttributeType.PURITY].value.double_value == 0.5
+
+    # Only overrides are stored; moving the instance and moving it back to the
+    # template's position adds an override and drops it again
+    assert len(MobileItemAttribute.find_by_mobile_item_id(mobile_item_id)) == 1
+    moved = ThriftAttribute(
+        internal_name=template_position.internal_name,
+        visible=template_position.visible,
+        value=AttributeValue(vector3=ItemVector3(x=1.0, y=2.0, z=9.0)),
+        attribute_type=AttributeType.LOCAL_POSITION,
+    )
+    request.data.set_item_attributes.attributes = [moved]
+    assert is_ok(service.set_item_attributes(request).results)
+    assert len(MobileItemAttribute.find_by_mobile_item_id(mobile_item_id)) == 2
+    request.data.set_item_attributes.attributes = [template_position]
+    assert is_ok(service.set_item_attributes(request).results)
+    assert len(MobileItemAttribute.find_by_mobile_item_id(mobile_item_id)) == 1
+
+    # Customizing part of a stack splits it off; the rest stays a reference
+    create_test_entry(inventory.id, product.id, 5.0)
+    request.data.set_item_attributes.mobile_item_id = None
+    request.data.set_item_attributes.attributes = [purity]
+    request.data.set_item_attributes.quantity = 2.0
+    with assert_max_queries(2):
+        response = service.set_item_attributes(request)
+    assert is_ok(response.results)
+    split_mobile_item_id = response.response_data.set_item_attributes.mobile_item_id
+    entries = [
+        (entry.get_quantity(), entry.get_mobile_item_id())
+        for entry in InventoryEntry.find_by_inventory_id(inventory.id)
+        if entry.get_item_id() == product.id
+    ]
+    assert (3.0, None) in entries and (2.0, split_mobile_item_id) in entries
+    request.data.set_item_attributes.quantity = 4.0
+    response = service.set_item_attributes(request)
+    assert response.results[0].error_code == GameError.INV_INSUFFICIENT_QUANTITY
+
+
+def test_mobile_item_attributes_budget():
+    """
+    A mobile item's attributes: the template's and the overrides in one
+    query, interned so that instances with equal attributes share them.
+    """
+    item = create_test_item(f"budget_flyweight_{uuid.uuid4().hex[:6]}")
+    create_test_position(item.id, AttributeType.LOCAL_POSITION, (1.0, 2.0, 3.0))
+    create_test_position(item.id, AttributeType.SIZE, (1.0, 1.0, 1.0))
+    instances = []
+    for _ in range(2):
+        mobile_item = MobileItem()
+        mobile_item.set_mobile_id(100)
+        mobile_item.set_internal_name(item.internal_name)
+        mobile_item.set_item_type("RAWMATERIAL")
+        mobile_item.set_item_id(item.id)
+        mobile_item.save()
+        instances.append(mobile_item)
+    override = MobileItemAttribute()
+    override.set_mobile_item_id(instances[1].get_id())
+    override.set_internal_name("local_position")
+    override.set_visible(0)
+    override.set_attribute_type("LOCAL_POSITION")
+    override.set_vector3_x(5.0)
+    override.set_vector3_y(5.0)
+    override.set_vector3_z(5.0)
+    override.save()
+
+    loaded = [MobileItem.find(instance.get_id()) for instance in instances]
+    with assert_max_queries(1):
+        first = loaded[0].get_attributes()
+    with assert_max_queries(1):
+        second = loaded[1].get_attributes()
+    assert [attribute.get_attribute_type() for attribute in first] == [AttributeType.LOCAL_POSITION, AttributeType.SIZE]
+    assert [attribute.get_attribute_type() for attribute in second] == [AttributeType.LOCAL_POSITION, AttributeType.SIZE]
+    assert first[0].get_vector3_x() == 1.0 and second[0].get_vector3_x() == 5.0
+    # The template attribute neither overrides is one shared, read-only object
+    assert first[1] is second[1]
+    assert first[1].into_thrift()[1].id == first[1].get_id() is not None
+    try:
+        first[1].set_vector3_x(2.0)
+        assert False, "Interned attributes must be read-only"
+    except TypeError:
+        pass
+    assert MobileItem.find(instances[0].get_id()).get_attributes() is first
+
+
+# ============================================================================
+# PlayerService
+# ============================================================================
+
+
+def test_player_load_budget():
+    """Player load: the player joined with its mobile, then the mobile's attributes."""
+    service = PlayerServiceHandler()
+    player_id = create_test_player(f"budget_load_{uuid.uuid4().hex[:6]}")
+
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            load_player=LoadPlayerRequestData(player_id=player_id),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.load(request)
+    assert is_ok(response.results)
+    assert response.response_data.load_player.player.mobile is not None
+
+
+def test_player_load_without_mobile_budget():
+    """Projecting the mobile out leaves only the player SELECT."""
+    service = PlayerServiceHandler()
+    player_id = create_test_player(f"budget_sparse_{uuid.uuid4().hex[:6]}")
+
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            load_player=LoadPlayerRequestData(
+                player_id=player_id,
+                projection=Projection(include_mobile=False),
+            ),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.load(request)
+    assert is_ok(response.results)
+    assert response.response_data.load_player.player.mobile is None
+
+
+def test_player_load_missing_budget():
+    service = PlayerServiceHandler()
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            load_player=LoadPlayerRequestData(player_id=MISSING_ID),
+        ),
+    )
+    with assert_max_queries(1):
+        response = service.load(request)
+    assert response.results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+    with assert_max_queries(0):
+        response = service.load(request)
+    assert response.results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+
+
+def test_player_create_budget():
+    service = PlayerServiceHandler()
+    player = ThriftPlayer(
+        id=None,
+        full_name="Budget Create",
+        what_we_call_you=f"budget_create_{uuid.uuid4().hex[:6]}",
+        security_token="hashed_password",
+        over_13=True,
+        year_of_birth=1990,
+        email="budget_create@example.com",
+    )
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            create_player=CreatePlayerRequestData(player=player),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.create(request)
+    assert is_ok(response.results)
+
+
+def test_player_save_budget():
+    service = PlayerServiceHandler()
+    name = f"budget_save_{uuid.uuid4().hex[:6]}"
+    player_id = create_test_player(name)
+    player = ThriftPlayer(
+        id=player_id,
+        full_name="Budget Save Renamed",
+        what_we_call_you=name,
+        security_token="hashed_password",
+        over_13=True,
+        year_of_birth=1990,
+        email="budget_save@example.com",
+    )
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            save_player=SavePlayerRequestData(player=player),
+        ),
+    )
+    with assert_max_queries(3):
+        response = service.save(request)
+    assert is_ok(response.results)
+
+
+def test_player_delete_budget():
+    service = PlayerServiceHandler()
+    player_id = create_test_player(
+        f"budget_delete_{uuid.uuid4().hex[:6]}",
+        with_mobile=False,
+    )
+
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            delete_player=DeletePlayerRequestData(player_id=player_id),
+        ),
+    )
+    with assert_max_queries(8):
+        response = service.delete(request)
+    assert is_ok(response.results)
+
+
+def test_player_list_records_budget():
+    """Player pages: count, page, then every row's mobile and their attributes in one query each."""
+    service = PlayerServiceHandler()
+    prefix = f"budget_list_{uuid.uuid4().hex[:6]}"
+    page_size = 10
+    for i in range(page_size):
+        create_test_player(f"{prefix}_{i:02d}")
+
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            list_player=ListPlayerRequestData(
+                page=0,
+                results_per_page=page_size,
+                search_string=prefix,
+            ),
+        ),
+    )
+    with assert_max_queries(4):
+        response = service.list_records(request)
+    assert is_ok(response.results)
+    players = response.response_data.list_player.players
+    assert len(players) == page_size
+    assert all(player.mobile is not None for player in players)
+
+
+def test_player_load_many_budget():
+    """Many players: the players joined with their mobiles, then the mobiles' attributes."""
+    service = PlayerServiceHandler()
+    prefix = f"budget_many_{uuid.uuid4().hex[:6]}"
+    player_ids = [create_test_player(f"{prefix}_{i:02d}") for i in range(10)]
+
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            load_many_players=LoadManyPlayersRequestData(player_ids=player_ids),
+        ),
+    )
+    with assert_max_queries(2):
+        response = service.load_many(request)
+    assert is_ok(response.results)
+    assert len(response.response_data.load_many_players.players) == 10
+
+
+def test_player_load_session_budget():
+    """
+    Session: the player joined with its mobile, the mobile's attributes, the
+    owned inventories, all of their entries, then the items with their
+    attributes, blueprints and blueprint components.
+    """
+    service = PlayerServiceHandler()
+    player_id = create_test_player(f"budget_session_{uuid.uuid4().hex[:6]}")
+    mobile_id = Player.find(player_id).get_mobile().get_id()
+    inventories = [create_test_inventory(mobile_id=mobile_id) for _ in range(3)]
+    items = [create_test_item(f"budget_session_{uuid.uuid4().hex[:6]}") for _ in range(4)]
+    for inventory in inventories:
+        for item in items:
+            create_test_entry(inventory.id, item.id, 5.0)
+
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            load_session=LoadSessionRequestData(player_id=player_id),
+        ),
+    )
+    with assert_max_queries(8):
+        response = service.load_session(request)
+    assert is_ok(response.results)
+    session = response.response_data.load_session
+    assert session.player.mobile.id == mobile_id
+    assert len(session.inventories) == 3
+    assert all(len(inventory.entries) == 4 for inventory in session.inventories)
+    assert set(session.items) == {item.id for item in items}
+
+
+def test_player_load_session_mobile_items_budget():
+    """
+    Session with mobile item instances: the session queries plus one for the
+    instances the entries point at and one for all of their attributes.
+    """
+    service = PlayerServiceHandler()
+    player_id = create_test_player(f"budget_session_{uuid.uuid4().hex[:6]}")
+    mobile_id = Player.find(player_id).get_mobile().get_id()
+    inventory = create_test_inventory(mobile_id=mobile_id)
+    item = create_test_item(f"budget_session_{uuid.uuid4().hex[:6]}")
+    create_test_position(item.id, AttributeType.LOCAL_POSITION, (1.0, 2.0, 3.0))
+    instance_ids = []
+    for _ in range(3):
+        mobile_item = MobileItem()
+        mobile_item.set_mobile_id(mobile_id)
+        mobile_item.set_internal_name(item.internal_name)
+        mobile_item.set_item_type("RAWMATERIAL")
+        mobile_item.set_item_id(item.id)
+        mobile_item.save()
+        instance_ids.append(mobile_item.get_id())
+        create_test_entry(inventory.id, item.id, 1.0, mobile_item_id=mobile_item.get_id())
+    create_test_entry(inventory.id, item.id, 5.0)
+
+    request = PlayerRequest(
+        data=PlayerRequestData(
+            load_session=LoadSessionRequestData(player_id=player_id),
+        ),
+    )
+    with assert_max_queries(10):
+        response = service.load_session(request)
+    assert is_ok(response.results)
+    session = response.response_data.load_session
+    assert set(session.items) == {item.id}
+    assert set(session.mobile_items) == set(instance_ids)
+    for instance_id, mobile_item in session.mobile_items.items():
+        assert mobile_item.id == instance_id
+        assert mobile_item.item_id == item.id
+        assert mobile_item.mobile_id == mobile_id
+        assert mobile_item.attributes[AttributeType.LOCAL_POSITION].value.vector3.z == 3.0
+
+
+# ============================================================================
+# WorldService
+# ============================================================================
+
+
+def create_test_position(item_id, attribute_type, position):
+    """Helper function to give an item a position attribute outside of any budget."""
+    attribute = Attribute()
+    attribute.set_internal_name(AttributeType._VALUES_TO_NAMES[attribute_type].lower())
+    attribute.set_visible(0)
+    attribute.set_attribute_type(AttributeType._VALUES_TO_NAMES[attribute_type])
+    attribute.set_vector3_x(position[0])
+    attribute.set_vector3_y(position[1])
+    attribute.set_vector3_z(position[2])
+    attribute.save()
+
+    owner = AttributeOwner()
+    owner.set_attribute_id(attribute.get_id())
+    owner.set_item_id(item_id)
+    owner.save()
+
+
+def test_world_load_budget():
+    """World load: every position attribute of every entity in one query."""
+    service = WorldServiceHandler()
+    item = create_test_item(f"budget_world_{uuid.uuid4().hex[:6]}")
+    create_test_position(item.id, AttributeType.GLOBAL_POSITION, (3.0, 4.0, 0.0))
+    create_test_position(item.id, AttributeType.LOCAL_POSITION, (1.0, 1.0, 0.0))
+
+    with assert_max_queries(1):
+        service.load()
+    assert (EntityKind.ITEM, item.id) in service.index
+
+
+def test_world_query_radius_budget():
+    """query_radius is answered from the index without touching the database."""
+    service = WorldServiceHandler()
+    item = create_test_item(f"budget_radius_{uuid.uuid4().hex[:6]}")
+    frame = (float(item.id), 0.0, 0.0)
+    create_test_position(item.id, AttributeType.GLOBAL_POSITION, frame)
+    create_test_position(item.id, AttributeType.LOCAL_POSITION, (1.0, 1.0, 0.0))
+    service.load()
+
+    request = WorldRequest(
+        data=WorldRequestData(
+            query_radius=QueryRadiusRequestData(
+                level=AttributeType.LOCAL_POSITION,
+                center=ItemVector3(x=0.0, y=1.0, z=0.0),
+                radius=2.0,
+                frame={AttributeType.GLOBAL_POSITION: ItemVector3(x=frame[0], y=frame[1], z=frame[2])},
+            ),
+        ),
+    )
+    with assert_max_queries(0):
+        response = service.query_radius(request)
+    assert is_ok(response.results)
+    entities = response.response_data.query_radius.entities
+    assert [(entity.kind, entity.id) for entity in entities] == [(EntityKind.ITEM, item.id)]
+    assert entities[0].distance == 1.0
+
+
+def test_world_refresh_item_budget():
+    """An item invalidation re-reads only that item's positions, with one query."""
+    service = WorldServiceHandler()
+    item = create_test_item(f"budget_refresh_{uuid.uuid4().hex[:6]}")
+    service.load()
+    assert (EntityKind.ITEM, item.id) not in service.index
+
+    create_test_position(item.id, AttributeType.LOCAL_POSITION, (5.0, 5.0, 0.0))
+    with assert_max_queries(1):
+        service.refresh_item(item.id)
+    assert service.index.positions_of((EntityKind.ITEM, item.id)) == {
+        AttributeType.LOCAL_POSITION: (5.0, 5.0, 0.0),
+    }
+
+
+def test_world_update_positions_budget():
+    """
+    Position updates are applied in memory and the flush writes every changed
+    position row with one UPDATE. Positions not stored yet are rejected, so a
+    flush never INSERTs.
+    """
+    service = WorldServiceHandler()
+    item = create_test_item(f"budget_move_{uuid.uuid4().hex[:6]}")
+    create_test_position(item.id, AttributeType.GLOBAL_POSITION, (1.0, 1.0, 0.0))
+    create_test_position(item.id, AttributeType.LOCAL_POSITION, (1.0, 1.0, 0.0))
+    service.load()
+    service.store.flush()
+
+    updates = [
+        PositionUpdate(
+            kind=EntityKind.ITEM,
+            id=item.id,
+            level=AttributeType.LOCAL_POSITION,
+            position=ItemVector3(x=float(step), y=1.0, z=0.0),
+        )
+        for step in range(10)
+    ] + [
+        PositionUpdate(
+            kind=EntityKind.ITEM,
+            id=item.id,
+            level=AttributeType.GLOBAL_POSITION,
+            position=ItemVector3(x=2.0, y=2.0, z=0.0),
+        ),
+    ]
+    request = WorldRequest(
+        data=WorldRequestData(
+            update_positions=UpdatePositionsRequestData(updates=updates),
+        ),
+    )
+    with assert_max_queries(0):
+        response = service.update_positions(request)
+    assert is_ok(response.results)
+    assert response.response_data.update_positions.updated == 11
+    assert (EntityKind.ITEM, item.id) in service.index
+
+    with assert_max_queries(1):
+        assert service.store.flush() == 2
+
+    unplaced = create_test_item(f"budget_unplaced_{uuid.uuid4().hex[:6]}")
+    request = WorldRequest(
+        data=WorldRequestData(
+            update_positions=UpdatePositionsRequestData(
+                updates=[
+                    PositionUpdate(
+                        kind=EntityKind.ITEM,
+                        id=unplaced.id,
+                        level=AttributeType.LOCAL_POSITION,
+                        position=ItemVector3(x=3.0, y=3.0, z=0.0),
+                    ),
+                ],
+            ),
+        ),
+    )
+    with assert_max_queries(0):
+        response = service.update_positions(request)
+    assert response.response_data.update_positions.updated == 0
+    assert response.response_data.update_positions.errors[0].error_code == GameError.DB_RECORD_NOT_FOUND
+    assert (EntityKind.ITEM, unplaced.id) not in service.index
+    with assert_max_queries(0):
+        assert service.store.flush() == 0
+
+    with assert_max_queries(1):
+        service.refresh_item(item.id)
+    assert service.index.positions_of((EntityKind.ITEM, item.id)) == {
+        AttributeType.GLOBAL_POSITION: (2.0, 2.0, 0.0),
+        AttributeType.LOCAL_POSITION: (9.0, 1.0, 0.0),
+    }
+    with assert_max_queries(1):
+        service.refresh_item(unplaced.id)
+    assert service.index.positions_of((EntityKind.ITEM, unplaced.id)) == {}
+
+
+def test_world_area_subscription_budget():
+    """Area subscriptions are kept current in memory: no RPC of theirs queries the database."""
+    service = WorldServiceHandler()
+    viewer = create_test_item(f"budget_viewer_{uuid.uuid4().hex[:6]}")
+    frame = (float(viewer.id), 1.0, 0.0)
+    create_test_position(viewer.id, AttributeType.GLOBAL_POSITION, frame)
+    create_test_position(viewer.id, AttributeType.LOCAL_POSITION, (0.0, 0.0, 0.0))
+    service.load()
+
+    request = WorldRequest(
+        data=WorldRequestData(
+            subscribe_area=SubscribeAreaRequestData(
+                level=AttributeType.LOCAL_POSITION,
+                radius=5.0,
+                center=ItemVector3(x=0.0, y=0.0, z=0.0),
+                frame={AttributeType.GLOBAL_POSITION: ItemVector3(x=frame[0], y=frame[1], z=frame[2])},
+            ),
+        ),
+    )
+    with assert_max_queries(0):
+        response = service.subscribe_area(request)
+    assert is_ok(response.results)
+    subscription_id = response.response_data.subscribe_area.subscription_id
+    assert [entity.id for entity in response.response_data.subscribe_area.entities] == [viewer.id]
+
+    service.update_positions(
+        WorldRequest(
+            data=WorldRequestData(
+                update_positions=UpdatePositionsRequestData(
+                    updates=[
+                        PositionUpdate(
+                            kind=EntityKind.ITEM,
+                            id=viewer.id,
+                            level=AttributeType.LOCAL_POSITION,
+                            position=ItemVector3(x=9.0, y=0.0, z=0.0),
+                        ),
+                    ],
+                ),
+            ),
+        ),
+    )
+    request = WorldRequest(
+        data=WorldRequestData(
+            poll_area=PollAreaRequestData(subscription_id=subscription_id),
+        ),
+    )
+    with assert_max_queries(0):
+        response = service.poll_area(request)
+    assert is_ok(response.results)
+    assert [entity.id for entity in response.response_data.poll_area.left] == [viewer.id]
+
+    request = WorldRequest(
+        data=WorldRequestData(
+            unsubscribe_area=UnsubscribeAreaRequestData(subscription_id=subscription_id),
+        ),
+    )
+    with assert_max_queries(0):
+        response = service.unsubscribe_area(request)
+    assert is_ok(response.results)
+    service.store.flush()
+
+
+def run_all_tests():
+    """Run all query budget tests."""
+    print("=" * 60)
+    print("Running Query Budget Tests")
+    print("=" * 60 + "\n")
+
+    tests = [
+        test_item_load_budget,
+        test_item_load_missing_budget,
+        test_item_create_budget,
+        test_item_save_budget,
+        test_item_destroy_budget,
+        test_item_list_records_budget,
+        test_item_list_records_without_attributes_budget,
+        test_item_list_records_attribute_types_budget,
+        test_item_load_many_budget,
+        test_item_autocomplete_budget,
+        test_item_load_with_blueprint_tree_budget,
+        test_item_load_bill_of_materials_budget,
+        test_item_load_dependents_budget,
+        test_inventory_load_budget,
+        test_inventory_load_missing_budget,
+        test_inventory_create_budget,
+        test_inventory_save_budget,
+        test_inventory_save_entries_budget,
+        test_inventory_split_stack_budget,
+        test_inventory_transfer_item_budget,
+        test_inventory_list_records_budget,
+        test_inventory_load_many_budget,
+        test_inventory_owner_item_totals_budget,
+        test_inventory_owner_capacity_budget,
+        test_inventory_owner_has_items_budget,
+        test_inventory_load_container_tree_budget,
+        test_inventory_transfer_container_budget,
+        test_inventory_owner_craftable_budget,
+        test_inventory_start_crafting_budget,
+        test_inventory_cancel_and_list_crafting_budget,
+        test_inventory_complete_crafting_budget,
+        test_inventory_breakdown_item_budget,
+        test_inventory_salvage_containers_budget,
+        test_inventory_set_item_attributes_budget,
+        test_mobile_item_attributes_budget,
+        test_player_load_budget,
+        test_player_load_without_mobile_budget,
+        test_player_load_missing_budget,
+        test_player_create_budget,
+        test_player_save_budget,
+        test_player_delete_budget,
+        test_player_list_records_budget,
+        test_player_load_many_budget,
+        test_player_load_session_budget,
+        test_player_load_session_mobile_items_budget,
+        test_world_load_budget,
+        test_world_query_radius_budget,
+        test_world_refresh_item_budget,
+        test_world_update_positions_budget,
+        test_world_area_subscription_budget,
+    ]
+    for test in tests:
+        print(f"Testing {test.__name__}...")
+        test()
+        print(f"  ✓ {test.__name__}\n")
+
+    print("=" * 60)
+    print("✓ All query budget tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    setUpModule()
+    try:
+        run_all_tests()
+    finally:
+        tearDownModule()
@@ -0,0 +1,129 @@
+"""
+Hierarchical timing wheel.
+
+Scheduling and cancelling a timer cost O(1) however many timers are pending,
+where a heap costs O(log n) for both. Level 0 of the wheel has one slot per
+tick, and each higher level has one slot per full turn of the level below. A
+timer goes in the lowest level whose span covers its delay. Whenever a level
+completes a turn, the next slot of the level above is emptied into the levels
+below ("cascading"), so a timer moves down at most once per level before it
+fires.
+
+With the defaults (100 ms ticks, 4 levels of 256 slots) the wheel spans more
+than 13 years. Timers beyond that wait in an overflow set that is re-placed
+whenever the top level completes a turn.
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# Milliseconds per tick of the lowest level
+WHEEL_TICK_MS = 100
+
+# Slots per level and number of levels
+WHEEL_SLOTS = 256
+WHEEL_LEVELS = 4
+
+
+class TimingWheel:
+    """
+    Timers keyed by any hashable, each firing once its due time has passed.
+
+    Not thread-safe; callers hold their own lock.
+
+    Usage:
+        wheel = TimingWheel(start_ms=now_ms)
+        wheel.schedule(job_id, now_ms + 5000)
+        ...
+        for job_id in wheel.advance(now_ms):
+            run(job_id)
+    """
+
+    def __init__(
+        self,
+        start_ms: int,
+        tick_ms: int = WHEEL_TICK_MS,
+        slots: int = WHEEL_SLOTS,
+        levels: int = WHEEL_LEVELS,
+    ):
+        self.tick_ms = tick_ms
+        self._slots = slots
+        # _spans[level] = ticks covered by one slot of that level
+        self._spans = [slots ** level for level in range(levels + 1)]
+        self._wheel: List[List[Dict[Hashable, int]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._overflow: Dict[Hashable, int] = {}
+        # key -> (level, slot); level is None for overflow
+        self._where: Dict[Hashable, Tuple[Optional[int], int]] = {}
+        # Last tick processed; ticks after it have not fired yet
+        self._tick = start_ms // tick_ms
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def _place(self, key: Hashable, due_tick: int) -> None:
+        delay = due_tick - self._tick
+        for level, timers in enumerate(self._wheel):
+            if delay < self._spans[level + 1]:
+                slot = (due_tick // self._spans[level]) % self._slots
+                timers[slot][key] = due_tick
+                self._where[key] = (level, slot)
+                return
+        self._overflow[key] = due_tick
+        self._where[key] = (None, 0)
+
+    def schedule(self, key: Hashable, due_ms: int) -> None:
+        """Fire key at due_ms, replacing any timer already scheduled for it."""
+        self.cancel(key)
+        # Round up, so a timer never fires before it is due; overdue timers
+        # fire on the next tick processed
+        self._place(key, max(-(-due_ms // self.tick_ms), self._tick + 1))
+
+    def cancel(self, key: Hashable) -> bool:
+        """Remove key's timer. Returns False if it had none."""
+        where = self._where.pop(key, None)
+        if where is None:
+            return False
+        level, slot = where
+        if level is None:
+            del self._overflow[key]
+        else:
+            del self._wheel[level][slot][key]
+        return True
+
+    def _cascade(self, level: int) -> None:
+        slot = (self._tick // self._spans[level]) % self._slots
+        timers = self._wheel[level][slot]
+        self._wheel[level][slot] = {}
+        for key, due_tick in timers.items():
+            self._place(key, due_tick)
+
+    def advance(self, now_ms: int) -> List[Hashable]:
+        """Process every tick up to now_ms and return the keys whose timers fired, in due order."""
+        target = now_ms // self.tick_ms
+        fired: List[Hashable] = []
+        while self._tick < target:
+            if not self._where:
+                self._tick = target
+                break
+            self._tick += 1
+
+            if self._overflow and self._tick % self._spans[-1] == 0:
+                overflow, self._overflow = self._overflow, {}
+                for key, due_tick in overflow.items():
+                    self._place(key, due_tick)
+            for level in range(len(self._wheel) - 1, 0, -1):
+                if self._tick % self._spans[level] == 0:
+                    self._cascade(level)
+
+            slot = self._tick % self._slots
+            due = self._wheel[0][slot]
+            if due:
+                self._wheel[0][slot] = {}
+                for key in due:
+                    del self._where[key]
+                fired.extend(due)
+        return fired
@@ -0,0 +1,601 @@
+import sys
+
+sys.path.append("../../gen-py")
+sys.path.append("..")
+
+import logging
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.DEBUG,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+from game.ttypes import (
+    WorldRequest,
+    WorldResponse,
+    WorldRequestData,
+    WorldResponseData,
+    QueryRadiusRequestData,
+    QueryRadiusResponseData,
+    UpdatePositionsRequestData,
+    UpdatePositionsResponseData,
+    SubscribeAreaResponseData,
+    PollAreaResponseData,
+    UnsubscribeAreaResponseData,
+    EntityPosition,
+    EntityRef,
+    EntityKind,
+    AttributeType,
+    ItemVector3,
+    GameResult,
+    StatusType,
+    GameError,
+)
+from game.WorldService import Iface as WorldServiceIface
+from db_models.models import Attribute
+from services.base_service import BaseServiceHandler
+from services.invalidation_bus import InvalidationBus, TOPIC_ITEM, TOPIC_PLAYER
+from services.interest import InterestManager
+from services.position_store import PositionStore
+from services.spatial_index import POSITION_LEVELS, SpatialIndex, Vector3, distance
+
+# Largest number of entities returned by one query_radius call
+QUERY_RADIUS_MAX_RESULTS = 1000
+
+# Largest number of positions accepted by one update_positions call
+UPDATE_POSITIONS_MAX_UPDATES = 10000
+
+_POSITION_TYPE_NAMES = tuple(AttributeType._VALUES_TO_NAMES[level] for level in POSITION_LEVELS)
+_POSITION_TYPE_PLACEHOLDERS = ", ".join(["%s"] * len(_POSITION_TYPE_NAMES))
+
+Entity = Tuple[int, int]
+
+
+def _position_of(row: dict) -> Optional[Vector3]:
+    if row["vector3_x"] is None or row["vector3_y"] is None or row["vector3_z"] is None:
+        return None
+    return (row["vector3_x"], row["vector3_y"], row["vector3_z"])
+
+
+class WorldServiceHandler(BaseServiceHandler, WorldServiceIface):
+    """
+    Implementation of the WorldService thrift interface.
+    Answers spatial queries over the position attributes of items and mobiles
+    from an in-memory SpatialIndex, loaded once and kept current from the
+    invalidations the item and player services publish when they save.
+    Position updates are applied to the index and a PositionStore at once and
+    reach the database with the store's next flush. Area subscriptions are
+    kept current as entities move by an InterestManager.
+    """
+
+    def __init__(
+        self,
+        index: Optional[SpatialIndex] = None,
+        store: Optional[PositionStore] = None,
+        bus: Optional[InvalidationBus] = None,
+    ):
+        BaseServiceHandler.__init__(self, WorldServiceHandler, bus)
+        self.index = index if index is not None else SpatialIndex()
+        self.store = store if store is not None else PositionStore()
+        self.interest = InterestManager(self.index)
+        # Mobiles currently indexed for each player, so deletes can be applied
+        self._player_mobiles: Dict[int, Set[int]] = {}
+        self._mobiles_lock = threading.Lock()
+        if bus is not None:
+            bus.subscribe(TOPIC_ITEM, self.refresh_item)
+            bus.subscribe(TOPIC_PLAYER, self.refresh_player)
+            bus.on_gap(self.load)
+
+    @staticmethod
+    def _query(sql: str, params: tuple) -> List[dict]:
+        connection = Attribute._create_connection()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+
+    @staticmethod
+    def _collect(
+        rows: List[dict],
+        key_column: str,
+        kind: int,
+    ) -> Dict[Entity, Dict[int, Tuple[int, Vector3]]]:
+        """
+        Group position rows by entity, as level -> (attribute_id, position);
+        entities with no valid position map to {}.
+        """
+        positions: Dict[Entity, Dict[int, Tuple[int, Vector3]]] = {}
+        for row in rows:
+            entity = (kind, row[key_column])
+            entity_positions = positions.setdefault(entity, {})
+            if row["attribute_type"] is None:
+                continue
+            position = _position_of(row)
+            if position is not None:
+                level = AttributeType._NAMES_TO_VALUES[row["attribute_type"]]
+                entity_positions[level] = (row["attribute_id"], position)
+        return positions
+
+    def load(self) -> int:
+        """Rebuild the index from every position attribute with one query."""
+        rows = self._query(
+            "SELECT ao.item_id, ao.mobile_id, m.owner_player_id,"
+            " a.id AS attribute_id, a.attribute_type, a.vector3_x, a.vector3_y, a.vector3_z"
+            " FROM attributes a"
+            " JOIN attribute_owners ao ON ao.attribute_id = a.id"
+            " LEFT JOIN mobiles m ON m.id = ao.mobile_id"
+            f" WHERE a.attribute_type IN ({_POSITION_TYPE_PLACEHOLDERS})",
+            _POSITION_TYPE_NAMES,
+        )
+        positions = self._collect(
+            [row for row in rows if row["item_id"] is not None], "item_id", EntityKind.ITEM
+        )
+        positions.update(self._collect(
+            [row for row in rows if row["mobile_id"] is not None], "mobile_id", EntityKind.MOBILE
+        ))
+
+        player_mobiles: Dict[int, Set[int]] = {}
+        for row in rows:
+            if row["mobile_id"] is not None and row["owner_player_id"] is not None:
+                player_mobiles.setdefault(row["owner_player_id"], set()).add(row["mobile_id"])
+
+        # Positions updated since the last flush win over the database
+        merged = self.store.merge_loaded(positions)
+
+        # Build aside and swap, so queries never see a half-loaded index
+        index = SpatialIndex(self.index.cell_sizes)
+        for entity, entity_positions in merged.items():
+            index.set_positions(entity, entity_positions)
+        self.index = index
+        self.interest.attach(index)
+        with self._mobiles_lock:
+            self._player_mobiles = player_mobiles
+
+        logger.info(f"Indexed positions of {len(self.index)} entities")
+        return len(self.index)
+
+    def refresh_item(self, item_id: int) -> None:
+        """Re-read the positions of one item after it was saved or destroyed."""
+        rows = self._query(
+            "SELECT ao.item_id, a.id AS attribute_id, a.attribute_type, a.vector3_x, a.vector3_y, a.vector3_z"
+            " FROM attribute_owners ao"
+            " JOIN attributes a ON a.id = ao.attribute_id"
+            f" WHERE ao.item_id = %s AND a.attribute_type IN ({_POSITION_TYPE_PLACEHOLDERS})",
+            (item_id,) + _POSITION_TYPE_NAMES,
+        )
+        entity = (EntityKind.ITEM, item_id)
+        merged = self.store.merge_loaded(self._collect(rows, "item_id", EntityKind.ITEM), [entity])
+        self.index.set_positions(entity, merged[entity])
+
+    def refresh_player(self, player_id: int) -> None:
+        """Re-read the positions of a player's mobiles after the player was saved or deleted."""
+        rows = self._query(
+            "SELECT m.id AS mobile_id, a.id AS attribute_id, a.attribute_type, a.vector3_x, a.vector3_y, a.vector3_z"
+            " FROM mobiles m"
+            " LEFT JOIN attribute_owners ao ON ao.mobile_id = m.id"
+            f" LEFT JOIN attributes a ON a.id = ao.attribute_id AND a.attribute_type IN ({_POSITION_TYPE_PLACEHOLDERS})"
+            " WHERE m.owner_player_id = %s",
+            _POSITION_TYPE_NAMES + (player_id,),
+        )
+        positions = self._collect(rows, "mobile_id", EntityKind.MOBILE)
+        mobile_ids = {mobile_id for _, mobile_id in positions}
+
+        with self._mobiles_lock:
+            gone = self._player_mobiles.get(player_id, set()) - mobile_ids
+            if mobile_ids:
+                self._player_mobiles[player_id] = mobile_ids
+            else:
+                self._player_mobiles.pop(player_id, None)
+
+        for mobile_id in gone:
+            self.store.remove((EntityKind.MOBILE, mobile_id))
+            self.index.remove((EntityKind.MOBILE, mobile_id))
+        merged = self.store.merge_loaded(positions, positions.keys())
+        for entity, entity_positions in merged.items():
+            self.index.set_positions(entity, entity_positions)
+
+    @staticmethod
+    def _frame_of(frame: Optional[Dict[int, ItemVector3]]) -> Optional[Dict[int, Vector3]]:
+        if not frame:
+            return None
+        return {level: (vector.x, vector.y, vector.z) for level, vector in frame.items()}
+
+    @staticmethod
+    def _accept_kind(kind: Optional[int]):
+        if kind is None:
+            return None
+        return lambda entity: entity[0] == kind
+
+    @staticmethod
+    def _entity_positions(
+        members: Dict[Entity, Vector3],
+        center: Optional[Vector3],
+    ) -> List[EntityPosition]:
+        return [
+            EntityPosition(
+                kind=kind,
+                id=entity_id,
+                position=ItemVector3(x=position[0], y=position[1], z=position[2]),
+                distance=distance(center, position) if center is not None else 0.0,
+            )
+            for (kind, entity_id), position in members.items()
+        ]
+
+    @staticmethod
+    def _invalid_request(message: str) -> WorldResponse:
+        """Failure response for a request missing required data."""
+        return WorldResponse(
+            results=[
+                GameResult(
+                    status=StatusType.FAILURE,
+                    message=message,
+                    error_code=GameError.DB_INVALID_DATA,
+                ),
+            ],
+            response_data=None,
+        )
+
+    @staticmethod
+    def _unknown_subscription(subscription_id: int) -> WorldResponse:
+        logger.warning(f"FAILURE: Area subscription {subscription_id} not found")
+        return WorldResponse(
+            results=[
+                GameResult(
+                    status=StatusType.FAILURE,
+                    message=f"Area subscription {subscription_id} not found",
+                    error_code=GameError.DB_RECORD_NOT_FOUND,
+                ),
+            ],
+            response_data=None,
+        )
+
+    def query_radius(self, request: WorldRequest) -> WorldResponse:
+        """Entities within a radius of a point, nearest first."""
+        logger.info("=== QUERY_RADIUS request ===")
+        try:
+            query_data = request.data.query_radius
+            if not query_data:
+                logger.error("Request data missing query_radius field")
+                return WorldResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="Request data must contain query_radius",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            if (
+                query_data.level not in POSITION_LEVELS
+                or query_data.center is None
+                or query_data.radius is None
+                or query_data.radius < 0
+            ):
+                logger.error(
+                    f"Invalid query: level={query_data.level}, center={query_data.center}, radius={query_data.radius}"
+                )
+                return WorldResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="query_radius needs a position level, a center and a non-negative radius",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            center = (query_data.center.x, query_data.center.y, query_data.center.z)
+            frame = self._frame_of(query_data.frame)
+            limit = QUERY_RADIUS_MAX_RESULTS
+            if query_data.max_results is not None:
+                limit = max(0, min(query_data.max_results, QUERY_RADIUS_MAX_RESULTS))
+            accept = self._accept_kind(query_data.kind)
+
+            logger.info(
+                f"Querying {AttributeType._VALUES_TO_NAMES[query_data.level]} within {query_data.radius} of {center}"
+            )
+            matches = self.index.query_radius(
+                query_data.level,
+                center,
+                query_data.radius,
+                frame=frame,
+                accept=accept,
+                limit=limit,
+            )
+            entities = [
+                EntityPosition(
+                    kind=kind,
+                    id=entity_id,
+                    position=ItemVector3(x=position[0], y=position[1], z=position[2]),
+                    distance=entity_distance,
+                )
+                for (kind, entity_id), position, entity_distance in matches
+            ]
+
+            logger.info(f"SUCCESS: Found {len(entities)} entities")
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Found {len(entities)} entities",
+                    ),
+                ],
+                response_data=WorldResponseData(
+                    query_radius=QueryRadiusResponseData(entities=entities),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in query_radius: {type(e).__name__}: {str(e)}")
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to query positions: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def update_positions(self, request: WorldRequest) -> WorldResponse:
+        """Apply a batch of position changes in memory; they are written on the next flush."""
+        logger.info("=== UPDATE_POSITIONS request ===")
+        try:
+            update_data = request.data.update_positions
+            if not update_data:
+                logger.error("Request data missing update_positions field")
+                return WorldResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message="Request data must contain update_positions",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            updates = update_data.updates or []
+            if len(updates) > UPDATE_POSITIONS_MAX_UPDATES:
+                logger.error(f"Too many updates: {len(updates)} > {UPDATE_POSITIONS_MAX_UPDATES}")
+                return WorldResponse(
+                    results=[
+                        GameResult(
+                            status=StatusType.FAILURE,
+                            message=f"update_positions accepts at most {UPDATE_POSITIONS_MAX_UPDATES} updates",
+                            error_code=GameError.DB_INVALID_DATA,
+                        ),
+                    ],
+                    response_data=None,
+                )
+
+            logger.info(f"Updating {len(updates)} positions")
+            accepted = []
+            accepted_indices = []
+            errors = {}
+            for i, update in enumerate(updates):
+                if (
+                    update.kind not in EntityKind._VALUES_TO_NAMES
+                    or update.id is None
+                    or update.level not in POSITION_LEVELS
+                    or update.position is None
+                ):
+                    errors[i] = GameResult(
+                        status=StatusType.FAILURE,
+                        message="Position update needs an entity kind, an id, a position level and a position",
+                        error_code=GameError.DB_INVALID_DATA,
+                    )
+                    continue
+                position = (update.position.x, update.position.y, update.position.z)
+                accepted.append(((update.kind, update.id), update.level, position))
+                accepted_indices.append(i)
+
+            # Only positions loaded from the database can move: the owning
+            # entity and its attributes row must already exist
+            rejected = set(self.store.update(accepted))
+            for j in rejected:
+                errors[accepted_indices[j]] = GameResult(
+                    status=StatusType.FAILURE,
+                    message="Entity has no stored position at this level",
+                    error_code=GameError.DB_RECORD_NOT_FOUND,
+                )
+            accepted = [update for j, update in enumerate(accepted) if j not in rejected]
+            for entity, level, position in accepted:
+                self.index.set_position(entity, level, position)
+
+            logger.info(f"SUCCESS: Updated {len(accepted)} positions, rejected {len(errors)}")
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Updated {len(accepted)} positions",
+                    ),
+                ],
+                response_data=WorldResponseData(
+                    update_positions=UpdatePositionsResponseData(
+                        updated=len(accepted),
+                        errors=errors,
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in update_positions: {type(e).__name__}: {str(e)}")
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to update positions: {str(e)}",
+                        error_code=GameError.DB_UPDATE_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def subscribe_area(self, request: WorldRequest) -> WorldResponse:
+        """Start watching an area; returns the entities in it now."""
+        logger.info("=== SUBSCRIBE_AREA request ===")
+        try:
+            subscribe_data = request.data.subscribe_area
+            if not subscribe_data:
+                logger.error("Request data missing subscribe_area field")
+                return self._invalid_request("Request data must contain subscribe_area")
+
+            if (
+                subscribe_data.level not in POSITION_LEVELS
+                or subscribe_data.radius is None
+                or subscribe_data.radius < 0
+                or (subscribe_data.center is None) == (subscribe_data.follow_mobile_id is None)
+            ):
+                logger.error(
+                    f"Invalid area: level={subscribe_data.level}, radius={subscribe_data.radius}, "
+                    f"center={subscribe_data.center}, follow_mobile_id={subscribe_data.follow_mobile_id}"
+                )
+                return self._invalid_request(
+                    "subscribe_area needs a position level, a non-negative radius and either a center or a mobile to follow"
+                )
+
+            center = None
+            follow = None
+            if subscribe_data.center is not None:
+                center = (subscribe_data.center.x, subscribe_data.center.y, subscribe_data.center.z)
+            else:
+                follow = (EntityKind.MOBILE, subscribe_data.follow_mobile_id)
+
+            subscription, members = self.interest.subscribe(
+                subscribe_data.level,
+                subscribe_data.radius,
+                center=center,
+                frame=self._frame_of(subscribe_data.frame),
+                follow=follow,
+                accept=self._accept_kind(subscribe_data.kind),
+            )
+
+            logger.info(
+                f"SUCCESS: Subscription {subscription.subscription_id} starts with {len(members)} entities"
+            )
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Subscribed to an area holding {len(members)} entities",
+                    ),
+                ],
+                response_data=WorldResponseData(
+                    subscribe_area=SubscribeAreaResponseData(
+                        subscription_id=subscription.subscription_id,
+                        entities=self._entity_positions(members, subscription.center),
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in subscribe_area: {type(e).__name__}: {str(e)}")
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to subscribe to area: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def poll_area(self, request: WorldRequest) -> WorldResponse:
+        """Entities that entered, moved within or left an area since the last poll."""
+        logger.info("=== POLL_AREA request ===")
+        try:
+            poll_data = request.data.poll_area
+            if not poll_data:
+                logger.error("Request data missing poll_area field")
+                return self._invalid_request("Request data must contain poll_area")
+
+            changes = self.interest.poll(poll_data.subscription_id)
+            if changes is None:
+                return self._unknown_subscription(poll_data.subscription_id)
+            center, entered, moved, left = changes
+
+            logger.info(
+                f"SUCCESS: {len(entered)} entered, {len(moved)} moved, {len(left)} left"
+            )
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"{len(entered)} entered, {len(moved)} moved, {len(left)} left",
+                    ),
+                ],
+                response_data=WorldResponseData(
+                    poll_area=PollAreaResponseData(
+                        entered=self._entity_positions(entered, center),
+                        moved=self._entity_positions(moved, center),
+                        left=[EntityRef(kind=kind, id=entity_id) for kind, entity_id in left],
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in poll_area: {type(e).__name__}: {str(e)}")
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to poll area: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
+
+    def unsubscribe_area(self, request: WorldRequest) -> WorldResponse:
+        """Stop watching an area."""
+        logger.info("=== UNSUBSCRIBE_AREA request ===")
+        try:
+            unsubscribe_data = request.data.unsubscribe_area
+            if not unsubscribe_data:
+                logger.error("Request data missing unsubscribe_area field")
+                return self._invalid_request("Request data must contain unsubscribe_area")
+
+            subscription_id = unsubscribe_data.subscription_id
+            if not self.interest.unsubscribe(subscription_id):
+                return self._unknown_subscription(subscription_id)
+
+            logger.info(f"SUCCESS: Removed subscription {subscription_id}")
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.SUCCESS,
+                        message=f"Unsubscribed from area subscription {subscription_id}",
+                    ),
+                ],
+                response_data=WorldResponseData(
+                    unsubscribe_area=UnsubscribeAreaResponseData(
+                        subscription_id=subscription_id,
+                    ),
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"EXCEPTION in unsubscribe_area: {type(e).__name__}: {str(e)}")
+            return WorldResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Failed to unsubscribe from area: {str(e)}",
+                        error_code=GameError.DB_QUERY_FAILED,
+                    ),
+                ],
+                response_data=None,
+            )
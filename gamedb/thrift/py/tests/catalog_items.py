@@ -0,0 +1,79 @@
+"""
+Item and inventory builders shared by the catalog, bill of materials,
+craftability, crafting, recycling and inventory tests.
+"""
+
+from game.ttypes import (
+    Inventory,
+    InventoryEntry,
+    Item,
+    ItemType,
+    ItemBlueprint,
+    ItemBlueprintComponent,
+)
+
+
+def make_item(item_id, components=None, bake_time_ms=0, name=None, item_type=None, attributes=None):
+    """
+    Build a catalog item. components maps component item ids to ratios; an
+    item gets a blueprint when components is given (even empty) or it has a
+    bake time. Items with components default to refined materials, others
+    to raw materials.
+
+    Usage:
+        ore = make_item(1)
+        ingot = make_item(2, {1: 2.0}, bake_time_ms=1000)
+    """
+    blueprint = None
+    if components is not None or bake_time_ms:
+        blueprint = ItemBlueprint(
+            id=item_id,
+            components={
+                component_id: ItemBlueprintComponent(ratio=ratio, item_id=component_id)
+                for component_id, ratio in (components or {}).items()
+            },
+            bake_time_ms=bake_time_ms,
+        )
+    if item_type is None:
+        item_type = ItemType.REFINEDMATERIAL if components else ItemType.RAWMATERIAL
+    return Item(
+        id=item_id,
+        internal_name=name or f"item_{item_id}",
+        attributes=attributes or {},
+        max_stack_size=100,
+        item_type=item_type,
+        blueprint=blueprint,
+    )
+
+
+def make_inventory(
+    entries,
+    inventory_id=1,
+    max_entries=10,
+    max_volume=1000.0,
+    last_calculated_volume=0.0,
+    contained_volume=0.0,
+):
+    """
+    Build an inventory. entries are InventoryEntry objects or
+    (item_id, quantity[, mobile_item_id]) tuples.
+
+    Usage:
+        inventory = make_inventory([(1, 10.0), (2, 1.0, 900)])
+    """
+    return Inventory(
+        id=inventory_id,
+        max_entries=max_entries,
+        max_volume=max_volume,
+        entries=[
+            entry if isinstance(entry, InventoryEntry) else InventoryEntry(
+                item_id=entry[0],
+                quantity=entry[1],
+                is_max_stacked=False,
+                mobile_item_id=entry[2] if len(entry) > 2 else None,
+            )
+            for entry in entries
+        ],
+        last_calculated_volume=last_calculated_volume,
+        contained_volume=contained_volume,
+    )
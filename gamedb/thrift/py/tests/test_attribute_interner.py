@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Simple test to verify attribute rows are interned into shared flyweights."""
+
+import gc
+import sys
+sys.path.append('../gen-py')
+
+from db_models.models import AttributeInterner
+from game.ttypes import AttributeType
+
+
+def make_row(attribute_type, x=None, double_value=None, attribute_id=None):
+    return {
+        'id': attribute_id,
+        'internal_name': attribute_type.lower(),
+        'visible': 0,
+        'attribute_type': attribute_type,
+        'bool_value': None,
+        'double_value': double_value,
+        'vector3_x': x,
+        'vector3_y': None if x is None else 0.0,
+        'vector3_z': None if x is None else 0.0,
+        'asset_id': None,
+    }
+
+
+def test_attribute_interner():
+    """Test shared attributes, layered sets and weak release."""
+    print("Testing attribute interning...")
+
+    # Test 1: Equal rows are one object
+    print("  Test 1: Attributes...")
+    position = AttributeInterner.attribute(make_row('LOCAL_POSITION', x=1.0))
+    assert AttributeInterner.attribute(make_row('LOCAL_POSITION', x=1.0)) is position
+    assert AttributeInterner.attribute(make_row('LOCAL_POSITION', x=2.0)) is not position
+    assert position.get_vector3_x() == 1.0
+    stored = AttributeInterner.attribute(make_row('LOCAL_POSITION', x=1.0, attribute_id=7))
+    assert stored is not position
+    assert AttributeInterner.attribute(make_row('LOCAL_POSITION', x=1.0, attribute_id=7)) is stored
+    assert stored.into_thrift()[1].id == 7
+    print("  ✓ Equal rows share one Attribute, which keeps its row id")
+
+    # Test 2: Later rows override earlier ones of the same type
+    print("  Test 2: Layered sets...")
+    template = [make_row('PURITY', double_value=0.5), make_row('LOCAL_POSITION', x=1.0)]
+    plain = AttributeInterner.attribute_set(template)
+    assert [attribute.get_attribute_type() for attribute in plain] == [AttributeType.LOCAL_POSITION, AttributeType.PURITY]
+    assert AttributeInterner.attribute_set(list(reversed(template))) is plain
+    overridden = AttributeInterner.attribute_set(template + [make_row('PURITY', double_value=0.9)])
+    assert overridden is not plain
+    assert overridden[0] is plain[0]
+    assert overridden[1].get_double_value() == 0.9
+    assert len(AttributeInterner.attribute_set([])) == 0
+    print("  ✓ Sets merge overrides and share unchanged attributes")
+
+    # Test 3: Shared attributes cannot be changed
+    print("  Test 3: Read-only...")
+    for change in (
+        lambda: stored.set_vector3_x(9.0),
+        lambda: stored.save(),
+        lambda: stored.destroy(),
+        lambda: stored.from_thrift(stored.into_thrift()[1]),
+    ):
+        try:
+            change()
+            assert False, "Interned attributes must be read-only"
+        except TypeError:
+            pass
+    try:
+        stored._data['vector3_x'] = 9.0
+        assert False, "Interned data must be read-only"
+    except TypeError:
+        pass
+    assert stored.get_vector3_x() == 1.0
+    print("  ✓ Setters, save, destroy and from_thrift raise")
+
+    # Test 4: Unused entries are released
+    print("  Test 4: Weak release...")
+    before = AttributeInterner.size()
+    transient = AttributeInterner.attribute_set([make_row('SIZE', x=42.0)])
+    assert AttributeInterner.size() == (before[0] + 1, before[1] + 1)
+    del transient
+    gc.collect()
+    assert AttributeInterner.size() == before
+    print("  ✓ Entries no owner references disappear")
+
+    print("\n✓ All attribute interner tests passed!")
+
+
+if __name__ == "__main__":
+    test_attribute_interner()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Simple test to verify flattened bills of materials and their incremental refresh."""
+
+import sys
+sys.path.append('../gen-py')
+
+from services.item_catalog import CatalogSnapshot
+from tests.catalog_items import make_item
+
+
+def test_bill_of_materials():
+    """Test ratio multiplication, shared sub-assemblies, cycles, incremental refresh and dependents."""
+    print("Testing bills of materials...")
+
+    items = {
+        1: make_item(1),
+        2: make_item(2),
+        3: make_item(3, {1: 2.0}, bake_time_ms=1000),          # ingot: 2 ore
+        4: make_item(4, {3: 3.0, 2: 0.5}, bake_time_ms=500),   # plate: 3 ingots, half a coal
+        5: make_item(5, {4: 2.0, 3: 1.0}, bake_time_ms=250),   # frame: 2 plates, 1 ingot
+        6: make_item(6, {2: 1.0}),
+    }
+    snapshot = CatalogSnapshot(1, items)
+
+    # Test 1: Ratios are multiplied down the tree
+    print("  Test 1: Flattening...")
+    plate = snapshot.bom(4)
+    assert plate.materials == {1: 6.0, 2: 0.5}
+    assert plate.total_bake_time_ms == 500 + 3 * 1000
+    assert not plate.cycle_detected
+    print("  ✓ Raw material quantities and bake times multiply through sub-assemblies")
+
+    # Test 2: Shared sub-assemblies are summed
+    print("  Test 2: Shared sub-assemblies...")
+    frame = snapshot.bom(5)
+    assert frame.materials == {1: 14.0, 2: 1.0}
+    assert frame.total_bake_time_ms == 250 + 2 * 3500 + 1000
+    assert snapshot.boms[5].materials is frame.materials
+    print("  ✓ Materials reached through several paths are added up")
+
+    # Test 3: Raw materials and unknown items
+    print("  Test 3: Raw materials...")
+    assert snapshot.bom(1).materials == {1: 1.0}
+    assert 1 not in snapshot.boms
+    assert snapshot.bom(99) is None
+    thrift_bom = snapshot.bom(3).to_thrift()
+    assert thrift_bom.item_id == 3 and thrift_bom.materials == {1: 2.0}
+    print("  ✓ Items without components are their own material")
+
+    # Test 4: Cycles are cut and flagged
+    print("  Test 4: Cycles...")
+    cyclic = CatalogSnapshot(1, {
+        1: make_item(1),
+        7: make_item(7, {8: 1.0, 1: 1.0}),
+        8: make_item(8, {7: 1.0, 1: 2.0}),
+    })
+    assert cyclic.bom(7).cycle_detected
+    assert cyclic.bom(8).cycle_detected
+    assert cyclic.bom(7).materials[1] > 0
+    print("  ✓ Blueprint cycles terminate and are reported")
+
+    # Test 5: A refresh recomputes only the changed item and its dependents
+    print("  Test 5: Incremental refresh...")
+    changed = dict(items)
+    changed[3] = make_item(3, {1: 4.0}, bake_time_ms=1000)
+    refreshed = CatalogSnapshot(2, changed, snapshot, [3])
+    assert refreshed.bom(6) is snapshot.bom(6)
+    assert refreshed.bom(4) is not snapshot.bom(4)
+    assert refreshed.bom(4).materials == {1: 12.0, 2: 0.5}
+    assert refreshed.bom(5).materials == {1: 28.0, 2: 1.0}
+    removed = dict(changed)
+    del removed[6]
+    assert 6 not in CatalogSnapshot(3, removed, refreshed, [6]).boms
+    print("  ✓ Unaffected bills of materials are carried over")
+
+    # Test 6: Reverse closure with depth limits
+    print("  Test 6: Dependents...")
+    assert snapshot.dependents(1) == ({3: 1, 4: 2, 5: 2}, False)
+    assert snapshot.dependents(2) == ({4: 1, 6: 1, 5: 2}, False)
+    assert snapshot.dependents(1, max_depth=1) == ({3: 1}, True)
+    assert snapshot.dependents(5, max_depth=1) == ({}, False)
+    assert cyclic.dependents(7) == ({8: 1}, False)
+    print("  ✓ Every item using a material is found with its fewest steps")
+
+    print("\n✓ All bill of materials tests passed!")
+
+
+if __name__ == "__main__":
+    test_bill_of_materials()
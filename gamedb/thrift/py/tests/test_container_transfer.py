@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Simple test to verify nested container volume counts towards capacity and moves with its container."""
+
+import sys
+sys.path.append('../gen-py')
+
+from common import is_ok
+from inventory import add_item_to_inventory, transfer_instance
+from tests.catalog_items import make_inventory, make_item
+from game.ttypes import (
+    Attribute,
+    AttributeType,
+    AttributeValue,
+    GameError,
+    InventoryEntry,
+    ItemType,
+)
+
+
+def volume_attributes(volume):
+    return {
+        AttributeType.VOLUME: Attribute(
+            internal_name="volume",
+            visible=True,
+            attribute_type=AttributeType.VOLUME,
+            value=AttributeValue(double_value=volume),
+        ),
+    }
+
+
+def test_container_transfer():
+    """Test capacity checks with contained volume and moving a container instance with its contents."""
+    print("Testing container transfers...")
+
+    ore = make_item(1, item_type=ItemType.RAWMATERIAL, attributes=volume_attributes(1.0))
+    crate = make_item(2, item_type=ItemType.CONTAINER, attributes=volume_attributes(5.0))
+
+    # Test 1: volume nested below an inventory fills it
+    print("\n1. Testing contained volume in the add check...")
+    inventory = make_inventory([], max_volume=100.0, last_calculated_volume=20.0, contained_volume=75.0)
+    results = add_item_to_inventory(inventory=inventory, item=ore, item_quantity=10.0)
+    assert not is_ok(results), "20 + 75 + 10 exceeds 100"
+    assert results[0].error_code == GameError.INV_NEW_VOLUME_TOO_HIGH
+    results = add_item_to_inventory(inventory=inventory, item=ore, item_quantity=5.0)
+    assert is_ok(results), "20 + 75 + 5 fits in 100"
+    print("   ✓ last_calculated_volume + contained_volume is checked")
+
+    # Test 2: the instance moves whole, with its nested inventory's volume
+    print("\n2. Testing moving a container instance...")
+    source = make_inventory(
+        [
+            InventoryEntry(id=11, item_id=ore.id, quantity=3.0, is_max_stacked=False),
+            InventoryEntry(id=12, item_id=crate.id, quantity=1.0, is_max_stacked=False, mobile_item_id=900),
+        ],
+        max_volume=100.0,
+        last_calculated_volume=8.0,
+        contained_volume=30.0,
+    )
+    destination = make_inventory([], inventory_id=2, max_volume=100.0)
+    results = transfer_instance(source, destination, crate, 900, contained_volume=30.0)
+    assert is_ok(results), f"Transfer failed: {results}"
+    assert [entry.item_id for entry in source.entries] == [ore.id]
+    moved = destination.entries[0]
+    assert moved.mobile_item_id == 900 and moved.quantity == 1.0
+    assert moved.id is None, "The moved entry is a new row of the destination"
+    assert source.last_calculated_volume == 3.0 and destination.last_calculated_volume == 5.0
+    assert source.contained_volume == 0.0 and destination.contained_volume == 30.0
+    print("   ✓ Entry and contained volume moved")
+
+    # Test 3: the container's contents count towards the destination's capacity
+    print("\n3. Testing the destination capacity...")
+    small = make_inventory([], inventory_id=3, max_volume=20.0)
+    results = transfer_instance(destination, small, crate, 900, contained_volume=30.0)
+    assert not is_ok(results), "5 + 30 exceeds 20"
+    assert results[0].error_code == GameError.INV_NEW_VOLUME_TOO_HIGH
+    assert len(destination.entries) == 1 and small.entries == []
+    print("   ✓ Nothing moved when the contents do not fit")
+
+    # Test 4: only the named instance moves
+    print("\n4. Testing an unknown instance...")
+    results = transfer_instance(destination, source, crate, 901)
+    assert not is_ok(results)
+    assert results[0].error_code == GameError.INV_ITEM_NOT_FOUND
+    print("   ✓ Unknown instance rejected")
+
+    print("\n✅ All container transfer tests passed!")
+
+
+if __name__ == '__main__':
+    test_container_transfer()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Simple test to verify craftable counts from the blueprint requirement matrix."""
+
+import sys
+sys.path.append('../gen-py')
+
+from services.craftability import CraftingMatrix
+from services.item_catalog import CatalogSnapshot
+from tests.catalog_items import make_item
+
+
+def test_craftability():
+    """Test counts, limiting materials, filtering and rounding."""
+    print("Testing craftability...")
+
+    snapshot = CatalogSnapshot(1, {
+        1: make_item(1),
+        2: make_item(2),
+        3: make_item(3, {1: 2.0}),
+        4: make_item(4, {3: 3.0, 2: 0.5}),
+        5: make_item(5, {2: 0.1}),
+        6: make_item(6, {7: 1.0}),
+        7: make_item(7),
+    })
+    matrix = CraftingMatrix.from_catalog(snapshot)
+    assert len(matrix) == 4
+    assert matrix.material_ids.tolist() == [1, 2, 3, 7]
+
+    # Test 1: The scarcest material limits each blueprint
+    print("  Test 1: Counts...")
+    held = {1: 41.0, 2: 1.0, 3: 7.0, 99: 5.0}
+    assert matrix.craftable(held) == {3: 20, 4: 2, 5: 10}
+    print("  ✓ Counts are floored by the limiting material")
+
+    # Test 2: Missing materials and empty inventories
+    print("  Test 2: Nothing held...")
+    assert matrix.craftable({}) == {}
+    assert matrix.craftable({2: 0.3}) == {5: 3}
+    print("  ✓ Unheld materials block a blueprint; rounding is absorbed")
+
+    # Test 3: Only the requested blueprints
+    print("  Test 3: Filtering...")
+    assert matrix.craftable(held, [4, 6, 42]) == {4: 2}
+    print("  ✓ item_ids limits the result")
+
+    # Test 4: Raw rows from the database, duplicates summed
+    print("  Test 4: Component rows...")
+    rows = CraftingMatrix([(10, 1, 1.0), (10, 1, 1.0), (11, 2, 0.0)])
+    assert len(rows) == 1
+    assert rows.craftable({1: 5.0}) == {10: 2}
+    assert CraftingMatrix([]).craftable({1: 5.0}) == {}
+    print("  ✓ Repeated components add up; zero ratios are ignored")
+
+    print("\n✓ All craftability tests passed!")
+
+
+if __name__ == "__main__":
+    test_craftability()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Simple test to verify crafting jobs consume their inputs in memory and are retried when they raise."""
+
+import sys
+sys.path.append('../gen-py')
+
+from common import is_ok
+from services.crafting import CRAFTING_RETRY_MS, CraftingScheduler, _now_ms
+from services.item_catalog import CatalogSnapshot
+from tests.catalog_items import make_inventory, make_item
+from game.ttypes import (
+    CraftingJob,
+    CraftingJobState,
+    GameError,
+)
+
+
+class StaticCatalog:
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def snapshot(self):
+        return self._snapshot
+
+
+def make_job(job_id, item_id, quantity):
+    return CraftingJob(
+        id=job_id,
+        inventory_id=1,
+        item_id=item_id,
+        quantity=quantity,
+        state=CraftingJobState.PENDING,
+        ready_at_ms=0,
+    )
+
+
+def quantities(inventory):
+    return {entry.item_id: entry.quantity for entry in inventory.entries}
+
+
+def test_crafting_scheduler():
+    """Test crafting in memory, its failures, and rescheduling jobs whose completion raised."""
+    print("Testing crafting scheduler...")
+
+    scheduler = CraftingScheduler(catalog=StaticCatalog(CatalogSnapshot(1, {
+        1: make_item(1),                                       # ore
+        2: make_item(2),                                       # coal
+        3: make_item(3, {1: 2.0, 2: 0.5}, bake_time_ms=1000),  # ingot: 2 ore, half a coal
+        4: make_item(4, {99: 1.0}, bake_time_ms=1000),         # unknown component
+    })))
+
+    # Test 1: Inputs are taken and the output added
+    print("  Test 1: Crafting...")
+    inventory = make_inventory([(1, 10.0), (2, 2.0)])
+    results = scheduler._craft(inventory, make_job(1, 3, 4.0))
+    assert is_ok(results), f"Craft failed: {results}"
+    assert quantities(inventory) == {1: 2.0, 3: 4.0}
+    print("  ✓ Components consumed by ratio x quantity, output added")
+
+    # Test 2: Missing inputs fail the job
+    print("  Test 2: Missing inputs...")
+    inventory = make_inventory([(1, 3.0), (2, 2.0)])
+    results = scheduler._craft(inventory, make_job(2, 3, 4.0))
+    assert results[0].error_code == GameError.INV_INSUFFICIENT_QUANTITY
+    assert quantities(inventory) == {1: 3.0, 2: 2.0}, "Nothing is taken without all the inputs"
+    print("  ✓ Insufficient components fail the craft")
+
+    # Test 3: The output must fit
+    print("  Test 3: Full inventory...")
+    inventory = make_inventory([(1, 10.0), (2, 2.0)], max_entries=2)
+    results = scheduler._craft(inventory, make_job(3, 3, 1.0))
+    assert not is_ok(results)
+    assert GameError.INV_MAX_ITEMS_REACHED in [result.error_code for result in results]
+    assert 3 not in quantities(inventory)
+    print("  ✓ An output that does not fit fails the craft")
+
+    # Test 4: Unknown items
+    print("  Test 4: Unknown items...")
+    inventory = make_inventory([(1, 10.0)])
+    results = scheduler._craft(inventory, make_job(4, 4, 1.0))
+    assert results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+    results = scheduler._craft(inventory, make_job(5, 1, 1.0))
+    assert results[0].error_code == GameError.DB_RECORD_NOT_FOUND
+    assert quantities(inventory) == {1: 10.0}
+    print("  ✓ Unknown components and items without blueprint fail")
+
+    # Test 5: A completion that raises is retried later, not dropped
+    print("  Test 5: Retries...")
+    attempts = []
+
+    def complete_job(job_id):
+        attempts.append(job_id)
+        if len(attempts) == 1:
+            raise ConnectionError("database went away")
+        return make_job(job_id, 3, 1.0)
+
+    scheduler.complete_job = complete_job
+    now_ms = _now_ms()
+    scheduler._wheel.schedule(7, now_ms)
+    assert scheduler.run_due(now_ms + scheduler.tick_ms) == 0
+    assert attempts == [7]
+    assert len(scheduler) == 1, "The job is rescheduled"
+    assert scheduler.run_due(now_ms + CRAFTING_RETRY_MS // 2) == 0
+    assert attempts == [7], "Not before the retry delay"
+    assert scheduler.run_due(_now_ms() + CRAFTING_RETRY_MS + 2 * scheduler.tick_ms) == 1
+    assert attempts == [7, 7]
+    assert len(scheduler) == 0
+    print("  ✓ Failed completions are retried after CRAFTING_RETRY_MS")
+
+    print("\n✓ All crafting scheduler tests passed!")
+
+
+if __name__ == "__main__":
+    test_crafting_scheduler()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Simple test to verify area-of-interest subscriptions follow moving entities."""
+
+import sys
+sys.path.append('../gen-py')
+
+from game.ttypes import AttributeType, EntityKind
+from services.interest import InterestManager
+from services.spatial_index import SpatialIndex
+
+GLOBAL = AttributeType.GLOBAL_POSITION
+LOCAL = AttributeType.LOCAL_POSITION
+
+PLANET_A = (1.0, 2.0, 0.0)
+PLANET_B = (50.0, 2.0, 0.0)
+
+VIEWER = (EntityKind.MOBILE, 1)
+WALKER = (EntityKind.MOBILE, 2)
+CRATE = (EntityKind.ITEM, 3)
+
+
+def _place(index, entity, local, planet=PLANET_A):
+    index.set_positions(entity, {GLOBAL: planet, LOCAL: local})
+
+
+def test_interest():
+    """Test fixed and followed areas, delta coalescing and unsubscribing."""
+    print("Testing area-of-interest subscriptions...")
+
+    index = SpatialIndex()
+    interest = InterestManager(index)
+    _place(index, VIEWER, (0.0, 0.0, 0.0))
+    _place(index, WALKER, (3.0, 0.0, 0.0))
+    _place(index, CRATE, (30.0, 0.0, 0.0))
+
+    # Test 1: Subscribing returns the entities already in the area
+    print("  Test 1: Subscribe...")
+    fixed, members = interest.subscribe(LOCAL, 5.0, center=(0.0, 0.0, 0.0), frame={GLOBAL: PLANET_A})
+    assert set(members) == {VIEWER, WALKER}
+    following, members = interest.subscribe(LOCAL, 5.0, follow=VIEWER)
+    assert set(members) == {WALKER}
+    print("  ✓ Initial members exclude the followed mobile")
+
+    # Test 2: Enter, move and leave deltas
+    print("  Test 2: Deltas...")
+    index.set_position(CRATE, LOCAL, (4.0, 0.0, 0.0))
+    index.set_position(WALKER, LOCAL, (2.0, 0.0, 0.0))
+    center, entered, moved, left = interest.poll(fixed.subscription_id)
+    assert center == (0.0, 0.0, 0.0)
+    assert entered == {CRATE: (4.0, 0.0, 0.0)}
+    assert moved == {WALKER: (2.0, 0.0, 0.0)}
+    assert left == set()
+    index.set_position(WALKER, GLOBAL, PLANET_B)
+    _, entered, moved, left = interest.poll(fixed.subscription_id)
+    assert (entered, moved, left) == ({}, {}, {WALKER})
+    print("  ✓ Entering, moving and leaving entities are reported")
+
+    # Test 3: Changes between polls are coalesced
+    print("  Test 3: Coalescing...")
+    _place(index, (EntityKind.ITEM, 4), (1.0, 1.0, 0.0))
+    index.remove((EntityKind.ITEM, 4))
+    index.set_position(CRATE, LOCAL, (40.0, 0.0, 0.0))
+    index.set_position(CRATE, LOCAL, (3.5, 0.0, 0.0))
+    _, entered, moved, left = interest.poll(fixed.subscription_id)
+    assert (entered, moved, left) == ({}, {CRATE: (3.5, 0.0, 0.0)}, set())
+    print("  ✓ Short visits vanish and returns read as moves")
+
+    # Test 4: A followed area moves with its mobile
+    print("  Test 4: Following...")
+    interest.poll(following.subscription_id)
+    index.set_position(VIEWER, LOCAL, (38.0, 0.0, 0.0))
+    # No GLOBAL_POSITION, so not on the viewer's planet
+    index.set_position((EntityKind.ITEM, 5), LOCAL, (39.0, 0.0, 0.0))
+    center, entered, moved, left = interest.poll(following.subscription_id)
+    assert center == (38.0, 0.0, 0.0)
+    assert entered == {}
+    assert left == {CRATE}
+    _place(index, (EntityKind.ITEM, 6), (40.0, 0.0, 0.0))
+    _, entered, _, _ = interest.poll(following.subscription_id)
+    assert entered == {(EntityKind.ITEM, 6): (40.0, 0.0, 0.0)}
+    print("  ✓ Members are recomputed around the new position")
+
+    # Test 5: A rebuilt index is diffed against the old members
+    print("  Test 5: Reload...")
+    rebuilt = SpatialIndex()
+    _place(rebuilt, VIEWER, (0.0, 0.0, 0.0))
+    _place(rebuilt, CRATE, (1.0, 0.0, 0.0))
+    interest.attach(rebuilt)
+    _, entered, moved, left = interest.poll(following.subscription_id)
+    assert entered == {CRATE: (1.0, 0.0, 0.0)}
+    assert left == {(EntityKind.ITEM, 6)}
+    print("  ✓ Subscriptions follow the rebuilt index")
+
+    # Test 6: Unsubscribing
+    print("  Test 6: Unsubscribe...")
+    assert interest.unsubscribe(fixed.subscription_id)
+    assert not interest.unsubscribe(fixed.subscription_id)
+    assert interest.poll(fixed.subscription_id) is None
+    assert len(interest) == 1
+    print("  ✓ Removed subscriptions are gone")
+
+    print("\n✓ All area-of-interest tests passed!")
+
+
+if __name__ == "__main__":
+    test_interest()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Simple test to verify cross-process invalidation over the bus."""
+
+import sys
+sys.path.append('../gen-py')
+
+import os
+import queue
+import socket
+import tempfile
+
+from services.invalidation_bus import InvalidationBus, TOPIC_ITEM, TOPIC_PLAYER
+
+
+def test_invalidation_bus():
+    """Test delivery between buses, topic filtering and gap detection."""
+    print("Testing invalidation bus...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        publisher = InvalidationBus("ItemService", directory)
+        subscriber = InvalidationBus("InventoryService", directory)
+
+        received = queue.Queue()
+        gaps = []
+        subscriber.subscribe(TOPIC_ITEM, received.put)
+        subscriber.on_gap(lambda: gaps.append(True))
+        publisher.start()
+        subscriber.start()
+        try:
+            # Test 1: Delivery to the other process, never to the publisher
+            print("  Test 1: Delivery...")
+            publisher.publish(TOPIC_ITEM, 42)
+            assert received.get(timeout=2) == 42
+            assert not gaps
+            print("  ✓ Subscriber received the invalidated key")
+
+            # Test 2: Other topics are ignored
+            print("  Test 2: Topic filtering...")
+            publisher.publish(TOPIC_PLAYER, 7)
+            publisher.publish(TOPIC_ITEM, 43)
+            assert received.get(timeout=2) == 43
+            assert received.empty()
+            assert not gaps
+            print("  ✓ Only subscribed topics reach callbacks")
+        finally:
+            publisher.stop()
+            subscriber.stop()
+
+        # Test 3: A skipped sequence number triggers the gap handlers
+        print("  Test 3: Gap detection...")
+        subscriber.dispatch({"origin": publisher.origin, "seq": 10, "topic": TOPIC_ITEM, "key": 5})
+        assert received.get_nowait() == 5
+        assert gaps == [True]
+        subscriber.dispatch({"origin": publisher.origin, "seq": 11, "topic": TOPIC_ITEM, "key": 6})
+        assert gaps == [True]
+        print("  ✓ Missed invalidations are detected once")
+
+        # Test 4: Publishing to a socket whose process is gone removes it
+        print("  Test 4: Stale sockets...")
+        # A socket file nobody is bound to any more, as left by a killed process
+        stale_path = os.path.join(directory, "Gone-0.sock")
+        stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        stale_socket.bind(stale_path)
+        stale_socket.close()
+        publisher.publish(TOPIC_ITEM, 1)
+        assert not os.path.exists(stale_path)
+        print("  ✓ Stale sockets are cleaned up")
+
+        # Test 5: stop() ends the receive thread
+        print("  Test 5: Stop...")
+        stopped = InvalidationBus("Stopped", directory)
+        stopped.start()
+        thread = stopped._thread
+        stopped.stop()
+        assert not thread.is_alive()
+        assert not os.path.exists(stopped.path)
+        print("  ✓ The receive thread exits and the socket is removed")
+
+    print("\n✓ All invalidation bus tests passed!")
+
+
+if __name__ == "__main__":
+    test_invalidation_bus()
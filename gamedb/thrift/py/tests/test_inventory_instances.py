@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Simple test to verify stacks are never merged into item instance entries."""
+
+import sys
+sys.path.append('../gen-py')
+
+from common import is_ok, is_true
+from inventory import add_item_to_inventory, can_transfer_item, is_item_in_inventory, transfer_item
+from tests.catalog_items import make_inventory, make_item
+from game.ttypes import GameError
+
+
+def entries_of(inventory):
+    return [(entry.item_id, entry.quantity, entry.mobile_item_id) for entry in inventory.entries]
+
+
+def test_inventory_instances():
+    """Test adding, counting and transferring next to instance entries."""
+    print("Testing instance entries...")
+
+    ore = make_item(1)
+
+    # Test 1: Adding stacks onto the stack, never onto the instance
+    print("  Test 1: Adding...")
+    inventory = make_inventory([(ore.id, 1.0, 900), (ore.id, 4.0, None)])
+    results = add_item_to_inventory(inventory=inventory, item=ore, item_quantity=3.0)
+    assert is_ok(results), f"Add failed: {results}"
+    assert entries_of(inventory) == [(ore.id, 1.0, 900), (ore.id, 7.0, None)]
+    print("  ✓ The instance keeps its quantity")
+
+    # Test 2: With only an instance, adding needs an entry of its own
+    print("  Test 2: Instance only...")
+    inventory = make_inventory([(ore.id, 1.0, 900)])
+    assert not is_true(is_item_in_inventory(inventory, ore.id))
+    results = add_item_to_inventory(inventory=inventory, item=ore, item_quantity=3.0)
+    assert is_ok(results)
+    assert entries_of(inventory) == [(ore.id, 1.0, 900), (ore.id, 3.0, None)]
+    full = make_inventory([(ore.id, 1.0, 900)], max_entries=1)
+    results = add_item_to_inventory(inventory=full, item=ore, item_quantity=3.0)
+    assert results[0].error_code == GameError.INV_MAX_ITEMS_REACHED
+    assert entries_of(full) == [(ore.id, 1.0, 900)]
+    print("  ✓ Instances are not stacks to add to or to count")
+
+    # Test 3: Transfers move stack units and leave instances behind
+    print("  Test 3: Transfers...")
+    source = make_inventory([(ore.id, 1.0, 900), (ore.id, 5.0, None)])
+    destination = make_inventory([(ore.id, 1.0, 901)], inventory_id=2)
+    results = can_transfer_item(source, destination, ore, 6.0)
+    assert results[0].error_code == GameError.INV_INSUFFICIENT_QUANTITY
+    results = transfer_item(source, destination, ore, 2.0)
+    assert is_ok(results), f"Transfer failed: {results}"
+    assert entries_of(source) == [(ore.id, 1.0, 900), (ore.id, 3.0, None)]
+    assert entries_of(destination) == [(ore.id, 1.0, 901), (ore.id, 2.0, None)]
+    only_instance = make_inventory([(ore.id, 1.0, 902)], inventory_id=3)
+    results = transfer_item(only_instance, destination, ore)
+    assert results[0].error_code == GameError.INV_ITEM_NOT_FOUND
+    assert entries_of(only_instance) == [(ore.id, 1.0, 902)]
+    print("  ✓ Instances move only with transfer_instance")
+
+    print("\n✓ All instance entry tests passed!")
+
+
+if __name__ == "__main__":
+    test_inventory_instances()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Simple test to verify item catalog snapshot indexes and projection."""
+
+import sys
+sys.path.append('../gen-py')
+
+from services.item_catalog import CatalogSnapshot, project_item
+from tests.catalog_items import make_item
+from game.ttypes import (
+    ItemType,
+    Attribute,
+    AttributeType,
+    AttributeValue,
+    Owner,
+    Projection,
+)
+
+
+def make_catalog_item(item_id, name, item_type, components=None):
+    attributes = {
+        AttributeType.VOLUME: Attribute(
+            id=item_id * 10,
+            internal_name="volume",
+            visible=True,
+            value=AttributeValue(double_value=1.0),
+            attribute_type=AttributeType.VOLUME,
+            owner=Owner(item_id=item_id),
+        ),
+        AttributeType.PURITY: Attribute(
+            id=item_id * 10 + 1,
+            internal_name="purity",
+            visible=True,
+            value=AttributeValue(double_value=0.5),
+            attribute_type=AttributeType.PURITY,
+            owner=Owner(item_id=item_id),
+        ),
+    }
+    return make_item(item_id, components, name=name, item_type=item_type, attributes=attributes)
+
+
+def test_item_catalog():
+    """Test snapshot indexes, search and projection."""
+    print("Testing item catalog snapshot...")
+
+    items = {
+        1: make_catalog_item(1, "Iron_Ore", ItemType.RAWMATERIAL),
+        2: make_catalog_item(2, "iron_ingot", ItemType.REFINEDMATERIAL, {1: 0.5}),
+        3: make_catalog_item(3, "copper_ore", ItemType.RAWMATERIAL),
+        4: make_catalog_item(4, "wire", ItemType.REFINEDMATERIAL, {2: 0.2, 3: 0.8}),
+    }
+    snapshot = CatalogSnapshot(1, items)
+
+    # Test 1: Indexes
+    print("  Test 1: Indexes...")
+    assert len(snapshot) == 4
+    assert snapshot.get(2).internal_name == "iron_ingot"
+    assert snapshot.get(99) is None
+    assert snapshot.find_by_name("wire").id == 4
+    assert snapshot.ids_by_type[ItemType.RAWMATERIAL] == (3, 1)
+    assert snapshot.used_in[2] == (4,)
+    assert set(snapshot.components_of(4)) == {2, 3}
+    assert snapshot.components_of(1) == {}
+    print("  ✓ id, name, type and blueprint indexes are built")
+
+    # Test 2: Search matches LIKE semantics and ordering
+    print("  Test 2: Search...")
+    assert snapshot.search("iron") == [2, 1]
+    assert snapshot.search("ORE") == [3, 1]
+    assert snapshot.search(None) == [3, 2, 1, 4]
+    print("  ✓ Case-insensitive substring search ordered by name")
+
+    # Test 3: Snapshots do not see later changes to the source dict
+    print("  Test 3: Immutability...")
+    items[5] = make_catalog_item(5, "late", ItemType.VIRTUAL)
+    assert snapshot.get(5) is None
+    try:
+        snapshot.items_by_id[6] = items[5]
+        assert False, "items_by_id should be read-only"
+    except TypeError:
+        pass
+    print("  ✓ Snapshot is isolated and read-only")
+
+    # Test 4: Projection never mutates shared items
+    print("  Test 4: Projection...")
+    shared = snapshot.get(1)
+    assert project_item(shared, None) is shared
+    sparse = project_item(shared, Projection(include_attributes=False))
+    assert sparse.attributes is None
+    filtered = project_item(shared, Projection(attribute_types=[AttributeType.PURITY]))
+    assert list(filtered.attributes) == [AttributeType.PURITY]
+    assert len(shared.attributes) == 2, "Shared item must be untouched"
+    print("  ✓ Projections copy before trimming")
+
+    # Test 5: Incremental snapshots match a full rebuild
+    print("  Test 5: Incremental indexes...")
+    items = {item_id: item for item_id, item in items.items() if item_id != 5}
+    changed_items = dict(items)
+    changed_items[3] = make_catalog_item(3, "bronze_ore", ItemType.REFINEDMATERIAL)           # renamed, retyped
+    changed_items[4] = make_catalog_item(4, "wire", ItemType.REFINEDMATERIAL, {1: 1.0})      # new blueprint
+    changed_items[6] = make_catalog_item(6, "cable", ItemType.REFINEDMATERIAL, {4: 2.0})     # added
+    del changed_items[2]                                                             # removed
+    incremental = CatalogSnapshot(2, changed_items, CatalogSnapshot(1, items), [2, 3, 4, 6])
+    rebuilt = CatalogSnapshot(2, changed_items)
+    assert dict(incremental.ids_by_name) == dict(rebuilt.ids_by_name)
+    assert dict(incremental.ids_by_type) == dict(rebuilt.ids_by_type)
+    assert dict(incremental.used_in) == dict(rebuilt.used_in)
+    assert incremental.search(None) == rebuilt.search(None)
+    assert incremental.bom(6).materials == rebuilt.bom(6).materials == {1: 2.0}
+    assert 2 not in incremental.used_in and 2 not in incremental.boms
+    print("  ✓ Only the changed items move, with the same result")
+
+    print("\n✓ All item catalog tests passed!")
+
+
+if __name__ == "__main__":
+    test_item_catalog()
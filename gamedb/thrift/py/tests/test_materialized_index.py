@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Simple test to verify the indexed loaders for materialized.bin and the shared catalog."""
+
+import sys
+sys.path.append('../gen-py')
+
+import os
+import tempfile
+
+from thrift.protocol.TBinaryProtocol import TBinaryProtocolFactory
+from thrift.TSerialization import serialize
+
+from services.materialized_index import ItemIndexes, MaterializedIndex
+from services.shared_catalog import write_catalog, MappedCatalog
+from game.ttypes import (
+    Item,
+    ItemDb,
+    ItemType,
+    ItemBlueprint,
+    ItemBlueprintComponent,
+    Attribute,
+    AttributeType,
+    AttributeValue,
+)
+
+
+def build_items():
+    ore = Item(
+        id=1,
+        internal_name="hematite",
+        attributes={
+            AttributeType.VOLUME: Attribute(
+                id=10,
+                internal_name="volume",
+                visible=True,
+                value=AttributeValue(double_value=2.0),
+                attribute_type=AttributeType.VOLUME,
+            ),
+        },
+        max_stack_size=10000,
+        item_type=ItemType.RAWMATERIAL,
+    )
+    carbon = Item(
+        id=2,
+        internal_name="carbon",
+        attributes={},
+        max_stack_size=10000,
+        item_type=ItemType.RAWMATERIAL,
+    )
+    steel = Item(
+        id=3,
+        internal_name="steel",
+        attributes={},
+        max_stack_size=100,
+        item_type=ItemType.REFINEDMATERIAL,
+        blueprint=ItemBlueprint(
+            bake_time_ms=3000,
+            components={
+                1: ItemBlueprintComponent(ratio=0.9, item_id=1),
+                2: ItemBlueprintComponent(ratio=0.1, item_id=2),
+            },
+        ),
+    )
+    return [ore, carbon, steel]
+
+
+def check_indexes(index, items):
+    ore, carbon, steel = items
+    assert len(index) == 3
+    assert index.by_name("steel") == steel
+    assert index.by_name("missing") is None
+    assert index.by_id(1) == ore
+    assert index.by_id(99) is None
+    assert set(index.components_of(3)) == {1, 2}
+    assert index.components_of(3)[1].ratio == 0.9
+    assert index.components_of(1) == {}
+    assert index.used_in(2) == [3]
+    assert index.bom(3).materials == {1: 0.9, 2: 0.1}
+    assert index.bom(3).total_bake_time_ms == 3000
+    assert index.bom(1).materials == {1: 1.0}
+    assert index.bom(99) is None
+    assert index.dependents(1) == ({3: 1}, False)
+    assert index.dependents(1, max_depth=0) == ({}, True)
+
+
+def test_materialized_index():
+    """Test id, name and blueprint lookups over both file formats."""
+    print("Testing indexed materialized loaders...")
+    items = build_items()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Test 1: materialized.bin as written by compile.py
+        print("  Test 1: MaterializedIndex over an ItemDb...")
+        path = os.path.join(directory, "materialized.bin")
+        with open(path, "wb") as f:
+            f.write(serialize(ItemDb(items=items), TBinaryProtocolFactory()))
+        index = MaterializedIndex(path)
+        assert index._decoded == {}, "Scanning must not decode items"
+        check_indexes(index, items)
+        assert index.by_id(1) is index.by_id(1), "Decoded items are reused"
+        print("  ✓ by_id, by_name, components_of, used_in, bom and dependents work")
+
+        # Test 2: the shared catalog file
+        print("  Test 2: MappedCatalog name and blueprint indexes...")
+        path = os.path.join(directory, "catalog.bin")
+        write_catalog(path, items, version=1)
+        check_indexes(MappedCatalog(path), items)
+        print("  ✓ Same queries work on the shared catalog")
+
+    # Test 3: ItemIndexes decodes from any buffer it is given ranges of
+    print("  Test 3: ItemIndexes over a plain buffer...")
+    buffer = bytearray()
+    index = ItemIndexes(buffer)
+    for item in items:
+        start = len(buffer)
+        buffer += serialize(item, TBinaryProtocolFactory())
+        index.add(item.id, item.internal_name, item.blueprint, start, len(buffer))
+    check_indexes(index, items)
+    print("  ✓ Items decode from their byte ranges")
+
+    print("\n✓ All materialized index tests passed!")
+
+
+if __name__ == "__main__":
+    test_materialized_index()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Simple test to verify which attribute changes diverge from an item template."""
+
+import sys
+sys.path.append('../gen-py')
+
+from services.mobile_items import attribute_columns, diverging_attributes
+from game.ttypes import (
+    Attribute,
+    AttributeType,
+    AttributeValue,
+    Item,
+    ItemType,
+    ItemVector3,
+)
+
+
+def make_position(attribute_type, x, y, z):
+    return Attribute(
+        internal_name=AttributeType._VALUES_TO_NAMES[attribute_type].lower(),
+        visible=False,
+        value=AttributeValue(vector3=ItemVector3(x=x, y=y, z=z)),
+        attribute_type=attribute_type,
+    )
+
+
+def make_purity(value):
+    return Attribute(
+        internal_name="purity",
+        visible=True,
+        value=AttributeValue(double_value=value),
+        attribute_type=AttributeType.PURITY,
+    )
+
+
+def test_mobile_items():
+    """Test attribute columns and divergence from the template."""
+    print("Testing mobile item materialization...")
+
+    template = Item(
+        id=1,
+        internal_name="ingot",
+        attributes={
+            AttributeType.LOCAL_POSITION: make_position(AttributeType.LOCAL_POSITION, 1.0, 2.0, 3.0),
+            AttributeType.PURITY: make_purity(0.5),
+        },
+        max_stack_size=100,
+        item_type=ItemType.REFINEDMATERIAL,
+    )
+
+    # Test 1: Columns are the stored values
+    print("  Test 1: Columns...")
+    columns = attribute_columns(make_position(AttributeType.LOCAL_POSITION, 1.0, 2.0, 3.0))
+    assert (columns["vector3_x"], columns["vector3_y"], columns["vector3_z"]) == (1.0, 2.0, 3.0)
+    assert columns["double_value"] is None
+    assert attribute_columns(make_purity(0.5))["double_value"] == 0.5
+    print("  ✓ Thrift attributes flatten to their columns")
+
+    # Test 2: Matching attributes do not diverge
+    print("  Test 2: Matching...")
+    assert diverging_attributes(template, [make_position(AttributeType.LOCAL_POSITION, 1.0, 2.0, 3.0), make_purity(0.5)]) == []
+    assert diverging_attributes(template, []) == []
+    print("  ✓ The template's own values keep the reference")
+
+    # Test 3: Changed and new attributes diverge
+    print("  Test 3: Diverging...")
+    moved = make_position(AttributeType.LOCAL_POSITION, 1.0, 2.0, 4.0)
+    assert diverging_attributes(template, [moved, make_purity(0.5)]) == [moved]
+    heading = make_position(AttributeType.GLOBAL_POSITION, 0.0, 0.0, 0.0)
+    assert diverging_attributes(template, [heading]) == [heading]
+    bare = Item(id=2, internal_name="ore", attributes=None, max_stack_size=100, item_type=ItemType.RAWMATERIAL)
+    assert diverging_attributes(bare, [make_purity(0.5)]) == [make_purity(0.5)]
+    print("  ✓ Values or types the template lacks diverge")
+
+    print("\n✓ All mobile item tests passed!")
+
+
+if __name__ == "__main__":
+    test_mobile_items()
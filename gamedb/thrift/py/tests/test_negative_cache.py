@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Simple test to verify negative caching of missing ids."""
+
+import sys
+sys.path.append('../gen-py')
+
+import time
+
+from services.negative_cache import NegativeCache
+
+
+def test_negative_cache():
+    """Test remembering, expiry, forgetting and eviction of misses."""
+    print("Testing negative cache...")
+
+    # Test 1: Misses are remembered until forgotten
+    print("  Test 1: Remember and forget...")
+    missing = NegativeCache("test", ttl=60)
+    assert not missing.is_missing(1)
+    missing.remember(1)
+    assert missing.is_missing(1)
+    assert missing.hits == 1
+    missing.forget(1)
+    assert not missing.is_missing(1)
+    print("  ✓ Created ids are no longer reported missing")
+
+    # Test 2: Entries expire after the TTL
+    print("  Test 2: Expiry...")
+    short = NegativeCache("short", ttl=0.05)
+    short.remember(2)
+    assert short.is_missing(2)
+    time.sleep(0.1)
+    assert not short.is_missing(2)
+    assert len(short) == 0
+    print("  ✓ Misses are trusted only for the TTL")
+
+    # Test 3: Batch lookups and size bound
+    print("  Test 3: Batches and eviction...")
+    small = NegativeCache("small", ttl=60, max_entries=3)
+    for key in range(5):
+        small.remember(key)
+    assert len(small) == 3
+    assert small.missing_of(range(6)) == [2, 3, 4]
+    small.clear()
+    assert small.missing_of(range(6)) == []
+    print("  ✓ Oldest misses are evicted first")
+
+    print("\n✓ All negative cache tests passed!")
+
+
+if __name__ == "__main__":
+    test_negative_cache()
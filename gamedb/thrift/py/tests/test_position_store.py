@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Simple test to verify in-memory position updates and dirty tracking."""
+
+import sys
+sys.path.append('../gen-py')
+
+from game.ttypes import AttributeType, EntityKind
+from services.position_store import PositionStore, _bulk_update_sql
+
+LOCAL = AttributeType.LOCAL_POSITION
+GLOBAL = AttributeType.GLOBAL_POSITION
+
+MOBILE = (EntityKind.MOBILE, 7)
+ITEM = (EntityKind.ITEM, 9)
+
+
+def test_position_store():
+    """Test loading, batched updates, merging with reloads and slot reuse."""
+    print("Testing position store...")
+
+    store = PositionStore(capacity=2)
+    store.merge_loaded({
+        MOBILE: {LOCAL: (100, (1.0, 1.0, 0.0)), GLOBAL: (101, (5.0, 5.0, 0.0))},
+        ITEM: {LOCAL: (102, (2.0, 2.0, 0.0))},
+    })
+    assert len(store) == 2
+    assert store.dirty_count() == 0
+
+    # Test 1: Batched updates, last one wins
+    print("  Test 1: Batched updates...")
+    store.update([
+        (MOBILE, LOCAL, (1.5, 1.0, 0.0)),
+        (ITEM, LOCAL, (3.0, 2.0, 0.0)),
+        (MOBILE, LOCAL, (2.0, 1.0, 0.0)),
+    ])
+    assert store.positions_of(MOBILE) == {LOCAL: (2.0, 1.0, 0.0), GLOBAL: (5.0, 5.0, 0.0)}
+    assert store.dirty_count() == 2
+    print("  ✓ Updates are applied and marked dirty")
+
+    # Test 2: Reloads never overwrite unflushed positions
+    print("  Test 2: Reloads...")
+    merged = store.merge_loaded({MOBILE: {LOCAL: (100, (1.0, 1.0, 0.0))}}, [MOBILE])
+    assert merged[MOBILE] == {LOCAL: (2.0, 1.0, 0.0)}
+    merged = store.merge_loaded({ITEM: {LOCAL: (102, (2.0, 2.0, 0.0))}}, [ITEM])
+    assert merged[ITEM] == {LOCAL: (3.0, 2.0, 0.0)}
+    print("  ✓ Dirty positions survive; clean ones follow the database")
+
+    # Test 3: Loaded positions grow the arrays and reuse freed slots
+    print("  Test 3: Slots...")
+    store.merge_loaded(
+        {(EntityKind.MOBILE, 100 + i): {LOCAL: (200 + i, (float(i), 0.0, 0.0))} for i in range(10)},
+        [(EntityKind.MOBILE, 100 + i) for i in range(10)],
+    )
+    assert len(store) == 12
+    assert store.positions_of((EntityKind.MOBILE, 109)) == {LOCAL: (9.0, 0.0, 0.0)}
+    store.remove((EntityKind.MOBILE, 109))
+    assert store.positions_of((EntityKind.MOBILE, 109)) == {}
+    store.merge_loaded({(EntityKind.MOBILE, 200): {LOCAL: (300, (4.0, 4.0, 0.0))}}, [(EntityKind.MOBILE, 200)])
+    assert store.positions_of((EntityKind.MOBILE, 200)) == {LOCAL: (4.0, 4.0, 0.0)}
+    assert store.positions_of((EntityKind.MOBILE, 108)) == {LOCAL: (8.0, 0.0, 0.0)}
+    print("  ✓ Slots are allocated, grown and reused")
+
+    # Test 4: Updates never create positions
+    print("  Test 4: Unknown positions...")
+    dirty = store.dirty_count()
+    rejected = store.update([
+        ((EntityKind.MOBILE, 109), LOCAL, (1.0, 0.0, 0.0)),
+        (ITEM, GLOBAL, (1.0, 0.0, 0.0)),
+        ((EntityKind.MOBILE, 108), LOCAL, (8.5, 0.0, 0.0)),
+    ])
+    assert rejected == [0, 1]
+    assert store.positions_of((EntityKind.MOBILE, 109)) == {}
+    assert store.positions_of(ITEM) == {LOCAL: (3.0, 2.0, 0.0)}
+    assert store.positions_of((EntityKind.MOBILE, 108)) == {LOCAL: (8.5, 0.0, 0.0)}
+    assert store.dirty_count() == dirty + 1
+    print("  ✓ Only stored positions are updated")
+
+    # Test 5: A full reload drops vanished positions, even unflushed ones
+    print("  Test 5: Full reload...")
+    store.merge_loaded({MOBILE: {LOCAL: (100, (1.0, 1.0, 0.0))}})
+    snapshot = store.snapshot()
+    assert list(snapshot) == [MOBILE]
+    assert snapshot[MOBILE] == {LOCAL: (2.0, 1.0, 0.0)}
+    assert store.dirty_count() == 1
+    print("  ✓ Positions whose row is gone are dropped")
+
+    # Test 6: One UPDATE statement carries a whole chunk
+    print("  Test 6: Bulk statement...")
+    sql = _bulk_update_sql(3)
+    assert sql.count("%s") == 12
+    assert sql.count("UNION ALL") == 2
+    print("  ✓ Bulk UPDATE has four parameters per row")
+
+    print("\n✓ All position store tests passed!")
+
+
+if __name__ == "__main__":
+    test_position_store()
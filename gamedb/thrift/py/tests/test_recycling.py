@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Simple test to verify items break down into their blueprint components in memory."""
+
+import sys
+sys.path.append('../gen-py')
+
+from common import is_ok
+from services.item_catalog import CatalogSnapshot
+from services.recycling import breakdown, breakdown_outputs, salvage
+from tests.catalog_items import make_inventory, make_item
+from game.ttypes import GameError
+
+
+def test_recycling():
+    """Test direct and raw breakdowns, salvaging and all-or-nothing failures."""
+    print("Testing recycling...")
+
+    snapshot = CatalogSnapshot(0, {
+        1: make_item(1),                  # ore
+        2: make_item(2),                  # coal
+        3: make_item(3, {1: 2.0}),        # ingot: 2 ore
+        4: make_item(4, {3: 3.0, 2: 0.5}),  # plate: 3 ingots, half a coal
+    })
+
+    # Test 1: Outputs are the components scaled by ratio and quantity
+    print("  Test 1: Outputs...")
+    assert breakdown_outputs(snapshot, 4, 2.0) == {3: 6.0, 2: 1.0}
+    assert breakdown_outputs(snapshot, 4, 2.0, to_raw_materials=True) == {1: 12.0, 2: 1.0}
+    assert breakdown_outputs(snapshot, 1, 2.0) == {}
+    print("  ✓ Direct components and raw materials")
+
+    # Test 2: Breaking down part of a stack
+    print("  Test 2: Breakdown...")
+    inventory = make_inventory([(4, 3.0, None), (1, 5.0, None)])
+    results, produced = breakdown(inventory, snapshot, 4, 2.0)
+    assert is_ok(results)
+    assert produced == {3: 6.0, 2: 1.0}
+    quantities = {entry.item_id: entry.quantity for entry in inventory.entries}
+    assert quantities == {4: 1.0, 1: 5.0, 3: 6.0, 2: 1.0}
+    results, _ = breakdown(inventory, snapshot, 4, 2.0)
+    assert results[0].error_code == GameError.INV_INSUFFICIENT_QUANTITY
+    results, _ = breakdown(inventory, snapshot, 1, 1.0)
+    assert not is_ok(results)
+    print("  ✓ Only what is held and has a blueprint breaks down")
+
+    # Test 3: Salvaging keeps raw materials and item instances
+    print("  Test 3: Salvage...")
+    inventory = make_inventory([(4, 1.0, None), (3, 2.0, None), (3, 1.0, 77), (2, 1.0, None)])
+    results, consumed, produced = salvage(inventory, snapshot, to_raw_materials=True)
+    assert is_ok(results)
+    assert consumed == {4: 1.0, 3: 2.0}
+    assert produced == {1: 10.0, 2: 0.5}
+    quantities = sorted((entry.item_id, entry.quantity, entry.mobile_item_id) for entry in inventory.entries)
+    assert quantities == [(1, 10.0, None), (2, 1.5, None), (3, 1.0, 77)]
+    print("  ✓ Stacks break down to raw materials, instances stay")
+
+    # Test 4: Outputs that do not fit fail the breakdown
+    print("  Test 4: Full inventory...")
+    inventory = make_inventory([(4, 1.0, None)], max_entries=1)
+    results, _, _ = salvage(inventory, snapshot)
+    assert not is_ok(results)
+    print("  ✓ A breakdown that does not fit fails")
+
+    print("\n✓ All recycling tests passed!")
+
+
+if __name__ == "__main__":
+    test_recycling()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Simple test to verify the pre-serialized ItemService response cache."""
+
+import sys
+sys.path.append('../gen-py')
+
+from thrift.protocol import TBinaryProtocol
+from thrift.transport import TTransport
+
+from services.response_cache import ResponseCache, CachingItemProcessor
+from game.ItemService import Client
+from game.ttypes import (
+    ItemRequest,
+    ItemRequestData,
+    ItemResponse,
+    ItemResponseData,
+    LoadItemRequestData,
+    LoadItemResponseData,
+    GameResult,
+    StatusType,
+    GameError,
+    Item,
+    ItemType,
+)
+
+
+class CountingHandler:
+    """Answers load() from a dict and counts how often it runs."""
+
+    def __init__(self):
+        self.catalog_version = 0
+        self.calls = 0
+        self.names = {1: "iron_ore"}
+
+    def load(self, request):
+        self.calls += 1
+        item_id = request.data.load_item.item_id
+        if item_id not in self.names:
+            return ItemResponse(
+                results=[
+                    GameResult(
+                        status=StatusType.FAILURE,
+                        message=f"Item {item_id} not found",
+                        error_code=GameError.DB_RECORD_NOT_FOUND,
+                    ),
+                ],
+                response_data=None,
+            )
+        item = Item(
+            id=item_id,
+            internal_name=self.names[item_id],
+            attributes={},
+            max_stack_size=100,
+            item_type=ItemType.RAWMATERIAL,
+        )
+        return ItemResponse(
+            results=[GameResult(status=StatusType.SUCCESS, message="ok")],
+            response_data=ItemResponseData(
+                load_item=LoadItemResponseData(item=item),
+            ),
+        )
+
+
+def call_load(processor, item_id, seqid=1):
+    """Runs one load call through the processor and decodes the reply."""
+    request_buffer = TTransport.TMemoryBuffer()
+    client = Client(TBinaryProtocol.TBinaryProtocol(request_buffer))
+    client._seqid = seqid
+    client.send_load(
+        ItemRequest(data=ItemRequestData(load_item=LoadItemRequestData(item_id=item_id)))
+    )
+
+    iprot = TBinaryProtocol.TBinaryProtocol(
+        TTransport.TMemoryBuffer(request_buffer.getvalue())
+    )
+    reply_buffer = TTransport.TMemoryBuffer()
+    processor.process(iprot, TBinaryProtocol.TBinaryProtocol(reply_buffer))
+
+    reader = Client(
+        TBinaryProtocol.TBinaryProtocol(TTransport.TMemoryBuffer(reply_buffer.getvalue()))
+    )
+    return reader.recv_load()
+
+
+def test_response_cache():
+    """Test that repeated reads skip the handler until the version changes."""
+    print("Testing pre-serialized response cache...")
+
+    # Test 1: LRU eviction and version handling
+    print("  Test 1: ResponseCache bookkeeping...")
+    cache = ResponseCache(max_entries=2)
+    cache.put(0, "a", b"1")
+    cache.put(0, "b", b"2")
+    cache.get(0, "a")
+    cache.put(0, "c", b"3")
+    assert cache.get(0, "b") is None, "Least recently used entry should be evicted"
+    assert cache.get(0, "a") == b"1"
+    assert cache.get(1, "a") is None, "Other versions must miss"
+    cache.put(1, "d", b"4")
+    assert len(cache) == 1, "A newer version should drop older entries"
+    cache.put(0, "e", b"5")
+    assert cache.get(0, "e") is None, "Older versions must not be stored"
+    print("  ✓ Eviction and versioning work")
+
+    # Test 2: Hits bypass the handler and return identical replies
+    print("  Test 2: Cached replies skip the handler...")
+    handler = CountingHandler()
+    processor = CachingItemProcessor(handler)
+    first = call_load(processor, 1, seqid=1)
+    second = call_load(processor, 1, seqid=7)
+    assert handler.calls == 1, f"Expected 1 handler call, got {handler.calls}"
+    assert first == second, "Cached reply should decode to the same response"
+    assert second.response_data.load_item.item.internal_name == "iron_ore"
+    print("  ✓ Second load served from cache")
+
+    # Test 3: Version bumps invalidate
+    print("  Test 3: Catalog version bump invalidates...")
+    handler.names[1] = "refined_iron"
+    handler.catalog_version += 1
+    third = call_load(processor, 1)
+    assert handler.calls == 2, f"Expected 2 handler calls, got {handler.calls}"
+    assert third.response_data.load_item.item.internal_name == "refined_iron"
+    print("  ✓ Stale replies are not served")
+
+    # Test 4: Failures are not cached
+    print("  Test 4: Failures are not cached...")
+    call_load(processor, 2)
+    call_load(processor, 2)
+    assert handler.calls == 4, f"Expected 4 handler calls, got {handler.calls}"
+    print("  ✓ Not-found replies always reach the handler")
+
+    print("\n✓ All response cache tests passed!")
+
+
+if __name__ == "__main__":
+    test_response_cache()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Simple test to verify the memory-mapped shared item catalog."""
+
+import sys
+sys.path.append('../gen-py')
+
+import os
+import tempfile
+
+from services.shared_catalog import write_catalog, SharedCatalogReader, MappedCatalog
+from game.ttypes import Item, ItemType
+
+
+def make_items(count):
+    return [
+        Item(
+            id=1000 + i * 7,
+            internal_name=f"item_{i:03d}",
+            attributes={},
+            max_stack_size=100,
+            item_type=ItemType.RAWMATERIAL,
+        )
+        for i in range(count)
+    ]
+
+
+def test_shared_catalog():
+    """Test publishing, lookups and remapping of the catalog file."""
+    print("Testing shared item catalog...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.bin")
+        items = make_items(50)
+
+        # Test 1: Every published item can be looked up by id
+        print("  Test 1: Publish and look up...")
+        write_catalog(path, reversed(items), version=1)
+        mapped = MappedCatalog(path)
+        assert len(mapped) == 50
+        assert mapped.version == 1
+        for item in items:
+            assert mapped.get(item.id) == item, f"Item {item.id} did not round-trip"
+        assert mapped.get(999) is None
+        assert mapped.get(1001) is None
+        assert mapped.item_ids() == sorted(item.id for item in items)
+        print("  ✓ 50 items found by binary search")
+
+        # Test 2: Readers pick up a newly published version
+        print("  Test 2: Remap on publish...")
+        reader = SharedCatalogReader(path, check_interval=0)
+        first = reader.snapshot()
+        write_catalog(path, items[:10], version=2)
+        second = reader.snapshot()
+        assert second.version == 2 and len(second) == 10
+        assert first.get(items[40].id) == items[40], "Old mapping must stay readable"
+        assert reader.snapshot() is second, "Unchanged file must not be remapped"
+        print("  ✓ New version mapped, old mapping still valid")
+
+        # Test 3: No temporary files are left behind
+        print("  Test 3: Atomic publish...")
+        assert os.listdir(directory) == ["catalog.bin"], os.listdir(directory)
+        print("  ✓ Only the catalog file remains")
+
+    print("\n✓ All shared catalog tests passed!")
+
+
+if __name__ == "__main__":
+    test_shared_catalog()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Simple test to verify single-flight request coalescing."""
+
+import sys
+sys.path.append('../gen-py')
+
+import threading
+import time
+
+from services.single_flight import SingleFlight
+from game.ttypes import Inventory, Owner
+
+
+def test_single_flight():
+    """Test that concurrent calls for one key share a single execution."""
+    print("Testing single-flight coalescing...")
+
+    flight = SingleFlight("test")
+    calls = []
+    calls_lock = threading.Lock()
+
+    def fetch():
+        with calls_lock:
+            calls.append(1)
+        time.sleep(0.2)
+        return Inventory(
+            id=1,
+            max_entries=10,
+            max_volume=100.0,
+            entries=[],
+            owner=Owner(mobile_id=1),
+        )
+
+    # Test 1: Concurrent calls share one fetch
+    print("  Test 1: Concurrent calls coalesce...")
+    results = []
+    results_lock = threading.Lock()
+    start = threading.Barrier(8)
+
+    def worker():
+        start.wait()
+        value = flight.do(1, fetch)
+        with results_lock:
+            results.append(value)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1, f"Expected 1 fetch, got {len(calls)}"
+    assert len(results) == 8, f"Expected 8 results, got {len(results)}"
+    assert all(r.id == 1 for r in results), "Every caller should get the inventory"
+    assert len(set(id(r) for r in results)) == 8, "Callers must not share objects"
+    assert flight.in_flight() == 0, "No call should remain in flight"
+    print("  ✓ 8 concurrent calls ran 1 fetch")
+
+    # Test 2: Sequential calls are not cached
+    print("  Test 2: Sequential calls fetch again...")
+    flight.do(1, fetch)
+    assert len(calls) == 2, f"Expected 2 fetches, got {len(calls)}"
+    print("  ✓ Completed calls are not reused")
+
+    # Test 3: Errors propagate to waiters
+    print("  Test 3: Errors propagate...")
+    errors = []
+
+    def failing_fetch():
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    def failing_worker():
+        try:
+            flight.do(2, failing_fetch)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=failing_worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 4, f"Expected 4 errors, got {len(errors)}"
+    print("  ✓ Leader errors raised in every caller")
+
+    print("\n✓ All single-flight tests passed!")
+
+
+if __name__ == "__main__":
+    test_single_flight()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Simple test to verify radius queries over the hierarchical spatial index."""
+
+import sys
+sys.path.append('../gen-py')
+
+from game.ttypes import AttributeType, EntityKind
+from services.spatial_index import SpatialIndex
+
+GLOBAL = AttributeType.GLOBAL_POSITION
+LOCAL = AttributeType.LOCAL_POSITION
+
+PLANET_A = (1.0, 2.0, 0.0)
+PLANET_B = (50.0, 2.0, 0.0)
+
+
+def _ids(matches):
+    return [entity[1] for entity, _, _ in matches]
+
+
+def test_spatial_index():
+    """Test radius queries, frames, moves, removal and filtering."""
+    print("Testing spatial index...")
+
+    index = SpatialIndex()
+    index.set_positions((EntityKind.MOBILE, 1), {GLOBAL: PLANET_A, LOCAL: (10.0, 3.5, 0.0)})
+    index.set_positions((EntityKind.MOBILE, 2), {GLOBAL: PLANET_A, LOCAL: (13.0, 6.0, 0.0)})
+    index.set_positions((EntityKind.MOBILE, 3), {GLOBAL: PLANET_A, LOCAL: (40.0, 3.0, 0.0)})
+    index.set_positions((EntityKind.ITEM, 4), {GLOBAL: PLANET_B, LOCAL: (10.0, 3.0, 0.0)})
+    assert len(index) == 4
+
+    # Test 1: Radius, nearest first
+    print("  Test 1: Radius query...")
+    matches = index.query_radius(LOCAL, (10.0, 3.0, 0.0), 5.0, frame={GLOBAL: PLANET_A})
+    assert _ids(matches) == [1, 2]
+    assert matches[0][2] == 0.5
+    print("  ✓ Entities within the radius are returned nearest first")
+
+    # Test 2: Frames keep other planets apart
+    print("  Test 2: Frames...")
+    matches = index.query_radius(LOCAL, (10.0, 3.0, 0.0), 5.0, frame={GLOBAL: PLANET_B})
+    assert _ids(matches) == [4]
+    matches = index.query_radius(LOCAL, (10.0, 3.0, 0.0), 5.0)
+    assert sorted(_ids(matches)) == [1, 2, 4]
+    print("  ✓ Only the requested frame is searched")
+
+    # Test 3: Moving an outer level moves the entity to another frame
+    print("  Test 3: Outer moves...")
+    index.set_position((EntityKind.MOBILE, 2), GLOBAL, PLANET_B)
+    matches = index.query_radius(LOCAL, (10.0, 3.0, 0.0), 5.0, frame={GLOBAL: PLANET_A})
+    assert _ids(matches) == [1]
+    matches = index.query_radius(LOCAL, (10.0, 3.0, 0.0), 5.0, frame={GLOBAL: PLANET_B})
+    assert _ids(matches) == [4, 2]
+    print("  ✓ The entity followed its new frame")
+
+    # Test 4: Large radii over few occupied cells
+    print("  Test 4: Large radius...")
+    matches = index.query_radius(LOCAL, (0.0, 0.0, 0.0), 1000.0, frame={GLOBAL: PLANET_A})
+    assert _ids(matches) == [1, 3]
+    print("  ✓ Wide queries find every entity in range")
+
+    # Test 5: Filtering and limits
+    print("  Test 5: Filtering...")
+    matches = index.query_radius(
+        LOCAL, (10.0, 3.0, 0.0), 5.0,
+        frame={GLOBAL: PLANET_B},
+        accept=lambda entity: entity[0] == EntityKind.ITEM,
+    )
+    assert _ids(matches) == [4]
+    matches = index.query_radius(LOCAL, (10.0, 3.0, 0.0), 5.0, frame={GLOBAL: PLANET_B}, limit=1)
+    assert _ids(matches) == [4]
+    print("  ✓ accept and limit narrow the results")
+
+    # Test 6: Removal
+    print("  Test 6: Removal...")
+    index.remove((EntityKind.ITEM, 4))
+    assert (EntityKind.ITEM, 4) not in index
+    matches = index.query_radius(LOCAL, (10.0, 3.0, 0.0), 5.0, frame={GLOBAL: PLANET_B})
+    assert _ids(matches) == [2]
+    index.clear()
+    assert len(index) == 0
+    assert index.query_radius(LOCAL, (10.0, 3.0, 0.0), 5.0) == []
+    print("  ✓ Removed entities are no longer found")
+
+    print("\n✓ All spatial index tests passed!")
+
+
+if __name__ == "__main__":
+    test_spatial_index()
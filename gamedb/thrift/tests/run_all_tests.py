@@ -103,6 +103,21 @@ def player_service_wrapper(host, user, password, database_name):
     player_service_run()
 
 
+def query_budget_wrapper(host, user, password, database_name):
+    """Wrapper to run the service query budget tests."""
+    from services.tests.query_budget_test import (
+        setUpModule as query_budget_setup,
+        tearDownModule as query_budget_teardown,
+        run_all_tests as query_budget_run,
+    )
+
+    query_budget_setup()
+    try:
+        query_budget_run()
+    finally:
+        query_budget_teardown()
+
+
 def main():
     """Main test runner."""
     print("\n" + "=" * 80)
@@ -247,6 +262,13 @@ def main():
             player_service_wrapper,
             noop_teardown,
         ),
+        (
+            "Service Query Budget Tests",
+            "test_querybudget_db",
+            noop_setup,
+            query_budget_wrapper,
+            noop_teardown,
+        ),
     ]
 
     print(f"Running {len(tests)} test suites concurrently...\n")